@@ -55,7 +55,6 @@ INTENTIONALLY NOT TOUCHED:
 from __future__ import annotations
 
 import logging
-import math
 from dataclasses import dataclass, asdict
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Tuple
@@ -201,6 +200,95 @@ def _pregame_team_rating(team, game) -> float:
     return float(team.rating)
 
 
+# The replay scores with unit weights — the house model as shipped.
+_REPLAY_WEIGHTS = {'rating': 1.0, 'pitcher': 1.0, 'hfa': 1.0}
+
+
+def _pregame_inputs(game, *, use_recent_form: bool = False, ledger=None) -> dict:
+    """batch_scoring.ScoringColumns row for `game`, pre-game only.
+
+    L3 + L4 team ratings via `_pregame_team_rating`; pitcher ratings are
+    current values (documented approximation). The recent-form lookback
+    is anchored on game.first_pitch so the replay cannot peek at the game
+    being simulated or any later game; `ledger` (a pitcher_form.StartLedger)
+    serves it from memory.
+    """
+    home_pitcher_rating = float(game.home_pitcher.rating) if game.home_pitcher else None
+    away_pitcher_rating = float(game.away_pitcher.rating) if game.away_pitcher else None
+    home_form = away_form = 0.0
+    if use_recent_form and game.home_pitcher is not None and game.away_pitcher is not None:
+        from apps.mlb.services.pitcher_form import recent_form_delta
+        home_form = recent_form_delta(
+            game.home_pitcher, reference_date=game.first_pitch, ledger=ledger,
+        )
+        away_form = recent_form_delta(
+            game.away_pitcher, reference_date=game.first_pitch, ledger=ledger,
+        )
+    return {
+        'home_team_rating': _pregame_team_rating(game.home_team, game),
+        'away_team_rating': _pregame_team_rating(game.away_team, game),
+        'home_pitcher_rating': home_pitcher_rating,
+        'away_pitcher_rating': away_pitcher_rating,
+        'home_form_delta': home_form,
+        'away_form_delta': away_form,
+        'neutral_site': bool(game.neutral_site),
+    }
+
+
+def _replay_scores(games, *, use_recent_form: bool = False,
+                   skip_errors: bool = True) -> dict:
+    """{game.pk: {'score', 'raw_prob', team ratings}} for every game, from
+    one batch_scoring call.
+
+    The score and pre-blend probability don't depend on the blend weight,
+    so the experiments score the slate once and hand each game's row to
+    `_simulate_recommendation` for every variant. With `skip_errors` a
+    game whose inputs can't be read is left out; `_simulate_recommendation`
+    then scores it itself and the caller's per-game isolation counts the
+    failure.
+    """
+    from apps.mlb.services.batch_scoring import ScoringColumns, score_columns
+    from apps.mlb.services.pitcher_form import StartLedger
+
+    games = list(games)
+    ledger = None
+    if use_recent_form and games:
+        # One query for every starter's history; each game's lookback is
+        # then a bisect at its own first_pitch. Without it, form is
+        # queried per pitcher as before.
+        try:
+            ledger = StartLedger.for_pitchers(
+                {pid for g in games for pid in (g.home_pitcher_id, g.away_pitcher_id) if pid},
+                until=max(g.first_pitch for g in games),
+            )
+        except Exception:
+            if not skip_errors:
+                raise
+            logger.exception('method_replay: start ledger load failed')
+
+    columns = ScoringColumns()
+    keys = []
+    for game in games:
+        try:
+            row = _pregame_inputs(game, use_recent_form=use_recent_form, ledger=ledger)
+        except Exception:
+            if not skip_errors:
+                raise
+            continue
+        columns.append(**row)
+        keys.append(game.pk)
+    scored = score_columns(columns, _REPLAY_WEIGHTS, use_recent_form=use_recent_form)
+    return {
+        key: {
+            'home_team_rating': columns.home_team_rating[i],
+            'away_team_rating': columns.away_team_rating[i],
+            'score': scored['score'][i],
+            'raw_prob': scored['raw_prob'][i],
+        }
+        for i, key in enumerate(keys)
+    }
+
+
 def _clamp_probability(p: float) -> float:
     """Mirrors `apps.core.services.probability_calibration.clamp_probability`.
     Duplicated here so the replay is self-contained and stable against
@@ -301,6 +389,7 @@ def _simulate_recommendation(
     method_label: str,
     *,
     use_recent_form: bool = False,
+    scored: Optional[dict] = None,
 ) -> Optional[SimulatedRecommendation]:
     """Simulate one recommendation under the given blend weight.
 
@@ -308,6 +397,9 @@ def _simulate_recommendation(
     (no primary-source snapshots, missing moneylines). Such games
     are NOT counted as recommended OR not-recommended — they're
     excluded entirely.
+
+    `scored` is this game's `_replay_scores` row (computed with the same
+    `use_recent_form`); without it the game is scored on its own.
     """
     from apps.core.services.recommendations import (
         compute_status, _raw_tier,
@@ -315,7 +407,6 @@ def _simulate_recommendation(
     from apps.core.utils.odds import (
         american_to_implied_prob, devig_two_way, closing_line_value,
     )
-    from apps.mlb.services.model_service import HFA
 
     snaps = _pregame_snapshots(game, only_primary=True)
     if not snaps:
@@ -329,39 +420,21 @@ def _simulate_recommendation(
     if opening.market_home_win_prob is None:
         return None
 
-    # ---- L3 + L4: pre-game team ratings (no leakage) ----
-    home_rating = _pregame_team_rating(game.home_team, game)
-    away_rating = _pregame_team_rating(game.away_team, game)
+    # ---- Score + sigmoid → raw probability (L3 + L4 inside) ----
+    # apps.mlb.services.batch_scoring — the same engine as the live model.
+    if scored is None:
+        scored = _replay_scores(
+            [game], use_recent_form=use_recent_form, skip_errors=False,
+        )[game.pk]
+    home_rating = scored['home_team_rating']
+    away_rating = scored['away_team_rating']
+    score = scored['score']
+    raw_prob = scored['raw_prob']
 
     # ---- Pitcher ratings — current values (documented approximation) ----
     home_pitcher_rating = float(game.home_pitcher.rating) if game.home_pitcher else 50.0
     away_pitcher_rating = float(game.away_pitcher.rating) if game.away_pitcher else 50.0
 
-    # ---- Score formula (mirrors apps.mlb.services.model_service._score) ----
-    rating_term = (home_rating - away_rating) * 0.35
-    pitcher_term = 0.0
-    pitcher_form_term = 0.0
-    if game.home_pitcher is not None and game.away_pitcher is not None:
-        pitcher_term = (home_pitcher_rating - away_pitcher_rating) * 0.65
-        # 2026-06-25 v3.1: recent-form variant. Anchor the form lookback on
-        # game.first_pitch so the replay cannot peek at the game being
-        # simulated or any later game. L1/L2/L3 leakage safeguards preserved.
-        if use_recent_form:
-            from apps.mlb.services.pitcher_form import recent_form_delta
-            home_form = recent_form_delta(
-                game.home_pitcher, reference_date=game.first_pitch,
-            )
-            away_form = recent_form_delta(
-                game.away_pitcher, reference_date=game.first_pitch,
-            )
-            pitcher_form_term = (home_form - away_form) * 0.65
-    hfa_term = HFA if not game.neutral_site else 0.0
-    score = rating_term + pitcher_term + pitcher_form_term + hfa_term
-
-    # ---- Sigmoid → raw probability ----
-    raw_prob = 1.0 / (1.0 + math.exp(-score / 25.0))
-    raw_prob = max(0.01, min(0.99, raw_prob))
-
     # ---- Blend with PRE-GAME (opening) market — never closing ----
     market_home = opening.market_home_win_prob
     w = max(0.0, min(0.65, blend_weight))
@@ -748,6 +821,7 @@ def run_replay(
         .order_by('first_pitch')
     )
 
+    scores = _replay_scores(games)
     variants = []
     for weight, label in zip(blend_weights, method_labels):
         # Per-game isolation: a single pathological game (unexpected data
@@ -756,7 +830,9 @@ def run_replay(
         sim_errors = 0
         for g in games:
             try:
-                sim = _simulate_recommendation(g, weight, label)
+                sim = _simulate_recommendation(
+                    g, weight, label, scored=scores.get(g.pk),
+                )
             except Exception:
                 sim_errors += 1
                 logger.exception(
@@ -1046,12 +1122,17 @@ def run_blend_experiment(
 
     # Simulate ONCE per weight over the widest game set. Store (game_date, sim)
     # so sub-windows can be sliced without re-querying or re-simulating.
+    # Scores don't depend on the weight — compute them once for both.
+    scores = _replay_scores(games)
+
     def _simulate_all(weight: float):
         out = []          # list of (game_date, SimulatedRecommendation)
         errors = 0
         for g in games:
             try:
-                sim = _simulate_recommendation(g, weight, f'{weight:.2f}')
+                sim = _simulate_recommendation(
+                    g, weight, f'{weight:.2f}', scored=scores.get(g.pk),
+                )
             except Exception:
                 errors += 1
                 logger.exception(
@@ -1150,11 +1231,14 @@ def run_favorites_experiment(
         .order_by('first_pitch')
     )
 
+    scores = _replay_scores(games)
     sims = []          # (game_date, sim) for lane-corrected recommended only
     sim_errors = 0
     for g in games:
         try:
-            sim = _simulate_recommendation(g, blend, f'{blend:.2f}')
+            sim = _simulate_recommendation(
+                g, blend, f'{blend:.2f}', scored=scores.get(g.pk),
+            )
         except Exception:
             sim_errors += 1
             logger.exception(
@@ -1455,13 +1539,14 @@ def run_recent_form_experiment(
     )
 
     def _simulate_all(use_form: bool):
+        scores = _replay_scores(games, use_recent_form=use_form)
         sims = []
         errors = 0
         for g in games:
             try:
                 sim = _simulate_recommendation(
                     g, blend_weight, ('+form' if use_form else 'prod'),
-                    use_recent_form=use_form,
+                    use_recent_form=use_form, scored=scores.get(g.pk),
                 )
             except Exception:
                 errors += 1
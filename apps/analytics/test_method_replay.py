@@ -901,21 +901,27 @@ class BlendExperimentProductionShapeTests(TestCase):
 
         self._build_production_shape(n=6)
         real = mr._simulate_recommendation
-        calls = {'n': 0}
+        calls = {'n': 0, 'simulated': 0}
 
-        def flaky(game, weight, label):
+        def flaky(game, weight, label, **kwargs):
             calls['n'] += 1
             if calls['n'] == 2:  # blow up on the 2nd sim call
                 raise ValueError('simulated bad game data')
-            return real(game, weight, label)
+            sim = real(game, weight, label, **kwargs)
+            if sim is not None:
+                calls['simulated'] += 1
+            return sim
 
         with patch.object(mr, '_simulate_recommendation', side_effect=flaky):
             exp = mr.run_blend_experiment(
                 blend_a=0.40, blend_b=0.55, windows=(60,),
                 min_games_for_window=2,
             )
-        # Did not raise; error was counted.
-        self.assertGreaterEqual(exp['sim_errors']['a'] + exp['sim_errors']['b'], 1)
+        # Did not raise; exactly the one bad call was counted and every
+        # other game (6 per blend) was still simulated.
+        self.assertEqual(exp['sim_errors'], {'a': 1, 'b': 0})
+        self.assertEqual(calls['n'], 12)
+        self.assertEqual(calls['simulated'], 11)
         txt = mr.render_blend_experiment(exp)
         self.assertIn('BLEND EXPERIMENT', txt)
 
@@ -928,11 +934,11 @@ class BlendExperimentProductionShapeTests(TestCase):
         real = mr._simulate_recommendation
         calls = {'n': 0}
 
-        def flaky(game, weight, label):
+        def flaky(game, weight, label, **kwargs):
             calls['n'] += 1
             if calls['n'] == 1:   # blow up on the first game
                 raise RuntimeError('boom')
-            return real(game, weight, label)
+            return real(game, weight, label, **kwargs)
 
         with patch.object(mr, '_simulate_recommendation', side_effect=flaky):
             result = mr.run_replay(
@@ -940,8 +946,11 @@ class BlendExperimentProductionShapeTests(TestCase):
                 timezone.localdate() - timedelta(days=1),
                 [0.55],
             )
-        # Did not raise; the variant records sim_errors.
-        self.assertGreaterEqual(result['variants'][0]['sim_errors'], 1)
+        # Did not raise; only the first game errored and the other three
+        # were still simulated.
+        variant = result['variants'][0]
+        self.assertEqual(variant['sim_errors'], 1)
+        self.assertEqual(len(variant['simulations']), 3)
 
     def test_view_captures_exception_as_diagnostic(self):
         """If run_blend_experiment raises (non-timeout), the staff view
@@ -14,7 +14,18 @@ HOUSE_WEIGHTS = {
 
 
 def _get_latest_odds(game):
-    return game.odds_snapshots.order_by('-captured_at').first()
+    # last_seen_at first: an unchanged line re-confirmed by the latest pull
+    # is the freshest row even though its captured_at is older.
+    if hasattr(game, 'prefetched_latest_odds'):
+        return game.prefetched_latest_odds
+    return game.odds_snapshots.order_by('-last_seen_at', '-captured_at').first()
+
+
+def _recent_odds(game):
+    """The two newest snapshots by captured_at (line-movement input)."""
+    if hasattr(game, 'prefetched_recent_odds'):
+        return game.prefetched_recent_odds
+    return list(game.odds_snapshots.order_by('-captured_at')[:2])
 
 
 def _get_injuries(game):
@@ -88,7 +99,7 @@ def compute_data_confidence(game, latest_odds=None, injuries=None):
     if not latest_odds:
         return 'low'
 
-    age = (timezone.now() - latest_odds.captured_at).total_seconds() / 3600.0
+    age = (timezone.now() - (latest_odds.last_seen_at or latest_odds.captured_at)).total_seconds() / 3600.0
     has_injuries = len(injuries) > 0
 
     if age < 2 and has_injuries:
@@ -114,7 +125,7 @@ def compute_edges(market_prob, house_prob, user_prob=None):
     return result
 
 
-def compute_game_data(game, user=None):
+def compute_game_data(game, user=None, *, user_config=None):
     latest_odds = _get_latest_odds(game)
     injuries = _get_injuries(game)
 
@@ -124,7 +135,7 @@ def compute_game_data(game, user=None):
     user_prob = None
     if user and user.is_authenticated:
         from apps.accounts.models import UserModelConfig
-        config = UserModelConfig.get_or_create_for_user(user)
+        config = user_config or UserModelConfig.get_or_create_for_user(user)
         user_prob = compute_user_win_prob(game, config, injuries)
 
     edges = compute_edges(market_prob, house_prob, user_prob)
@@ -145,7 +156,7 @@ def compute_game_data(game, user=None):
     # Line movement detection
     line_movement = None
     if latest_odds:
-        snapshots = list(game.odds_snapshots.order_by('-captured_at')[:2])
+        snapshots = _recent_odds(game)
         if len(snapshots) == 2:
             prob_diff = (snapshots[0].market_home_win_prob - snapshots[1].market_home_win_prob) * 100
             if abs(prob_diff) > 0.5:
@@ -167,3 +178,17 @@ def compute_game_data(game, user=None):
         'injuries': injuries,
         'model_version': HOUSE_MODEL_VERSION,
     }
+
+
+def compute_slate_data(games, user=None):
+    """compute_game_data for a whole slate in a fixed number of queries:
+    latest and line-movement snapshots, injuries, teams and the user's
+    config are prefetched once (apps.core.services.slate). Returns the
+    per-game dicts in `games` order."""
+    from apps.core.services import slate
+
+    games = slate.prefetch_slate(games, lambda c: c[0] if c else None)
+    if not games:
+        return []
+    config = slate.user_model_config(user)
+    return [compute_game_data(g, user, user_config=config) for g in games]
@@ -24,7 +24,17 @@ HOUSE_WEIGHTS = {
 
 def _get_latest_odds(game):
     """Get the most recent OddsSnapshot for a game."""
-    return game.odds_snapshots.first()  # ordered by -captured_at
+    # See apps.cbb.services.model_service._get_latest_odds on the ordering.
+    if hasattr(game, 'prefetched_latest_odds'):
+        return game.prefetched_latest_odds
+    return game.odds_snapshots.order_by('-last_seen_at', '-captured_at').first()
+
+
+def _recent_odds(game):
+    """The two newest snapshots by captured_at (line-movement input)."""
+    if hasattr(game, 'prefetched_recent_odds'):
+        return game.prefetched_recent_odds
+    return list(game.odds_snapshots.order_by('-captured_at')[:2])
 
 
 def _get_injuries(game):
@@ -128,7 +138,7 @@ def compute_data_confidence(game, latest_odds=None, injuries=None):
         return 'low'
 
     now = timezone.now()
-    age = (now - latest_odds.captured_at).total_seconds() / 3600  # hours
+    age = (now - (latest_odds.last_seen_at or latest_odds.captured_at)).total_seconds() / 3600  # hours
 
     has_injuries = game.injuries.exists()
 
@@ -157,7 +167,7 @@ def compute_edges(market_prob, house_prob, user_prob=None):
     return result
 
 
-def compute_game_data(game, user=None):
+def compute_game_data(game, user=None, *, user_config=None):
     """
     Compute full game analysis data.
     Returns a dict with all computed values for template rendering.
@@ -170,10 +180,9 @@ def compute_game_data(game, user=None):
     confidence = compute_data_confidence(game, latest_odds, injuries)
 
     user_prob = None
-    user_config = None
     if user and user.is_authenticated:
         from apps.accounts.models import UserModelConfig
-        user_config = UserModelConfig.get_or_create_for_user(user)
+        user_config = user_config or UserModelConfig.get_or_create_for_user(user)
         user_prob = compute_user_win_prob(game, user_config, injuries)
 
     edges = compute_edges(market_prob, house_prob, user_prob)
@@ -191,7 +200,7 @@ def compute_game_data(game, user=None):
 
     # Line movement
     line_movement = None
-    snapshots = list(game.odds_snapshots.all()[:2])
+    snapshots = _recent_odds(game)
     if len(snapshots) >= 2:
         newer = snapshots[0].market_home_win_prob
         older = snapshots[1].market_home_win_prob
@@ -217,3 +226,17 @@ def compute_game_data(game, user=None):
         'injuries': injuries,
         'model_version': HOUSE_MODEL_VERSION,
     }
+
+
+def compute_slate_data(games, user=None):
+    """compute_game_data for a whole slate in a fixed number of queries:
+    latest and line-movement snapshots, injuries, teams and the user's
+    config are prefetched once (apps.core.services.slate). Returns the
+    per-game dicts in `games` order."""
+    from apps.core.services import slate
+
+    games = slate.prefetch_slate(games, lambda c: c[0] if c else None)
+    if not games:
+        return []
+    config = slate.user_model_config(user)
+    return [compute_game_data(g, user, user_config=config) for g in games]
@@ -200,11 +200,15 @@ class OddsSnapshot(models.Model):
     )
     # See apps.mlb.models.OddsSnapshot for the doc on is_derived.
     is_derived = models.BooleanField(default=False, db_index=True)
+    # See apps.mlb.models.OddsSnapshot for the doc on these two fields.
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+    observation_count = models.PositiveIntegerField(default=1)
 
     class Meta:
         ordering = ['-captured_at']
         indexes = [
             models.Index(fields=['game', '-captured_at']),
+            models.Index(fields=['game', '-last_seen_at']),
             models.Index(fields=['snapshot_type', '-captured_at']),
         ]
 
@@ -214,6 +218,8 @@ class OddsSnapshot(models.Model):
     def save(self, *args, **kwargs):
         if self.market_away_win_prob is None:
             self.market_away_win_prob = 1.0 - self.market_home_win_prob
+        if self.last_seen_at is None:
+            self.last_seen_at = self.captured_at
         super().save(*args, **kwargs)
 
 
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_bettingrecommendation_feature_contributions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OddsMovementState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sport', models.CharField(choices=[('cfb', 'College Football'), ('cbb', 'College Basketball'), ('mlb', 'MLB'), ('college_baseball', 'College Baseball')], max_length=20)),
+                ('game_id', models.UUIDField()),
+                ('sportsbook', models.CharField(max_length=50)),
+                ('market', models.CharField(choices=[('moneyline_home', 'Moneyline (home)'), ('moneyline_away', 'Moneyline (away)'), ('spread', 'Spread'), ('total', 'Total')], max_length=20)),
+                ('window', models.JSONField(blank=True, default=list)),
+                ('observation_count', models.PositiveIntegerField(default=0)),
+                ('first_price', models.FloatField(blank=True, null=True)),
+                ('first_at', models.DateTimeField(blank=True, null=True)),
+                ('last_price', models.FloatField(blank=True, null=True)),
+                ('last_at', models.DateTimeField(blank=True, null=True)),
+                ('signed_delta', models.FloatField(default=0.0)),
+                ('up_moves', models.PositiveIntegerField(default=0)),
+                ('down_moves', models.PositiveIntegerField(default=0)),
+                ('last_move_at', models.DateTimeField(blank=True, null=True)),
+                ('last_snapshot_id', models.BigIntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sport', 'game_id', 'sportsbook', 'market'), name='core_movement_state_key_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_oddsmovementstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CurrentLine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sport', models.CharField(choices=[('cfb', 'College Football'), ('cbb', 'College Basketball'), ('mlb', 'MLB'), ('college_baseball', 'College Baseball')], max_length=20)),
+                ('game_id', models.UUIDField()),
+                ('sportsbook', models.CharField(max_length=50)),
+                ('odds_source', models.CharField(max_length=20)),
+                ('is_derived', models.BooleanField(default=False)),
+                ('snapshot_id', models.BigIntegerField()),
+                ('trust_tier', models.CharField(max_length=10)),
+                ('source_quality', models.CharField(blank=True, default='', max_length=15)),
+                ('captured_at', models.DateTimeField()),
+                ('last_seen_at', models.DateTimeField()),
+                ('market_home_win_prob', models.FloatField(blank=True, null=True)),
+                ('moneyline_home', models.IntegerField(blank=True, null=True)),
+                ('moneyline_away', models.IntegerField(blank=True, null=True)),
+                ('spread', models.FloatField(blank=True, null=True)),
+                ('total', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['sport', 'game_id', '-last_seen_at'], name='core_curren_sport_543369_idx')],
+                'constraints': [models.UniqueConstraint(fields=('sport', 'game_id', 'sportsbook', 'odds_source', 'is_derived'), name='core_current_line_key_unique')],
+            },
+        ),
+    ]
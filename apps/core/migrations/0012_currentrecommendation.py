@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_currentline'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CurrentRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sport', models.CharField(choices=[('cfb', 'College Football'), ('cbb', 'College Basketball'), ('mlb', 'MLB'), ('college_baseball', 'College Baseball')], max_length=20)),
+                ('game_id', models.UUIDField()),
+                ('model_source', models.CharField(choices=[('house', 'House Model'), ('user', 'User Model')], default='house', max_length=5)),
+                ('snapshot_id', models.BigIntegerField(blank=True, null=True)),
+                ('model_key', models.CharField(max_length=32)),
+                ('pick', models.CharField(blank=True, default='', max_length=200)),
+                ('odds_american', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(blank=True, default='', max_length=20)),
+                ('tier', models.CharField(blank=True, default='', max_length=10)),
+                ('lane', models.CharField(blank=True, default='', max_length=10)),
+                ('payload', models.JSONField(blank=True, null=True)),
+                ('computed_at', models.DateTimeField()),
+                ('changed_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sport', 'game_id', 'model_source'), name='core_current_recommendation_key_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_currentrecommendation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bettingrecommendation',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='bettingrecommendation',
+            name='last_confirmed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
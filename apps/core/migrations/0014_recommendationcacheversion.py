@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_bettingrecommendation_fingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationCacheVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sport', models.CharField(choices=[('cfb', 'College Football'), ('cbb', 'College Basketball'), ('mlb', 'MLB'), ('college_baseball', 'College Baseball')], max_length=20)),
+                ('kind', models.CharField(max_length=10)),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sport', 'kind'), name='core_recommendation_cache_version_key_unique')],
+            },
+        ),
+    ]
@@ -47,7 +47,8 @@ class BettingRecommendation(models.Model):
     Sport-agnostic via per-sport nullable FKs (mirrors MockBet's pattern). A row is a
     snapshot in time — the current pick can change as odds or injuries move, so we do
     not enforce uniqueness on (game, model_source). The freshest row is whichever has
-    the newest `created_at`.
+    the newest `created_at`; a new row is written only when the decision changes,
+    otherwise the freshest row's `last_confirmed_at` moves.
     """
     SPORT_CHOICES = [
         ('cfb', 'College Football'),
@@ -230,6 +231,16 @@ class BettingRecommendation(models.Model):
 
     created_at = models.DateTimeField(default=timezone.now)
 
+    # 2026-10-17 write-on-change. `fingerprint` hashes the decision
+    # (pick, line, odds, status, tier, lane, edge); persisting the same
+    # decision again only moves `last_confirmed_at` on the latest row
+    # instead of inserting a duplicate. See recommendation_fingerprint()
+    # in apps/core/services/recommendations.py. Blank / null on rows
+    # written before the change — they never match, so the next persist
+    # for that game writes a fresh row.
+    fingerprint = models.CharField(max_length=40, blank=True, default='')
+    last_confirmed_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
@@ -384,3 +395,202 @@ class BettingRecommendation(models.Model):
             self.movement_supports_pick,
             self.market_warning,
         )
+
+
+class OddsMovementState(models.Model):
+    """Running movement state for one (sport, game, sportsbook, market).
+
+    Maintained incrementally as snapshots land (see
+    apps/core/services/movement_state.py) so movement scoring reads one row
+    instead of re-reading and re-walking the last N OddsSnapshot rows.
+
+    `window` holds the bounded observation ring the score is defined over —
+    [captured_at ISO, price, snapshot pk] triples, oldest→newest, at most
+    HISTORY_MAX_SNAPSHOTS entries (CROSS_BOOK_MAX_SNAPSHOTS for the
+    sportsbook='*' all-books rows). Null prices stay in the ring because
+    window membership is by snapshot, not by observation. The aggregate
+    columns below are derived from the ring on every write; readers use
+    them directly unless part of the ring has aged past HISTORY_MAX_HOURS.
+
+    game_id is a plain UUID rather than an FK because games live in the
+    per-sport apps. Rows for deleted games are dropped by
+    `rebuild_movement_state`.
+    """
+    SPORT_CHOICES = BettingRecommendation.SPORT_CHOICES
+
+    MARKET_CHOICES = [
+        ('moneyline_home', 'Moneyline (home)'),
+        ('moneyline_away', 'Moneyline (away)'),
+        ('spread', 'Spread'),
+        ('total', 'Total'),
+    ]
+
+    sport = models.CharField(max_length=20, choices=SPORT_CHOICES)
+    game_id = models.UUIDField()
+    # '*' = every book for the game (the movement_signal_for_pick window)
+    sportsbook = models.CharField(max_length=50)
+    market = models.CharField(max_length=20, choices=MARKET_CHOICES)
+
+    window = models.JSONField(default=list, blank=True)
+    observation_count = models.PositiveIntegerField(default=0)
+    first_price = models.FloatField(null=True, blank=True)
+    first_at = models.DateTimeField(null=True, blank=True)
+    last_price = models.FloatField(null=True, blank=True)
+    last_at = models.DateTimeField(null=True, blank=True)
+    # Cents for moneylines, points for spread/total; first → last in window.
+    signed_delta = models.FloatField(default=0.0)
+    up_moves = models.PositiveIntegerField(default=0)
+    down_moves = models.PositiveIntegerField(default=0)
+    last_move_at = models.DateTimeField(null=True, blank=True)
+    last_snapshot_id = models.BigIntegerField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sport', 'game_id', 'sportsbook', 'market'],
+                name='core_movement_state_key_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.sport} game={self.game_id} {self.sportsbook} {self.market}"
+
+    @property
+    def move_count(self):
+        return self.up_moves + self.down_moves
+
+
+class CurrentLine(models.Model):
+    """The current line for one (sport, game, sportsbook, provenance).
+
+    Upserted in the same transaction as every odds snapshot insert (see
+    apps/core/services/current_line.py), so latest-odds, consensus,
+    best-price and staleness reads for a slate are one indexed query here
+    instead of ordered scans over OddsSnapshot per game.
+
+    Provenance (odds_source, is_derived) is part of the key. ESPN relays
+    other books' lines under their names, so one sportsbook can carry an
+    Odds API line and an ESPN line at once, and the MLB trust ladder picks
+    by source. The line fields are copied from the snapshot; snapshot_id
+    points back at the row itself.
+
+    game_id is a plain UUID rather than an FK because games live in the
+    per-sport apps. `rebuild_current_lines` drops rows for deleted games.
+    """
+    SPORT_CHOICES = BettingRecommendation.SPORT_CHOICES
+
+    sport = models.CharField(max_length=20, choices=SPORT_CHOICES)
+    game_id = models.UUIDField()
+    sportsbook = models.CharField(max_length=50)
+    odds_source = models.CharField(max_length=20)
+    is_derived = models.BooleanField(default=False)
+
+    snapshot_id = models.BigIntegerField()
+    # odds_trust.get_odds_trust_tier of the snapshot: primary / secondary /
+    # invalid / unknown.
+    trust_tier = models.CharField(max_length=10)
+    source_quality = models.CharField(max_length=15, blank=True, default='')
+    captured_at = models.DateTimeField()
+    last_seen_at = models.DateTimeField()
+    market_home_win_prob = models.FloatField(null=True, blank=True)
+    moneyline_home = models.IntegerField(null=True, blank=True)
+    moneyline_away = models.IntegerField(null=True, blank=True)
+    spread = models.FloatField(null=True, blank=True)
+    total = models.FloatField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sport', 'game_id', 'sportsbook', 'odds_source', 'is_derived'],
+                name='core_current_line_key_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['sport', 'game_id', '-last_seen_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.sport} game={self.game_id} {self.sportsbook} ({self.odds_source})"
+
+
+class CurrentRecommendation(models.Model):
+    """The current house-model pick for one (sport, game, model_source).
+
+    Written by the post-ingest worker (apps/core/services/current_recommendation.py)
+    at the end of `ingest_odds` and `refresh_data`, so the hub, value board
+    and Bet All eligibility read one row per game instead of running the
+    decision layer inline. `payload` holds every Recommendation field
+    except game/sport — None when the game has no pick (no usable odds).
+
+    A row is only served while it matches the game's current snapshot
+    (`snapshot_id`) and rating mode (`model_key`) and was confirmed within
+    CURRENT_RECOMMENDATION_MAX_AGE_MINUTES; otherwise readers compute
+    inline. `computed_at` moves on every worker pass that confirms the
+    row; `changed_at` only when the pick, status, tier or lane changes.
+
+    game_id is a plain UUID rather than an FK because games live in the
+    per-sport apps. The worker drops rows for games that left the slate.
+    """
+    SPORT_CHOICES = BettingRecommendation.SPORT_CHOICES
+    MODEL_SOURCE_CHOICES = BettingRecommendation.MODEL_SOURCE_CHOICES
+
+    sport = models.CharField(max_length=20, choices=SPORT_CHOICES)
+    game_id = models.UUIDField()
+    model_source = models.CharField(max_length=5, choices=MODEL_SOURCE_CHOICES, default='house')
+
+    snapshot_id = models.BigIntegerField(null=True, blank=True)
+    # rating mode + model flags the pick was computed under, e.g. 'dynamic|form=1'
+    model_key = models.CharField(max_length=32)
+
+    pick = models.CharField(max_length=200, blank=True, default='')
+    odds_american = models.IntegerField(null=True, blank=True)
+    status = models.CharField(max_length=20, blank=True, default='')
+    tier = models.CharField(max_length=10, blank=True, default='')
+    lane = models.CharField(max_length=10, blank=True, default='')
+    payload = models.JSONField(null=True, blank=True)
+
+    computed_at = models.DateTimeField()
+    changed_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sport', 'game_id', 'model_source'],
+                name='core_current_recommendation_key_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.sport} game={self.game_id} {self.model_source}: {self.pick or '-'}"
+
+
+class RecommendationCacheVersion(models.Model):
+    """Invalidation counter for the recommendation cache, one per
+    (sport, kind) where kind is 'inputs' or 'odds'.
+
+    Kept in the database rather than Django's cache so a bump made by a
+    cron process is seen by every web worker on its next lookup (see
+    apps/core/services/recommendation_cache.py). Rows are created by the
+    first bump; a missing row reads as version 0.
+    """
+    SPORT_CHOICES = BettingRecommendation.SPORT_CHOICES
+
+    sport = models.CharField(max_length=20, choices=SPORT_CHOICES)
+    kind = models.CharField(max_length=10)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['sport', 'kind'],
+                name='core_recommendation_cache_version_key_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.sport} {self.kind} v{self.version}"
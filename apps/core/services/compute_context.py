@@ -0,0 +1,90 @@
+"""Request-scoped memo for model computation.
+
+One `/mlb/` render asks the same questions about a game several times:
+`prioritization.build_signals` reads the newest snapshot and computes the
+house probability, then `get_recommendation` → `compute_game_data` reads
+the latest odds, injuries and recent form again and recomputes the house
+and user probabilities, and `_moneyline_candidate` queries line movement.
+
+Inside `computation_context()` (or a view wrapped with `request_scoped`)
+those results are memoized, keyed on what they depend on:
+
+    (kind, game, snapshot id, rating mode, user config)
+
+so every consumer in the request shares one computation. Outside a
+context `memoize` just calls through — behavior is unchanged for
+commands, tasks and tests that don't opt in.
+
+The memo lives for one request only, so it never serves a value computed
+before a write made by another request. Views that write and then read
+back within the same request should not use it.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+_memo = ContextVar('compute_context_memo', default=None)
+
+
+@contextmanager
+def computation_context():
+    """Memoize model computation until the block exits. Nested contexts
+    share the outermost memo."""
+    if _memo.get() is not None:
+        yield
+        return
+    token = _memo.set({})
+    try:
+        yield
+    finally:
+        _memo.reset(token)
+
+
+def request_scoped(view):
+    """View decorator: run the view inside a computation_context."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        with computation_context():
+            return view(request, *args, **kwargs)
+    return wrapper
+
+
+def active() -> bool:
+    return _memo.get() is not None
+
+
+def memoize(key, compute):
+    """compute() once per key within the active context; a plain call
+    outside one."""
+    memo = _memo.get()
+    if memo is None:
+        return compute()
+    try:
+        return memo[key]
+    except KeyError:
+        value = memo[key] = compute()
+        return value
+
+
+def snapshot_key(snapshot):
+    """Snapshot component of a memo key (None when there are no odds)."""
+    return getattr(snapshot, 'pk', None)
+
+
+def rating_mode() -> str:
+    """'dynamic' or 'static' — team ratings differ between the two."""
+    from apps.core.services.elo_service import is_dynamic_active
+    return 'dynamic' if is_dynamic_active() else 'static'
+
+
+def config_key(user_config):
+    """User-config component of a memo key: the weights the user model
+    reads, so two configs with equal weights share results."""
+    if user_config is None:
+        return None
+    return (
+        user_config.rating_weight,
+        getattr(user_config, 'pitcher_weight', 1.0),
+        user_config.hfa_weight,
+        user_config.injury_weight,
+    )
@@ -0,0 +1,183 @@
+"""Materialized current line per (game, sportsbook, provenance) — sport-agnostic.
+
+Latest-odds lookups used to be ordered scans over OddsSnapshot for every
+game: up to three per game for the MLB trust ladder, a per-book dedupe walk
+for consensus / best price, and one more each for source attribution and
+staleness. CurrentLine keeps the newest snapshot for each key instead,
+written with the snapshot itself:
+
+  - upsert_current_lines(model_class, snapshots)   write side; one
+                                                   INSERT .. ON CONFLICT per pass
+  - touch_current_lines(model_class, pks, now)     change-only extensions
+  - current_lines_by_game(model_class, game_ids)   slate read, one query
+  - current_snapshots_by_game(model_class, ids)    same, as OddsSnapshot rows
+  - rebuild_current_lines(model_class)             backfill / repair
+
+AbstractProvider._write_snapshots runs the upsert in the same transaction as
+the insert, so the two never disagree. Reads are gated by
+settings.CURRENT_LINE_READS; writes always happen so the table is warm
+before the flag flips.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from apps.core.services.odds_trust import get_odds_trust_tier
+
+KEY_FIELDS = ('sport', 'game_id', 'sportsbook', 'odds_source', 'is_derived')
+
+LINE_FIELDS = (
+    'snapshot_id', 'trust_tier', 'source_quality', 'captured_at', 'last_seen_at',
+    'market_home_win_prob', 'moneyline_home', 'moneyline_away', 'spread', 'total',
+)
+
+REBUILD_BATCH_SIZE = 500
+
+
+def reads_enabled() -> bool:
+    return getattr(settings, 'CURRENT_LINE_READS', False)
+
+
+def _sport(model_class) -> str:
+    return model_class._meta.app_label
+
+
+def _line_from_snapshot(sport, snap):
+    from apps.core.models import CurrentLine
+
+    return CurrentLine(
+        sport=sport,
+        game_id=snap.game_id,
+        sportsbook=snap.sportsbook,
+        odds_source=snap.odds_source,
+        is_derived=snap.is_derived,
+        snapshot_id=snap.pk,
+        trust_tier=get_odds_trust_tier(snap),
+        source_quality=snap.source_quality or '',
+        captured_at=snap.captured_at,
+        last_seen_at=snap.last_seen_at or snap.captured_at,
+        market_home_win_prob=snap.market_home_win_prob,
+        moneyline_home=snap.moneyline_home,
+        moneyline_away=snap.moneyline_away,
+        spread=snap.spread,
+        total=snap.total,
+        updated_at=timezone.now(),  # bulk_create's upsert skips auto_now
+    )
+
+
+def upsert_current_lines(model_class, snapshots) -> int:
+    """Make each snapshot the current line for its key. Returns rows written.
+
+    Snapshots must already be saved. When a pass holds several rows for one
+    key the newest (captured_at, pk) wins. Not exception-safe on purpose:
+    callers run this inside the insert's transaction so a failure rolls
+    both back.
+    """
+    from apps.core.models import CurrentLine
+
+    sport = _sport(model_class)
+    newest = {}
+    for snap in snapshots:
+        if snap is None or snap.pk is None:
+            continue
+        key = (snap.game_id, snap.sportsbook, snap.odds_source, snap.is_derived)
+        held = newest.get(key)
+        if held is None or (snap.captured_at, snap.pk) > (held.captured_at, held.pk):
+            newest[key] = snap
+    if not newest:
+        return 0
+
+    CurrentLine.objects.bulk_create(
+        [_line_from_snapshot(sport, snap) for snap in newest.values()],
+        update_conflicts=True,
+        unique_fields=KEY_FIELDS,
+        update_fields=LINE_FIELDS + ('updated_at',),
+        batch_size=REBUILD_BATCH_SIZE,
+    )
+    return len(newest)
+
+
+def touch_current_lines(model_class, snapshot_ids, now) -> int:
+    """Move last_seen_at on the lines whose snapshots were just reconfirmed."""
+    from apps.core.models import CurrentLine
+
+    if not snapshot_ids:
+        return 0
+    return CurrentLine.objects.filter(
+        sport=_sport(model_class), snapshot_id__in=snapshot_ids,
+    ).update(last_seen_at=now, updated_at=now)
+
+
+def current_lines_by_game(model_class, game_ids) -> dict:
+    """{game_id: [CurrentLine, ...]} for every game in `game_ids`, one query.
+
+    Lines within a game come newest-seen first.
+    """
+    from apps.core.models import CurrentLine
+
+    out = defaultdict(list)
+    for line in CurrentLine.objects.filter(
+        sport=_sport(model_class), game_id__in=list(game_ids),
+    ).order_by('game_id', '-last_seen_at', '-captured_at'):
+        out[line.game_id].append(line)
+    return out
+
+
+def current_snapshots_by_game(model_class, game_ids) -> dict:
+    """{game_id: [snapshot, ...]} — the OddsSnapshot row behind every current
+    line, for callers that hand snapshots on. One query (the CurrentLine
+    lookup is a subquery). Newest-seen first within a game.
+    """
+    from apps.core.models import CurrentLine
+
+    current = CurrentLine.objects.filter(
+        sport=_sport(model_class), game_id__in=list(game_ids),
+    ).values('snapshot_id')
+    out = defaultdict(list)
+    for snap in model_class.objects.filter(pk__in=current).order_by(
+        'game_id', '-last_seen_at', '-captured_at',
+    ):
+        out[snap.game_id].append(snap)
+    return out
+
+
+def rebuild_current_lines(model_class, *, game_ids=None) -> int:
+    """Rebuild one sport's CurrentLine rows from OddsSnapshot.
+
+    Drops the sport's rows (or just `game_ids`' rows) and writes the newest
+    snapshot per key, ranked by (captured_at, pk) like the ingest path.
+    Returns the number of rows written.
+    """
+    from apps.core.models import CurrentLine
+
+    sport = _sport(model_class)
+    stale = CurrentLine.objects.filter(sport=sport)
+    qs = model_class.objects.all()
+    if game_ids is not None:
+        stale = stale.filter(game_id__in=game_ids)
+        qs = qs.filter(game_id__in=game_ids)
+    stale.delete()
+
+    qs = qs.annotate(recency_rank=Window(
+        expression=RowNumber(),
+        partition_by=[F('game_id'), F('sportsbook'), F('odds_source'), F('is_derived')],
+        order_by=[F('captured_at').desc(), F('pk').desc()],
+    )).filter(recency_rank=1)
+
+    written = 0
+    pending = []
+    for snap in qs.iterator(chunk_size=2000):
+        pending.append(_line_from_snapshot(sport, snap))
+        if len(pending) >= REBUILD_BATCH_SIZE:
+            CurrentLine.objects.bulk_create(pending)
+            written += len(pending)
+            pending = []
+    if pending:
+        CurrentLine.objects.bulk_create(pending)
+        written += len(pending)
+    return written
@@ -0,0 +1,266 @@
+"""Precomputed current recommendation per game — written after ingest.
+
+Every page that shows picks used to run the decision layer inline: the
+hub and Bet All call `get_recommendation` per game, the value board per
+slate row. The pick only changes when ingest does, so a post-ingest
+worker computes the house-model pick for every upcoming and live game
+once and stores it in core.CurrentRecommendation:
+
+  - refresh_current_recommendations(sport)      worker; run at the end of
+                                                `ingest_odds` and `refresh_data`
+  - prefetch_current_recommendations(sport, games, user)  slate read, one query
+  - lookup(sport, game, user)                   what get_recommendation asks
+
+A row is served only while it is fresh: same snapshot as the game's
+latest odds, same rating mode / model flags, and confirmed within
+CURRENT_RECOMMENDATION_MAX_AGE_MINUTES. Anything else — no row, a newer
+snapshot, a user whose model config differs from the house weights —
+falls back to computing inline. Users whose config equals the house
+weights get the house pick labelled 'user', which is exactly what the
+inline path produces for them.
+
+Writes always happen; reads are gated by settings.CURRENT_RECOMMENDATION_READS.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.core.sport_registry import SPORT_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+ROW_ATTR = 'prefetched_current_recommendation'
+# (user key, model source) resolved once per slate by the prefetch.
+SOURCE_ATTR = 'prefetched_current_recommendation_source'
+# Changes to these are what `changed_at` tracks.
+DECISION_FIELDS = ('pick', 'status', 'tier', 'lane')
+ROW_FIELDS = ('snapshot_id', 'model_key', 'odds_american', 'payload') + DECISION_FIELDS
+_NOT_STORED = ('game', 'sport')
+
+
+def reads_enabled() -> bool:
+    return getattr(settings, 'CURRENT_RECOMMENDATION_READS', False)
+
+
+def _max_age() -> timedelta:
+    return timedelta(minutes=int(getattr(settings, 'CURRENT_RECOMMENDATION_MAX_AGE_MINUTES', 30)))
+
+
+def model_key() -> str:
+    """Rating mode and model flags a pick depends on besides its inputs."""
+    from apps.core.services import compute_context
+    form = int(bool(getattr(settings, 'USE_STARTER_RECENT_FORM', False)))
+    return f'{compute_context.rating_mode()}|form={form}'
+
+
+def _payload(rec):
+    """JSON form of a Recommendation (None → None), normalized so it
+    compares equal to what the JSONField reads back."""
+    if rec is None:
+        return None
+    fields = {
+        f.name: getattr(rec, f.name)
+        for f in dataclasses.fields(rec) if f.name not in _NOT_STORED
+    }
+    return json.loads(json.dumps(fields))
+
+
+def _recommendation(row, game, model_source):
+    from apps.core.services.recommendations import Recommendation
+
+    if row.payload is None:
+        return None
+    rec = Recommendation(game=game, sport=row.sport, **row.payload)
+    rec.model_source = model_source
+    return rec
+
+
+def _user_key(user):
+    return user.pk if user is not None and getattr(user, 'is_authenticated', False) else None
+
+
+def _model_source_for(sport, user, entry):
+    """'house' for anonymous users, 'user' for a user whose config equals
+    the house weights, None when the user's model would pick differently."""
+    if not (user is not None and getattr(user, 'is_authenticated', False)):
+        return 'house'
+    from apps.core.services import slate
+    config = slate.user_model_config(user)
+    if config is None:
+        return 'house'
+    for name, weight in entry['house_weights'].items():
+        if getattr(config, f'{name}_weight', 1.0) != weight:
+            return None
+    return 'user'
+
+
+# --- Reads ----------------------------------------------------------------------
+
+def prefetch_current_recommendations(sport, games, user=None):
+    """Attach each game's CurrentRecommendation row (or None) in one query,
+    plus the model source `user` is served under, resolved once for the
+    slate. A user whose config differs from the house weights costs no
+    row query at all. No-op while reads are off."""
+    from apps.core.models import CurrentRecommendation
+
+    games = list(games)
+    if not (reads_enabled() and games and sport in SPORT_REGISTRY):
+        return games
+    model_source = _model_source_for(sport, user, SPORT_REGISTRY[sport])
+    rows = {}
+    if model_source is not None:
+        rows = {
+            row.game_id: row
+            for row in CurrentRecommendation.objects.filter(
+                sport=sport, model_source='house', game_id__in=[g.pk for g in games],
+            )
+        }
+    source = (_user_key(user), model_source)
+    for game in games:
+        setattr(game, ROW_ATTR, rows.get(game.pk))
+        setattr(game, SOURCE_ATTR, source)
+    return games
+
+
+def lookup(sport, game, user=None):
+    """(True, recommendation or None) when a fresh row answers
+    get_recommendation(sport, game, user); (False, None) when the caller
+    must compute inline."""
+    from apps.core.models import CurrentRecommendation
+    from apps.core.services import compute_context
+
+    entry = SPORT_REGISTRY.get(sport)
+    if not (reads_enabled() and entry and game is not None):
+        return False, None
+    # Prefetched for this user: source and row come from the slate read.
+    # For anyone else, resolve both here (the prefetch skips the rows
+    # when its user would not be served).
+    prefetched = getattr(game, SOURCE_ATTR, None)
+    use_prefetch = prefetched is not None and prefetched[0] == _user_key(user)
+    if use_prefetch:
+        model_source = prefetched[1]
+    else:
+        model_source = _model_source_for(sport, user, entry)
+    if model_source is None:
+        return False, None
+
+    if use_prefetch:
+        row = getattr(game, ROW_ATTR)
+    else:
+        row = CurrentRecommendation.objects.filter(
+            sport=sport, game_id=game.pk, model_source='house',
+        ).first()
+    if row is None:
+        return False, None
+    if row.model_key != model_key() or row.computed_at < timezone.now() - _max_age():
+        return False, None
+    if row.snapshot_id != compute_context.snapshot_key(entry['latest_odds_fn'](game)):
+        return False, None
+    return True, _recommendation(row, game, model_source)
+
+
+# --- Worker ---------------------------------------------------------------------
+
+def _slate(entry, now):
+    time_field = entry['time_field']
+    return (
+        entry['game_model'].objects
+        .filter(Q(status='scheduled', **{f'{time_field}__gte': now}) | Q(status='live'))
+        .select_related('home_team', 'away_team')
+    )
+
+
+def upcoming_games(sport, now=None):
+    """The slate the worker scores: scheduled games not yet started, plus live."""
+    return _slate(SPORT_REGISTRY[sport], now or timezone.now())
+
+
+def refresh_current_recommendations(sport, *, now=None) -> dict:
+    """Recompute the house pick for every upcoming / live game of `sport`
+    and sync CurrentRecommendation. Rows whose payload is unchanged only
+    get `computed_at` moved; games no longer on the slate lose their row.
+    Returns counts."""
+    from apps.core.models import CurrentRecommendation
+    from apps.core.services import compute_context
+    from apps.core.services.recommendations import _compute_recommendation
+
+    entry = SPORT_REGISTRY[sport]
+    now = now or timezone.now()
+    key = model_key()
+
+    existing = {
+        row.game_id: row
+        for row in CurrentRecommendation.objects.filter(sport=sport, model_source='house')
+    }
+    to_create, to_update, unchanged = [], [], []
+    seen = set()
+    for data in entry['compute_slate_fn'](_slate(entry, now), None):
+        game = data['game']
+        seen.add(game.pk)
+        rec = _compute_recommendation(sport, game, None, data)
+        payload = _payload(rec)
+        values = {
+            'snapshot_id': compute_context.snapshot_key(data.get('latest_odds')),
+            'model_key': key,
+            'pick': rec.pick if rec else '',
+            'odds_american': rec.odds_american if rec else None,
+            'status': rec.status if rec else '',
+            'tier': rec.tier if rec else '',
+            'lane': rec.lane if rec else '',
+            'payload': payload,
+        }
+        row = existing.get(game.pk)
+        if row is None:
+            to_create.append(CurrentRecommendation(
+                sport=sport, game_id=game.pk, model_source='house',
+                computed_at=now, changed_at=now, **values,
+            ))
+            continue
+        if all(getattr(row, name) == value for name, value in values.items()):
+            unchanged.append(row.pk)
+            continue
+        if any(getattr(row, name) != values[name] for name in DECISION_FIELDS):
+            row.changed_at = now
+        for name, value in values.items():
+            setattr(row, name, value)
+        row.computed_at = now
+        to_update.append(row)
+
+    if to_create:
+        CurrentRecommendation.objects.bulk_create(to_create)
+    if to_update:
+        CurrentRecommendation.objects.bulk_update(
+            to_update, ['computed_at', 'changed_at', *ROW_FIELDS],
+        )
+    if unchanged:
+        CurrentRecommendation.objects.filter(pk__in=unchanged).update(computed_at=now)
+    gone = [row.pk for game_id, row in existing.items() if game_id not in seen]
+    if gone:
+        CurrentRecommendation.objects.filter(pk__in=gone).delete()
+
+    return {
+        'games': len(seen),
+        'created': len(to_create),
+        'changed': len(to_update),
+        'unchanged': len(unchanged),
+        'deleted': len(gone),
+    }
+
+
+def refresh_after_ingest(sport) -> dict | None:
+    """refresh_current_recommendations for the end of an ingest command.
+    None for sports without per-game picks (golf); never raises."""
+    if sport not in SPORT_REGISTRY:
+        return None
+    try:
+        return refresh_current_recommendations(sport)
+    except Exception as exc:  # noqa: BLE001 — readers fall back to inline
+        logger.warning('current recommendation refresh failed sport=%s: %s', sport, exc)
+        return None
@@ -40,6 +40,7 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 
 from django.conf import settings
+from django.db import transaction
 
 
 # Initial Elo rating for any team that has not been processed yet — the
@@ -367,12 +368,58 @@ def get_game_model(sport: str):
 # Persistence-layer helpers (rebuild/update commands compose these)
 
 
+def _apply_result(sport: str, home_pre: float, away_pre: float,
+                  home_score, away_score, neutral: bool):
+    """One game's Elo update from pre-game ratings and the final score.
+
+    Returns (new_home, new_away, home_won, margin_for_history, mult).
+    Shared by process_game and the in-memory replay so both paths apply
+    exactly the same math.
+    """
+    margin = abs(int(home_score) - int(away_score))
+    home_won = home_score > away_score
+    new_home, new_away, _delta, mult = update_ratings(
+        home_pre, away_pre, home_won, margin, sport, neutral_site=neutral,
+    )
+    # MLB/college_baseball don't use margin in their Elo update, so we
+    # store None to make that explicit in the history (rather than the
+    # raw run-differential, which could be misread as causal).
+    margin_for_history = margin if sport in MARGIN_AWARE_SPORTS else None
+    return new_home, new_away, home_won, margin_for_history, mult
+
+
+def _history_rows(sport: str, game_id, home_id, away_id, home_pre, away_pre,
+                  new_home, new_away, home_won, margin, mult):
+    """The two unsaved TeamEloHistory rows (home, away) for one game."""
+    from apps.analytics.models import TeamEloHistory
+
+    entry = SPORT_ELO_REGISTRY[sport]
+    common = {
+        'sport': sport,
+        f'{entry.history_game_fk}_id': game_id,
+        'k_factor': K_FACTORS[sport],
+        'margin': margin,
+        'margin_multiplier': mult,
+    }
+    return [
+        TeamEloHistory(
+            **common, **{f'{entry.history_team_fk}_id': home_id},
+            pre_rating=home_pre, post_rating=new_home, is_home=True, won=home_won,
+        ),
+        TeamEloHistory(
+            **common, **{f'{entry.history_team_fk}_id': away_id},
+            pre_rating=away_pre, post_rating=new_away, is_home=False, won=not home_won,
+        ),
+    ]
+
+
 def process_game(sport: str, game) -> bool:
     """Apply one game's Elo update + persist team ratings + history rows.
 
     Idempotent w.r.t. itself: a TeamEloHistory row already existing for
-    this game causes a no-op. The caller (rebuild/update commands) is
-    responsible for choosing which games to feed in.
+    this game causes a no-op. The caller is responsible for choosing
+    which games to feed in; the rebuild/update commands replay whole
+    backlogs through `rebuild_sport` / `update_sport` instead.
 
     Returns True on update, False when skipped (already-processed, ties,
     missing scores).
@@ -402,12 +449,9 @@ def process_game(sport: str, game) -> bool:
     home_pre = home.elo_rating if home.elo_rating is not None else INITIAL_RATING
     away_pre = away.elo_rating if away.elo_rating is not None else INITIAL_RATING
 
-    margin = abs(int(game.home_score) - int(game.away_score))
-    home_won = game.home_score > game.away_score
-    neutral = bool(getattr(game, 'neutral_site', False))
-
-    new_home, new_away, delta, mult = update_ratings(
-        home_pre, away_pre, home_won, margin, sport, neutral_site=neutral,
+    new_home, new_away, home_won, margin, mult = _apply_result(
+        sport, home_pre, away_pre, game.home_score, game.away_score,
+        bool(getattr(game, 'neutral_site', False)),
     )
 
     game_time = getattr(game, entry.time_field)
@@ -417,35 +461,135 @@ def process_game(sport: str, game) -> bool:
     away.elo_rating = new_away
     away.elo_last_updated = game_time
     away.save(update_fields=['elo_rating', 'elo_last_updated'])
+    from apps.core.services import recommendation_cache
+    recommendation_cache.bump(sport, 'inputs')
 
-    # MLB/college_baseball don't use margin in their Elo update, so we
-    # store None to make that explicit in the history (rather than the
-    # raw run-differential, which could be misread as causal).
-    margin_for_history = margin if sport in MARGIN_AWARE_SPORTS else None
+    TeamEloHistory.objects.bulk_create(_history_rows(
+        sport, game.pk, home.pk, away.pk, home_pre, away_pre,
+        new_home, new_away, home_won, margin, mult,
+    ))
+    return True
 
-    TeamEloHistory.objects.create(
-        sport=sport,
-        **{entry.history_team_fk: home, entry.history_game_fk: game},
-        pre_rating=home_pre,
-        post_rating=new_home,
-        k_factor=K_FACTORS[sport],
-        is_home=True,
-        won=home_won,
-        margin=margin_for_history,
-        margin_multiplier=mult,
+
+# History rows per bulk_create and teams per bulk_update when replaying.
+REPLAY_BATCH_SIZE = 2000
+
+
+def _replay(sport: str, games, ratings: dict, *, batch_size: int = REPLAY_BATCH_SIZE) -> dict:
+    """Apply `games` in order against `ratings` (team id → Elo or None)
+    without touching the database per game.
+
+    `games` yields (id, home_team_id, away_team_id, home_score,
+    away_score, game_time, neutral_site) tuples in chronological order.
+    Ratings live in the dict, so a team playing twice in the backlog
+    always starts its second game from its first game's result. History
+    rows are written with chunked bulk_create and the touched teams with
+    one bulk_update at the end. Returns counts.
+    """
+    from apps.analytics.models import TeamEloHistory
+
+    pending = []
+    last_played = {}
+    processed = skipped = 0
+    for game_id, home_id, away_id, home_score, away_score, game_time, neutral in games:
+        if home_score is None or away_score is None or home_score == away_score:
+            skipped += 1
+            continue
+        home_pre = ratings.get(home_id)
+        home_pre = home_pre if home_pre is not None else INITIAL_RATING
+        away_pre = ratings.get(away_id)
+        away_pre = away_pre if away_pre is not None else INITIAL_RATING
+
+        new_home, new_away, home_won, margin, mult = _apply_result(
+            sport, home_pre, away_pre, home_score, away_score, bool(neutral),
+        )
+        ratings[home_id] = new_home
+        ratings[away_id] = new_away
+        last_played[home_id] = game_time
+        last_played[away_id] = game_time
+        pending.extend(_history_rows(
+            sport, game_id, home_id, away_id, home_pre, away_pre,
+            new_home, new_away, home_won, margin, mult,
+        ))
+        processed += 1
+        if len(pending) >= batch_size:
+            TeamEloHistory.objects.bulk_create(pending)
+            pending = []
+    if pending:
+        TeamEloHistory.objects.bulk_create(pending)
+
+    teams = [
+        team for team in get_team_model(sport).objects.only('pk', 'elo_rating', 'elo_last_updated')
+        if team.pk in last_played
+    ]
+    for team in teams:
+        team.elo_rating = ratings[team.pk]
+        team.elo_last_updated = last_played[team.pk]
+    get_team_model(sport).objects.bulk_update(
+        teams, ['elo_rating', 'elo_last_updated'], batch_size=batch_size,
     )
-    TeamEloHistory.objects.create(
-        sport=sport,
-        **{entry.history_team_fk: away, entry.history_game_fk: game},
-        pre_rating=away_pre,
-        post_rating=new_away,
-        k_factor=K_FACTORS[sport],
-        is_home=False,
-        won=not home_won,
-        margin=margin_for_history,
-        margin_multiplier=mult,
+    if processed:
+        from apps.core.services import recommendation_cache
+        recommendation_cache.bump(sport, 'inputs')
+    return {'processed': processed, 'skipped': skipped, 'teams': len(teams)}
+
+
+def _final_games(sport: str):
+    entry = SPORT_ELO_REGISTRY[sport]
+    return (
+        get_game_model(sport).objects
+        .filter(status='final', home_score__isnull=False, away_score__isnull=False)
+        .order_by(entry.time_field)
     )
-    return True
+
+
+def _result_rows(qs, sport: str, batch_size: int):
+    entry = SPORT_ELO_REGISTRY[sport]
+    return qs.values_list(
+        'id', 'home_team_id', 'away_team_id', 'home_score', 'away_score',
+        entry.time_field, 'neutral_site',
+    ).iterator(chunk_size=batch_size)
+
+
+def rebuild_sport(sport: str, *, batch_size: int = REPLAY_BATCH_SIZE) -> dict:
+    """Wipe the sport's Elo state and replay every final game in memory.
+
+    Streams the games once in chronological order and writes history and
+    ratings in bulk, in one transaction. Produces the same ratings and
+    history as feeding each game to `process_game` in order. Returns
+    counts, plus `teams_reset`.
+    """
+    with transaction.atomic():
+        cleared = reset_sport(sport)
+        stats = _replay(
+            sport, _result_rows(_final_games(sport), sport, batch_size), {},
+            batch_size=batch_size,
+        )
+    stats['teams_reset'] = cleared
+    return stats
+
+
+def update_sport(sport: str, *, batch_size: int = REPLAY_BATCH_SIZE) -> dict:
+    """Replay final games not yet in TeamEloHistory on top of the current
+    team ratings — the incremental counterpart of `rebuild_sport`, with
+    the same engine and the same result. Returns counts."""
+    from apps.analytics.models import TeamEloHistory
+
+    entry = SPORT_ELO_REGISTRY[sport]
+    with transaction.atomic():
+        # Pull the set of game ids already represented in TeamEloHistory.
+        # Pre-filtering on the server side keeps the iteration cheap even
+        # on a multi-season backlog.
+        already_processed = set(
+            TeamEloHistory.objects
+            .filter(sport=sport)
+            .exclude(**{f'{entry.history_game_fk}__isnull': True})
+            .values_list(f'{entry.history_game_fk}_id', flat=True)
+            .distinct()
+        )
+        ratings = dict(get_team_model(sport).objects.values_list('pk', 'elo_rating'))
+        games = _final_games(sport).exclude(id__in=already_processed)
+        return _replay(sport, _result_rows(games, sport, batch_size), ratings, batch_size=batch_size)
 
 
 def reset_sport(sport: str) -> int:
@@ -457,4 +601,6 @@ def reset_sport(sport: str) -> int:
     from apps.analytics.models import TeamEloHistory
     TeamEloHistory.objects.filter(sport=sport).delete()
     TeamModel = get_team_model(sport)
+    from apps.core.services import recommendation_cache
+    recommendation_cache.bump(sport, 'inputs')
     return TeamModel.objects.update(elo_rating=None, elo_last_updated=None)
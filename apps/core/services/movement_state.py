@@ -0,0 +1,316 @@
+"""Persisted running movement state — sport-agnostic.
+
+apps.core.services.odds_movement scores a (game, sportsbook) by re-reading
+its last N snapshots and re-walking them on every call. This module keeps
+the reduced form of that walk in OddsMovementState, one row per
+(sport, game, sportsbook, market), updated as each ingest pass lands:
+
+  - record_snapshots(model_class, snapshots)   write side, one SELECT +
+                                               bulk create/update per pass
+  - movement_result_from_state(...)            per-book score, one read
+  - pick_signal_from_state(...)                all-books moneyline signal
+                                               for movement_signal_for_pick
+  - rebuild_movement_state(model_class)        replay history into the table
+
+Equivalence with the windowed math is by construction: the row keeps the
+same bounded window (last HISTORY_MAX_SNAPSHOTS snapshots, or
+CROSS_BOOK_MAX_SNAPSHOTS across books) and its aggregates come from
+odds_movement._market_aggregates, which _per_market_signal also uses. A
+window can't be maintained from counters alone — an evicted observation
+has to be subtracted back out — so the ring is stored alongside them.
+Updates are constant-bounded by the window size.
+
+Reads are gated by settings.MOVEMENT_STATE_READS; writes always happen so
+the table is warm before the flag flips.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.utils import timezone
+
+from apps.core.services.odds_movement import (
+    CROSS_BOOK_MAX_SNAPSHOTS,
+    HISTORY_MAX_HOURS,
+    HISTORY_MAX_SNAPSHOTS,
+    MARKET_ATTRS,
+    MovementResult,
+    _market_aggregates,
+    _result_from_signals,
+    _signal_from_aggregates,
+)
+
+logger = logging.getLogger(__name__)
+
+# sportsbook value for the per-game, every-book rows
+ALL_BOOKS = '*'
+
+# Markets tracked on the all-books rows (movement_signal_for_pick is
+# moneyline-only).
+CROSS_BOOK_MARKETS = ('moneyline_home', 'moneyline_away')
+
+REBUILD_BATCH_SIZE = 500
+
+
+def _sport(model_class) -> str:
+    return model_class._meta.app_label
+
+
+def _state_slots(snapshot):
+    """(sportsbook, market, window cap) for every state row a snapshot feeds."""
+    for attr in MARKET_ATTRS:
+        yield snapshot.sportsbook, attr, HISTORY_MAX_SNAPSHOTS
+    for attr in CROSS_BOOK_MARKETS:
+        yield ALL_BOOKS, attr, CROSS_BOOK_MAX_SNAPSHOTS
+
+
+def _entry_time(entry) -> datetime:
+    return datetime.fromisoformat(entry[0])
+
+
+def _observations(window, cutoff=None):
+    """Non-null (captured_at, price) pairs from a window, oldest→newest."""
+    pairs = []
+    for entry in window:
+        t = _entry_time(entry)
+        if cutoff is not None and t < cutoff:
+            continue
+        if entry[1] is not None:
+            pairs.append((t, entry[1]))
+    return pairs
+
+
+def _refresh_aggregates(state):
+    pairs = _observations(state.window)
+    state.observation_count = len(pairs)
+    agg = _market_aggregates(pairs, state.market)
+    if agg is None:
+        t, v = pairs[-1] if pairs else (None, None)
+        state.first_at = state.last_at = state.last_move_at = t
+        state.first_price = state.last_price = v
+        state.signed_delta = 0.0
+        state.up_moves = state.down_moves = 0
+        return
+    state.first_at = agg['first_at']
+    state.first_price = agg['first_price']
+    state.last_at = agg['last_at']
+    state.last_price = agg['last_price']
+    state.signed_delta = agg['signed_delta']
+    state.up_moves = agg['up_moves']
+    state.down_moves = agg['down_moves']
+    state.last_move_at = agg['last_move_at']
+
+
+def _advance(state, snapshot, cap, cutoff):
+    """Push one snapshot into a state's window and re-derive its aggregates.
+
+    Normally an append; an out-of-order snapshot is slotted into place so
+    the ring stays sorted the way the windowed query orders rows.
+    """
+    entry = [snapshot.captured_at.isoformat(), getattr(snapshot, state.market, None), snapshot.pk]
+    window = [e for e in state.window if _entry_time(e) >= cutoff] + [entry]
+    window.sort(key=lambda e: (_entry_time(e), e[2] or 0))
+    state.window = window[-cap:]
+    state.last_snapshot_id = window[-1][2]
+    _refresh_aggregates(state)
+
+
+def _signal(state, attr, cutoff) -> Optional[dict]:
+    """Per-market signal dict (same shape as _per_market_signal) from a row."""
+    if state.window and _entry_time(state.window[0]) >= cutoff:
+        if state.observation_count < 2:
+            return None
+        return _signal_from_aggregates({
+            'first_at': state.first_at,
+            'first_price': state.first_price,
+            'last_at': state.last_at,
+            'last_price': state.last_price,
+            'signed_delta': state.signed_delta,
+            'up_moves': state.up_moves,
+            'down_moves': state.down_moves,
+            'last_move_at': state.last_move_at,
+        }, attr)
+    # Part of the ring has aged out of the history window — re-derive.
+    agg = _market_aggregates(_observations(state.window, cutoff), attr)
+    if agg is None:
+        return None
+    return _signal_from_aggregates(agg, attr)
+
+
+def _in_window(state, cutoff) -> int:
+    return sum(1 for e in state.window if _entry_time(e) >= cutoff)
+
+
+def record_snapshots(model_class, snapshots) -> dict:
+    """Fold freshly created snapshots into their state rows.
+
+    One SELECT for every touched row, then one bulk_create for new keys and
+    one bulk_update for existing ones. Returns the state rows keyed by
+    (game_id, sportsbook, market) so callers scoring the same pass don't
+    need to re-read them.
+
+    Exception-safe: failures log and return {} — the rebuild command can
+    always bring the table back in line with OddsSnapshot.
+    """
+    from apps.core.models import OddsMovementState
+
+    snapshots = sorted(
+        (s for s in snapshots if s is not None and s.pk is not None),
+        key=lambda s: (s.captured_at, s.pk),
+    )
+    if not snapshots:
+        return {}
+
+    try:
+        sport = _sport(model_class)
+        cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+        game_ids = {s.game_id for s in snapshots}
+        books = {s.sportsbook for s in snapshots} | {ALL_BOOKS}
+        states = {
+            (st.game_id, st.sportsbook, st.market): st
+            for st in OddsMovementState.objects.filter(
+                sport=sport, game_id__in=game_ids, sportsbook__in=books,
+            )
+        }
+        existing = set(states)
+
+        for snap in snapshots:
+            for book, market, cap in _state_slots(snap):
+                key = (snap.game_id, book, market)
+                state = states.get(key)
+                if state is None:
+                    state = OddsMovementState(
+                        sport=sport, game_id=snap.game_id,
+                        sportsbook=book, market=market, window=[],
+                    )
+                    states[key] = state
+                _advance(state, snap, cap, cutoff)
+
+        now = timezone.now()
+        created = [st for key, st in states.items() if key not in existing]
+        updated = [st for key, st in states.items() if key in existing]
+        for st in updated:
+            st.updated_at = now  # bulk_update skips auto_now
+        if created:
+            OddsMovementState.objects.bulk_create(created, batch_size=REBUILD_BATCH_SIZE)
+        if updated:
+            OddsMovementState.objects.bulk_update(updated, [
+                'window', 'observation_count', 'first_price', 'first_at',
+                'last_price', 'last_at', 'signed_delta', 'up_moves',
+                'down_moves', 'last_move_at', 'last_snapshot_id', 'updated_at',
+            ], batch_size=REBUILD_BATCH_SIZE)
+        return states
+    except Exception as exc:  # noqa: BLE001 — telemetry must not break ingestion
+        logger.warning('record_snapshots failed: %s', exc)
+        return {}
+
+
+def movement_result_from_state(model_class, game_id, sportsbook, *, states=None):
+    """compute_movement_score for one (game, sportsbook), read from state.
+
+    Returns (found, MovementResult | None). found=False means there is no
+    state for the pair and the caller should fall back to the windowed read.
+    `states` lets a caller pass rows it already holds (see record_snapshots).
+    """
+    from apps.core.models import OddsMovementState
+
+    if states is None:
+        rows = {
+            st.market: st for st in OddsMovementState.objects.filter(
+                sport=_sport(model_class), game_id=game_id, sportsbook=sportsbook,
+            )
+        }
+    else:
+        rows = {
+            attr: states[(game_id, sportsbook, attr)]
+            for attr in MARKET_ATTRS if (game_id, sportsbook, attr) in states
+        }
+    if not rows:
+        return False, None
+
+    cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+    # Every market row shares the same ring of snapshots.
+    if _in_window(next(iter(rows.values())), cutoff) < 2:
+        return True, None
+    result: Optional[MovementResult] = _result_from_signals(
+        _signal(rows[attr], attr, cutoff) if attr in rows else None
+        for attr in MARKET_ATTRS
+    )
+    return True, result
+
+
+def pick_signal_from_state(model_class, game, attr):
+    """All-books moneyline signal for movement_signal_for_pick.
+
+    Returns (found, signal dict | None) with the same semantics as
+    movement_result_from_state.
+    """
+    from apps.core.models import OddsMovementState
+
+    state = OddsMovementState.objects.filter(
+        sport=_sport(model_class), game_id=game.pk,
+        sportsbook=ALL_BOOKS, market=attr,
+    ).first()
+    if state is None:
+        return False, None
+    cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+    if _in_window(state, cutoff) < 2:
+        return True, None
+    return True, _signal(state, attr, cutoff)
+
+
+def rebuild_movement_state(model_class, *, game_ids=None) -> int:
+    """Replay snapshot history into OddsMovementState for one sport.
+
+    Drops the sport's existing rows (or just `game_ids`' rows) and folds
+    every snapshot inside the history window back in, game by game, in
+    (captured_at, pk) order. Anything older than HISTORY_MAX_HOURS is
+    outside every window the scorer reads, so it isn't replayed.
+
+    Returns the number of state rows written.
+    """
+    from apps.core.models import OddsMovementState
+
+    sport = _sport(model_class)
+    cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+
+    stale = OddsMovementState.objects.filter(sport=sport)
+    qs = model_class.objects.filter(captured_at__gte=cutoff)
+    if game_ids is not None:
+        stale = stale.filter(game_id__in=game_ids)
+        qs = qs.filter(game_id__in=game_ids)
+    stale.delete()
+
+    qs = qs.only(
+        'pk', 'game_id', 'sportsbook', 'captured_at', *MARKET_ATTRS,
+    ).order_by('game_id', 'captured_at', 'pk')
+
+    written = 0
+    pending = []
+    current_game = None
+    states = {}
+    for snap in qs.iterator(chunk_size=2000):
+        if snap.game_id != current_game:
+            pending.extend(states.values())
+            states = {}
+            current_game = snap.game_id
+        for book, market, cap in _state_slots(snap):
+            state = states.get((book, market))
+            if state is None:
+                state = OddsMovementState(
+                    sport=sport, game_id=snap.game_id,
+                    sportsbook=book, market=market, window=[],
+                )
+                states[(book, market)] = state
+            _advance(state, snap, cap, cutoff)
+        if len(pending) >= REBUILD_BATCH_SIZE:
+            OddsMovementState.objects.bulk_create(pending, batch_size=REBUILD_BATCH_SIZE)
+            written += len(pending)
+            pending = []
+    pending.extend(states.values())
+    if pending:
+        OddsMovementState.objects.bulk_create(pending, batch_size=REBUILD_BATCH_SIZE)
+        written += len(pending)
+    return written
@@ -36,6 +36,7 @@ from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import List, Optional, Sequence
 
+from django.conf import settings
 from django.utils import timezone
 
 from apps.core.utils.odds import american_to_implied_prob, devig_two_way
@@ -48,6 +49,12 @@ SIGNIFICANCE_SPREAD_POINTS = 0.5   # spread or total points moved
 HISTORY_MAX_SNAPSHOTS = 10
 HISTORY_MAX_HOURS = 24
 
+# movement_signal_for_pick reads across every book for a game
+CROSS_BOOK_MAX_SNAPSHOTS = HISTORY_MAX_SNAPSHOTS * 3
+
+# Snapshot attributes scored as independent markets, in tie-break order.
+MARKET_ATTRS = ('moneyline_home', 'moneyline_away', 'spread', 'total')
+
 # Score component weights — must sum to 1.0
 W_MAGNITUDE = 0.40
 W_SPEED = 0.25
@@ -267,24 +274,72 @@ def _per_market_signal(snapshots: Sequence, attr: str) -> Optional[dict]:
     values = [(s.captured_at, getattr(s, attr, None)) for s in snapshots]
     # Filter to rows that actually have this market
     pairs = [(t, v) for t, v in values if v is not None]
+    aggregates = _market_aggregates(pairs, attr)
+    if aggregates is None:
+        return None
+    return _signal_from_aggregates(aggregates, attr)
+
+
+def _market_aggregates(pairs: Sequence, attr: str) -> Optional[dict]:
+    """Reduce a market's (captured_at, price) observations to the running
+    totals the score is built from.
+
+    Split out of _per_market_signal so the persisted movement state
+    (apps.core.services.movement_state) stores exactly these numbers and
+    feeds them back through _signal_from_aggregates — one formula, two
+    storage strategies. `pairs` are non-null observations, oldest→newest.
+    """
     if len(pairs) < 2:
         return None
 
     first_t, first_v = pairs[0]
     last_t, last_v = pairs[-1]
+    is_moneyline = attr in ('moneyline_home', 'moneyline_away')
+
+    if is_moneyline:
+        signed = cents_signed_delta(first_v, last_v)
+    else:  # spread or total
+        signed = last_v - first_v
+
+    # Step-to-step direction counts and the last step that changed price
+    up_moves = down_moves = 0
+    last_move_t = last_t
+    for (_, v_prev), (t_next, v_next) in zip(pairs[:-1], pairs[1:]):
+        d = cents_signed_delta(v_prev, v_next) if is_moneyline else v_next - v_prev
+        if d > 0:
+            up_moves += 1
+        elif d < 0:
+            down_moves += 1
+        if v_next != v_prev:
+            last_move_t = t_next
+
+    return {
+        'first_at': first_t,
+        'first_price': first_v,
+        'last_at': last_t,
+        'last_price': last_v,
+        'signed_delta': signed,
+        'up_moves': up_moves,
+        'down_moves': down_moves,
+        'last_move_at': last_move_t,
+    }
+
+
+def _signal_from_aggregates(aggregates: dict, attr: str) -> dict:
+    """Turn _market_aggregates output into magnitude / speed / consistency /
+    timing components (each 0..100)."""
+    signed = aggregates['signed_delta']
+    magnitude_raw = abs(signed)
 
     # Magnitude — pick the appropriate normalizer
     if attr in ('moneyline_home', 'moneyline_away'):
-        magnitude_raw = cents_moved(first_v, last_v)
         magnitude = _normalize_magnitude_cents(magnitude_raw)
-        signed = cents_signed_delta(first_v, last_v)
-    else:  # spread or total
-        magnitude_raw = abs(last_v - first_v)
+    else:
         magnitude = _normalize_magnitude_points(magnitude_raw)
-        signed = last_v - first_v
 
     # Speed — magnitude / hours elapsed, capped
-    elapsed_hours = max(0.05, (last_t - first_t).total_seconds() / 3600.0)
+    elapsed = aggregates['last_at'] - aggregates['first_at']
+    elapsed_hours = max(0.05, elapsed.total_seconds() / 3600.0)
     if attr in ('moneyline_home', 'moneyline_away'):
         speed = _normalize_speed_cents_per_hour(magnitude_raw / elapsed_hours)
     else:
@@ -293,28 +348,15 @@ def _per_market_signal(snapshots: Sequence, attr: str) -> Optional[dict]:
         speed = _normalize_speed_cents_per_hour(cph_eq)
 
     # Direction consistency — fraction of step-to-step deltas in dominant direction
-    deltas = []
-    for (_, v_prev), (_, v_next) in zip(pairs[:-1], pairs[1:]):
-        if attr in ('moneyline_home', 'moneyline_away'):
-            d = cents_signed_delta(v_prev, v_next)
-        else:
-            d = v_next - v_prev
-        if d != 0:
-            deltas.append(1 if d > 0 else -1)
-    if deltas:
-        ups = deltas.count(1)
-        downs = deltas.count(-1)
-        consistency = 100.0 * max(ups, downs) / len(deltas)
+    ups = aggregates['up_moves']
+    downs = aggregates['down_moves']
+    if ups or downs:
+        consistency = 100.0 * max(ups, downs) / (ups + downs)
     else:
         consistency = 0.0
 
     # Timing — minutes since the last non-zero step
-    last_move_t = last_t
-    for (t_prev, v_prev), (t_next, v_next) in reversed(list(zip(pairs[:-1], pairs[1:]))):
-        if v_next != v_prev:
-            last_move_t = t_next
-            break
-    minutes_since = (timezone.now() - last_move_t).total_seconds() / 60.0
+    minutes_since = (timezone.now() - aggregates['last_move_at']).total_seconds() / 60.0
     timing = _timing_weight(minutes_since)
 
     return {
@@ -382,10 +424,16 @@ def compute_movement_score(snapshots: Sequence) -> Optional[MovementResult]:
     """
     if not snapshots or len(snapshots) < 2:
         return None
+    return _result_from_signals(
+        _per_market_signal(snapshots, attr) for attr in MARKET_ATTRS
+    )
+
 
+def _result_from_signals(signals) -> Optional[MovementResult]:
+    """Weight each market's components into a score and keep the dominant
+    market. `signals` may contain None for markets without a signal."""
     candidates = []
-    for attr in ('moneyline_home', 'moneyline_away', 'spread', 'total'):
-        sig = _per_market_signal(snapshots, attr)
+    for sig in signals:
         if sig is None:
             continue
         score = (
@@ -466,6 +514,9 @@ def apply_movement_intelligence(model_class, snapshot) -> Optional[MovementResul
     logger = logging.getLogger(__name__)
 
     try:
+        from apps.core.services.movement_state import record_snapshots
+        states = record_snapshots(model_class, [snapshot])
+
         prev = (
             model_class.objects
             .filter(game=snapshot.game, sportsbook=snapshot.sportsbook,
@@ -476,13 +527,20 @@ def apply_movement_intelligence(model_class, snapshot) -> Optional[MovementResul
         if prev is None or not is_significant(prev, snapshot):
             return None
 
-        history = recent_snapshots_for_book(
-            model_class, snapshot.game, snapshot.sportsbook,
-        )
-        # Ensure the new snapshot is in the history (it usually is).
-        if not history or history[-1].pk != snapshot.pk:
-            history = history + [snapshot]
-        result = compute_movement_score(history)
+        found = False
+        if getattr(settings, 'MOVEMENT_STATE_READS', False):
+            from apps.core.services.movement_state import movement_result_from_state
+            found, result = movement_result_from_state(
+                model_class, snapshot.game_id, snapshot.sportsbook, states=states,
+            )
+        if not found:
+            history = recent_snapshots_for_book(
+                model_class, snapshot.game, snapshot.sportsbook,
+            )
+            # Ensure the new snapshot is in the history (it usually is).
+            if not history or history[-1].pk != snapshot.pk:
+                history = history + [snapshot]
+            result = compute_movement_score(history)
         if result is None:
             return None
 
@@ -496,6 +554,118 @@ def apply_movement_intelligence(model_class, snapshot) -> Optional[MovementResul
         return None
 
 
+def apply_movement_intelligence_batch(model_class, snapshots) -> dict:
+    """Set-based twin of apply_movement_intelligence for a whole ingest pass.
+
+    Providers that create every snapshot of a fetch in one go hand the
+    fresh rows here instead of calling the per-row hook N times. The
+    per-row hook costs 2–3 queries per snapshot; this costs two in total
+    (plus the OddsMovementState write, see movement_state.record_snapshots):
+
+      1. One windowed SELECT — ROW_NUMBER() over (game, sportsbook) by
+         recency — that pulls the newest rows for every touched pair,
+         deep enough to cover both the previous snapshot and the
+         HISTORY_MAX_SNAPSHOTS history window.
+      2. One bulk UPDATE of snapshot_type/movement_score/movement_class
+         for the rows that crossed the significance threshold.
+
+    Significance and scoring run in memory through the same is_significant /
+    compute_movement_score calls, so results match the per-row path.
+
+    Returns {snapshot pk: MovementResult} for the rows that were upgraded.
+    Exception-safe like the per-row hook: failures log and return {}.
+    """
+    import logging
+    from collections import defaultdict
+
+    from django.db.models import F, Window
+    from django.db.models.functions import RowNumber
+
+    logger = logging.getLogger(__name__)
+
+    snapshots = [s for s in snapshots if s is not None and s.pk is not None]
+    if not snapshots:
+        return {}
+
+    try:
+        from apps.core.services.movement_state import (
+            movement_result_from_state,
+            record_snapshots,
+        )
+        states = record_snapshots(model_class, snapshots)
+        state_reads = bool(states) and getattr(settings, 'MOVEMENT_STATE_READS', False)
+
+        fresh_by_key = defaultdict(list)
+        for snap in snapshots:
+            fresh_by_key[(snap.game_id, snap.sportsbook)].append(snap)
+
+        # Each fresh row in a pair can push the previous snapshot one rank
+        # deeper, so over-pull by the largest per-pair batch size. With
+        # state reads on, history comes from the state rows and only the
+        # previous snapshot is needed from here.
+        window = 1 if state_reads else HISTORY_MAX_SNAPSHOTS
+        depth = window + max(len(v) for v in fresh_by_key.values())
+        rows = (
+            model_class.objects
+            .filter(
+                game_id__in={k[0] for k in fresh_by_key},
+                sportsbook__in={k[1] for k in fresh_by_key},
+                captured_at__lte=max(s.captured_at for s in snapshots),
+            )
+            .annotate(recency_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F('game_id'), F('sportsbook')],
+                order_by=[F('captured_at').desc(), F('pk').desc()],
+            ))
+            .filter(recency_rank__lte=depth)
+        )
+        history_by_key = defaultdict(list)
+        for row in rows:
+            key = (row.game_id, row.sportsbook)
+            if key in fresh_by_key:
+                history_by_key[key].append(row)
+
+        cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+        results = {}
+        changed = []
+        for key, fresh in fresh_by_key.items():
+            # newest → oldest, matching the per-row hook's ordering
+            stored = sorted(history_by_key.get(key, []),
+                            key=lambda r: (r.captured_at, r.pk), reverse=True)
+            for snap in fresh:
+                prev = next((r for r in stored if r.captured_at < snap.captured_at), None)
+                if prev is None or not is_significant(prev, snap):
+                    continue
+
+                if state_reads:
+                    _, result = movement_result_from_state(
+                        model_class, snap.game_id, snap.sportsbook, states=states,
+                    )
+                else:
+                    history = [r for r in stored if r.captured_at >= cutoff][:HISTORY_MAX_SNAPSHOTS]
+                    history.reverse()
+                    if not history or history[-1].pk != snap.pk:
+                        history = history + [snap]
+                    result = compute_movement_score(history)
+                if result is None:
+                    continue
+
+                snap.snapshot_type = 'significant'
+                snap.movement_score = result.score
+                snap.movement_class = result.classification
+                changed.append(snap)
+                results[snap.pk] = result
+
+        if changed:
+            model_class.objects.bulk_update(
+                changed, ['snapshot_type', 'movement_score', 'movement_class'],
+            )
+        return results
+    except Exception as exc:  # noqa: BLE001 — telemetry must not break ingestion
+        logger.warning('apply_movement_intelligence_batch failed: %s', exc)
+        return {}
+
+
 # --- Decision-layer helper --------------------------------------------------
 
 def movement_signal_for_pick(snapshot_model, game, pick_side: str) -> dict:
@@ -523,7 +693,19 @@ def movement_signal_for_pick(snapshot_model, game, pick_side: str) -> dict:
 
     Returns all-None / False on failure or insufficient data — callers can
     treat the result as "no signal" without special-casing.
+
+    Memoized per (game, side) inside a compute_context.computation_context.
     """
+    from apps.core.services import compute_context
+    if compute_context.active() and game is not None:
+        return dict(compute_context.memoize(
+            ('movement_signal', snapshot_model._meta.label, game.pk, pick_side),
+            lambda: _movement_signal_for_pick(snapshot_model, game, pick_side),
+        ))
+    return _movement_signal_for_pick(snapshot_model, game, pick_side)
+
+
+def _movement_signal_for_pick(snapshot_model, game, pick_side: str) -> dict:
     empty = {
         'movement_class': None,
         'movement_score': None,
@@ -537,23 +719,31 @@ def movement_signal_for_pick(snapshot_model, game, pick_side: str) -> dict:
         return empty
 
     try:
-        # Pull the most recent significant snapshot's history. We deliberately
-        # look across *all* sportsbooks for a game and pick the consensus
-        # signal — recommendation fires once per game, not per book.
-        cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
-        snaps = list(
-            snapshot_model.objects
-            .filter(game=game, captured_at__gte=cutoff)
-            .order_by('-captured_at')[:HISTORY_MAX_SNAPSHOTS * 3]  # over-pull for cross-book averaging
-        )
-        if len(snaps) < 2:
-            return empty
-        snaps = list(reversed(snaps))  # oldest → newest
-
         # Compute moneyline-specific signal for the picked side, since
         # spread/total moves shouldn't drive ML-rec confidence.
         attr = 'moneyline_home' if pick_side == 'home' else 'moneyline_away'
-        sig = _per_market_signal(snaps, attr)
+
+        # Persisted running state answers this from one row; games without
+        # a state row yet (pre-rebuild) fall through to the windowed read.
+        found = False
+        if getattr(settings, 'MOVEMENT_STATE_READS', False):
+            from apps.core.services.movement_state import pick_signal_from_state
+            found, sig = pick_signal_from_state(snapshot_model, game, attr)
+
+        if not found:
+            # Pull the most recent significant snapshot's history. We deliberately
+            # look across *all* sportsbooks for a game and pick the consensus
+            # signal — recommendation fires once per game, not per book.
+            cutoff = timezone.now() - timedelta(hours=HISTORY_MAX_HOURS)
+            snaps = list(
+                snapshot_model.objects
+                .filter(game=game, captured_at__gte=cutoff)
+                .order_by('-captured_at')[:CROSS_BOOK_MAX_SNAPSHOTS]  # over-pull for cross-book averaging
+            )
+            if len(snaps) < 2:
+                return empty
+            snaps = list(reversed(snaps))  # oldest → newest
+            sig = _per_market_signal(snaps, attr)
         if sig is None:
             return empty
 
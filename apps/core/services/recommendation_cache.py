@@ -0,0 +1,201 @@
+"""Versioned cross-request cache for `get_recommendation`.
+
+The hub, value board, game detail pages, bulk Bet All eligibility
+(`_eligible_games_for_user`) and `persist_recommendation` all recompute
+the same pick for the same game many times a minute, although it only
+changes when one of its inputs does. With RECOMMENDATION_CACHE on,
+`get_recommendation(sport, game, user)` is served from Django's cache
+under
+
+    (sport, game, latest snapshot id, inputs version, odds version,
+     rating mode, user-config hash)
+
+Invalidation is by version, not by guessing a TTL:
+  - `inputs` — bumped after every non-odds ingest run (schedule,
+    injuries, pitcher stats, team records), every score refresh that
+    changed a row (final scores feed recent form) and every Elo update.
+  - `odds` — bumped by every odds write (`_write_snapshots`), so line
+    movement is recomputed even when the snapshot the model reads stays
+    the same.
+  - The snapshot id is resolved per lookup through the sport's trust
+    ladder, so a line aging out of the fresh window changes the key too.
+  - The config hash includes `UserModelConfig.updated_at`: saving the
+    config changes the key, no bump needed.
+
+Bumps always happen (one UPDATE, queued with `on_commit`) so the cache
+can be switched on at any time. The counters live in the database
+(`core.RecommendationCacheVersion`), not in Django's cache: with the
+default per-process cache a bump made by a cron process would never reach
+the web workers. Entries themselves may stay per-process — a worker that
+reads a new version simply misses. RECOMMENDATION_CACHE_SECONDS only
+bounds memory. Versions are read once per computation context, so a
+slate costs one query.
+
+Only the `data is None` path is cached: callers that pass precomputed
+board data already did the expensive part. Hit / miss counts are
+per-process, see `stats()`.
+"""
+import dataclasses
+import hashlib
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'reccache'
+VERSION_KINDS = ('inputs', 'odds')
+
+_MISSING = object()
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'errors': 0}
+
+
+def enabled() -> bool:
+    return getattr(settings, 'RECOMMENDATION_CACHE', False)
+
+
+def _ttl() -> int:
+    return int(getattr(settings, 'RECOMMENDATION_CACHE_SECONDS', 600))
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def stats() -> dict:
+    """Per-process hit / miss / error counts since start (or reset)."""
+    with _stats_lock:
+        out = dict(_stats)
+    lookups = out['hits'] + out['misses']
+    out['hit_rate'] = round(out['hits'] / lookups, 3) if lookups else None
+    return out
+
+
+def reset_stats():
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+# --- Versions -------------------------------------------------------------------
+
+def _bump_now(sport, kinds):
+    from apps.core.models import RecommendationCacheVersion
+
+    for kind in kinds:
+        try:
+            bumped = RecommendationCacheVersion.objects.filter(sport=sport, kind=kind).update(
+                version=F('version') + 1, updated_at=timezone.now(),
+            )
+            if not bumped:
+                # First bump for this counter; a concurrent first bump
+                # makes get_or_create return the row, so bump it again.
+                row, created = RecommendationCacheVersion.objects.get_or_create(
+                    sport=sport, kind=kind, defaults={'version': 1},
+                )
+                if not created:
+                    RecommendationCacheVersion.objects.filter(pk=row.pk).update(
+                        version=F('version') + 1, updated_at=timezone.now(),
+                    )
+        except Exception as exc:  # noqa: BLE001 — the cache is an optimization
+            logger.warning('recommendation cache bump failed sport=%s kind=%s: %s', sport, kind, exc)
+
+
+def bump(sport, *kinds):
+    """Invalidate every cached recommendation for `sport` that depends on
+    `kinds` ('inputs' and / or 'odds'; both when omitted). Runs after the
+    current transaction commits so no reader can cache pre-commit data
+    under the new version. Never raises."""
+    kinds = kinds or VERSION_KINDS
+    try:
+        transaction.on_commit(lambda: _bump_now(sport, kinds))
+    except Exception as exc:  # noqa: BLE001
+        logger.warning('recommendation cache bump failed sport=%s: %s', sport, exc)
+
+
+def _read_versions(sport):
+    from apps.core.models import RecommendationCacheVersion
+
+    found = dict(
+        RecommendationCacheVersion.objects.filter(sport=sport, kind__in=VERSION_KINDS)
+        .values_list('kind', 'version')
+    )
+    return tuple(found.get(kind, 0) for kind in VERSION_KINDS)
+
+
+def versions(sport) -> tuple:
+    """Current (inputs, odds) versions for `sport`; 0 for a counter that
+    was never bumped. One query, memoized per computation context."""
+    from apps.core.services import compute_context
+
+    return compute_context.memoize(('reccache_versions', sport), lambda: _read_versions(sport))
+
+
+# --- Keys -----------------------------------------------------------------------
+
+def config_hash(user_config):
+    """User-config component of the key: every weight the sport models
+    read plus updated_at, so a save invalidates. 'anon' without a user."""
+    if user_config is None:
+        return 'anon'
+    return (
+        user_config.pk,
+        user_config.updated_at.isoformat() if user_config.updated_at else None,
+        user_config.rating_weight,
+        user_config.pitcher_weight,
+        user_config.hfa_weight,
+        user_config.injury_weight,
+        user_config.recent_form_weight,
+        user_config.conference_weight,
+    )
+
+
+def cache_key(sport, game, user, entry):
+    from apps.core.services import compute_context, slate
+
+    snapshot = entry['latest_odds_fn'](game)
+    return '{}:rec:{}:{}:{}:{}:{}:{}:{}'.format(
+        KEY_PREFIX, sport, game.pk,
+        compute_context.snapshot_key(snapshot),
+        ':'.join(str(v) for v in versions(sport)),
+        compute_context.rating_mode(),
+        int(bool(getattr(settings, 'USE_STARTER_RECENT_FORM', False))),
+        hashlib.sha1(repr(config_hash(slate.user_model_config(user))).encode()).hexdigest()[:16],
+    )
+
+
+# --- Lookup ---------------------------------------------------------------------
+
+def cached_recommendation(sport, game, user, entry, compute):
+    """compute() through the cache. The stored Recommendation has no game
+    attached; the caller's instance is re-attached on every hit, and each
+    hit is a fresh unpickled copy the caller may mutate (assign_tiers)."""
+    try:
+        key = cache_key(sport, game, user, entry)
+        stored = cache.get(key, _MISSING)
+    except Exception as exc:  # noqa: BLE001 — degrade to computing
+        logger.warning('recommendation cache read failed sport=%s: %s', sport, exc)
+        _count('errors')
+        return compute()
+
+    if stored is not _MISSING:
+        _count('hits')
+        if stored is not None:
+            stored.game = game
+        return stored
+
+    _count('misses')
+    rec = compute()
+    try:
+        cache.set(key, dataclasses.replace(rec, game=None) if rec is not None else None, _ttl())
+    except Exception as exc:  # noqa: BLE001
+        logger.warning('recommendation cache write failed sport=%s: %s', sport, exc)
+        _count('errors')
+    return rec
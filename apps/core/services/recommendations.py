@@ -12,8 +12,11 @@ from dataclasses import dataclass, asdict, field
 from decimal import Decimal
 from typing import List, Optional
 
+import hashlib
 import logging
 
+from django.utils import timezone
+
 from apps.core.sport_registry import SPORT_REGISTRY
 
 logger = logging.getLogger(__name__)
@@ -1089,9 +1092,16 @@ def _moneyline_candidate(game, data, model_source: str) -> Optional[Recommendati
     )
 
 
-def get_recommendation(sport: str, game, user=None) -> Optional[Recommendation]:
+def get_recommendation(sport: str, game, user=None, *, data=None) -> Optional[Recommendation]:
     """Compute the single highest-edge pick for a game. Returns None if no odds exist.
 
+    `data` is this game's compute_fn / compute_slate_fn output for the same
+    user when the caller already has it (the value and live boards).
+    With CURRENT_RECOMMENDATION_READS on, a fresh precomputed row answers
+    first (apps/core/services/current_recommendation.py). Without `data`, and
+    with RECOMMENDATION_CACHE on, the result is served from the versioned
+    cache (apps/core/services/recommendation_cache.py).
+
     Preference order for model source:
       - If the user has a configured model AND its prob differs meaningfully from house,
         use the user model. Otherwise fall back to the house model.
@@ -1100,8 +1110,23 @@ def get_recommendation(sport: str, game, user=None) -> Optional[Recommendation]:
     if not entry:
         return None
 
-    data = entry['compute_fn'](game, user)
+    from apps.core.services import current_recommendation
+    found, rec = current_recommendation.lookup(sport, game, user)
+    if found:
+        return rec
+
+    if data is None:
+        from apps.core.services import recommendation_cache
+        if recommendation_cache.enabled():
+            return recommendation_cache.cached_recommendation(
+                sport, game, user, entry,
+                lambda: _compute_recommendation(sport, game, user, entry['compute_fn'](game, user)),
+            )
+        data = entry['compute_fn'](game, user)
+    return _compute_recommendation(sport, game, user, data)
 
+
+def _compute_recommendation(sport, game, user, data) -> Optional[Recommendation]:
     prefer_user = (
         user is not None
         and getattr(user, 'is_authenticated', False)
@@ -1136,7 +1161,10 @@ def _build_shadow_alt_data(sport: str, game, user, active_mode: str) -> dict:
     for the duration of the alt computation only — does NOT change the
     process-level setting. Safe to call inline; the outer
     persist_recommendation has already finished its primary computation
-    by the time this runs.
+    by the time this runs, inside the computation_context this pass
+    shares: every memo key that doesn't include the rating mode (odds,
+    injuries, form, movement, config) is a hit, so only the score and
+    edge are recomputed.
     """
     if sport != 'mlb':
         return {}
@@ -1223,26 +1251,24 @@ def _build_shadow_alt_data(sport: str, game, user, active_mode: str) -> dict:
     }
 
 
-def persist_recommendation(sport: str, game, user=None):
-    """Compute and save a BettingRecommendation row. Returns the saved model or None."""
+def recommendation_fingerprint(rec) -> str:
+    """Hash of the decision a BettingRecommendation row records: pick,
+    line, odds, status, tier, lane and edge (at the stored 2dp). Two
+    persists with the same fingerprint are the same decision."""
+    edge = Decimal(str(rec.model_edge)).quantize(Decimal('0.01'))
+    parts = (rec.pick, rec.line, rec.odds_american, rec.status, rec.tier, rec.lane, edge)
+    return hashlib.sha1('|'.join(str(p) for p in parts).encode()).hexdigest()
+
+
+def _recommendation_row(sport: str, game, rec, shadow_alt_data: dict, now):
+    """Unsaved BettingRecommendation for `rec`."""
     from apps.core.models import BettingRecommendation
     from apps.core.services.elo_service import is_dynamic_active
 
-    rec = get_recommendation(sport, game, user)
-    if rec is None:
-        return None
-
-    # Phase 1B Elo shadow mode — capture both the active rating mode AND
-    # the alt-mode recommendation. For MLB only; other sports leave the
-    # fields blank/empty. Failure to compute the shadow alt MUST NOT
-    # block primary persistence — `_build_shadow_alt_data` swallows its
-    # own exceptions.
     active_mode = 'elo' if is_dynamic_active() else 'static'
     alt_mode = 'static' if active_mode == 'elo' else 'elo'
-    shadow_alt_data = _build_shadow_alt_data(sport, game, user, active_mode)
-
     game_fk_field = f"{sport}_game"
-    return BettingRecommendation.objects.create(
+    return BettingRecommendation(
         sport=sport,
         bet_type=rec.bet_type,
         pick=rec.pick,
@@ -1276,5 +1302,124 @@ def persist_recommendation(sport: str, game, user=None):
         # 2026-06-25 v3.1 feature-attribution payload (empty for sports
         # whose model service hasn't been wired yet — readers must .get()).
         feature_contributions=getattr(rec, 'feature_contributions', {}) or {},
+        fingerprint=recommendation_fingerprint(rec),
+        created_at=now,
+        last_confirmed_at=now,
         **{game_fk_field: game},
     )
+
+
+def _latest_rows(sport: str, model_source: str, games) -> dict:
+    """Newest BettingRecommendation per game id for `model_source`, one query."""
+    from apps.core.models import BettingRecommendation
+
+    fk_id = f"{sport}_game_id"
+    rows = (
+        BettingRecommendation.objects
+        .filter(sport=sport, model_source=model_source, **{f'{fk_id}__in': [g.pk for g in games]})
+        .order_by(fk_id, '-created_at')
+    )
+    latest = {}
+    for row in rows:
+        latest.setdefault(getattr(row, fk_id), row)
+    return latest
+
+
+def _confirm(rows, now):
+    from apps.core.models import BettingRecommendation
+
+    BettingRecommendation.objects.filter(pk__in=[r.pk for r in rows]).update(last_confirmed_at=now)
+    for row in rows:
+        row.last_confirmed_at = now
+
+
+def persist_recommendation(sport: str, game, user=None):
+    """Compute the current pick and record it. Returns the BettingRecommendation
+    row or None.
+
+    Write-on-change: when the newest stored row for this game and model
+    source has the same fingerprint, that row gets `last_confirmed_at`
+    and is returned; only a changed decision inserts a new row (with its
+    Elo shadow snapshot).
+
+    Both rating modes are computed in one computation_context, so the
+    shadow pass reuses the active pass's odds, injuries, recent form,
+    movement signal and user config and only rescores the game.
+    """
+    from apps.core.services import compute_context
+    from apps.core.services.elo_service import is_dynamic_active
+
+    now = timezone.now()
+    with compute_context.computation_context():
+        rec = get_recommendation(sport, game, user)
+        if rec is None:
+            return None
+
+        latest = _latest_rows(sport, rec.model_source, [game]).get(game.pk)
+        if latest is not None and latest.fingerprint == recommendation_fingerprint(rec):
+            _confirm([latest], now)
+            return latest
+
+        # Phase 1B Elo shadow mode — capture both the active rating mode AND
+        # the alt-mode recommendation. For MLB only; other sports leave the
+        # fields blank/empty. Failure to compute the shadow alt MUST NOT
+        # block primary persistence — `_build_shadow_alt_data` swallows its
+        # own exceptions.
+        active_mode = 'elo' if is_dynamic_active() else 'static'
+        shadow_alt_data = _build_shadow_alt_data(sport, game, user, active_mode)
+
+    row = _recommendation_row(sport, game, rec, shadow_alt_data, now)
+    row.save(force_insert=True)
+    return row
+
+
+def persist_slate_recommendations(sport: str, games, user=None, *, now=None) -> dict:
+    """persist_recommendation for a whole slate.
+
+    Scores the slate through the sport's `compute_slate_fn`, reads the
+    newest stored row per game in one query, confirms unchanged
+    decisions with one UPDATE and bulk_creates the changed ones. Returns
+    counts.
+    """
+    from apps.core.models import BettingRecommendation
+    from apps.core.services import compute_context
+    from apps.core.services.elo_service import is_dynamic_active
+
+    entry = SPORT_REGISTRY[sport]
+    now = now or timezone.now()
+    active_mode = 'elo' if is_dynamic_active() else 'static'
+    counts = {'games': 0, 'created': 0, 'confirmed': 0, 'no_pick': 0}
+
+    with compute_context.computation_context():
+        recs = []
+        for data in entry['compute_slate_fn'](games, user):
+            counts['games'] += 1
+            rec = _compute_recommendation(sport, data['game'], user, data)
+            if rec is None:
+                counts['no_pick'] += 1
+            else:
+                recs.append(rec)
+
+        unchanged, to_create = [], []
+        by_source = {}
+        for rec in recs:
+            by_source.setdefault(rec.model_source, []).append(rec.game)
+        latest = {
+            source: _latest_rows(sport, source, source_games)
+            for source, source_games in by_source.items()
+        }
+        for rec in recs:
+            row = latest[rec.model_source].get(rec.game.pk)
+            if row is not None and row.fingerprint == recommendation_fingerprint(rec):
+                unchanged.append(row)
+                continue
+            shadow_alt_data = _build_shadow_alt_data(sport, rec.game, user, active_mode)
+            to_create.append(_recommendation_row(sport, rec.game, rec, shadow_alt_data, now))
+
+    if unchanged:
+        _confirm(unchanged, now)
+    if to_create:
+        BettingRecommendation.objects.bulk_create(to_create)
+    counts['confirmed'] = len(unchanged)
+    counts['created'] = len(to_create)
+    return counts
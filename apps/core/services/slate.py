@@ -0,0 +1,108 @@
+"""Slate-level prefetch for the per-game compute functions.
+
+`compute_game_data(game, user)` is written for one game: it looks up the
+latest snapshot, lists injuries, reads the two newest snapshots for line
+movement, loads the user's model config and (MLB) runs two recent-form
+queries — 5–10 queries per game. The value board and live board call it
+for every game on the slate.
+
+Each sport's `compute_slate_data(games, user)` (SPORT_REGISTRY
+'compute_slate_fn') runs the same per-game code after `prefetch_slate`
+has loaded everything it reads for the whole slate in a fixed number of
+queries:
+
+  - teams / pitchers / injuries   Django's prefetch_related_objects, so
+                                  `game.injuries.all()` is served from the
+                                  prefetch cache
+  - latest odds                   one windowed query (newest-seen snapshot
+                                  per game, source and derived flag) handed
+                                  to the sport's own trust ladder
+  - line-movement snapshots       one windowed query (two newest per game)
+
+The snapshot results are attached as `game.prefetched_latest_odds` /
+`game.prefetched_recent_odds`, which the sports' `_get_latest_odds` /
+`_recent_odds` return when present — the same convention as a
+`Prefetch(..., to_attr=...)`. Output is identical to the per-game path.
+"""
+from collections import defaultdict
+
+from django.db.models import F, Window, prefetch_related_objects
+from django.db.models.functions import RowNumber
+
+LATEST_ODDS_ATTR = 'prefetched_latest_odds'
+RECENT_ODDS_ATTR = 'prefetched_recent_odds'
+
+
+def snapshot_model_for(game_model):
+    return game_model._meta.get_field('odds_snapshots').related_model
+
+
+def newest_per_source(snapshot_model, game_ids) -> dict:
+    """{game_id: [snapshot, ...]} — the newest-seen snapshot for each
+    (odds_source, is_derived) of each game, newest-seen first. Enough for
+    any "newest row matching a source filter" ladder. One query."""
+    ranked = snapshot_model.objects.filter(game_id__in=list(game_ids)).annotate(
+        seen_rank=Window(
+            expression=RowNumber(),
+            partition_by=[F('game_id'), F('odds_source'), F('is_derived')],
+            order_by=[F('last_seen_at').desc(), F('captured_at').desc()],
+        ),
+    ).filter(seen_rank=1).order_by('game_id', '-last_seen_at', '-captured_at')
+    out = defaultdict(list)
+    for snap in ranked:
+        out[snap.game_id].append(snap)
+    return out
+
+
+def newest_captured(snapshot_model, game_ids, n=2) -> dict:
+    """{game_id: [snapshot, ...]} — each game's `n` newest snapshots by
+    captured_at, newest first. One query."""
+    ranked = snapshot_model.objects.filter(game_id__in=list(game_ids)).annotate(
+        captured_rank=Window(
+            expression=RowNumber(),
+            partition_by=[F('game_id')],
+            order_by=[F('captured_at').desc()],
+        ),
+    ).filter(captured_rank__lte=n).order_by('game_id', '-captured_at')
+    out = defaultdict(list)
+    for snap in ranked:
+        out[snap.game_id].append(snap)
+    return out
+
+
+def prefetch_slate(games, pick_latest, *, related=('home_team', 'away_team'),
+                   candidates=None):
+    """Load what compute_game_data reads for every game in `games`.
+
+    `pick_latest(candidates)` is the sport's trust ladder over one game's
+    `newest_per_source` list (or over `candidates`, a prebuilt
+    {game_id: [snapshot, ...]} such as current_line.current_snapshots_by_game).
+    Returns `games` as a list.
+    """
+    games = list(games)
+    if not games:
+        return games
+    snapshot_model = snapshot_model_for(type(games[0]))
+    game_ids = [g.pk for g in games]
+
+    prefetch_related_objects(games, *related, 'injuries')
+    if candidates is None:
+        candidates = newest_per_source(snapshot_model, game_ids)
+    recent = newest_captured(snapshot_model, game_ids)
+    for game in games:
+        setattr(game, LATEST_ODDS_ATTR, pick_latest(candidates.get(game.pk, [])))
+        setattr(game, RECENT_ODDS_ATTR, recent.get(game.pk, []))
+    return games
+
+
+def user_model_config(user):
+    """The user's UserModelConfig, or None for anonymous users. Loaded once
+    per computation_context."""
+    if not (user and user.is_authenticated):
+        return None
+    from apps.accounts.models import UserModelConfig
+    from apps.core.services import compute_context
+    return compute_context.memoize(
+        ('user_model_config', user.pk),
+        lambda: UserModelConfig.get_or_create_for_user(user),
+    )
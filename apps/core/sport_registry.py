@@ -12,15 +12,34 @@ The UI-facing "label" is what appears on lobby tabs and in empty-state
 copy. `season_months` is inclusive and used by `is_in_season` to decide
 whether a tab should surface even when no games are in the DB yet
 (off-season placeholder).
+
+`compute_fn(game, user)` computes one game; `compute_slate_fn(games, user)`
+returns the same dicts for a whole board with its lookups prefetched
+(apps/core/services/slate.py) — use it whenever there's a list of games.
+`latest_odds_fn(game)` returns the snapshot the model reads (the
+recommendation cache keys on it). `house_weights` is the house model's
+weight set; a user whose config matches it gets house-identical picks.
 """
 from apps.cfb.models import Game as CFBGame
 from apps.cbb.models import Game as CBBGame
 from apps.mlb.models import Game as MLBGame
 from apps.college_baseball.models import Game as CBaseballGame
 from apps.cfb.services.model_service import compute_game_data as cfb_compute
+from apps.cfb.services.model_service import compute_slate_data as cfb_compute_slate
+from apps.cfb.services.model_service import _get_latest_odds as cfb_latest_odds
+from apps.cfb.services.model_service import HOUSE_WEIGHTS as cfb_house_weights
 from apps.cbb.services.model_service import compute_game_data as cbb_compute
+from apps.cbb.services.model_service import compute_slate_data as cbb_compute_slate
+from apps.cbb.services.model_service import _get_latest_odds as cbb_latest_odds
+from apps.cbb.services.model_service import HOUSE_WEIGHTS as cbb_house_weights
 from apps.mlb.services.model_service import compute_game_data as mlb_compute
+from apps.mlb.services.model_service import compute_slate_data as mlb_compute_slate
+from apps.mlb.services.model_service import _get_latest_odds as mlb_latest_odds
+from apps.mlb.services.model_service import HOUSE_WEIGHTS as mlb_house_weights
 from apps.college_baseball.services.model_service import compute_game_data as cb_compute
+from apps.college_baseball.services.model_service import compute_slate_data as cb_compute_slate
+from apps.college_baseball.services.model_service import _get_latest_odds as cb_latest_odds
+from apps.college_baseball.services.model_service import HOUSE_WEIGHTS as cb_house_weights
 
 
 SPORT_REGISTRY = {
@@ -29,6 +48,9 @@ SPORT_REGISTRY = {
         'game_model': CFBGame,
         'time_field': 'kickoff',
         'compute_fn': cfb_compute,
+        'compute_slate_fn': cfb_compute_slate,
+        'latest_odds_fn': cfb_latest_odds,
+        'house_weights': cfb_house_weights,
         'season_months': [8, 9, 10, 11, 12, 1],
     },
     'cbb': {
@@ -36,6 +58,9 @@ SPORT_REGISTRY = {
         'game_model': CBBGame,
         'time_field': 'tipoff',
         'compute_fn': cbb_compute,
+        'compute_slate_fn': cbb_compute_slate,
+        'latest_odds_fn': cbb_latest_odds,
+        'house_weights': cbb_house_weights,
         'season_months': [11, 12, 1, 2, 3, 4],
     },
     'mlb': {
@@ -43,6 +68,9 @@ SPORT_REGISTRY = {
         'game_model': MLBGame,
         'time_field': 'first_pitch',
         'compute_fn': mlb_compute,
+        'compute_slate_fn': mlb_compute_slate,
+        'latest_odds_fn': mlb_latest_odds,
+        'house_weights': mlb_house_weights,
         'season_months': [3, 4, 5, 6, 7, 8, 9, 10],
     },
     'college_baseball': {
@@ -50,6 +78,9 @@ SPORT_REGISTRY = {
         'game_model': CBaseballGame,
         'time_field': 'first_pitch',
         'compute_fn': cb_compute,
+        'compute_slate_fn': cb_compute_slate,
+        'latest_odds_fn': cb_latest_odds,
+        'house_weights': cb_house_weights,
         'season_months': [2, 3, 4, 5, 6],
     },
 }
@@ -233,6 +233,20 @@ class CommandCenterTodaysPlaysTests(TestCase):
         for rec in resp.context['today_recs']:
             self.assertEqual(rec.status, 'recommended')
 
+    def test_pick_confirmed_today_renders(self):
+        # Write-on-change: an unchanged pick keeps yesterday's created_at
+        # and only moves last_confirmed_at.
+        old = timezone.now() - timedelta(days=2)
+        confirmed = self._make_rec(ext='conf-1')
+        stale = self._make_rec(ext='conf-2')
+        type(confirmed).objects.filter(pk=confirmed.pk).update(
+            created_at=old, last_confirmed_at=timezone.now(),
+        )
+        type(stale).objects.filter(pk=stale.pk).update(created_at=old, last_confirmed_at=old)
+        resp = self.client.get('/')
+        ids = [r.pk for r in resp.context['today_recs']]
+        self.assertEqual(ids, [confirmed.pk])
+
     def test_capped_at_five(self):
         for i in range(8):
             self._make_rec(edge=Decimal('5.0') + Decimal(str(i * 0.1)),
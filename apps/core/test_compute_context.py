@@ -0,0 +1,120 @@
+"""Tests for the request-scoped computation memo (apps/core/services/compute_context.py).
+
+Inside a context every consumer on the MLB hub shares one computation per
+(game, snapshot, rating mode, user config); results must be identical to
+the uncached path and the hub's per-game query cost must collapse.
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.services import compute_context
+from apps.mlb.models import Conference, Game, OddsSnapshot, StartingPitcher, Team
+
+
+def _live_games(n, tag):
+    """`n` live MLB games with starters, two snapshots and recent history
+    (live games are on the hub regardless of the viewer's local date)."""
+    conf = Conference.objects.create(name=tag, slug=tag)
+    now = timezone.now()
+    games = []
+    for i in range(n):
+        home = Team.objects.create(name=f'H{tag}{i}', slug=f'h-{tag}-{i}', conference=conf, rating=60 + i)
+        away = Team.objects.create(name=f'A{tag}{i}', slug=f'a-{tag}-{i}', conference=conf, rating=42)
+        hp = StartingPitcher.objects.create(team=home, name=f'HP{tag}{i}', rating=62)
+        ap = StartingPitcher.objects.create(team=away, name=f'AP{tag}{i}', rating=44 + i)
+        for k in range(3):
+            Game.objects.create(
+                home_team=home, away_team=away, home_pitcher=hp, away_pitcher=ap,
+                first_pitch=now - timedelta(days=k + 2), status='final',
+                home_score=k + 1, away_score=2,
+            )
+        game = Game.objects.create(
+            home_team=home, away_team=away, home_pitcher=hp, away_pitcher=ap,
+            first_pitch=now - timedelta(minutes=30), status='live',
+            home_score=1, away_score=0,
+        )
+        for minutes_ago, ml_home in ((90, -125), (5, -150)):
+            OddsSnapshot.objects.create(
+                game=game, captured_at=now - timedelta(minutes=minutes_ago),
+                market_home_win_prob=0.55, moneyline_home=ml_home, moneyline_away=130,
+                odds_source='odds_api',
+            )
+        games.append(game)
+    return games
+
+
+class ComputationContextTests(TestCase):
+
+    def test_memoize_calls_through_outside_a_context(self):
+        calls = []
+        for _ in range(2):
+            compute_context.memoize('k', lambda: calls.append(1))
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(compute_context.active())
+
+    def test_memoize_once_per_key_inside_a_context(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        with compute_context.computation_context():
+            self.assertEqual(compute_context.memoize('a', compute), 1)
+            with compute_context.computation_context():  # nested: shared memo
+                self.assertEqual(compute_context.memoize('a', compute), 1)
+            self.assertEqual(compute_context.memoize('b', compute), 2)
+        self.assertFalse(compute_context.active())
+        self.assertEqual(compute_context.memoize('a', compute), 3)
+
+
+class MLBHubComputationContextTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('ctx', password='pw')
+        self.client.force_login(self.user)
+
+    def _signals(self, games):
+        from apps.mlb.services.prioritization import prioritize
+        fresh = Game.objects.filter(pk__in=[g.pk for g in games]).select_related(
+            'home_team', 'away_team', 'home_pitcher', 'away_pitcher',
+        ).order_by('home_team__rating')
+        return prioritize(fresh, user=self.user)
+
+    def test_signals_and_recommendations_match_uncached_path(self):
+        games = _live_games(3, 'par')
+        plain = self._signals(games)
+        with compute_context.computation_context():
+            cached = self._signals(games)
+        for a, b in zip(plain, cached):
+            self.assertEqual(a.house_prob, b.house_prob)
+            self.assertEqual(a.market_prob, b.market_prob)
+            self.assertEqual(a.priority_score, b.priority_score)
+            self.assertEqual(a.latest_odds.pk, b.latest_odds.pk)
+            ra, rb = a.recommendation, b.recommendation
+            self.assertEqual(
+                (ra.pick, ra.odds_american, ra.model_edge, ra.confidence_score, ra.status,
+                 ra.lane, ra.movement_class, ra.feature_contributions),
+                (rb.pick, rb.odds_american, rb.model_edge, rb.confidence_score, rb.status,
+                 rb.lane, rb.movement_class, rb.feature_contributions),
+            )
+
+    def test_hub_query_cost_per_game(self):
+        self.client.get('/mlb/')  # warm session / profile rows
+        _live_games(2, 'qa')
+        with CaptureQueriesContext(connection) as small:
+            self.client.get('/mlb/')
+        _live_games(4, 'qb')
+        with CaptureQueriesContext(connection) as large:
+            resp = self.client.get('/mlb/')
+        self.assertEqual(len(resp.context['live_tiles']), 6)
+        per_game = (len(large.captured_queries) - len(small.captured_queries)) / 4
+        # Uncached this was ~12 per game (odds ladder, injuries, recent
+        # form twice, user config, movement...); only the per-game
+        # movement read is left.
+        self.assertLessEqual(per_game, 1)
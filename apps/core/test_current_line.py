@@ -0,0 +1,228 @@
+"""Tests for apps/core/services/current_line.py.
+
+CurrentLine must always name the newest snapshot per (game, sportsbook,
+provenance), stay in step with change-only extensions, and — with
+CURRENT_LINE_READS on — give the latest-odds and multi-book helpers the
+same answers as the OddsSnapshot scans they replace.
+"""
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.models import CurrentLine
+from apps.core.services.current_line import (
+    current_lines_by_game,
+    rebuild_current_lines,
+    upsert_current_lines,
+)
+from apps.core.utils import multi_book
+from apps.mlb.models import Conference, Game, OddsSnapshot, Team
+from apps.mlb.services.model_service import _get_latest_odds
+
+
+def _game(start_offset_hours=6):
+    suffix = uuid.uuid4().hex[:8]
+    league = Conference.objects.create(name=f'L-{suffix}', slug=f'l-{suffix}')
+    home = Team.objects.create(name='New York Yankees', slug=f'nyy-{suffix}', conference=league)
+    away = Team.objects.create(name='Boston Red Sox', slug=f'bos-{suffix}', conference=league)
+    return Game.objects.create(
+        home_team=home, away_team=away,
+        first_pitch=timezone.now() + timedelta(hours=start_offset_hours),
+    )
+
+
+def _snap(game, *, sportsbook='DraftKings', minutes_ago=0, ml_home=-110, ml_away=-110,
+          prob=0.5, odds_source='odds_api', is_derived=False):
+    snap = OddsSnapshot.objects.create(
+        game=game,
+        captured_at=timezone.now() - timedelta(minutes=minutes_ago),
+        sportsbook=sportsbook,
+        market_home_win_prob=prob,
+        moneyline_home=ml_home,
+        moneyline_away=ml_away,
+        odds_source=odds_source,
+        is_derived=is_derived,
+    )
+    upsert_current_lines(OddsSnapshot, [snap])
+    return snap
+
+
+class CurrentLineIngestTests(TestCase):
+
+    def setUp(self):
+        self.game = _game()
+
+    def _persist(self, ml_home=-140, books=('DraftKings', 'FanDuel'), change_only=False):
+        from apps.datahub.providers.mlb.odds_provider import MLBOddsProvider
+        rows = [{
+            'home_team': 'New York Yankees',
+            'away_team': 'Boston Red Sox',
+            'commence_time': self.game.first_pitch.isoformat().replace('+00:00', 'Z'),
+            'sportsbook': book,
+            'moneyline_home': ml_home, 'moneyline_away': 120,
+            'spread': -1.5, 'total': 8.5,
+        } for book in books]
+        provider = MLBOddsProvider.__new__(MLBOddsProvider)
+        with self.settings(ODDS_CHANGE_ONLY_WRITES=change_only):
+            return provider.persist(rows)
+
+    def test_ingest_upserts_one_line_per_book(self):
+        self._persist()
+        self._persist(ml_home=-150)
+        lines = CurrentLine.objects.filter(game_id=self.game.pk).order_by('sportsbook')
+        self.assertEqual([l.sportsbook for l in lines], ['DraftKings', 'FanDuel'])
+        for line in lines:
+            newest = OddsSnapshot.objects.filter(
+                game=self.game, sportsbook=line.sportsbook,
+            ).order_by('-captured_at', '-pk').first()
+            self.assertEqual(line.snapshot_id, newest.pk)
+            self.assertEqual(line.moneyline_home, -150)
+            self.assertEqual(line.trust_tier, 'primary')
+
+    def test_unchanged_pull_moves_last_seen_at(self):
+        self._persist(change_only=True)
+        before = CurrentLine.objects.get(game_id=self.game.pk, sportsbook='DraftKings')
+        self._persist(change_only=True)
+        after = CurrentLine.objects.get(game_id=self.game.pk, sportsbook='DraftKings')
+        snap = OddsSnapshot.objects.get(pk=after.snapshot_id)
+        self.assertEqual(after.snapshot_id, before.snapshot_id)
+        self.assertGreater(after.last_seen_at, before.last_seen_at)
+        self.assertEqual(after.last_seen_at, snap.last_seen_at)
+
+    def test_insert_and_upsert_are_atomic(self):
+        with patch('apps.core.services.current_line.upsert_current_lines',
+                   side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self._persist()
+        self.assertFalse(OddsSnapshot.objects.filter(game=self.game).exists())
+
+    def test_newest_snapshot_in_a_batch_wins(self):
+        older = OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now() - timedelta(minutes=5),
+            sportsbook='DraftKings', market_home_win_prob=0.55, moneyline_home=-120,
+        )
+        newer = OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now(),
+            sportsbook='DraftKings', market_home_win_prob=0.58, moneyline_home=-135,
+        )
+        self.assertEqual(upsert_current_lines(OddsSnapshot, [newer, older]), 1)
+        self.assertEqual(CurrentLine.objects.get(game_id=self.game.pk).snapshot_id, newer.pk)
+
+    def test_provenance_is_part_of_the_key(self):
+        _snap(self.game, odds_source='odds_api')
+        _snap(self.game, odds_source='espn')
+        _snap(self.game, odds_source='espn', is_derived=True)
+        self.assertEqual(
+            sorted(CurrentLine.objects.values_list('odds_source', 'is_derived', 'trust_tier')),
+            [('espn', False, 'secondary'), ('espn', True, 'invalid'), ('odds_api', False, 'primary')],
+        )
+
+
+@override_settings(FRESH_ODDS_MAX_AGE_MINUTES=180)
+class CurrentLineReadParityTests(TestCase):
+
+    def _both(self, fn, *args):
+        with self.settings(CURRENT_LINE_READS=False):
+            scanned = fn(*args)
+        with self.settings(CURRENT_LINE_READS=True):
+            materialized = fn(*args)
+        return scanned, materialized
+
+    def test_latest_odds_ladder_matches(self):
+        cases = [
+            # fresh primary behind a newer ESPN row
+            [dict(odds_source='odds_api', minutes_ago=10),
+             dict(sportsbook='ESPN BET', odds_source='espn', minutes_ago=1)],
+            # stale primary, fresh ESPN under the same book name
+            [dict(odds_source='odds_api', minutes_ago=400),
+             dict(odds_source='espn', minutes_ago=5)],
+            # only derived ESPN fresh — falls through to newest overall
+            [dict(odds_source='odds_api', minutes_ago=400),
+             dict(odds_source='espn', is_derived=True, minutes_ago=5)],
+            # history behind the current line is never picked
+            [dict(odds_source='odds_api', minutes_ago=30, ml_home=-105),
+             dict(odds_source='odds_api', minutes_ago=3, ml_home=-125)],
+        ]
+        for rows in cases:
+            game = _game()
+            for row in rows:
+                _snap(game, **row)
+            scanned, materialized = self._both(_get_latest_odds, game)
+            self.assertIsNotNone(scanned)
+            self.assertEqual(materialized.pk, scanned.pk)
+
+    def test_latest_odds_is_one_query(self):
+        game = _game()
+        _snap(game, odds_source='odds_api', minutes_ago=400)
+        _snap(game, odds_source='espn', is_derived=True, minutes_ago=5)
+        with self.settings(CURRENT_LINE_READS=True):
+            with self.assertNumQueries(1):
+                _get_latest_odds(game)
+
+    def test_multi_book_helpers_match(self):
+        game = _game(start_offset_hours=0.25)
+        _snap(game, sportsbook='DraftKings', minutes_ago=50, ml_home=-120, prob=0.55)
+        _snap(game, sportsbook='DraftKings', minutes_ago=45, ml_home=-130, prob=0.57)
+        _snap(game, sportsbook='FanDuel', minutes_ago=40, ml_home=-115, prob=0.53)
+        _snap(game, sportsbook='FanDuel', minutes_ago=35, odds_source='espn', ml_home=-125, prob=0.56)
+        _snap(game, sportsbook='BetMGM', minutes_ago=32, is_derived=True, ml_home=-200, prob=0.66)
+
+        scanned, materialized = self._both(multi_book.get_latest_snapshots_for_game, game)
+        self.assertEqual([s.pk for s in materialized], [s.pk for s in scanned])
+        for fn, args in [
+            (multi_book.get_consensus_prob, (game,)),
+            (multi_book.get_best_price, (game, 'home')),
+            (multi_book.get_best_price, (game, 'away')),
+            (multi_book.get_odds_source_for_game, (game,)),
+            (multi_book.is_odds_stale, (game,)),
+        ]:
+            scanned, materialized = self._both(fn, *args)
+            self.assertEqual(materialized, scanned, fn.__name__)
+        self.assertTrue(materialized)  # last seen 32 min ago, 15 min to first pitch
+
+    def test_count_stale_games_is_one_query_per_sport(self):
+        games = []
+        for minutes_ago in (5, 40, 90):
+            game = _game(start_offset_hours=0.25)
+            _snap(game, minutes_ago=minutes_ago)
+            games.append(game)
+        games.append(_game(start_offset_hours=0.25))  # no odds at all
+        scanned, _ = self._both(multi_book.count_stale_games, games)
+        with self.settings(CURRENT_LINE_READS=True):
+            with self.assertNumQueries(1):
+                materialized = multi_book.count_stale_games(games)
+        self.assertEqual((scanned, materialized), (2, 2))
+
+
+class RebuildCurrentLinesTests(TestCase):
+
+    def test_rebuild_matches_incremental(self):
+        game = _game()
+        for i, book in enumerate(('DraftKings', 'FanDuel', 'DraftKings')):
+            _snap(game, sportsbook=book, minutes_ago=30 - i * 10, ml_home=-110 - i * 5)
+        _snap(game, sportsbook='FanDuel', odds_source='espn', minutes_ago=1)
+        fields = ('sportsbook', 'odds_source', 'is_derived', 'snapshot_id',
+                  'trust_tier', 'moneyline_home', 'last_seen_at')
+        incremental = sorted(CurrentLine.objects.values_list(*fields))
+        self.assertEqual(rebuild_current_lines(OddsSnapshot), 3)
+        self.assertEqual(sorted(CurrentLine.objects.values_list(*fields)), incremental)
+
+    def test_command_rebuilds_one_game(self):
+        keep, redo = _game(), _game()
+        _snap(keep)
+        OddsSnapshot.objects.create(
+            game=redo, captured_at=timezone.now(), sportsbook='FanDuel',
+            market_home_win_prob=0.5, moneyline_home=-110,
+        )
+        out = StringIO()
+        call_command('rebuild_current_lines', '--sport', 'mlb', '--game', str(redo.pk), stdout=out)
+        self.assertEqual(
+            {gid: len(lines) for gid, lines in current_lines_by_game(OddsSnapshot, [keep.pk, redo.pk]).items()},
+            {keep.pk: 1, redo.pk: 1},
+        )
+        self.assertIn('mlb: 1 current lines', out.getvalue())
@@ -0,0 +1,173 @@
+"""Tests for the precomputed current recommendation table
+(apps/core/services/current_recommendation.py).
+
+Served rows must equal what get_recommendation computes inline, unchanged
+passes must only re-confirm rows, and anything stale or user-specific
+must fall back to computing inline.
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.accounts.models import UserModelConfig
+from apps.core.models import CurrentRecommendation
+from apps.core.services import current_recommendation
+from apps.core.services.current_recommendation import (
+    lookup,
+    prefetch_current_recommendations,
+    refresh_current_recommendations,
+)
+from apps.core.services.recommendations import get_recommendation
+from apps.mlb.models import Conference, Game, OddsSnapshot, StartingPitcher, Team
+
+
+def _fields(rec):
+    return (
+        rec.pick, rec.odds_american, rec.model_edge, rec.confidence_score, rec.status,
+        rec.status_reason, rec.lane, rec.tier, rec.model_source, rec.movement_class,
+        rec.risk_flags, rec.final_model_prob, rec.market_prob, rec.feature_contributions,
+    )
+
+
+@override_settings(CURRENT_RECOMMENDATION_READS=True)
+class CurrentRecommendationTests(TestCase):
+
+    def setUp(self):
+        conf = Conference.objects.create(name='AL', slug='al-currec')
+        self.games = []
+        for i in range(3):
+            home = Team.objects.create(name=f'H{i}', slug=f'h-currec-{i}', conference=conf, rating=65 + i)
+            away = Team.objects.create(name=f'A{i}', slug=f'a-currec-{i}', conference=conf, rating=45)
+            game = Game.objects.create(
+                home_team=home, away_team=away,
+                home_pitcher=StartingPitcher.objects.create(team=home, name=f'HP{i}', rating=60),
+                away_pitcher=StartingPitcher.objects.create(team=away, name=f'AP{i}', rating=48),
+                first_pitch=timezone.now() + timedelta(hours=2 + i),
+            )
+            if i != 2:  # game 2 has no odds → stored as "no pick"
+                self._snapshot(game, -110)
+            self.games.append(game)
+
+    def _snapshot(self, game, ml_home):
+        return OddsSnapshot.objects.create(
+            game=game, captured_at=timezone.now(), market_home_win_prob=0.5,
+            moneyline_home=ml_home, moneyline_away=-110, odds_source='odds_api',
+        )
+
+    def _fresh(self, game):
+        return Game.objects.select_related('home_team', 'away_team').get(pk=game.pk)
+
+    def _inline(self, game, user=None):
+        with override_settings(CURRENT_RECOMMENDATION_READS=False):
+            return get_recommendation('mlb', self._fresh(game), user)
+
+    def test_served_rows_match_inline(self):
+        stats = refresh_current_recommendations('mlb')
+        self.assertEqual((stats['games'], stats['created']), (3, 3))
+        user = User.objects.create_user('currec', password='pw')
+        for who in (None, user):
+            for game in self.games:
+                found, rec = lookup('mlb', self._fresh(game), who)
+                self.assertTrue(found)
+                inline = self._inline(game, who)
+                if inline is None:
+                    self.assertIsNone(rec)
+                    continue
+                # model_source included: 'user' for the default-config user
+                self.assertEqual(_fields(rec), _fields(inline))
+
+    def test_unchanged_pass_only_confirms(self):
+        first = refresh_current_recommendations('mlb')
+        before = {r.game_id: r for r in CurrentRecommendation.objects.all()}
+        later = timezone.now() + timedelta(minutes=5)
+        stats = refresh_current_recommendations('mlb', now=later)
+        self.assertEqual((stats['created'], stats['changed'], stats['unchanged']), (0, 0, first['games']))
+        for row in CurrentRecommendation.objects.all():
+            self.assertEqual(row.computed_at, later)
+            self.assertEqual(row.changed_at, before[row.game_id].changed_at)
+
+    def test_new_snapshot_falls_back_until_next_pass(self):
+        refresh_current_recommendations('mlb')
+        game = self.games[0]
+        self._snapshot(game, +160)
+        found, _ = lookup('mlb', self._fresh(game))
+        self.assertFalse(found)
+        self.assertEqual(get_recommendation('mlb', self._fresh(game)).odds_american,
+                         self._inline(game).odds_american)
+        stats = refresh_current_recommendations('mlb')
+        self.assertEqual(stats['changed'], 1)
+        found, rec = lookup('mlb', self._fresh(game))
+        self.assertTrue(found)
+        self.assertEqual(_fields(rec), _fields(self._inline(game)))
+
+    def test_stale_mode_or_age_falls_back(self):
+        refresh_current_recommendations('mlb')
+        game = self.games[0]
+        from apps.core.services.elo_service import force_use_dynamic, is_dynamic_active
+        with force_use_dynamic(not is_dynamic_active()):
+            self.assertFalse(lookup('mlb', self._fresh(game))[0])
+        CurrentRecommendation.objects.update(computed_at=timezone.now() - timedelta(hours=2))
+        self.assertFalse(lookup('mlb', self._fresh(game))[0])
+
+    def test_custom_user_config_computes_inline(self):
+        refresh_current_recommendations('mlb')
+        user = User.objects.create_user('tuned', password='pw')
+        config = UserModelConfig.get_or_create_for_user(user)
+        config.pitcher_weight = 2.0
+        config.save()
+        self.assertFalse(lookup('mlb', self._fresh(self.games[0]), user)[0])
+
+    def test_games_leaving_the_slate_lose_their_row(self):
+        refresh_current_recommendations('mlb')
+        Game.objects.filter(pk=self.games[1].pk).update(status='final')
+        stats = refresh_current_recommendations('mlb')
+        self.assertEqual(stats['deleted'], 1)
+        self.assertFalse(CurrentRecommendation.objects.filter(game_id=self.games[1].pk).exists())
+
+    def test_prefetch_serves_without_row_queries(self):
+        refresh_current_recommendations('mlb')
+        games = [self._fresh(g) for g in self.games]
+        for g in games:
+            g.prefetched_latest_odds = OddsSnapshot.objects.filter(game=g).order_by('-captured_at').first()
+        prefetch_current_recommendations('mlb', games)
+        with self.assertNumQueries(0):
+            for g in games:
+                self.assertTrue(lookup('mlb', g)[0])
+
+    def test_prefetch_resolves_user_source_once_per_slate(self):
+        refresh_current_recommendations('mlb')
+        default_user = User.objects.create_user('currec-default', password='pw')
+        tuned = User.objects.create_user('currec-tuned', password='pw')
+        config = UserModelConfig.get_or_create_for_user(tuned)
+        config.pitcher_weight = 2.0
+        config.save()
+        for user, served in ((default_user, True), (tuned, False)):
+            games = [self._fresh(g) for g in self.games]
+            for g in games:
+                g.prefetched_latest_odds = OddsSnapshot.objects.filter(game=g).order_by('-captured_at').first()
+            prefetch_current_recommendations('mlb', games, user)
+            # No per-game UserModelConfig lookup, served or not.
+            with self.assertNumQueries(0):
+                for g in games:
+                    found, rec = lookup('mlb', g, user)
+                    self.assertEqual(found, served)
+                    if served and rec is not None:
+                        self.assertEqual(rec.model_source, 'user')
+        # A different user than the slate was prefetched for resolves afresh.
+        self.assertTrue(lookup('mlb', games[0], None)[0])
+
+    def test_reads_off_never_serves(self):
+        refresh_current_recommendations('mlb')
+        with override_settings(CURRENT_RECOMMENDATION_READS=False):
+            self.assertFalse(lookup('mlb', self._fresh(self.games[0]))[0])
+
+    def test_command_refreshes_every_sport(self):
+        out = StringIO()
+        call_command('refresh_recommendations', stdout=out)
+        self.assertIn("mlb: {'games': 3", out.getvalue())
+        self.assertEqual(CurrentRecommendation.objects.filter(sport='mlb').count(), 3)
+        self.assertIsNone(current_recommendation.refresh_after_ingest('golf'))
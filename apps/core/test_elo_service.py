@@ -10,6 +10,8 @@ Coverage targets:
   6. reset_sport — wipes only the targeted sport's state.
   7. Rebuild idempotence — same input data → same final ratings.
   8. Update idempotence — running twice produces zero new rows.
+  9. In-memory replay — rebuild_sport / update_sport match per-game
+     process_game exactly, in a constant number of queries.
 """
 from datetime import timedelta
 import math
@@ -28,6 +30,7 @@ from apps.core.services.elo_service import (
     expected_win_prob,
     margin_multiplier,
     process_game,
+    rebuild_sport,
     reset_sport,
     team_rating_for_model,
     update_ratings,
@@ -378,6 +381,91 @@ class RebuildIdempotenceTests(TestCase):
         self.assertEqual(before, after)
 
 
+class InMemoryReplayTests(TestCase):
+    """rebuild_sport / update_sport against per-game process_game."""
+
+    SCORES = [  # (home, away, home_score, away_score, neutral)
+        (0, 1, 80, 70, False), (1, 2, 65, 66, False), (2, 0, 90, 60, True),
+        (0, 1, 70, 70, False),  # tie — skipped
+        (1, 0, 77, 59, False), (2, 1, 50, 71, False), (0, 2, 62, 61, True),
+    ]
+
+    def setUp(self):
+        from apps.cbb.models import Conference, Game, Team
+        conf = Conference.objects.create(name='X', slug='x-replay')
+        self.teams = [
+            Team.objects.create(name=f'T{i}', slug=f't-replay-{i}', conference=conf)
+            for i in range(4)  # team 3 never plays
+        ]
+        start = timezone.now() - timedelta(days=30)
+        self.games = [
+            Game.objects.create(
+                home_team=self.teams[h], away_team=self.teams[a],
+                tipoff=start + timedelta(days=i), neutral_site=neutral,
+                status='final', home_score=hs, away_score=as_,
+            )
+            for i, (h, a, hs, as_, neutral) in enumerate(self.SCORES)
+        ]
+
+    def _state(self):
+        from apps.cbb.models import Team
+        teams = list(Team.objects.order_by('name').values_list(
+            'name', 'elo_rating', 'elo_last_updated',
+        ))
+        history = sorted(TeamEloHistory.objects.filter(sport='cbb').values_list(
+            'cbb_game_id', 'cbb_team_id', 'pre_rating', 'post_rating', 'k_factor',
+            'is_home', 'won', 'margin', 'margin_multiplier',
+        ), key=str)
+        return teams, history
+
+    def _per_game(self, games):
+        from apps.cbb.models import Game
+        for game in games:
+            process_game('cbb', Game.objects.select_related('home_team', 'away_team').get(pk=game.pk))
+
+    def test_rebuild_matches_per_game_process_game(self):
+        self._per_game(self.games)
+        expected = self._state()
+        stats = rebuild_sport('cbb')
+        self.assertEqual((stats['processed'], stats['skipped'], stats['teams']), (6, 1, 3))
+        self.assertEqual(self._state(), expected)
+        self.assertEqual(len(expected[1]), 12)
+
+    def test_update_continues_from_stored_ratings(self):
+        from apps.cbb.models import Game
+        from apps.core.services.elo_service import update_sport
+        self._per_game(self.games)
+        expected = self._state()
+        reset_sport('cbb')
+        later = [g.pk for g in self.games[3:]]
+        Game.objects.filter(pk__in=later).update(status='scheduled')
+        rebuild_sport('cbb')
+        Game.objects.filter(pk__in=later).update(status='final')
+        self.assertEqual(update_sport('cbb')['processed'], 3)
+        self.assertEqual(self._state(), expected)
+
+    def test_rebuild_query_count_is_independent_of_games(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as small:
+            rebuild_sport('cbb', batch_size=100)
+        for game in list(self.games):
+            game.pk = None
+            game.tipoff += timedelta(days=60)
+            game.save()
+        with CaptureQueriesContext(connection) as large:
+            rebuild_sport('cbb', batch_size=100)
+        self.assertEqual(len(small), len(large))
+
+    def test_rebuild_bumps_recommendation_cache_per_sport_not_per_game(self):
+        from unittest.mock import patch
+        from apps.core.services import recommendation_cache
+        with patch.object(recommendation_cache, 'bump') as bump:
+            rebuild_sport('cbb')
+        # One from reset_sport, one after the replay — never one per game.
+        self.assertEqual([c.args for c in bump.call_args_list], [('cbb', 'inputs')] * 2)
+
+
 class ModelServiceIntegrationTests(TestCase):
     """The four sport model_services pick up Elo via team_rating_for_model.
 
@@ -0,0 +1,241 @@
+"""Equivalence tests for apps/core/services/movement_state.py.
+
+Every read from the persisted OddsMovementState must match what the
+windowed math in apps/core/services/odds_movement.py computes from the
+same snapshots — per-book scores, the cross-book pick signal, after window
+eviction, after rows age past HISTORY_MAX_HOURS, and after a rebuild.
+"""
+import random
+import uuid
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.models import OddsMovementState
+from apps.core.services.movement_state import (
+    ALL_BOOKS,
+    movement_result_from_state,
+    pick_signal_from_state,
+    rebuild_movement_state,
+    record_snapshots,
+)
+from apps.core.services.odds_movement import (
+    _per_market_signal,
+    apply_movement_intelligence_batch,
+    compute_movement_score,
+    movement_signal_for_pick,
+    recent_snapshots_for_book,
+)
+from apps.mlb.models import Conference, Game, OddsSnapshot, Team
+
+
+def _game():
+    suffix = uuid.uuid4().hex[:8]
+    league = Conference.objects.create(name=f'L-{suffix}', slug=f'l-{suffix}')
+    home = Team.objects.create(name='H', slug=f'h-{suffix}', conference=league)
+    away = Team.objects.create(name='A', slug=f'a-{suffix}', conference=league)
+    return Game.objects.create(
+        home_team=home, away_team=away,
+        first_pitch=timezone.now() + timedelta(hours=3),
+    )
+
+
+def _walk(rng, steps, start):
+    """Random price path with flat steps, reversals and the odd null."""
+    out, v = [], start
+    for _ in range(steps):
+        v = v + rng.choice([-15, -8, -5, 0, 0, 5, 8, 15])
+        out.append(None if rng.random() < 0.1 else v)
+    return out
+
+
+class MovementStateEquivalenceTests(TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(20261017)
+        self.game = _game()
+
+    def _ingest(self, game, book, minutes_ago, **lines):
+        snap = OddsSnapshot.objects.create(
+            game=game,
+            captured_at=timezone.now() - timedelta(minutes=minutes_ago),
+            sportsbook=book,
+            market_home_win_prob=0.5,
+            **lines,
+        )
+        record_snapshots(OddsSnapshot, [snap])
+        return snap
+
+    def _random_book(self, game, book, steps, *, start_minutes_ago=600, offset=0):
+        home = _walk(self.rng, steps, -120)
+        away = _walk(self.rng, steps, 100)
+        spread = _walk(self.rng, steps, 0)
+        total = _walk(self.rng, steps, 80)
+        for i in range(steps):
+            self._ingest(
+                game, book, start_minutes_ago - i * 37 - offset,
+                moneyline_home=home[i], moneyline_away=away[i],
+                spread=None if spread[i] is None else spread[i] / 10.0,
+                total=None if total[i] is None else total[i] / 10.0,
+            )
+
+    def _windowed(self, game, book):
+        return compute_movement_score(recent_snapshots_for_book(OddsSnapshot, game, book))
+
+    def assertSameResult(self, state_result, windowed):
+        if windowed is None:
+            self.assertIsNone(state_result)
+            return
+        self.assertIsNotNone(state_result)
+        self.assertEqual(state_result.as_dict(), windowed.as_dict())
+        self.assertEqual(state_result.components, windowed.components)
+
+    def test_per_book_score_matches_windowed(self):
+        for steps in (2, 3, 5, 9):
+            game = _game()
+            self._random_book(game, 'DraftKings', steps)
+            found, result = movement_result_from_state(OddsSnapshot, game.pk, 'DraftKings')
+            self.assertTrue(found)
+            self.assertSameResult(result, self._windowed(game, 'DraftKings'))
+
+    def test_window_eviction_matches_windowed(self):
+        # 25 snapshots → the ring has evicted 15 of them.
+        self._random_book(self.game, 'FanDuel', 25, start_minutes_ago=1000)
+        state = OddsMovementState.objects.get(
+            game_id=self.game.pk, sportsbook='FanDuel', market='moneyline_home',
+        )
+        self.assertEqual(len(state.window), 10)
+        _, result = movement_result_from_state(OddsSnapshot, self.game.pk, 'FanDuel')
+        self.assertSameResult(result, self._windowed(self.game, 'FanDuel'))
+
+    def test_aged_window_matches_windowed(self):
+        self._random_book(self.game, 'BetMGM', 8, start_minutes_ago=1400)
+        later = timezone.now() + timedelta(hours=2)
+        with patch('django.utils.timezone.now', return_value=later):
+            _, result = movement_result_from_state(OddsSnapshot, self.game.pk, 'BetMGM')
+            windowed = self._windowed(self.game, 'BetMGM')
+        self.assertSameResult(result, windowed)
+
+    def test_all_null_market_matches_windowed(self):
+        for i, ml in enumerate((-110, -125, -140)):
+            self._ingest(self.game, 'Caesars', 90 - i * 30, moneyline_home=ml)
+        _, result = movement_result_from_state(OddsSnapshot, self.game.pk, 'Caesars')
+        self.assertSameResult(result, self._windowed(self.game, 'Caesars'))
+        self.assertNotIn('spread', result.components)
+
+    def test_single_snapshot_has_no_score(self):
+        self._ingest(self.game, 'DraftKings', 5, moneyline_home=-110, moneyline_away=-110)
+        self.assertEqual(
+            movement_result_from_state(OddsSnapshot, self.game.pk, 'DraftKings'),
+            (True, None),
+        )
+
+    def test_missing_state_is_not_found(self):
+        self.assertEqual(
+            movement_result_from_state(OddsSnapshot, self.game.pk, 'DraftKings'),
+            (False, None),
+        )
+        self.assertEqual(
+            pick_signal_from_state(OddsSnapshot, self.game, 'moneyline_home'),
+            (False, None),
+        )
+
+    def test_cross_book_pick_signal_matches_windowed(self):
+        # Offsets keep every captured_at distinct so the windowed query's
+        # ordering is fully determined.
+        for j, book in enumerate(('DraftKings', 'FanDuel', 'BetMGM', 'Caesars')):
+            self._random_book(self.game, book, 9, offset=j * 7)
+        cutoff = timezone.now() - timedelta(hours=24)
+        snaps = list(reversed(list(
+            OddsSnapshot.objects.filter(game=self.game, captured_at__gte=cutoff)
+            .order_by('-captured_at')[:30]
+        )))
+        for attr in ('moneyline_home', 'moneyline_away'):
+            found, sig = pick_signal_from_state(OddsSnapshot, self.game, attr)
+            self.assertTrue(found)
+            expected = _per_market_signal(snaps, attr)
+            self.assertEqual(sig.keys(), expected.keys())
+            for key, value in expected.items():
+                if key == 'attr':
+                    self.assertEqual(sig[key], value)
+                else:
+                    # minutes_since_last_move is read against the wall clock
+                    self.assertAlmostEqual(sig[key], value, places=2)
+
+    def test_movement_signal_for_pick_reads_state_when_enabled(self):
+        for j, book in enumerate(('DraftKings', 'FanDuel')):
+            self._random_book(self.game, book, 6, offset=j * 5)
+        for side in ('home', 'away'):
+            windowed = movement_signal_for_pick(OddsSnapshot, self.game, side)
+            with override_settings(MOVEMENT_STATE_READS=True):
+                with patch.object(OddsSnapshot.objects, 'filter',
+                                  side_effect=AssertionError('history re-read')):
+                    from_state = movement_signal_for_pick(OddsSnapshot, self.game, side)
+            self.assertEqual(from_state, windowed)
+
+    def test_rebuild_matches_incremental(self):
+        for book in ('DraftKings', 'FanDuel'):
+            self._random_book(self.game, book, 14)
+        fields = ('sportsbook', 'market', 'window', 'observation_count', 'first_price',
+                  'last_price', 'signed_delta', 'up_moves', 'down_moves', 'last_move_at')
+        incremental = sorted(OddsMovementState.objects.values_list(*fields))
+        written = rebuild_movement_state(OddsSnapshot)
+        self.assertEqual(written, len(incremental))
+        self.assertEqual(sorted(OddsMovementState.objects.values_list(*fields)), incremental)
+
+    def test_batch_hook_matches_with_state_reads(self):
+        books = ('DraftKings', 'FanDuel', 'BetMGM')
+        for book in books:
+            self._random_book(self.game, book, 6, start_minutes_ago=400)
+        fresh = [
+            OddsSnapshot.objects.create(
+                game=self.game, captured_at=timezone.now(), sportsbook=book,
+                market_home_win_prob=0.5, moneyline_home=ml_h, moneyline_away=ml_a,
+            )
+            for book, (ml_h, ml_a) in zip(books, [(-190, 165), (-200, 170), (-105, -115)])
+        ]
+        with override_settings(MOVEMENT_STATE_READS=True):
+            results = apply_movement_intelligence_batch(OddsSnapshot, fresh)
+        self.assertTrue(results)
+        for snap in fresh:
+            if snap.pk in results:
+                self.assertSameResult(results[snap.pk], self._windowed(self.game, snap.sportsbook))
+
+    def test_record_is_exception_safe(self):
+        snap = OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now(), sportsbook='DraftKings',
+            market_home_win_prob=0.5, moneyline_home=-110, moneyline_away=-110,
+        )
+        with patch(
+            'apps.core.services.movement_state._advance',
+            side_effect=RuntimeError('boom'),
+        ):
+            self.assertEqual(record_snapshots(OddsSnapshot, [snap]), {})
+
+
+class RebuildMovementStateCommandTests(TestCase):
+
+    def test_rebuilds_all_books_rows(self):
+        game = _game()
+        for i, ml in enumerate((-110, -130)):
+            OddsSnapshot.objects.create(
+                game=game, captured_at=timezone.now() - timedelta(minutes=60 - i * 30),
+                sportsbook='DraftKings', market_home_win_prob=0.5,
+                moneyline_home=ml, moneyline_away=-ml,
+            )
+        out = StringIO()
+        call_command('rebuild_movement_state', '--sport', 'mlb', stdout=out)
+        # 4 per-book markets + 2 all-books moneyline rows
+        self.assertEqual(OddsMovementState.objects.filter(sport='mlb').count(), 6)
+        row = OddsMovementState.objects.get(sportsbook=ALL_BOOKS, market='moneyline_home')
+        self.assertEqual(row.move_count, 1)
+        self.assertIn('mlb: 6 state rows', out.getvalue())
+
+    def test_game_requires_sport(self):
+        with self.assertRaises(CommandError):
+            call_command('rebuild_movement_state', '--game', str(uuid.uuid4()), stdout=StringIO())
@@ -0,0 +1,159 @@
+"""Tests for the versioned recommendation cache
+(apps/core/services/recommendation_cache.py).
+
+Cached picks must equal the uncached ones, and every input change the
+cache claims to track — a new snapshot, an Elo update, an ingest run, a
+UserModelConfig save — must produce a miss.
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.accounts.models import UserModelConfig
+from apps.core.services import recommendation_cache
+from apps.core.services.elo_service import process_game
+from apps.core.services.recommendations import get_recommendation
+from apps.mlb.models import Conference, Game, OddsSnapshot, StartingPitcher, Team
+
+
+def _fields(rec):
+    return (
+        rec.pick, rec.odds_american, rec.model_edge, rec.confidence_score, rec.status,
+        rec.status_reason, rec.lane, rec.tier, rec.model_source, rec.movement_class,
+        rec.feature_contributions,
+    )
+
+
+@override_settings(RECOMMENDATION_CACHE=True)
+class RecommendationCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        recommendation_cache.reset_stats()
+        conf = Conference.objects.create(name='AL', slug='al-reccache')
+        self.home = Team.objects.create(name='Home', slug='h-reccache', conference=conf, rating=70)
+        self.away = Team.objects.create(name='Away', slug='a-reccache', conference=conf, rating=40)
+        self.game = Game.objects.create(
+            home_team=self.home, away_team=self.away,
+            home_pitcher=StartingPitcher.objects.create(team=self.home, name='HP', rating=60),
+            away_pitcher=StartingPitcher.objects.create(team=self.away, name='AP', rating=45),
+            first_pitch=timezone.now() + timedelta(hours=3),
+        )
+        self._snapshot(-110)
+
+    def _snapshot(self, ml_home, minutes_ago=0):
+        return OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now() - timedelta(minutes=minutes_ago),
+            market_home_win_prob=0.5, moneyline_home=ml_home, moneyline_away=-110,
+            odds_source='odds_api',
+        )
+
+    def _rec(self, user=None):
+        return get_recommendation('mlb', Game.objects.get(pk=self.game.pk), user)
+
+    def _counts(self):
+        s = recommendation_cache.stats()
+        return s['hits'], s['misses']
+
+    def test_hit_matches_uncached_and_reattaches_game(self):
+        with override_settings(RECOMMENDATION_CACHE=False):
+            plain = self._rec()
+        first = self._rec()
+        game = Game.objects.get(pk=self.game.pk)
+        second = get_recommendation('mlb', game)
+        self.assertEqual(self._counts(), (1, 1))
+        self.assertEqual(_fields(plain), _fields(first))
+        self.assertEqual(_fields(first), _fields(second))
+        self.assertIs(second.game, game)
+
+    def test_game_without_odds_caches_none(self):
+        OddsSnapshot.objects.filter(game=self.game).delete()
+        self.assertIsNone(self._rec())
+        self.assertIsNone(self._rec())
+        self.assertEqual(self._counts(), (1, 1))
+
+    def test_new_snapshot_misses(self):
+        before = self._rec()
+        with self.captureOnCommitCallbacks(execute=True):
+            self._snapshot(+150)
+        after = self._rec()
+        self.assertEqual(self._counts(), (0, 2))
+        self.assertNotEqual(before.odds_american, after.odds_american)
+
+    def test_elo_update_bumps_inputs(self):
+        self._rec()
+        before = recommendation_cache.versions('mlb')
+        final = Game.objects.create(
+            home_team=self.home, away_team=self.away, status='final',
+            first_pitch=timezone.now() - timedelta(days=1), home_score=5, away_score=1,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(process_game('mlb', final))
+        after = recommendation_cache.versions('mlb')
+        self.assertNotEqual(before[0], after[0])
+        self.assertEqual(before[1], after[1])
+        self._rec()
+        self.assertEqual(self._counts(), (0, 2))
+
+    def test_bump_waits_for_commit(self):
+        before = recommendation_cache.versions('mlb')
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            recommendation_cache.bump('mlb', 'odds')
+        self.assertEqual(recommendation_cache.versions('mlb'), before)
+        callbacks[0]()
+        self.assertNotEqual(recommendation_cache.versions('mlb')[1], before[1])
+
+    def test_bump_from_another_process_is_seen(self):
+        """A cron process has its own per-process cache; its bump must
+        still reach this worker's lookups."""
+        from unittest.mock import patch
+        from django.core.cache.backends.locmem import LocMemCache
+        self._rec()
+        self._rec()
+        self.assertEqual(self._counts(), (1, 1))
+        cron_cache = LocMemCache('reccache-cron', {})
+        with patch.object(recommendation_cache, 'cache', cron_cache), \
+                self.captureOnCommitCallbacks(execute=True):
+            recommendation_cache.bump('mlb', 'inputs')
+        self._rec()
+        self.assertEqual(self._counts(), (1, 2))
+
+    def test_versions_are_read_once_per_context(self):
+        from apps.core.services.compute_context import computation_context
+        recommendation_cache._bump_now('mlb', ('odds',))
+        with computation_context(), self.assertNumQueries(1):
+            first = recommendation_cache.versions('mlb')
+            self.assertEqual(recommendation_cache.versions('mlb'), first)
+        self.assertEqual(first[1], 1)
+
+    def test_config_save_misses_and_users_do_not_share(self):
+        user = User.objects.create_user('reccache', password='pw')
+        self._rec(user)
+        self._rec(user)
+        self.assertEqual(self._counts(), (1, 1))
+        config = UserModelConfig.get_or_create_for_user(user)
+        config.rating_weight = 0.2
+        config.save()
+        changed = self._rec(user)
+        self.assertEqual(self._counts(), (1, 2))
+        with override_settings(RECOMMENDATION_CACHE=False):
+            self.assertEqual(_fields(changed), _fields(self._rec(user)))
+        self._rec()  # anonymous
+        self.assertEqual(self._counts(), (1, 3))
+
+    def test_rating_mode_is_part_of_the_key(self):
+        from apps.core.services.elo_service import force_use_dynamic
+        with force_use_dynamic(False):
+            self._rec()
+        with force_use_dynamic(True):
+            self._rec()
+        self.assertEqual(self._counts(), (0, 2))
+
+    def test_disabled_bypasses_the_cache(self):
+        with override_settings(RECOMMENDATION_CACHE=False):
+            self._rec()
+            self._rec()
+        self.assertEqual(self._counts(), (0, 0))
@@ -0,0 +1,121 @@
+"""Tests for write-on-change BettingRecommendation persistence
+(persist_recommendation / persist_slate_recommendations in
+apps/core/services/recommendations.py).
+
+Persisting the same decision again must only confirm the latest row;
+a changed pick, line or odds must insert a new one, and the slate API
+must write exactly what per-game persistence would.
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.models import BettingRecommendation
+from apps.core.services import recommendations
+from apps.core.services.recommendations import (
+    persist_recommendation,
+    persist_slate_recommendations,
+    recommendation_fingerprint,
+)
+from apps.mlb.models import Conference, Game, OddsSnapshot, StartingPitcher, Team
+
+COMPARED = (
+    'pick', 'line', 'odds_american', 'confidence_score', 'model_edge', 'status',
+    'status_reason', 'lane', 'model_source', 'shadow_active_mode', 'shadow_alt_data',
+    'feature_contributions', 'fingerprint',
+)
+
+
+class RecommendationHistoryTests(TestCase):
+
+    def setUp(self):
+        conf = Conference.objects.create(name='AL', slug='al-rechist')
+        self.games = []
+        for i in range(3):
+            home = Team.objects.create(
+                name=f'H{i}', slug=f'h-rechist-{i}', conference=conf, rating=70, elo_rating=1650,
+            )
+            away = Team.objects.create(
+                name=f'A{i}', slug=f'a-rechist-{i}', conference=conf, rating=40, elo_rating=1400,
+            )
+            game = Game.objects.create(
+                home_team=home, away_team=away,
+                home_pitcher=StartingPitcher.objects.create(team=home, name=f'HP{i}', rating=60),
+                away_pitcher=StartingPitcher.objects.create(team=away, name=f'AP{i}', rating=45),
+                first_pitch=timezone.now() + timedelta(hours=2 + i),
+            )
+            if i != 2:  # game 2 has no odds → no pick
+                self._snapshot(game, -110)
+            self.games.append(game)
+
+    def _snapshot(self, game, ml_home):
+        return OddsSnapshot.objects.create(
+            game=game, captured_at=timezone.now(), market_home_win_prob=0.5,
+            moneyline_home=ml_home, moneyline_away=-110, odds_source='odds_api',
+        )
+
+    def _fresh(self, game):
+        return Game.objects.select_related('home_team', 'away_team').get(pk=game.pk)
+
+    def _slate(self):
+        return Game.objects.select_related('home_team', 'away_team').order_by('first_pitch')
+
+    def test_same_decision_only_confirms(self):
+        first = persist_recommendation('mlb', self._fresh(self.games[0]))
+        self.assertEqual(first.fingerprint, recommendation_fingerprint(
+            recommendations.get_recommendation('mlb', self._fresh(self.games[0]))
+        ))
+        with patch.object(
+            recommendations, '_build_shadow_alt_data', wraps=recommendations._build_shadow_alt_data,
+        ) as shadow:
+            second = persist_recommendation('mlb', self._fresh(self.games[0]))
+        self.assertEqual(second.pk, first.pk)
+        self.assertGreater(second.last_confirmed_at, first.last_confirmed_at)
+        self.assertEqual(shadow.call_count, 0)
+        self.assertEqual(BettingRecommendation.objects.count(), 1)
+
+    def test_changed_odds_writes_new_row(self):
+        first = persist_recommendation('mlb', self._fresh(self.games[0]))
+        self._snapshot(self.games[0], +150)
+        second = persist_recommendation('mlb', self._fresh(self.games[0]))
+        self.assertNotEqual(second.pk, first.pk)
+        self.assertNotEqual(second.fingerprint, first.fingerprint)
+        self.assertEqual(BettingRecommendation.objects.count(), 2)
+
+    def test_rows_without_fingerprint_never_match(self):
+        first = persist_recommendation('mlb', self._fresh(self.games[0]))
+        BettingRecommendation.objects.filter(pk=first.pk).update(fingerprint='')
+        second = persist_recommendation('mlb', self._fresh(self.games[0]))
+        self.assertNotEqual(second.pk, first.pk)
+
+    def test_slate_creates_then_confirms(self):
+        stats = persist_slate_recommendations('mlb', self._slate())
+        self.assertEqual(stats, {'games': 3, 'created': 2, 'confirmed': 0, 'no_pick': 1})
+        later = timezone.now() + timedelta(minutes=5)
+        stats = persist_slate_recommendations('mlb', self._slate(), now=later)
+        self.assertEqual(stats, {'games': 3, 'created': 0, 'confirmed': 2, 'no_pick': 1})
+        self.assertEqual(
+            set(BettingRecommendation.objects.values_list('last_confirmed_at', flat=True)), {later},
+        )
+        self._snapshot(self.games[1], +160)
+        stats = persist_slate_recommendations('mlb', self._slate())
+        self.assertEqual((stats['created'], stats['confirmed']), (1, 1))
+
+    def test_slate_rows_match_per_game_rows(self):
+        persist_slate_recommendations('mlb', self._slate())
+        slate_rows = {r.mlb_game_id: r for r in BettingRecommendation.objects.all()}
+        BettingRecommendation.objects.all().delete()
+        for game in self.games[:2]:
+            row = persist_recommendation('mlb', self._fresh(game))
+            for name in COMPARED:
+                self.assertEqual(getattr(row, name), getattr(slate_rows[game.pk], name), name)
+
+    def test_command_history_flag(self):
+        out = StringIO()
+        call_command('refresh_recommendations', '--sport', 'mlb', '--history', stdout=out)
+        self.assertIn("mlb history: {'games': 3, 'created': 2", out.getvalue())
+        self.assertEqual(BettingRecommendation.objects.count(), 2)
@@ -11,6 +11,8 @@ Coverage:
      (alt-mode compute is sandboxed behind force_use_dynamic).
   6. A failure inside the alt compute does NOT block primary
      persistence — the row still saves with a degraded shadow blob.
+  7. Both modes are computed in one pass: the alt blob equals a
+     standalone alt compute while mode-independent inputs are read once.
 """
 from datetime import timedelta
 from decimal import Decimal
@@ -255,3 +257,55 @@ class ShadowModeNonInterferenceTests(TestCase):
 
         # We at least produced a row.
         self.assertIsNotNone(rec)
+
+
+class ShadowModeSinglePassTests(TestCase):
+    @override_settings(USE_DYNAMIC_RATINGS=False)
+    def test_alt_data_matches_standalone_alt_compute(self):
+        from django.contrib.auth.models import User
+        from apps.core.services.recommendations import (
+            _build_shadow_alt_data, persist_recommendation,
+        )
+        from apps.mlb.models import Game
+        game = _make_mlb_setup(home_elo=1800.0, away_elo=1250.0)
+        user = User.objects.create_user('shadow-single', password='pw')
+        for who in (None, user):
+            standalone = _build_shadow_alt_data(
+                'mlb', Game.objects.get(pk=game.pk), who, 'static',
+            )
+            rec = persist_recommendation('mlb', Game.objects.get(pk=game.pk), who)
+            self.assertEqual(rec.shadow_alt_data, standalone)
+
+    @override_settings(USE_DYNAMIC_RATINGS=False)
+    def test_mode_independent_inputs_read_once(self):
+        from apps.mlb.services import model_service
+        from apps.core.services.recommendations import persist_recommendation
+        game = _make_mlb_setup(home_elo=1800.0, away_elo=1250.0)
+        with patch.object(
+            model_service, '_query_latest_odds', wraps=model_service._query_latest_odds,
+        ) as odds, patch.object(
+            model_service, '_house_win_prob', wraps=model_service._house_win_prob,
+        ) as house:
+            rec = persist_recommendation('mlb', game)
+        self.assertTrue(rec.shadow_alt_data['elo_available'])
+        self.assertEqual(odds.call_count, 1)
+        self.assertEqual(house.call_count, 2)  # one score per rating mode
+
+    @override_settings(USE_DYNAMIC_RATINGS=False)
+    def test_batch_scored_game_rescored_under_alt_mode(self):
+        # compute_slate_data attaches static-mode probabilities to the
+        # instance; the alt pass must not reuse them.
+        from apps.core.services.recommendations import (
+            _build_shadow_alt_data, persist_recommendation,
+        )
+        from apps.mlb.models import Game
+        from apps.mlb.services.model_service import compute_slate_data
+        game = _make_mlb_setup(
+            home_rating=60.0, away_rating=40.0,
+            home_elo=1900.0, away_elo=1200.0,
+        )
+        expected = _build_shadow_alt_data('mlb', Game.objects.get(pk=game.pk), None, 'static')
+        scored = Game.objects.select_related('home_team', 'away_team').get(pk=game.pk)
+        compute_slate_data([scored], None)
+        rec = persist_recommendation('mlb', scored)
+        self.assertEqual(rec.shadow_alt_data, expected)
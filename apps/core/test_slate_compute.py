@@ -0,0 +1,175 @@
+"""Tests for SPORT_REGISTRY compute_slate_fn (apps/core/services/slate.py).
+
+compute_slate_data must return exactly what compute_game_data returns for
+each game, and its query count must not grow with the number of games.
+"""
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.core.sport_registry import SPORT_REGISTRY
+
+
+def _models(sport):
+    game_model = SPORT_REGISTRY[sport]['game_model']
+    app = game_model._meta.app_config.models_module
+    return app, game_model
+
+
+def _slate(sport, n, *, with_pitchers=True):
+    """`n` upcoming games with mixed-source snapshots and injuries."""
+    app, game_model = _models(sport)
+    time_field = SPORT_REGISTRY[sport]['time_field']
+    suffix = uuid.uuid4().hex[:8]
+    conf = app.Conference.objects.create(name=f'C-{suffix}', slug=f'c-{suffix}')
+    now = timezone.now()
+    games = []
+    for i in range(n):
+        home = app.Team.objects.create(
+            name=f'Home {i}', slug=f'h{i}-{suffix}', conference=conf, rating=50 + i,
+        )
+        away = app.Team.objects.create(
+            name=f'Away {i}', slug=f'a{i}-{suffix}', conference=conf, rating=52 - i,
+        )
+        kwargs = {'home_team': home, 'away_team': away, time_field: now + timedelta(hours=3 + i)}
+        if hasattr(app, 'StartingPitcher') and with_pitchers and i % 3 != 2:
+            kwargs['home_pitcher'] = app.StartingPitcher.objects.create(
+                team=home, name=f'HP {i}', rating=48 + 2 * i,
+            )
+            kwargs['away_pitcher'] = app.StartingPitcher.objects.create(
+                team=away, name=f'AP {i}', rating=55 - i,
+            )
+        game = game_model.objects.create(**kwargs)
+        games.append(game)
+        if i % 4 == 3:
+            continue  # no odds at all
+        for minutes_ago, source, derived, prob in (
+            (300, 'odds_api', False, 0.50 + i / 100),
+            (30, 'espn', False, 0.54),
+            (10, 'espn', True, 0.58 - i / 100),
+        )[: 1 + i % 3]:
+            app.OddsSnapshot.objects.create(
+                game=game, captured_at=now - timedelta(minutes=minutes_ago),
+                market_home_win_prob=prob, moneyline_home=-120, moneyline_away=110,
+                odds_source=source, is_derived=derived,
+            )
+        if i % 2:
+            app.InjuryImpact.objects.create(game=game, team=home, impact_level='high')
+    return games
+
+
+def _comparable(rows):
+    out = []
+    for row in rows:
+        row = dict(row)
+        row['game'] = row['game'].pk
+        row['latest_odds'] = row['latest_odds'].pk if row['latest_odds'] else None
+        row['injuries'] = sorted(i.pk for i in row['injuries'])
+        out.append(row)
+    return out
+
+
+class SlateParityTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user('slate', password='pw')
+
+    def _fresh(self, sport, games):
+        _, game_model = _models(sport)
+        return list(
+            game_model.objects.filter(pk__in=[g.pk for g in games])
+            .select_related('home_team', 'away_team')
+            .order_by(SPORT_REGISTRY[sport]['time_field'])
+        )
+
+    def test_slate_matches_per_game_for_every_sport(self):
+        for sport, entry in SPORT_REGISTRY.items():
+            with self.subTest(sport=sport):
+                games = _slate(sport, 8)
+                for user in (None, self.user):
+                    per_game = [entry['compute_fn'](g, user) for g in self._fresh(sport, games)]
+                    slate = entry['compute_slate_fn'](self._fresh(sport, games), user)
+                    self.assertEqual(_comparable(slate), _comparable(per_game))
+
+    def test_query_count_is_flat_in_slate_size(self):
+        for sport, entry in SPORT_REGISTRY.items():
+            with self.subTest(sport=sport):
+                small = _slate(sport, 2)
+                large = _slate(sport, 10)
+                counts = []
+                for games in (small, large):
+                    games = self._fresh(sport, games)
+                    entry['compute_slate_fn'](games, self.user)  # warm user/profile rows
+                    games = self._fresh(sport, games)
+                    with CaptureQueriesContext(connection) as ctx:
+                        entry['compute_slate_fn'](games, self.user)
+                    counts.append(len(ctx.captured_queries))
+                self.assertEqual(counts[0], counts[1])
+
+    def test_empty_slate(self):
+        for entry in SPORT_REGISTRY.values():
+            with self.assertNumQueries(0):
+                self.assertEqual(entry['compute_slate_fn']([], self.user), [])
+
+
+class RecentFormBatchTests(TestCase):
+
+    def test_batched_form_matches_per_pitcher(self):
+        from apps.mlb.models import Game, StartingPitcher
+        from apps.mlb.services.pitcher_form import recent_form_delta, recent_form_deltas
+
+        games = _slate('mlb', 3)
+        pitchers = list(StartingPitcher.objects.all())
+        now = timezone.now()
+        # History: every pitcher starts several finals against the others,
+        # home and away, with mixed results.
+        for k in range(14):
+            home_p = pitchers[k % len(pitchers)]
+            away_p = pitchers[(k + 1) % len(pitchers)]
+            Game.objects.create(
+                home_team=games[0].home_team, away_team=games[0].away_team,
+                first_pitch=now - timedelta(days=k + 1), status='final',
+                home_pitcher=home_p, away_pitcher=away_p,
+                home_score=k % 3, away_score=(k * 2) % 3,
+            )
+        batched = recent_form_deltas(pitchers)
+        for pitcher in pitchers:
+            self.assertEqual(batched[pitcher.id], recent_form_delta(pitcher), pitcher.name)
+        cutoff = now - timedelta(days=4)
+        batched = recent_form_deltas(pitchers, reference_date=cutoff, n=3)
+        for pitcher in pitchers:
+            self.assertEqual(
+                batched[pitcher.id], recent_form_delta(pitcher, reference_date=cutoff, n=3),
+            )
+
+    def test_slate_ledger_loads_only_the_lookback_window(self):
+        # Live boards look back from one cutoff: only the last n starts
+        # per pitcher and side are loaded, however long the career.
+        from apps.mlb.models import Game, StartingPitcher
+        from apps.mlb.services.pitcher_form import StartLedger, recent_form_delta
+
+        games = _slate('mlb', 1)
+        pitcher, other = StartingPitcher.objects.all()[:2]
+        now = timezone.now()
+        for k in range(30):
+            home = k % 2 == 0
+            Game.objects.create(
+                home_team=games[0].home_team, away_team=games[0].away_team,
+                first_pitch=now - timedelta(days=k + 1), status='final',
+                home_pitcher=pitcher if home else other,
+                away_pitcher=other if home else pitcher,
+                home_score=k % 4, away_score=(k * 3) % 4,
+            )
+        ledger = StartLedger.recent_for_pitchers({pitcher.id}, until=now, n=3)
+        self.assertLessEqual(len(ledger._times[pitcher.id]), 6)
+        for n in (2, 3):
+            ledger = StartLedger.recent_for_pitchers({pitcher.id}, until=now, n=n)
+            self.assertEqual(
+                ledger.delta(pitcher.id, now, n=n),
+                recent_form_delta(pitcher, reference_date=now, n=n),
+            )
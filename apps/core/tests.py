@@ -1029,6 +1029,109 @@ class ApplyMovementIntelligenceTests(TestCase):
             self.assertIsNone(result)
 
 
+class ApplyMovementIntelligenceBatchTests(TestCase):
+    """Batch hook: same classifications as the per-row hook, one history
+    read and one bulk UPDATE for the whole ingest pass."""
+
+    BOOKS = ('DraftKings', 'FanDuel', 'BetMGM')
+
+    def setUp(self):
+        from apps.mlb.models import Conference, Game, OddsSnapshot, Team
+        self.OddsSnapshot = OddsSnapshot
+        conf = Conference.objects.create(name='AL East', slug='al-east')
+        home = Team.objects.create(name='Home', slug='home', conference=conf)
+        away = Team.objects.create(name='Away', slug='away', conference=conf)
+        self.games = [
+            Game.objects.create(
+                home_team=home, away_team=away,
+                first_pitch=timezone.now() + timedelta(hours=2 + i),
+            )
+            for i in range(2)
+        ]
+
+    def _create(self, game, book, *, ml_h, ml_a, when_offset_min=0):
+        return self.OddsSnapshot.objects.create(
+            game=game,
+            captured_at=timezone.now() + timedelta(minutes=when_offset_min),
+            sportsbook=book,
+            market_home_win_prob=0.5,
+            moneyline_home=ml_h, moneyline_away=ml_a,
+        )
+
+    def _seed_history(self):
+        for game in self.games:
+            for book in self.BOOKS:
+                self._create(game, book, ml_h=-110, ml_a=-110, when_offset_min=-120)
+                self._create(game, book, ml_h=-120, ml_a=100, when_offset_min=-60)
+
+    def _fresh_pass(self):
+        # Mix of significant moves, noise, and a first-ever snapshot.
+        lines = [(-160, 140), (-122, 102), (-150, 130)]
+        fresh = []
+        for game in self.games:
+            for book, (ml_h, ml_a) in zip(self.BOOKS, lines):
+                fresh.append(self._create(game, book, ml_h=ml_h, ml_a=ml_a))
+        fresh.append(self._create(self.games[0], 'Caesars', ml_h=-110, ml_a=-110))
+        return fresh
+
+    def _state(self, snaps):
+        rows = self.OddsSnapshot.objects.filter(pk__in=[s.pk for s in snaps])
+        return {
+            (r.game_id, r.sportsbook): (r.snapshot_type, r.movement_score, r.movement_class)
+            for r in rows
+        }
+
+    def test_matches_per_row_hook(self):
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        self._seed_history()
+        fresh = self._fresh_pass()
+        results = apply_movement_intelligence_batch(self.OddsSnapshot, fresh)
+        batch_state = self._state(fresh)
+
+        # Reset and replay through the per-row hook.
+        self.OddsSnapshot.objects.filter(pk__in=[s.pk for s in fresh]).update(
+            snapshot_type='raw', movement_score=None, movement_class=None,
+        )
+        for snap in self.OddsSnapshot.objects.filter(pk__in=[s.pk for s in fresh]):
+            apply_movement_intelligence(self.OddsSnapshot, snap)
+        self.assertEqual(batch_state, self._state(fresh))
+
+        upgraded = {k for k, v in batch_state.items() if v[0] == 'significant'}
+        self.assertEqual(len(results), len(upgraded))
+        self.assertEqual(len(upgraded), 4)  # two significant books × two games
+
+    def test_two_queries_for_whole_pass(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        self._seed_history()
+        fresh = self._fresh_pass()
+        with CaptureQueriesContext(connection) as ctx:
+            apply_movement_intelligence_batch(self.OddsSnapshot, fresh)
+        # Snapshot-table traffic only; OddsMovementState has its own tests.
+        queries = [q['sql'].lstrip().upper() for q in ctx.captured_queries
+                   if 'MLB_ODDSSNAPSHOT' in q['sql'].upper()]
+        selects = [q for q in queries if q.startswith('SELECT')]
+        updates = [q for q in queries if q.startswith('UPDATE')]
+        self.assertEqual(len(selects), 1)
+        self.assertEqual(len(updates), 1)
+
+    def test_empty_batch_is_noop(self):
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        with self.assertNumQueries(0):
+            self.assertEqual(apply_movement_intelligence_batch(self.OddsSnapshot, []), {})
+
+    def test_exception_safe(self):
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        self._seed_history()
+        fresh = self._fresh_pass()
+        with patch(
+            'apps.core.services.odds_movement.compute_movement_score',
+            side_effect=RuntimeError('boom'),
+        ):
+            self.assertEqual(apply_movement_intelligence_batch(self.OddsSnapshot, fresh), {})
+
+
 class PruneOldRawSnapshotsTests(TestCase):
     """Pruning policy: raw older than retention deleted; significant/closing/
     bet_context kept; recent raw kept."""
@@ -6,6 +6,10 @@ No DB writes, no recommendation-engine integration. The engine continues to
 read its single-snapshot path; these helpers are additive infrastructure for
 future upgrades and the System Tuning surface.
 
+With settings.CURRENT_LINE_READS on, every helper reads the materialized
+core.CurrentLine rows (apps/core/services/current_line.py) instead of
+ordering the game's OddsSnapshot history. Results are the same.
+
 Design note: consensus deliberately averages raw `market_home_win_prob`
 without per-book de-vigging. The average across books partially neutralizes
 vig, and per-book de-vig can be added later when the engine actually consumes
@@ -13,11 +17,14 @@ this output. Document the simplification rather than hide it.
 """
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import timedelta
+from functools import partial
 from typing import Optional
 
 from django.utils import timezone
 
+from apps.core.services import current_line
 from apps.core.utils.odds import american_to_implied_prob
 
 
@@ -45,6 +52,17 @@ def get_latest_snapshots_for_game(game) -> list:
     """
     if game is None:
         return []
+    if current_line.reads_enabled():
+        newest = {}
+        for snap in current_line.current_snapshots_by_game(
+            game.odds_snapshots.model, [game.pk],
+        ).get(game.pk, []):
+            if snap.is_derived:
+                continue
+            held = newest.get(snap.sportsbook)
+            if held is None or snap.captured_at > held.captured_at:
+                newest[snap.sportsbook] = snap
+        return [newest[book] for book in sorted(newest)]
     qs = game.odds_snapshots.filter(is_derived=False).order_by('sportsbook', '-captured_at')
     seen: set = set()
     latest = []
@@ -100,6 +118,18 @@ def get_best_price(game, side: str):
     return (best_odds, best_book)
 
 
+def _newest_line(game):
+    """The game's most recently seen line — a CurrentLine when reads are on,
+    else the snapshot itself. Both carry odds_source / last_seen_at /
+    captured_at. None when the game has no odds."""
+    if current_line.reads_enabled():
+        from apps.core.models import CurrentLine
+        return CurrentLine.objects.filter(
+            sport=game._meta.app_label, game_id=game.pk,
+        ).order_by('-last_seen_at', '-captured_at').first()
+    return game.odds_snapshots.order_by('-last_seen_at', '-captured_at').first()
+
+
 # --- Source attribution for bet placement -----------------------------------
 
 def get_odds_source_for_game(game) -> str:
@@ -117,7 +147,7 @@ def get_odds_source_for_game(game) -> str:
     """
     if game is None:
         return 'unknown'
-    latest = game.odds_snapshots.order_by('-captured_at').first()
+    latest = _newest_line(game)
     if latest is None:
         return 'unknown'
     return getattr(latest, 'odds_source', None) or 'unknown'
@@ -126,7 +156,7 @@ def get_odds_source_for_game(game) -> str:
 # --- Stale-odds detection ---------------------------------------------------
 
 def is_odds_stale(game, threshold_minutes: int = 30) -> bool:
-    """True when a pre-game's latest snapshot is older than the threshold AND
+    """True when a pre-game's latest line was last seen before the threshold AND
     the game starts within the threshold window.
 
     "Stale" semantically means: we are inside the critical pre-game window where
@@ -142,6 +172,12 @@ def is_odds_stale(game, threshold_minutes: int = 30) -> bool:
     """
     if game is None:
         return False
+    return _is_stale(game, threshold_minutes, lambda: _newest_line(game))
+
+
+def _is_stale(game, threshold_minutes, newest_line):
+    """is_odds_stale's rules. `newest_line` is a zero-arg callable so games
+    outside the window never pay for the lookup."""
     start = _start_time(game)
     if start is None:
         return False
@@ -156,14 +192,34 @@ def is_odds_stale(game, threshold_minutes: int = 30) -> bool:
     if start - now > window:
         return False
 
-    latest = game.odds_snapshots.order_by('-captured_at').first()
+    # last_seen_at: an unchanged line confirmed by the latest pull is fresh
+    # even though the row was first captured long ago.
+    latest = newest_line()
     if latest is None:
         return False  # no data is its own signal; not "stale"
 
-    age = now - latest.captured_at
+    age = now - (latest.last_seen_at or latest.captured_at)
     return age > window
 
 
 def count_stale_games(games_qs, threshold_minutes: int = 30) -> int:
-    """Count games in a queryset/iterable that are currently flagged stale."""
-    return sum(1 for g in games_qs if is_odds_stale(g, threshold_minutes))
+    """Count games in a queryset/iterable that are currently flagged stale.
+
+    With CURRENT_LINE_READS on, the newest line for every game comes from
+    one CurrentLine query per sport rather than one query per game.
+    """
+    if not current_line.reads_enabled():
+        return sum(1 for g in games_qs if is_odds_stale(g, threshold_minutes))
+
+    games = list(games_qs)
+    ids_by_model = defaultdict(list)
+    for g in games:
+        ids_by_model[g.odds_snapshots.model].append(g.pk)
+    newest = {}
+    for model, ids in ids_by_model.items():
+        for game_id, lines in current_line.current_lines_by_game(model, ids).items():
+            newest[game_id] = lines[0]
+    return sum(
+        1 for g in games
+        if _is_stale(g, threshold_minutes, partial(newest.get, g.pk))
+    )
@@ -1,6 +1,7 @@
 import json
 from datetime import timedelta
 
+from django.db.models import Q
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
@@ -44,15 +45,16 @@ def command_center_home(request):
     # Pull BettingRecommendation rows captured today, status=recommended,
     # bet_type=moneyline (the only emitted type today). Order by edge DESC,
     # cap at 5. select_related the per-sport game so the template can read
-    # team names without N+1 lookups. The `created_at` field defaults to
-    # `timezone.now()` so a today's-local-date filter on it gives us the
-    # current slate's recs without requiring a per-game-time join.
+    # team names without N+1 lookups. Rows are write-on-change, so a pick
+    # that hasn't moved since yesterday keeps its old `created_at` — match
+    # on either timestamp falling today to get the current slate's recs
+    # without requiring a per-game-time join.
     today_recs_qs = (
         BettingRecommendation.objects
         .filter(
+            Q(created_at__date=today_local) | Q(last_confirmed_at__date=today_local),
             bet_type='moneyline',
             status='recommended',
-            created_at__date=today_local,
         )
         .select_related(
             'cfb_game__home_team', 'cfb_game__away_team',
@@ -62,9 +64,10 @@ def command_center_home(request):
         )
         .order_by('-model_edge')
     )
-    # Dedupe by (sport, game.id) — the engine writes a fresh row each time
-    # the rec mutates so the same game can have several rows in the day.
-    # Keep the highest-edge one per game (already first due to ordering).
+    # Dedupe by (sport, game.id) — the engine writes a fresh row only when
+    # the decision changes, but a game whose pick moved during the day
+    # still has several rows. Keep the highest-edge one per game (already
+    # first due to ordering).
     seen_games = set()
     today_recs = []
     for rec in today_recs_qs:
@@ -313,8 +316,7 @@ def _get_value_data_for_sport(sport, user, sort_by):
         .order_by(time_field)
     )
 
-    compute_fn = entry['compute_fn']
-    games_data = [compute_fn(g, user) for g in games]
+    games_data = entry['compute_slate_fn'](games, user)
     games_data = _apply_filters(games_data, user)
     _attach_recommendations(sport, user, games_data)
     _sort_games_by_tier_then_edge(games_data, sort_by)
@@ -333,21 +335,24 @@ def _get_live_data_for_sport(sport, user):
         .select_related('home_team', 'away_team')
         .order_by(time_field)
     )
-    compute_fn = entry['compute_fn']
-    data = [compute_fn(g, user) for g in games]
+    data = entry['compute_slate_fn'](games, user)
     _attach_recommendations(sport, user, data)
     return data
 
 
 def _attach_recommendations(sport, user, games_data):
     """Mutate each dict in `games_data` to add a `recommendation` key (or None)."""
+    from apps.core.services.current_recommendation import prefetch_current_recommendations
     from apps.core.services.recommendations import get_recommendation
+    prefetch_current_recommendations(
+        sport, [g['game'] for g in games_data if g.get('game') is not None], user,
+    )
     for g in games_data:
         game_obj = g.get('game')
         if game_obj is None:
             g['recommendation'] = None
             continue
-        g['recommendation'] = get_recommendation(sport, game_obj, user)
+        g['recommendation'] = get_recommendation(sport, game_obj, user, data=g)
 
 
 def _partition_elite(games_data, live_data):
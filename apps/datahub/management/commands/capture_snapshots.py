@@ -143,6 +143,8 @@ class Command(BaseCommand):
         from apps.mlb.services.model_service import (
             compute_data_confidence as mlb_confidence,
             compute_house_win_prob as mlb_house_prob,
+            house_win_probs as mlb_house_probs,
+            prefetch_scoring_inputs as mlb_prefetch,
         )
         games = MLBGame.objects.filter(
             status='scheduled',
@@ -151,19 +153,35 @@ class Command(BaseCommand):
         ).select_related('home_team', 'away_team').prefetch_related(
             'odds_snapshots', 'injuries', 'result_snapshots',
         )
-        captured = 0
+        pending = []
         for game in games:
             if game.result_snapshots.exists():
                 continue
             latest_odds = game.odds_snapshots.first()
             if not latest_odds:
                 continue
+            pending.append((game, latest_odds))
+
+        # Score the whole window in one batch; on failure fall back to the
+        # per-game model so one bad row can't block the others.
+        house_probs = {}
+        try:
+            batch = mlb_prefetch([game for game, _ in pending])
+            house_probs = dict(zip((g.pk for g in batch), mlb_house_probs(batch)))
+        except Exception as e:
+            logger.error(f'Batch MLB scoring failed, scoring per game: {e}')
+
+        captured = 0
+        for game, latest_odds in pending:
             try:
+                house_prob = house_probs.get(game.pk)
+                if house_prob is None:
+                    house_prob = mlb_house_prob(game)
                 with transaction.atomic():
                     ModelResultSnapshot.objects.create(
                         mlb_game=game,
                         market_prob=latest_odds.market_home_win_prob,
-                        house_prob=mlb_house_prob(game),
+                        house_prob=house_prob,
                         house_model_version='v1',
                         data_confidence=mlb_confidence(game, latest_odds),
                     )
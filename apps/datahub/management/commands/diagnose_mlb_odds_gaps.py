@@ -95,7 +95,7 @@ class _GameDiag:
         now = _tz.now()
         cutoff = now - timedelta(minutes=180)
         all_for_game = OddsSnapshot.objects.filter(game=self.game)
-        recent = all_for_game.filter(captured_at__gte=cutoff)
+        recent = all_for_game.filter(last_seen_at__gte=cutoff)
         self.db_books_count = recent.values('sportsbook').distinct().count()
 
         # All-time totals.
@@ -111,26 +111,26 @@ class _GameDiag:
         )
 
         # Latest snapshot overall.
-        latest = all_for_game.order_by('-captured_at').first()
+        latest = all_for_game.order_by('-last_seen_at').first()
         if latest:
-            self.snap_age_min = int((now - latest.captured_at).total_seconds() / 60)
+            self.snap_age_min = int((now - latest.last_seen_at).total_seconds() / 60)
             self.snap_source = (latest.odds_source or '?')[:8]
 
         # Latest primary + latest ESPN ages, so we can see the lag pattern.
         latest_primary = (
             all_for_game.filter(odds_source='odds_api')
-            .order_by('-captured_at').first()
+            .order_by('-last_seen_at').first()
         )
         self.last_primary_age_min = (
-            int((now - latest_primary.captured_at).total_seconds() / 60)
+            int((now - latest_primary.last_seen_at).total_seconds() / 60)
             if latest_primary else None
         )
         latest_espn = (
             all_for_game.filter(odds_source='espn')
-            .order_by('-captured_at').first()
+            .order_by('-last_seen_at').first()
         )
         self.last_espn_age_min = (
-            int((now - latest_espn.captured_at).total_seconds() / 60)
+            int((now - latest_espn.last_seen_at).total_seconds() / 60)
             if latest_espn else None
         )
 
@@ -891,7 +891,7 @@ class Command(BaseCommand):
             # the persist landed a row with is_derived=True (which
             # wouldn't pass freshness gate? — it's still primary so it
             # WOULD count). Most likely: the persist actually succeeded
-            # but its captured_at is older than fresh_window — i.e., the
+            # but its last_seen_at is older than fresh_window — i.e., the
             # row exists but is stale.
             return 'api_persisted_but_stale_or_filtered (re-check fresh window)'
         if d.api_present == 'YES' and d.api_parsed == 'NO':
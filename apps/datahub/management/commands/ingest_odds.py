@@ -52,8 +52,9 @@ def _current_day_snapshot_count(sport: str) -> int:
 def _find_mlb_games_without_fresh_odds(fresh_max_age_minutes: int = 180):
     """Return (upcoming_pks, gap_pks) for MLB games in the next ~36h.
 
-    A gap game is one with NO OddsSnapshot captured within
-    `fresh_max_age_minutes`. The window starts 2h ago so a game that
+    A gap game is one with NO OddsSnapshot seen within
+    `fresh_max_age_minutes` (last_seen_at, so an unchanged line confirmed
+    by the latest pull counts as fresh). The window starts 2h ago so a game that
     just first-pitched still gets covered. Used by the per-game ESPN
     fallback to fill exactly the holes primary missed — never the games
     primary already covered.
@@ -74,7 +75,7 @@ def _find_mlb_games_without_fresh_odds(fresh_max_age_minutes: int = 180):
 
     games_with_fresh = (
         OddsSnapshot.objects
-        .filter(game_id__in=upcoming_pks, captured_at__gte=fresh_cutoff)
+        .filter(game_id__in=upcoming_pks, last_seen_at__gte=fresh_cutoff)
         .values_list('game_id', flat=True)
         .distinct()
     )
@@ -193,6 +194,7 @@ class Command(BaseCommand):
         # snapshots regardless of how the slate splits.
         primary_created = (stats or {}).get('created', 0)
         primary_skipped = (stats or {}).get('skipped', 0)
+        primary_unchanged = (stats or {}).get('unchanged', 0)
         api_filled_count = 0
         espn_filled_count = 0
         still_missing_count = 0
@@ -218,6 +220,7 @@ class Command(BaseCommand):
                     # game's pk happened to fall outside the gap set.
                     provider = MLBEspnOddsProvider()
                     raw = provider.fetch()
+                    provider.archive_raw(raw)
                     normalized = provider.normalize(raw)
                     fallback_stats = provider.persist(normalized)
                     self.stdout.write(self.style.SUCCESS(
@@ -227,8 +230,9 @@ class Command(BaseCommand):
                     # Combine totals so the fail-fast check below sees the full
                     # picture. We keep 'source' = primary+espn_fallback for trace.
                     stats = {
-                        'status': 'ok' if (primary_created + fallback_created) else 'empty',
+                        'status': 'ok' if (primary_created + fallback_created + primary_unchanged) else 'empty',
                         'created': primary_created + fallback_created,
+                        'unchanged': primary_unchanged + fallback_stats.get('unchanged', 0),
                         'skipped': primary_skipped + fallback_stats.get('skipped', 0),
                         'source': 'primary+espn_fallback',
                     }
@@ -264,7 +268,10 @@ class Command(BaseCommand):
         # --- fail-fast integrity checks ----------------------------------
         created = (stats or {}).get('created', 0)
         skipped = (stats or {}).get('skipped', 0)
-        if created == 0:
+        # Change-only writes: a pull that only re-confirmed current lines
+        # inserts nothing but is a healthy ingest.
+        unchanged = (stats or {}).get('unchanged', 0)
+        if created == 0 and unchanged == 0:
             msg = (
                 f"{sport}_odds_ingest_zero_created "
                 f"skipped={skipped} stats={stats!r}"
@@ -284,3 +291,10 @@ class Command(BaseCommand):
             logger.error(msg)
         elif today_count > 0:
             logger.info(f"{sport}_odds_sanity_ok today_count={today_count}")
+
+        # Post-ingest: recompute the stored current pick for this sport's
+        # upcoming games (core.CurrentRecommendation). Never raises.
+        from apps.core.services.current_recommendation import refresh_after_ingest
+        rec_stats = refresh_after_ingest(sport)
+        if rec_stats is not None:
+            self.stdout.write(f"Current recommendations: {rec_stats}")
@@ -0,0 +1,60 @@
+"""Print the adaptive odds polling plan without pulling anything.
+
+Shows, per sport, the urgency tier of its next game, when it was last
+pulled, whether this cycle would pull it and why, and the quota pacing
+behind the decision (apps/datahub/services/odds_schedule.py). Works
+whether or not ODDS_ADAPTIVE_POLLING is on — use it to tune
+ODDS_POLL_TIERS before flipping the flag.
+
+Usage:
+    python manage.py plan_odds_pulls
+    python manage.py plan_odds_pulls --sport mlb
+    python manage.py plan_odds_pulls --enabled-only
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.sport_registry import SPORT_REGISTRY
+from apps.datahub.management.commands.refresh_data import SPORTS_CONFIG
+from apps.datahub.services.odds_schedule import adaptive_polling_enabled, plan_odds_pulls
+
+
+class Command(BaseCommand):
+    help = 'Dry-run report of which sports the adaptive odds poller would pull now.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sport', choices=list(SPORT_REGISTRY), help='Only plan this sport.')
+        parser.add_argument(
+            '--enabled-only', action='store_true',
+            help='Only plan sports whose LIVE_<SPORT>_ENABLED toggle is on.',
+        )
+
+    def handle(self, *args, **options):
+        sports = list(SPORT_REGISTRY)
+        if options.get('sport'):
+            sports = [options['sport']]
+        if options.get('enabled_only'):
+            enabled = {cfg[0] for cfg in SPORTS_CONFIG if getattr(settings, cfg[1], False)}
+            sports = [s for s in sports if s in enabled]
+
+        plan = plan_odds_pulls(sports)
+        mode = 'on' if adaptive_polling_enabled() else 'off (report only)'
+        self.stdout.write(f'Odds polling plan @ {plan.generated_at:%Y-%m-%d %H:%M} UTC — ODDS_ADAPTIVE_POLLING {mode}')
+        if plan.credits_remaining is None:
+            self.stdout.write('  quota: unknown (no metered Odds API call yet) — no pacing applied')
+        else:
+            self.stdout.write(
+                f'  quota: {plan.credits_remaining} remaining, {plan.days_left} days left in cycle, '
+                f'{plan.daily_budget:.0f}/day budget, {plan.spent_today} spent today'
+            )
+        for pull in plan.pulls:
+            start = '-' if pull.minutes_to_start is None else f'{pull.minutes_to_start}m'
+            last = pull.last_pull_at.strftime('%m-%d %H:%M') if pull.last_pull_at else 'never'
+            self.stdout.write(
+                f'  {pull.sport:<17} {pull.decision.upper():<4} {pull.reason:<18} '
+                f'tier={pull.tier or "-":<9} next={start:<7} games={pull.games_in_window:<4} '
+                f'last={last:<11} cost={pull.cost}'
+            )
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(plan.planned_sports)} pulls planned, {plan.planned_credits} credits'
+        ))
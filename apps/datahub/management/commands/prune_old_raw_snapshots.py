@@ -12,6 +12,11 @@ would be many millions of rows within a season. Significant/closing/
 bet_context rows are the ones we actually use for analytics, and they're
 a tiny fraction of the volume.
 
+Age is measured from last_seen_at, not captured_at: with change-only
+writes (ODDS_CHANGE_ONLY_WRITES) a quiet market's current line can be
+weeks old by captured_at yet confirmed by every pull, and must survive.
+Golf snapshots have no last_seen_at and keep the captured_at rule.
+
 Idempotent. Safe to run on every refresh_data invocation. Logs counts
 per sport.
 
@@ -64,7 +69,8 @@ class Command(BaseCommand):
 
         total_deleted = 0
         for label, model in SNAPSHOT_MODELS:
-            qs = model.objects.filter(snapshot_type='raw', captured_at__lt=cutoff)
+            age_field = 'last_seen_at' if label != 'golf' else 'captured_at'
+            qs = model.objects.filter(snapshot_type='raw', **{f'{age_field}__lt': cutoff})
             count = qs.count()
             if dry_run:
                 self.stdout.write(f'  {label}: would delete {count} raw rows older than {days}d')
@@ -0,0 +1,69 @@
+"""Prune raw OddsApiUsage and CronRunLog rows older than the retention window.
+
+Keeps:
+  - every row newer than --days (default OPS_RAW_RETENTION_DAYS, 30)
+  - CronRunLog rows still 'running' (is_command_running / stuck detection)
+  - all OddsApiUsageHourly / CronRunHourly rollups — the Command Center's
+    24h / 7d numbers come from those when OPS_ROLLUP_READS is on
+
+Why: one OddsApiUsage row per Odds API attempt and one CronRunLog row (with
+up to 80K of stdout tail) per run add up; the dashboard only looks at the
+last week, and the rollups carry the long-term counts.
+
+Run rebuild_ops_rollups first if the rollups don't cover the window being
+pruned yet — pruned rows can't be rolled up later.
+
+Usage:
+    python manage.py prune_ops_history
+    python manage.py prune_ops_history --days 14
+    python manage.py prune_ops_history --dry-run
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.ops.models import CronRunLog, OddsApiUsage
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Prune raw ops telemetry older than --days (rollups are kept).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int,
+            help='Retention window in days (default settings.OPS_RAW_RETENTION_DAYS).',
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report what would be deleted without deleting.',
+        )
+
+    def handle(self, *args, **options):
+        days = options.get('days') or getattr(settings, 'OPS_RAW_RETENTION_DAYS', 30)
+        dry_run = options['dry_run']
+        cutoff = timezone.now() - timedelta(days=days)
+
+        targets = [
+            ('api_usage', OddsApiUsage.objects.filter(timestamp__lt=cutoff)),
+            ('cron_runs', CronRunLog.objects.filter(started_at__lt=cutoff).exclude(status='running')),
+        ]
+        total = 0
+        for label, qs in targets:
+            if dry_run:
+                count = qs.count()
+                self.stdout.write(f'  {label}: would delete {count} rows older than {days}d')
+            else:
+                count, _ = qs.delete()
+                self.stdout.write(f'  {label}: deleted {count} rows older than {days}d')
+            total += count
+
+        verb = 'would delete' if dry_run else 'deleted'
+        logger.info(f"prune_ops_history {verb}={total} cutoff={cutoff.isoformat()}")
+        self.stdout.write(self.style.SUCCESS(
+            f'prune_ops_history {verb} {total} rows total (cutoff {cutoff:%Y-%m-%d %H:%M})'
+        ))
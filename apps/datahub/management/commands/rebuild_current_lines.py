@@ -0,0 +1,70 @@
+"""Rebuild core.CurrentLine from OddsSnapshot history.
+
+CurrentLine (apps/core/services/current_line.py) is upserted with every
+odds insert. This command drops it and writes the newest snapshot per
+(game, sportsbook, odds_source, is_derived) again, per sport. Run it:
+
+  - once before turning on CURRENT_LINE_READS, so games ingested before
+    the table existed have rows;
+  - after any manual OddsSnapshot edits or bulk deletes.
+
+Idempotent. Golf is excluded — its odds are per-golfer, not per-game.
+
+Usage:
+    python manage.py rebuild_current_lines
+    python manage.py rebuild_current_lines --sport mlb
+    python manage.py rebuild_current_lines --sport mlb --game <game uuid>
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.cbb.models import OddsSnapshot as CBBOddsSnapshot
+from apps.cfb.models import OddsSnapshot as CFBOddsSnapshot
+from apps.college_baseball.models import OddsSnapshot as CBOddsSnapshot
+from apps.core.services.current_line import rebuild_current_lines
+from apps.mlb.models import OddsSnapshot as MLBOddsSnapshot
+
+logger = logging.getLogger(__name__)
+
+# (label, model_class) — extend here when a sport gains per-game odds.
+SNAPSHOT_MODELS = [
+    ('mlb', MLBOddsSnapshot),
+    ('cfb', CFBOddsSnapshot),
+    ('cbb', CBBOddsSnapshot),
+    ('college_baseball', CBOddsSnapshot),
+]
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the materialized current-line table from snapshot history.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sport', choices=[label for label, _ in SNAPSHOT_MODELS],
+            help='Only rebuild this sport (default: all).',
+        )
+        parser.add_argument(
+            '--game', action='append', dest='game_ids',
+            help='Only rebuild this game id (repeatable; requires --sport).',
+        )
+
+    def handle(self, *args, **options):
+        sport = options.get('sport')
+        game_ids = options.get('game_ids')
+        if game_ids and not sport:
+            raise CommandError('--game requires --sport')
+
+        total = 0
+        for label, model in SNAPSHOT_MODELS:
+            if sport and label != sport:
+                continue
+            with transaction.atomic():
+                written = rebuild_current_lines(model, game_ids=game_ids)
+            self.stdout.write(f'  {label}: {written} current lines')
+            total += written
+
+        self.stdout.write(self.style.SUCCESS(
+            f'rebuild_current_lines wrote {total} rows total'
+        ))
@@ -11,19 +11,17 @@ When to use:
   - After changing K-factors, HFA, or margin formula.
   - After a data correction that affects historical scores.
 
+Ratings are replayed in memory (elo_service.rebuild_sport) and written
+with bulk_create / bulk_update, so a multi-season rebuild is a handful of
+queries per 2000 games rather than several per game.
+
 Examples:
   python manage.py rebuild_elo_ratings                # all sports
   python manage.py rebuild_elo_ratings --sport mlb
 """
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from apps.core.services.elo_service import (
-    SPORT_ELO_REGISTRY,
-    get_game_model,
-    process_game,
-    reset_sport,
-)
+from apps.core.services.elo_service import SPORT_ELO_REGISTRY, rebuild_sport
 
 
 SUPPORTED = ['all'] + list(SPORT_ELO_REGISTRY.keys())
@@ -47,34 +45,14 @@ class Command(BaseCommand):
             self._rebuild_sport(sport)
 
     def _rebuild_sport(self, sport: str):
-        entry = SPORT_ELO_REGISTRY[sport]
-        GameModel = get_game_model(sport)
-        time_field = entry.time_field
-
-        with transaction.atomic():
-            cleared = reset_sport(sport)
-            self.stdout.write(
-                f"[{sport}] Reset {cleared} teams; cleared TeamEloHistory rows."
-            )
-
-            qs = (
-                GameModel.objects
-                .filter(status='final', home_score__isnull=False, away_score__isnull=False)
-                .select_related('home_team', 'away_team')
-                .order_by(time_field)
-            )
-
-            processed = 0
-            skipped = 0
-            for game in qs.iterator():
-                if process_game(sport, game):
-                    processed += 1
-                else:
-                    # Skipped from process_game — typically a tie or
-                    # missing scores. Already-processed isn't possible
-                    # here because we reset above, but the guard is cheap.
-                    skipped += 1
-
-            self.stdout.write(self.style.SUCCESS(
-                f"[{sport}] Rebuild complete — processed={processed}, skipped={skipped}."
-            ))
+        # One transaction: reset, stream every final game once in
+        # chronological order with ratings held in memory, then bulk-write
+        # history and teams. Skipped games are ties.
+        stats = rebuild_sport(sport)
+        self.stdout.write(
+            f"[{sport}] Reset {stats['teams_reset']} teams; cleared TeamEloHistory rows."
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"[{sport}] Rebuild complete — processed={stats['processed']}, "
+            f"skipped={stats['skipped']}."
+        ))
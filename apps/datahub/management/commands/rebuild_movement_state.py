@@ -0,0 +1,71 @@
+"""Rebuild OddsMovementState from OddsSnapshot history.
+
+The running movement state (apps/core/services/movement_state.py) is
+updated on every ingest pass. This command throws it away and replays the
+snapshots still inside the movement history window, per sport. Run it:
+
+  - once before turning on MOVEMENT_STATE_READS, so games already in
+    flight have complete windows;
+  - after any manual OddsSnapshot edits or bulk deletes;
+  - whenever the movement tunables (HISTORY_MAX_SNAPSHOTS / _HOURS) change.
+
+Idempotent. Golf is excluded — it has no movement scoring.
+
+Usage:
+    python manage.py rebuild_movement_state
+    python manage.py rebuild_movement_state --sport mlb
+    python manage.py rebuild_movement_state --sport mlb --game <game uuid>
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.cbb.models import OddsSnapshot as CBBOddsSnapshot
+from apps.cfb.models import OddsSnapshot as CFBOddsSnapshot
+from apps.college_baseball.models import OddsSnapshot as CBOddsSnapshot
+from apps.core.services.movement_state import rebuild_movement_state
+from apps.mlb.models import OddsSnapshot as MLBOddsSnapshot
+
+logger = logging.getLogger(__name__)
+
+# (label, model_class) — extend here when a sport gains movement scoring.
+SNAPSHOT_MODELS = [
+    ('mlb', MLBOddsSnapshot),
+    ('cfb', CFBOddsSnapshot),
+    ('cbb', CBBOddsSnapshot),
+    ('college_baseball', CBOddsSnapshot),
+]
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the persisted odds movement state from snapshot history.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sport', choices=[label for label, _ in SNAPSHOT_MODELS],
+            help='Only rebuild this sport (default: all).',
+        )
+        parser.add_argument(
+            '--game', action='append', dest='game_ids',
+            help='Only rebuild this game id (repeatable; requires --sport).',
+        )
+
+    def handle(self, *args, **options):
+        sport = options.get('sport')
+        game_ids = options.get('game_ids')
+        if game_ids and not sport:
+            raise CommandError('--game requires --sport')
+
+        total = 0
+        for label, model in SNAPSHOT_MODELS:
+            if sport and label != sport:
+                continue
+            with transaction.atomic():
+                written = rebuild_movement_state(model, game_ids=game_ids)
+            self.stdout.write(f'  {label}: {written} state rows')
+            total += written
+
+        self.stdout.write(self.style.SUCCESS(
+            f'rebuild_movement_state wrote {total} rows total'
+        ))
@@ -0,0 +1,38 @@
+"""Recompute the hourly ops rollups from raw OddsApiUsage / CronRunLog rows.
+
+The rollups are maintained incrementally as telemetry is written, so this
+is only needed to backfill history from before they existed, or to repair
+them after a rollup write failed (logged as "Failed to roll up ...").
+Hours whose raw rows have already been pruned are left untouched.
+
+Usage:
+    python manage.py rebuild_ops_rollups
+    python manage.py rebuild_ops_rollups --days 7
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.ops.services.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Rebuild OddsApiUsageHourly / CronRunHourly from raw telemetry.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int,
+            help='Only rebuild the last N days (default: all raw history).',
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options.get('days'):
+            since = timezone.now() - timedelta(days=options['days'])
+        with transaction.atomic():
+            usage_n, cron_n = rebuild(since=since)
+        self.stdout.write(self.style.SUCCESS(
+            f'rebuild_ops_rollups folded {usage_n} API usage rows and {cron_n} cron runs'
+        ))
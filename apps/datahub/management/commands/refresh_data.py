@@ -19,13 +19,39 @@ captured into the CronRunLog row's stdout_tail. That way the Recent
 Runs panel shows lines like ingest_odds's persist summary
 ("Done: {created=N, skipped=M, skip_reasons={...}}") inline without the
 operator needing to dig through Railway logs.
+
+--parallel N: fans the per-sport ingestion out to a bounded pool of N
+worker threads (most of the wall time is blocked on HTTP). Each sport is
+a staged plan — schedule first, then odds / injuries / pitcher stats /
+team records concurrently, then capture_snapshots → resolve_outcomes —
+so the same-sport ordering constraints hold. Per-host request spacing
+lives in APIClient, so every provider's rate_limit_delay is still
+respected when several sports hit the Odds API at once. Each step's
+output is buffered and written back as one contiguous per-sport block,
+so stdout_tail reads the same as a serial run. The default (1) is the
+original serial walk.
+
+ODDS_ADAPTIVE_POLLING: when on, each sport's ingest_odds step is kept or
+dropped according to apps.datahub.services.odds_schedule.plan_odds_pulls
+(urgency tier, tier cadence, daily quota share). Schedule, injuries and
+the rest still run every cycle. Planned and actual Odds API credits are
+recorded on the CronRunLog row either way (planned only when the flag is
+on); a planning error falls back to pulling every sport.
 """
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from io import StringIO
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 
+from apps.datahub.services.odds_schedule import (
+    adaptive_polling_enabled,
+    latest_credits_used,
+    plan_odds_pulls,
+)
 from apps.ops.services.cron_logging import cron_run_log
 
 
@@ -43,6 +69,57 @@ SPORTS_CONFIG = [
 SNAPSHOT_ELIGIBLE_SPORTS = {'cfb', 'cbb', 'mlb', 'college_baseball'}
 
 
+def _sport_stages(sport, has_injuries, has_pitcher_stats, has_team_records,
+                  include_odds=True):
+    """Ordered stages for one sport. Each stage is a list of independent
+    tasks; each task is a list of (command, kwargs) run in order. A stage
+    starts only after every task in the previous stage succeeded.
+
+    The serial path runs the same commands in the same relative order
+    (flattened), so both modes ingest identically. `include_odds=False`
+    drops the ingest_odds task (the adaptive polling plan skipped it).
+    """
+    fetch_stage = []
+    if include_odds:
+        fetch_stage.append([('ingest_odds', {'sport': sport, 'force': True})])
+    if has_injuries:
+        fetch_stage.append([('ingest_injuries', {'sport': sport, 'force': True})])
+    if has_pitcher_stats:
+        fetch_stage.append([('ingest_pitcher_stats', {'sport': sport, 'force': True})])
+    if has_team_records:
+        fetch_stage.append([('ingest_team_records', {'sport': sport, 'force': True})])
+    stages = [
+        # Schedule before everything else: odds/pitcher stats match
+        # against the Game rows it creates.
+        [[('ingest_schedule', {'sport': sport, 'force': True})]],
+        fetch_stage,
+    ]
+    if sport in SNAPSHOT_ELIGIBLE_SPORTS:
+        stages.append([[
+            ('capture_snapshots', {'sport': sport}),
+            ('resolve_outcomes', {'sport': sport}),
+        ]])
+    return stages
+
+
+def _run_task(steps):
+    """Worker body — run one task's commands in order into a private buffer.
+
+    Returns the captured text. Closes this thread's DB connection on the
+    way out so pooled workers don't leak connections.
+    """
+    buf = StringIO()
+    try:
+        for command, kwargs in steps:
+            call_command(command, stdout=buf, **kwargs)
+    except Exception as exc:
+        exc.captured_output = buf.getvalue()
+        raise
+    finally:
+        connection.close()
+    return buf.getvalue()
+
+
 class Command(BaseCommand):
     help = 'Refresh all live data (schedule, odds, injuries, pitcher stats) for enabled sports'
 
@@ -51,8 +128,15 @@ class Command(BaseCommand):
         # with the requesting user. Default 'cron' covers Railway-scheduled runs.
         parser.add_argument('--trigger', choices=['cron', 'manual', 'deploy'], default='cron')
         parser.add_argument('--triggered-by-user-id', type=int, default=None)
+        parser.add_argument(
+            '--parallel', type=int, default=1, metavar='N',
+            help='Run per-sport ingestion on N worker threads (default 1 = serial)',
+        )
 
     def handle(self, *args, **options):
+        self.parallel = options.get('parallel', 1)
+        if self.parallel < 1:
+            raise CommandError('--parallel must be >= 1')
         triggered_by = None
         if options.get('triggered_by_user_id'):
             User = get_user_model()
@@ -110,37 +194,54 @@ class Command(BaseCommand):
         sport_failures = []
         sport_successes = []
 
+        odds_plan = None
+        if adaptive_polling_enabled():
+            enabled = [cfg[0] for cfg in SPORTS_CONFIG if getattr(settings, cfg[1], False)]
+            try:
+                odds_plan = plan_odds_pulls(enabled)
+            except Exception as e:
+                _emit(f'odds polling plan failed, pulling every sport: {e}')
+        credits_before = latest_credits_used()
+
+        plans = []
         for sport, toggle, has_injuries, has_pitcher_stats, has_team_records in SPORTS_CONFIG:
             if not getattr(settings, toggle, False):
                 _emit(f'  {sport}: skipped ({toggle}=false)')
                 continue
+            include_odds = True
+            pull = odds_plan.for_sport(sport) if odds_plan else None
+            if pull is not None and not pull.planned:
+                include_odds = False
+                _emit(f'  {sport}: odds skipped ({pull.reason}, tier={pull.tier or "-"})')
+            plans.append((sport, _sport_stages(
+                sport, has_injuries, has_pitcher_stats, has_team_records,
+                include_odds=include_odds,
+            )))
 
-            _emit(f'Refreshing {sport}...')
-            try:
-                # stdout=self.stdout forwards subcommand output through
-                # this command's monkey-patched write, capturing into
-                # stdout_lines. Without this, ingest_odds's "Done:
-                # {created=…, skip_reasons=…}" line would be lost to
-                # Railway's process stdout instead of the CronRunLog
-                # row's expandable summary.
-                call_command('ingest_schedule', sport=sport, force=True, stdout=self.stdout)
-                call_command('ingest_odds', sport=sport, force=True, stdout=self.stdout)
-                if has_injuries:
-                    call_command('ingest_injuries', sport=sport, force=True, stdout=self.stdout)
-                if has_pitcher_stats:
-                    call_command('ingest_pitcher_stats', sport=sport, force=True, stdout=self.stdout)
-                if has_team_records:
-                    call_command('ingest_team_records', sport=sport, force=True, stdout=self.stdout)
-                if sport in SNAPSHOT_ELIGIBLE_SPORTS:
-                    call_command('capture_snapshots', sport=sport, stdout=self.stdout)
-                    call_command('resolve_outcomes', sport=sport, stdout=self.stdout)
-                _emit(f'{sport} done')
-                sport_successes.append(sport)
-            except Exception as e:
-                # Visible, not silent — the UI "Data temporarily unavailable"
-                # state downstream reflects what happened here.
-                _emit(f'{sport} failed: {e}')
-                sport_failures.append((sport, str(e)))
+        if getattr(self, 'parallel', 1) > 1 and plans:
+            _emit(f'Parallel refresh: {self.parallel} workers')
+            self._refresh_sports_parallel(plans, _emit, sport_successes, sport_failures)
+        else:
+            for sport, stages in plans:
+                _emit(f'Refreshing {sport}...')
+                try:
+                    # stdout=self.stdout forwards subcommand output through
+                    # this command's monkey-patched write, capturing into
+                    # stdout_lines. Without this, ingest_odds's "Done:
+                    # {created=…, skip_reasons=…}" line would be lost to
+                    # Railway's process stdout instead of the CronRunLog
+                    # row's expandable summary.
+                    for stage in stages:
+                        for task in stage:
+                            for command, kwargs in task:
+                                call_command(command, stdout=self.stdout, **kwargs)
+                    _emit(f'{sport} done')
+                    sport_successes.append(sport)
+                except Exception as e:
+                    # Visible, not silent — the UI "Data temporarily unavailable"
+                    # state downstream reflects what happened here.
+                    _emit(f'{sport} failed: {e}')
+                    sport_failures.append((sport, str(e)))
 
         # Settle pending mock bets for any games that finalized this cycle.
         try:
@@ -169,6 +270,20 @@ class Command(BaseCommand):
             _emit(f'update_elo_ratings failed: {e}')
             sport_failures.append(('update_elo_ratings', str(e)))
 
+        # Recompute the stored current pick for every upcoming game of the
+        # sports that refreshed cleanly, now that schedule, odds, pitchers
+        # and Elo for this cycle have all landed. Readers fall back to
+        # computing inline, so a skipped or failed sport only costs page
+        # latency.
+        for sport in list(sport_successes):
+            if sport not in SNAPSHOT_ELIGIBLE_SPORTS:
+                continue
+            try:
+                call_command('refresh_recommendations', sport=sport, stdout=self.stdout)
+            except Exception as e:
+                _emit(f'refresh_recommendations {sport} failed: {e}')
+                sport_failures.append((f'refresh_recommendations:{sport}', str(e)))
+
         # Prune old raw OddsSnapshot rows. Cheap when there's nothing to
         # delete; protects the DB from runaway growth as we now keep
         # every API pull (not just one per day per game).
@@ -180,6 +295,12 @@ class Command(BaseCommand):
 
         _emit('Refresh complete')
 
+        if odds_plan is not None:
+            log.odds_credits_planned = odds_plan.planned_credits
+        credits_after = latest_credits_used()
+        if credits_before is not None and credits_after is not None and credits_after >= credits_before:
+            log.odds_credits_used = credits_after - credits_before
+
         log.summary = (
             f'success={len(sport_successes)} fail={len(sport_failures)}'
             f' [{",".join(sport_successes) or "none"}]'
@@ -188,3 +309,79 @@ class Command(BaseCommand):
         if sport_failures:
             detail = '; '.join(f'{name}: {err[:200]}' for name, err in sport_failures)
             log.mark_partial(detail)
+
+    def _refresh_sports_parallel(self, plans, _emit, sport_successes, sport_failures):
+        """Drive every sport's staged plan through one bounded worker pool.
+
+        Scheduling happens on this (main) thread: whenever a task finishes
+        we check whether its sport's stage is complete and, if so, submit
+        the next stage. Workers never submit work themselves, so a full
+        pool can't deadlock. A failed task stops its sport after the
+        in-flight siblings of that stage finish — the same "rest of this
+        sport is abandoned" semantics as the serial path's exception.
+
+        Output for a sport is emitted as one block once the sport settles,
+        in plan order, so the captured stdout_tail isn't interleaved.
+        """
+        state = {
+            sport: {
+                'stages': stages, 'stage': 0, 'pending': 0,
+                'outputs': [], 'error': None,
+            }
+            for sport, stages in plans
+        }
+        in_flight = {}
+
+        def _submit_stage(pool, sport):
+            st = state[sport]
+            tasks = st['stages'][st['stage']]
+            st['outputs'].append([''] * len(tasks))
+            st['pending'] = len(tasks)
+            for idx, task in enumerate(tasks):
+                future = pool.submit(_run_task, task)
+                in_flight[future] = (sport, st['stage'], idx)
+
+        def _finish(sport):
+            st = state[sport]
+            _emit(f'Refreshing {sport}...')
+            for stage_outputs in st['outputs']:
+                for text in stage_outputs:
+                    for line in text.splitlines():
+                        _emit(line)
+            if st['error'] is None:
+                _emit(f'{sport} done')
+                sport_successes.append(sport)
+            else:
+                _emit(f'{sport} failed: {st["error"]}')
+                sport_failures.append((sport, str(st['error'])))
+
+        with ThreadPoolExecutor(
+            max_workers=self.parallel, thread_name_prefix='refresh_data',
+        ) as pool:
+            for sport, _ in plans:
+                _submit_stage(pool, sport)
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    sport, stage_idx, task_idx = in_flight.pop(future)
+                    st = state[sport]
+                    try:
+                        text = future.result()
+                    except Exception as e:
+                        text = getattr(e, 'captured_output', '')
+                        if st['error'] is None:
+                            st['error'] = e
+                    st['outputs'][stage_idx][task_idx] = text
+                    st['pending'] -= 1
+                    if st['pending']:
+                        continue
+                    st['stage'] += 1
+                    if st['error'] is None and st['stage'] < len(st['stages']):
+                        _submit_stage(pool, sport)
+                    else:
+                        _finish(sport)
+
+        # Keep the summary's sport order stable regardless of finish order.
+        order = [sport for sport, _ in plans]
+        sport_successes.sort(key=order.index)
+        sport_failures.sort(key=lambda item: order.index(item[0]))
@@ -0,0 +1,57 @@
+"""Recompute core.CurrentRecommendation for every upcoming and live game.
+
+The post-ingest worker (apps/core/services/current_recommendation.py)
+stores each game's house-model pick so the hub, value board and Bet All
+read one row instead of running the decision layer per request.
+`ingest_odds` refreshes its sport after every run and `refresh_data`
+runs this command once the whole cycle (schedule, odds, pitchers, Elo)
+has landed. Run it by hand:
+
+  - once before turning on CURRENT_RECOMMENDATION_READS;
+  - after changing USE_DYNAMIC_RATINGS or USE_STARTER_RECENT_FORM.
+
+Idempotent; unchanged rows are only re-confirmed.
+
+`--history` also records each house pick in BettingRecommendation
+through persist_slate_recommendations — write-on-change, so an unchanged
+pick only moves `last_confirmed_at` on its latest row.
+
+Usage:
+    python manage.py refresh_recommendations
+    python manage.py refresh_recommendations --sport mlb
+    python manage.py refresh_recommendations --history
+"""
+from django.core.management.base import BaseCommand
+
+from apps.core.services.current_recommendation import (
+    refresh_current_recommendations,
+    upcoming_games,
+)
+from apps.core.services.recommendations import persist_slate_recommendations
+from apps.core.sport_registry import SPORT_ORDER
+
+
+class Command(BaseCommand):
+    help = 'Recompute the precomputed current recommendation for upcoming games.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sport', choices=SPORT_ORDER,
+            help='Only refresh this sport (default: all).',
+        )
+        parser.add_argument(
+            '--history', action='store_true',
+            help='Also record changed house picks in BettingRecommendation.',
+        )
+
+    def handle(self, *args, **options):
+        sport = options.get('sport')
+        for label in SPORT_ORDER:
+            if sport and label != sport:
+                continue
+            stats = refresh_current_recommendations(label)
+            self.stdout.write(f'  {label}: {stats}')
+            if options.get('history'):
+                history = persist_slate_recommendations(label, upcoming_games(label))
+                self.stdout.write(f'  {label} history: {history}')
+        self.stdout.write(self.style.SUCCESS('refresh_recommendations done'))
@@ -0,0 +1,114 @@
+"""Replay archived raw payloads through normalize -> persist, offline.
+
+Reads the raw-payload archive (apps/datahub/services/raw_archive.py,
+written when RAW_ARCHIVE_ENABLED is on) and feeds each matching payload,
+oldest first, to the provider class that fetched it. Providers are built
+without running `__init__`, so no API key or HTTP client exists and
+nothing can reach the network — every provider keeps its I/O in `fetch()`.
+
+Persist stamps rows with the replay time, as a live ingest would. For odds
+that would make an old payload the fresh current line (movement state,
+opportunity signals, recommendations), so odds payloads only replay with
+--dry-run, which runs persist in a rolled-back transaction and reports the
+stats (e.g. reproducing a parse or matching bug). Other data types replay
+for real and invalidate cached picks the way `run()` does.
+
+Usage:
+    python manage.py replay_ingest --sport mlb --data-type odds --since 2026-10-01 --dry-run
+    python manage.py replay_ingest --sha 3f9a2c --dry-run
+    python manage.py replay_ingest --sport mlb --until 2026-10-02 --limit 5
+"""
+import logging
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from apps.datahub.services.raw_archive import archive_root, iter_archived, load_payload
+
+logger = logging.getLogger(__name__)
+
+
+class _DryRunRollback(Exception):
+    pass
+
+
+def _parse_day(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Invalid date {value!r}; expected YYYY-MM-DD')
+
+
+class Command(BaseCommand):
+    help = 'Re-run normalize/persist against archived raw payloads (no network).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sport', help='Only replay this sport.')
+        parser.add_argument('--data-type', dest='data_type', help='Only replay this data type.')
+        parser.add_argument('--since', help='First capture day to replay (YYYY-MM-DD, UTC).')
+        parser.add_argument('--until', help='Last capture day to replay (YYYY-MM-DD, UTC).')
+        parser.add_argument('--sha', help='Only replay payloads whose sha256 starts with this.')
+        parser.add_argument('--limit', type=int, help='Stop after this many payloads.')
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Run persist inside a transaction that is rolled back.',
+        )
+
+    def handle(self, *args, **options):
+        since = _parse_day(options['since']) if options.get('since') else None
+        until = _parse_day(options['until']) if options.get('until') else None
+        dry_run = options['dry_run']
+        limit = options.get('limit')
+
+        entries = iter_archived(
+            sport=options.get('sport'), data_type=options.get('data_type'),
+            since=since, until=until, sha=options.get('sha'),
+        )
+        providers = {}
+        replayed = failed = 0
+        for entry in entries:
+            if limit is not None and replayed + failed >= limit:
+                break
+            label = f"{entry['sport']}/{entry['data_type']} {entry['captured_at']} {entry['sha'][:12]}"
+            try:
+                provider = providers.get(entry['provider'])
+                if provider is None:
+                    cls = import_string(entry['provider'])
+                    provider = providers[entry['provider']] = cls.__new__(cls)
+                if entry['data_type'] == 'odds' and not dry_run:
+                    raise CommandError('odds payloads only replay with --dry-run')
+                raw = load_payload(entry)
+                stats = self._replay(provider, raw, dry_run)
+            except Exception as e:
+                failed += 1
+                logger.error(f"replay_ingest_failed entry={label} err={e}", exc_info=True)
+                self.stdout.write(self.style.ERROR(f'  {label}: FAILED {e}'))
+                continue
+            replayed += 1
+            self.stdout.write(f'  {label}: {stats}')
+
+        if not replayed and not failed:
+            self.stdout.write(f'No archived payloads matched under {archive_root()}')
+        mode = ' (dry run, rolled back)' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'replay_ingest replayed {replayed} payloads, {failed} failed{mode}'
+        ))
+
+    def _replay(self, provider, raw, dry_run):
+        normalized = provider.normalize(raw)
+        if not dry_run:
+            stats = provider.persist(normalized)
+            if provider.data_type != 'odds':
+                from apps.core.services import recommendation_cache
+                recommendation_cache.bump(provider.sport, 'inputs')
+            return stats
+        stats = None
+        try:
+            with transaction.atomic():
+                stats = provider.persist(normalized)
+                raise _DryRunRollback
+        except _DryRunRollback:
+            pass
+        return stats
@@ -1,22 +1,17 @@
 """Incrementally update Elo ratings for newly-finalized games.
 
-Idempotent: each game is processed at most once because `process_game`
-checks for an existing TeamEloHistory row before applying the update.
-Designed for cron — safe to run on every refresh cycle.
+Idempotent: games that already have TeamEloHistory rows are excluded
+before the replay, which runs on the same in-memory engine as
+`rebuild_elo_ratings` (elo_service.update_sport). Designed for cron —
+safe to run on every refresh cycle.
 
 Examples:
   python manage.py update_elo_ratings              # all sports
   python manage.py update_elo_ratings --sport mlb
 """
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from apps.analytics.models import TeamEloHistory
-from apps.core.services.elo_service import (
-    SPORT_ELO_REGISTRY,
-    get_game_model,
-    process_game,
-)
+from apps.core.services.elo_service import SPORT_ELO_REGISTRY, update_sport
 
 
 SUPPORTED = ['all'] + list(SPORT_ELO_REGISTRY.keys())
@@ -39,39 +34,10 @@ class Command(BaseCommand):
             self._update_sport(sport)
 
     def _update_sport(self, sport: str):
-        entry = SPORT_ELO_REGISTRY[sport]
-        GameModel = get_game_model(sport)
-
-        # Pull the set of game ids already represented in TeamEloHistory.
-        # Pre-filtering on the server side keeps the iteration cheap even
-        # on a multi-season backlog.
-        already_processed = set(
-            TeamEloHistory.objects
-            .filter(sport=sport)
-            .exclude(**{f'{entry.history_game_fk}__isnull': True})
-            .values_list(f'{entry.history_game_fk}_id', flat=True)
-            .distinct()
-        )
-
-        candidate_qs = (
-            GameModel.objects
-            .filter(status='final', home_score__isnull=False, away_score__isnull=False)
-            .exclude(id__in=already_processed)
-            .select_related('home_team', 'away_team')
-            .order_by(entry.time_field)
-        )
-
-        processed = 0
-        skipped = 0
-        with transaction.atomic():
-            for game in candidate_qs.iterator():
-                if process_game(sport, game):
-                    processed += 1
-                else:
-                    # process_game returned False — score equal, missing
-                    # scores, or another concurrent update beat us to it.
-                    skipped += 1
-
+        # Skipped games are ties — already-processed games are filtered
+        # out before the replay.
+        stats = update_sport(sport)
         self.stdout.write(self.style.SUCCESS(
-            f"[{sport}] Update complete — processed={processed}, skipped={skipped}."
+            f"[{sport}] Update complete — processed={stats['processed']}, "
+            f"skipped={stats['skipped']}."
         ))
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 from datetime import timedelta
 
 from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,15 @@ def _score_window():
     return timedelta(hours=lookback), timedelta(hours=lookahead)
 
 
+def _same_value(obj, name, value):
+    """True when `obj.<name>` already equals `value`. FKs compare by id so
+    the dirty check never loads the related row."""
+    field = obj._meta.get_field(name)
+    if field.many_to_one:
+        return getattr(obj, field.attname) == (value.pk if value is not None else None)
+    return getattr(obj, name) == value
+
+
 class AbstractProvider(ABC):
     """Base class for all data providers (schedule, odds, injuries)."""
 
@@ -45,12 +56,200 @@ class AbstractProvider(ABC):
     def persist(self, normalized):
         """Upsert normalized data into Django models. Return stats dict."""
 
+    def _bulk_insert(self, model, objs, batch_size=500):
+        """Insert `objs` with `bulk_create` and return them with pks set.
+
+        `bulk_create` skips `Model.save()` and `post_save`, so callers must
+        fill any field `save()` would have derived, and we replay
+        `post_save(created=True)` per row here — receivers such as the MLB
+        opportunity-signal generator keep firing exactly as they do for a
+        single-row `create()`. On a backend that can't return pks from a
+        bulk insert we fall back to per-row saves.
+        """
+        objs = list(objs)
+        if not objs:
+            return []
+        using = router.db_for_write(model)
+        if not connections[using].features.can_return_rows_from_bulk_insert:
+            for obj in objs:
+                obj.save(using=using)
+            return objs
+        model.objects.using(using).bulk_create(objs, batch_size=batch_size)
+        for obj in objs:
+            post_save.send(
+                sender=model, instance=obj, created=True,
+                update_fields=None, raw=False, using=using,
+            )
+        return objs
+
+    def _bulk_upsert(self, model, rows, *, key_fields=('source', 'external_id'),
+                     update=True, batch_size=500):
+        """Upsert many rows of one model. Returns (objs by key, created, updated).
+
+        `rows` maps a key tuple (values for `key_fields`) to the field dict
+        `update_or_create(defaults=...)` would have taken — callers dedupe
+        across the payload simply by building the dict, last entry wins.
+        One SELECT finds the existing rows, then one `bulk_create` and one
+        `bulk_update` (dirty rows only) write the rest. `updated` counts
+        every existing row, matching what per-row `update_or_create`
+        reported. `update=False` makes it get_or_create: existing rows are
+        returned untouched.
+
+        Not ON CONFLICT: the (source, external_id) constraints are partial
+        (external_id <> ''), which Postgres won't accept as a conflict
+        target without the predicate, and an upsert can't tell created
+        from updated anyway. Like `_bulk_insert`, it skips `save()` and
+        signals; none of the schedule models rely on either.
+        """
+        if not rows:
+            return {}, 0, 0
+        using = router.db_for_write(model)
+        qs = model.objects.using(using).filter(**{
+            f'{field}__in': {key[i] for key in rows}
+            for i, field in enumerate(key_fields)
+        })
+        existing = {}
+        for obj in qs:
+            key = tuple(getattr(obj, field) for field in key_fields)
+            if key in rows:
+                existing[key] = obj
+
+        objs = {}
+        to_create = []
+        to_update = []
+        update_fields = set()
+        for key, fields in rows.items():
+            obj = existing.get(key)
+            if obj is None:
+                obj = model(**dict(zip(key_fields, key)), **fields)
+                to_create.append(obj)
+            elif update:
+                dirty = [f for f, v in fields.items() if not _same_value(obj, f, v)]
+                for f in dirty:
+                    setattr(obj, f, fields[f])
+                if dirty:
+                    to_update.append(obj)
+                    update_fields.update(dirty)
+            objs[key] = obj
+
+        if to_create:
+            if connections[using].features.can_return_rows_from_bulk_insert:
+                model.objects.using(using).bulk_create(to_create, batch_size=batch_size)
+            else:
+                for obj in to_create:
+                    obj.save(using=using)
+        if to_update:
+            model.objects.using(using).bulk_update(
+                to_update, sorted(update_fields), batch_size=batch_size,
+            )
+        return objs, len(to_create), len(existing)
+
+    # A pulled odds row is "unchanged" only when every price AND its
+    # provenance match the current line for that (game, sportsbook).
+    SNAPSHOT_LINE_FIELDS = (
+        'moneyline_home', 'moneyline_away', 'spread', 'total',
+        'odds_source', 'is_derived',
+    )
+
+    def _extend_unchanged_snapshots(self, model, pending, now):
+        """Change-only odds writes. Returns (objs still to insert, n unchanged).
+
+        Compares each unsaved snapshot in `pending` with the current line
+        for its (game, sportsbook) — one windowed query for the whole pass.
+        Exact matches aren't inserted; instead the existing row's
+        last_seen_at moves to `now` and observation_count goes up by one,
+        in a single UPDATE. No post_save fires for those rows: nothing
+        about the line changed, so nothing downstream needs to rerun.
+
+        No-op (everything is inserted) unless ODDS_CHANGE_ONLY_WRITES is on.
+        """
+        from django.db.models import F, Window
+        from django.db.models.functions import RowNumber
+
+        pending = list(pending)
+        if not pending or not getattr(settings, 'ODDS_CHANGE_ONLY_WRITES', False):
+            return pending, 0
+
+        current = {
+            (row.game_id, row.sportsbook): row
+            for row in (
+                model.objects
+                .filter(
+                    game_id__in={obj.game_id for obj in pending},
+                    sportsbook__in={obj.sportsbook for obj in pending},
+                )
+                .annotate(recency_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=[F('game_id'), F('sportsbook')],
+                    order_by=[F('captured_at').desc(), F('pk').desc()],
+                ))
+                .filter(recency_rank=1)
+            )
+        }
+
+        to_insert = []
+        unchanged_pks = set()
+        for obj in pending:
+            line = current.get((obj.game_id, obj.sportsbook))
+            if line is not None and all(
+                getattr(line, f) == getattr(obj, f) for f in self.SNAPSHOT_LINE_FIELDS
+            ):
+                unchanged_pks.add(line.pk)
+            else:
+                to_insert.append(obj)
+
+        if unchanged_pks:
+            from apps.core.services.current_line import touch_current_lines
+            model.objects.filter(pk__in=unchanged_pks).update(
+                last_seen_at=now,
+                observation_count=F('observation_count') + 1,
+            )
+            touch_current_lines(model, unchanged_pks, now)
+        return to_insert, len(pending) - len(to_insert)
+
+    def _write_snapshots(self, model, pending, now, *, bulk=False):
+        """Persist one pass of odds snapshots. Returns (created objs, n unchanged).
+
+        Change-only filtering, the insert and the CurrentLine upsert run in
+        one transaction, so the materialized current line never points at a
+        snapshot that didn't commit (or misses one that did). `bulk=True`
+        inserts through `_bulk_insert`; otherwise each row goes through
+        `save()` for providers that rely on it to derive fields.
+        """
+        from apps.core.services import recommendation_cache
+        from apps.core.services.current_line import upsert_current_lines
+
+        with transaction.atomic(using=router.db_for_write(model)):
+            pending, unchanged = self._extend_unchanged_snapshots(model, pending, now)
+            if bulk:
+                created = self._bulk_insert(model, pending)
+            else:
+                for obj in pending:
+                    obj.save()
+                created = pending
+            upsert_current_lines(model, created)
+            # Line movement and (maybe) the model's snapshot changed; the
+            # bump itself waits for the commit.
+            recommendation_cache.bump(self.sport, 'odds')
+        return created, unchanged
+
+    def archive_raw(self, raw):
+        """Write a fetch result to the raw-payload archive (RAW_ARCHIVE_ENABLED).
+
+        Call right after `fetch()` from any path that bypasses `run()`.
+        Never raises; see apps/datahub/services/raw_archive.py.
+        """
+        from apps.datahub.services.raw_archive import archive_payload
+
+        return archive_payload(self, raw)
+
     def run(self):
         """Orchestrate fetch -> normalize -> persist with error handling."""
         label = f"{self.sport}/{self.data_type}"
         logger.info(f"[{label}] Starting ingestion")
         try:
             raw = self.fetch()
+            self.archive_raw(raw)
             if not raw:
                 logger.warning(f"[{label}] No data returned from API")
                 return {'status': 'empty', 'created': 0, 'updated': 0}
@@ -59,11 +258,20 @@ class AbstractProvider(ABC):
             logger.info(f"[{label}] Normalized {len(normalized)} records")
 
             stats = self.persist(normalized)
+            if self.data_type != 'odds':
+                # Schedule, injuries, pitcher stats, records: model inputs.
+                from apps.core.services import recommendation_cache
+                recommendation_cache.bump(self.sport, 'inputs')
             logger.info(f"[{label}] Done — {stats}")
             return stats
         except Exception as e:
             logger.error(f"[{label}] Ingestion failed: {e}", exc_info=True)
             raise
+        finally:
+            # Buffered OddsApiUsage telemetry (ODDS_API_USAGE_BUFFERED) goes
+            # out once per run. No-op when unbuffered; never raises.
+            from apps.ops.services.api_logging import flush
+            flush()
 
     # --- Score-only refresh path --------------------------------------------
     # The 15-minute cron runs this *narrow* update: reuses fetch+normalize but
@@ -76,6 +284,28 @@ class AbstractProvider(ABC):
         Subclasses opting into score-only updates must override this."""
         return None
 
+    def _find_existing_games(self, normalized_items):
+        """Existing Game (or None) for each record, in order.
+
+        Defaults to one `_find_existing_game` call per record. Providers
+        keyed on (source, external_id) override this with a single
+        `_games_by_external_id` query for the whole live window.
+        """
+        return [self._find_existing_game(item) for item in normalized_items]
+
+    def _games_by_external_id(self, model, source, normalized_items):
+        """`_find_existing_games` in one `external_id__in` query. Records
+        sharing an external id get the same instance, so in-memory diffs
+        stack the way sequential saves did."""
+        ext_ids = [self._normalized_external_id(item) for item in normalized_items]
+        by_ext = {
+            game.external_id: game
+            for game in model.objects.filter(
+                source=source, external_id__in={e for e in ext_ids if e},
+            )
+        }
+        return [by_ext.get(ext_id) if ext_id else None for ext_id in ext_ids]
+
     def _normalized_game_time(self, normalized_item):
         """Return the game start time as an aware datetime, or None if unknown.
         Used by `update_scores_only` to filter to the live window."""
@@ -105,6 +335,7 @@ class AbstractProvider(ABC):
             return {'status': 'not_supported', 'updated': 0, 'skipped': 0}
 
         raw = self.fetch()
+        self.archive_raw(raw)
         if not raw:
             return {'status': 'empty', 'updated': 0, 'skipped': 0}
         normalized = self.normalize(raw) or []
@@ -119,13 +350,18 @@ class AbstractProvider(ABC):
         out_of_window = 0
         not_found = 0
 
+        in_window = []
         for item in normalized:
             game_time = self._normalized_game_time(item)
             if game_time is None or not (window_start <= game_time <= window_end):
                 out_of_window += 1
                 continue
+            in_window.append(item)
 
-            game = self._find_existing_game(item)
+        # One lookup for the whole window, diff in memory, then flush every
+        # dirty row with a single bulk_update.
+        dirty = {}
+        for item, game in zip(in_window, self._find_existing_games(in_window)):
             if game is None:
                 # Visibility: structured warning per miss so operators can see
                 # provider drift (games the API reports but we haven't ingested).
@@ -157,9 +393,18 @@ class AbstractProvider(ABC):
             game.status = new_status
             game.home_score = new_home
             game.away_score = new_away
-            game.save(update_fields=['status', 'home_score', 'away_score'])
+            dirty[game.pk] = game
             updated += 1
 
+        if dirty:
+            games = list(dirty.values())
+            model = type(games[0])
+            with transaction.atomic(using=router.db_for_write(model)):
+                model.objects.bulk_update(games, ['status', 'home_score', 'away_score'])
+                # Final scores feed recent form.
+                from apps.core.services import recommendation_cache
+                recommendation_cache.bump(self.sport, 'inputs')
+
         stats = {
             'status': 'ok',
             'sport': self.sport,
@@ -106,10 +106,11 @@ class CBBOddsProvider(AbstractProvider):
         return normalized
 
     def persist(self, normalized):
-        """Create OddsSnapshot records (append-only)."""
-        created = 0
+        """Create OddsSnapshot records (append-only; unchanged lines only bump
+        last_seen_at when ODDS_CHANGE_ONLY_WRITES is on)."""
         skipped = 0
         now = timezone.now()
+        pending = []
 
         for item in normalized:
             home = Team.objects.filter(slug=slugify(item['home_team'])).first()
@@ -146,7 +147,7 @@ class CBBOddsProvider(AbstractProvider):
                 skipped += 1
                 continue
 
-            snapshot = OddsSnapshot.objects.create(
+            pending.append(OddsSnapshot(
                 game=game,
                 captured_at=now,
                 sportsbook=item['sportsbook'],
@@ -155,9 +156,17 @@ class CBBOddsProvider(AbstractProvider):
                 total=item.get('total'),
                 moneyline_home=ml_home,
                 moneyline_away=item.get('moneyline_away'),
-            )
-            from apps.core.services.odds_movement import apply_movement_intelligence
-            apply_movement_intelligence(OddsSnapshot, snapshot)
-            created += 1
-
-        return {'status': 'ok', 'created': created, 'skipped': skipped}
+            ))
+
+        # Change-only writes: rows identical to the current line just bump
+        # last_seen_at on it; only moved lines are inserted, and CurrentLine
+        # is upserted in the same transaction.
+        pending, unchanged = self._write_snapshots(OddsSnapshot, pending, now)
+        created = len(pending)
+
+        # Movement intelligence for the whole pass — silent no-op on the
+        # first snapshot for a (game, sportsbook); upgrades rows that cross
+        # the significance threshold. Exception-safe by contract.
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        apply_movement_intelligence_batch(OddsSnapshot, pending)
+        return {'status': 'ok', 'created': created, 'unchanged': unchanged, 'skipped': skipped}
@@ -83,47 +83,64 @@ class CFBScheduleProvider(AbstractProvider):
         return normalized
 
     def persist(self, normalized):
-        """Upsert conferences, teams, and games."""
+        """Upsert conferences, teams, and games.
+
+        Conferences and teams are deduped across the payload and written
+        with one bulk statement each (AbstractProvider._bulk_upsert, keyed on
+        slug — CFB rows carry no source/external_id). Games are matched
+        against one preloaded candidate set and written with one bulk
+        create and one bulk update.
+        """
+        from django.utils.dateparse import parse_datetime
+
         created = 0
         updated = 0
 
+        # Pass 1 — distinct conferences and teams. get_or_create semantics:
+        # the first entry for a slug supplies the defaults.
+        conferences = {}
+        teams = {}
         for item in normalized:
-            # Upsert conferences
-            for conf_name in [item['home_conference'], item['away_conference']]:
-                if conf_name:
-                    Conference.objects.get_or_create(
-                        slug=slugify(conf_name),
-                        defaults={'name': conf_name},
-                    )
-
-            # Upsert teams
             for team_name, conf_name in [
                 (item['home_team'], item['home_conference']),
                 (item['away_team'], item['away_conference']),
             ]:
-                conf = None
                 if conf_name:
-                    conf = Conference.objects.filter(slug=slugify(conf_name)).first()
-                if not conf:
-                    conf, _ = Conference.objects.get_or_create(
-                        slug='independent',
-                        defaults={'name': 'Independent'},
-                    )
+                    conf_slug = slugify(conf_name)
+                    conferences.setdefault((conf_slug,), {'name': conf_name})
+                else:
+                    conf_slug = 'independent'
+                    conferences.setdefault((conf_slug,), {'name': 'Independent'})
                 team_slug = slugify(team_name)
+                defaults = {'name': team_name, 'conference': conf_slug}
                 color = get_team_color(team_slug, 'cfb')
-                defaults = {'name': team_name, 'conference': conf}
                 if color:
                     defaults['primary_color'] = color
-                team_obj, team_created = Team.objects.get_or_create(
-                    slug=team_slug, defaults=defaults,
-                )
-                if not team_created and not team_obj.primary_color and color:
-                    team_obj.primary_color = color
-                    team_obj.save(update_fields=['primary_color'])
+                teams.setdefault((team_slug,), defaults)
 
-            # Look up teams
-            home = Team.objects.filter(slug=slugify(item['home_team'])).first()
-            away = Team.objects.filter(slug=slugify(item['away_team'])).first()
+        conf_objs, _, _ = self._bulk_upsert(
+            Conference, conferences, key_fields=('slug',), update=False,
+        )
+        for defaults in teams.values():
+            defaults['conference'] = conf_objs[(defaults['conference'],)]
+        team_objs, _, _ = self._bulk_upsert(
+            Team, teams, key_fields=('slug',), update=False,
+        )
+        # Existing teams only ever gain a color they were missing.
+        recolored = []
+        for key, team_obj in team_objs.items():
+            color = teams[key].get('primary_color')
+            if color and not team_obj.primary_color:
+                team_obj.primary_color = color
+                recolored.append(team_obj)
+        if recolored:
+            Team.objects.bulk_update(recolored, ['primary_color'])
+
+        # Pass 2 — games.
+        matchups = []
+        for item in normalized:
+            home = team_objs.get((slugify(item['home_team']),))
+            away = team_objs.get((slugify(item['away_team']),))
             if not home or not away:
                 logger.warning(
                     f"Could not resolve teams: {item['home_team']} vs {item['away_team']}"
@@ -131,25 +148,35 @@ class CFBScheduleProvider(AbstractProvider):
                 continue
 
             # Parse kickoff time
-            from django.utils.dateparse import parse_datetime
             kickoff = parse_datetime(item['start_date'])
             if kickoff is None:
                 continue
             if timezone.is_naive(kickoff):
                 kickoff = timezone.make_aware(kickoff)
-
+            matchups.append((item, home, away, kickoff))
+
+        candidates = {}
+        if matchups:
+            kickoffs = [kickoff for *_, kickoff in matchups]
+            for game in Game.objects.filter(
+                home_team_id__in={home.pk for _, home, _, _ in matchups},
+                kickoff__gte=min(kickoffs) - timedelta(days=3),
+                kickoff__lte=max(kickoffs) + timedelta(days=3),
+            ).order_by('kickoff'):
+                candidates.setdefault((game.home_team_id, game.away_team_id), []).append(game)
+
+        to_create = []
+        to_update = {}
+        for item, home, away, kickoff in matchups:
             # Match existing game: same teams, within ±1 day
-            existing = Game.objects.filter(
-                home_team=home,
-                away_team=away,
-                kickoff__date__gte=(kickoff - timedelta(days=1)).date(),
-                kickoff__date__lte=(kickoff + timedelta(days=1)).date(),
-            ).first()
+            pair = candidates.setdefault((home.pk, away.pk), [])
+            existing = _first_within_a_day(pair, 'kickoff', kickoff)
 
             if existing:
                 changed = False
                 if existing.kickoff != kickoff:
                     existing.kickoff = kickoff
+                    pair.sort(key=lambda g: g.kickoff)
                     changed = True
                 if existing.status != item['status']:
                     existing.status = item['status']
@@ -161,10 +188,11 @@ class CFBScheduleProvider(AbstractProvider):
                     existing.away_score = item['away_score']
                     changed = True
                 if changed:
-                    existing.save()
+                    if not existing._state.adding:
+                        to_update[existing.pk] = existing
                     updated += 1
             else:
-                Game.objects.create(
+                game = Game(
                     home_team=home,
                     away_team=away,
                     kickoff=kickoff,
@@ -173,6 +201,27 @@ class CFBScheduleProvider(AbstractProvider):
                     home_score=item.get('home_score'),
                     away_score=item.get('away_score'),
                 )
+                to_create.append(game)
+                pair.append(game)
+                pair.sort(key=lambda g: g.kickoff)
                 created += 1
 
+        if to_create:
+            Game.objects.bulk_create(to_create)
+        if to_update:
+            Game.objects.bulk_update(
+                list(to_update.values()), ['kickoff', 'status', 'home_score', 'away_score'],
+            )
+
         return {'status': 'ok', 'created': created, 'updated': updated}
+
+
+def _first_within_a_day(games, start_field, start):
+    """First of `games` (start-ordered) whose local start date is within a
+    day of `start` — the `<start>__date` range the per-row lookup used."""
+    lo = (start - timedelta(days=1)).date()
+    hi = (start + timedelta(days=1)).date()
+    for game in games:
+        if lo <= timezone.localtime(getattr(game, start_field)).date() <= hi:
+            return game
+    return None
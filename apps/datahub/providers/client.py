@@ -1,7 +1,11 @@
 import logging
+import threading
 import time
+from urllib.parse import urlsplit
 
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +14,35 @@ MAX_RETRIES = 3
 BACKOFF_BASE = 2  # seconds
 BODY_SNIPPET_LEN = 200  # chars of body to include in non-JSON error messages
 
+# Defaults for the shared connection pools. Overridable via settings
+# (HTTP_POOL_CONNECTIONS / HTTP_POOL_MAXSIZE) so a bigger --parallel
+# refresh can widen them without a code change.
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 8
+
+# Sent on every pooled request. requests already negotiates gzip, but we
+# pin it here so the contract survives a library default change — the
+# Odds API and ESPN scoreboard payloads compress ~8-10x.
+DEFAULT_SESSION_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# One pooled Session per scheme://host, shared across every APIClient (and
+# therefore every provider instance) in the process. Keyed per host so the
+# Odds API, ESPN and statsapi.mlb.com each keep their own warm connections
+# and a slow host can't starve another's pool.
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Earliest time.time() at which the next request to a host may start,
+# shared across APIClient instances and threads. Lets `refresh_data
+# --parallel` run several providers against the same host (e.g. CBB + MLB
+# + college-baseball odds all on the Odds API) without any of them
+# violating its own `rate_limit_delay`.
+_HOST_NEXT_SLOT: dict[str, float] = {}
+_RATE_LIMIT_LOCK = threading.Lock()
+
 
 class NonJSONResponseError(ValueError):
     """Raised when an upstream API returned a non-JSON body (e.g., HTML
@@ -22,19 +55,94 @@ class NonJSONResponseError(ValueError):
     """
 
 
+def _host_key(url):
+    """scheme://host[:port] for a URL — the granularity keep-alive works at."""
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'.lower()
+
+
+def get_session(url):
+    """Return the process-wide pooled Session for `url`'s host, creating it
+    on first use.
+
+    Retries stay in APIClient.get (so every attempt is logged to
+    OddsApiUsage), hence `max_retries=0` on the adapter. Pool sizes are
+    read from settings when the session is first built.
+    """
+    key = _host_key(url)
+    session = _SESSIONS.get(key)
+    if session is not None:
+        return session
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_SESSION_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=int(getattr(
+                    settings, 'HTTP_POOL_CONNECTIONS', DEFAULT_POOL_CONNECTIONS,
+                )),
+                pool_maxsize=int(getattr(
+                    settings, 'HTTP_POOL_MAXSIZE', DEFAULT_POOL_MAXSIZE,
+                )),
+                max_retries=0,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _SESSIONS[key] = session
+    return session
+
+
+def close_sessions():
+    """Close and forget every pooled session. Used by tests and by long-lived
+    processes that want to drop idle sockets (e.g. after a fork)."""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:  # noqa: BLE001 — best-effort socket cleanup
+            pass
+
+
 class APIClient:
-    """Shared HTTP client with rate limiting, retries, and logging."""
+    """Shared HTTP client with rate limiting, retries, and logging.
 
-    def __init__(self, base_url, headers=None, rate_limit_delay=1.0):
+    Requests go through a pooled keep-alive Session shared per host (see
+    `get_session`), so consecutive calls — the pitcher-stats 40-id chunk
+    loop, the golf per-tournament fetches, back-to-back providers hitting
+    the Odds API — skip the TCP+TLS handshake after the first one. Pass
+    `session=` to inject a specific Session (tests, one-off tooling).
+    """
+
+    def __init__(self, base_url, headers=None, rate_limit_delay=1.0, session=None):
         self.base_url = base_url.rstrip('/')
         self.headers = headers or {}
         self.rate_limit_delay = rate_limit_delay
         self._last_request_time = 0
+        self.session = session if session is not None else get_session(self.base_url)
+        self._host_key = _host_key(self.base_url)
 
     def _wait_for_rate_limit(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
+        """Sleep until this client may issue its next request.
+
+        Two constraints, whichever is later: `rate_limit_delay` since this
+        client's previous response (the original per-instance rule), and
+        `rate_limit_delay` since the last request *start* against the same
+        host from any client/thread. The host slot is reserved under a lock
+        so concurrent callers queue up rather than firing together.
+        """
+        with _RATE_LIMIT_LOCK:
+            now = time.time()
+            ready_at = max(
+                self._last_request_time + self.rate_limit_delay,
+                _HOST_NEXT_SLOT.get(self._host_key, 0.0),
+            )
+            wait = max(0.0, ready_at - now)
+            _HOST_NEXT_SLOT[self._host_key] = now + wait + self.rate_limit_delay
+        if wait > 0:
+            time.sleep(wait)
 
     @staticmethod
     def _validate_json_response(resp, url):
@@ -67,6 +175,9 @@ class APIClient:
         Side effect: every Odds API call (success or failure) is logged to
         the OddsApiUsage table via apps.ops.services.api_logging. Logging
         never raises — a DB hiccup writing telemetry must not break ingestion.
+        The logged latency is measured around the pooled request only (not
+        the rate-limit sleep), so warm-connection calls show up as the drop
+        in `response_time_ms` after the first call of a run.
         """
         url = f"{self.base_url}/{path.lstrip('/')}" if path else self.base_url
         for attempt in range(1, MAX_RETRIES + 1):
@@ -74,7 +185,7 @@ class APIClient:
             start = time.time()
             resp = None
             try:
-                resp = requests.get(
+                resp = self.session.get(
                     url,
                     params=params,
                     headers=self.headers,
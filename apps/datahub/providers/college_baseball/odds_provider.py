@@ -108,8 +108,9 @@ class CollegeBaseballOddsProvider(AbstractProvider):
         return normalized
 
     def persist(self, normalized):
-        created = skipped = 0
+        skipped = 0
         now = timezone.now()
+        pending = []
         for item in normalized:
             home = _find_team(item['home_team'])
             away = _find_team(item['away_team'])
@@ -137,7 +138,7 @@ class CollegeBaseballOddsProvider(AbstractProvider):
                 skipped += 1
                 continue
 
-            snapshot = OddsSnapshot.objects.create(
+            pending.append(OddsSnapshot(
                 game=game,
                 captured_at=now,
                 sportsbook=item['sportsbook'],
@@ -146,8 +147,17 @@ class CollegeBaseballOddsProvider(AbstractProvider):
                 total=item.get('total'),
                 moneyline_home=item.get('moneyline_home'),
                 moneyline_away=item.get('moneyline_away'),
-            )
-            from apps.core.services.odds_movement import apply_movement_intelligence
-            apply_movement_intelligence(OddsSnapshot, snapshot)
-            created += 1
-        return {'status': 'ok', 'created': created, 'skipped': skipped}
+            ))
+
+        # Change-only writes: rows identical to the current line just bump
+        # last_seen_at on it; only moved lines are inserted, and CurrentLine
+        # is upserted in the same transaction.
+        pending, unchanged = self._write_snapshots(OddsSnapshot, pending, now)
+        created = len(pending)
+
+        # Movement intelligence for the whole pass — silent no-op on the
+        # first snapshot for a (game, sportsbook); upgrades rows that cross
+        # the significance threshold. Exception-safe by contract.
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        apply_movement_intelligence_batch(OddsSnapshot, pending)
+        return {'status': 'ok', 'created': created, 'unchanged': unchanged, 'skipped': skipped}
@@ -33,14 +33,11 @@ STATUS_MAP = {
 }
 
 
-def _upsert_conference(name):
+def _conference_row(name):
+    """(slug, name) for a conference; blank names fall back to Independent."""
     if not name:
         name = 'Independent'
-    slug = slugify(name) or 'independent'
-    conference, _ = Conference.objects.get_or_create(
-        slug=slug, defaults={'name': name},
-    )
-    return conference
+    return slugify(name) or 'independent', name
 
 
 def _parse_record_summary(summary):
@@ -73,8 +70,9 @@ def _extract_overall_record(competitor):
     return None, None
 
 
-def _upsert_team(team_payload, conference, wins=None, losses=None):
-    """team_payload is ESPN competitor.team dict."""
+def _team_row(team_payload, wins=None, losses=None):
+    """(external_id, Team fields) from an ESPN competitor.team dict, or None.
+    The conference is attached by the caller."""
     ext_id = str(team_payload.get('id', '') or '')
     name = (
         team_payload.get('displayName')
@@ -88,24 +86,19 @@ def _upsert_team(team_payload, conference, wins=None, losses=None):
 
     slug = slugify(name)
     color = get_team_color(slug, 'college_baseball') or ''
-    defaults = {
+    fields = {
         'name': name,
         'slug': slug,
-        'conference': conference,
         'abbreviation': abbr,
         'primary_color': color,
     }
     # Only overwrite W/L when the payload provided values — avoids stomping
     # a fresher record with a None from a game that didn't include records.
     if wins is not None:
-        defaults['wins'] = wins
+        fields['wins'] = wins
     if losses is not None:
-        defaults['losses'] = losses
-    team, _ = Team.objects.update_or_create(
-        source=SOURCE, external_id=ext_id,
-        defaults=defaults,
-    )
-    return team
+        fields['losses'] = losses
+    return ext_id, fields
 
 
 class CollegeBaseballScheduleProvider(AbstractProvider):
@@ -127,6 +120,9 @@ class CollegeBaseballScheduleProvider(AbstractProvider):
             return None
         return Game.objects.filter(source=SOURCE, external_id=ext).first()
 
+    def _find_existing_games(self, items):
+        return self._games_by_external_id(Game, SOURCE, items)
+
     def _normalized_game_time(self, item):
         dt = parse_datetime(item.get('start_date', '') or '')
         if dt and timezone.is_naive(dt):
@@ -222,23 +218,35 @@ class CollegeBaseballScheduleProvider(AbstractProvider):
         return normalized
 
     def persist(self, normalized):
-        created = updated = skipped = 0
+        skipped = 0
+
+        # Pass 1 — parse, and collect each distinct conference and team once.
+        # Team fields merge across the payload so a later game without W/L
+        # keeps the record an earlier one supplied, as sequential
+        # update_or_create calls did.
+        conferences = {}
+        teams = {}
+        games = []
         for item in normalized:
             if not item['external_id']:
                 skipped += 1
                 continue
 
-            home_conf = _upsert_conference(item['home_conf'])
-            away_conf = _upsert_conference(item['away_conf'])
-            home = _upsert_team(
-                item['home_payload'], home_conf,
-                wins=item.get('home_wins'), losses=item.get('home_losses'),
-            )
-            away = _upsert_team(
-                item['away_payload'], away_conf,
-                wins=item.get('away_wins'), losses=item.get('away_losses'),
-            )
-            if not home or not away:
+            sides = []
+            for side in ('home', 'away'):
+                conf_slug, conf_name = _conference_row(item[f'{side}_conf'])
+                conferences[(conf_slug,)] = {'name': conf_name}
+                row = _team_row(
+                    item[f'{side}_payload'],
+                    wins=item.get(f'{side}_wins'), losses=item.get(f'{side}_losses'),
+                )
+                if row is None:
+                    continue
+                ext_id, fields = row
+                fields['conference'] = conf_slug
+                teams.setdefault((SOURCE, ext_id), {}).update(fields)
+                sides.append(ext_id)
+            if len(sides) < 2:
                 skipped += 1
                 continue
 
@@ -248,22 +256,29 @@ class CollegeBaseballScheduleProvider(AbstractProvider):
                 continue
             if timezone.is_naive(first_pitch):
                 first_pitch = timezone.make_aware(first_pitch)
+            games.append((item, *sides, first_pitch))
 
-            defaults = {
-                'home_team': home,
-                'away_team': away,
+        # Pass 2 — one bulk upsert per entity type, parents first.
+        conf_objs, _, _ = self._bulk_upsert(
+            Conference, conferences, key_fields=('slug',), update=False,
+        )
+        for fields in teams.values():
+            fields['conference'] = conf_objs[(fields['conference'],)]
+        team_objs, _, _ = self._bulk_upsert(Team, teams)
+
+        game_rows = {}
+        for item, home_id, away_id, first_pitch in games:
+            game_rows[(SOURCE, item['external_id'])] = {
+                'home_team': team_objs[(SOURCE, home_id)],
+                'away_team': team_objs[(SOURCE, away_id)],
                 'first_pitch': first_pitch,
                 'status': item['status'],
                 'neutral_site': item['neutral_site'],
                 'home_score': item.get('home_score'),
                 'away_score': item.get('away_score'),
             }
-            _, was_created = Game.objects.update_or_create(
-                source=SOURCE, external_id=item['external_id'],
-                defaults=defaults,
-            )
-            if was_created:
-                created += 1
-            else:
-                updated += 1
+        _, created, updated = self._bulk_upsert(Game, game_rows)
+        # A repeated event id was one create or update plus more updates
+        # under per-row update_or_create.
+        updated += len(games) - len(game_rows)
         return {'status': 'ok', 'created': created, 'updated': updated, 'skipped': skipped}
@@ -46,6 +46,40 @@ def _find_team(name):
     return Team.objects.filter(name__iexact=canonical).first()
 
 
+class _TeamsByName:
+    """In-memory `_find_team` for one persist run: every Team loaded once,
+    same canonical-name iexact rule (Team is ordered by name, so
+    setdefault keeps the row `.first()` would have returned)."""
+
+    def __init__(self):
+        self._by_name = {}
+        for team in Team.objects.all():
+            self._by_name.setdefault(team.name.lower(), team)
+
+    def find(self, name):
+        if not name:
+            return None
+        return self._by_name.get(normalize_mlb_team_name(name).lower())
+
+
+def _candidate_games(team_pairs, now):
+    """{(home_id, away_id): [Game, ...]} for upcoming-or-just-started games
+    (first_pitch in [now-2h, now+72h]), first_pitch order, one query."""
+    by_pair = {}
+    home_ids = {home_id for home_id, _ in team_pairs}
+    if not home_ids:
+        return by_pair
+    games = Game.objects.filter(
+        home_team_id__in=home_ids,
+        first_pitch__gte=now - timedelta(hours=2),
+        first_pitch__lte=now + timedelta(hours=72),
+    ).select_related('home_team', 'away_team').order_by('first_pitch')
+    for game in games:
+        if (game.home_team_id, game.away_team_id) in team_pairs:
+            by_pair.setdefault((game.home_team_id, game.away_team_id), []).append(game)
+    return by_pair
+
+
 def american_to_prob(ml):
     if ml is None:
         return None
@@ -402,20 +436,23 @@ class MLBEspnOddsProvider(AbstractProvider):
         """Persist normalized ESPN odds rows.
 
         Matching strategy (deterministic, no caller-provided ID set):
-          1. Normalize team names → DB Team.
+          1. Normalize team names → DB Team (every Team loaded once).
           2. Restrict candidate Games to upcoming-or-just-started games
              (first_pitch in [now-2h, now+72h]). This prevents matching
              ESPN events to YESTERDAY's already-played game with the same
              matchup — a real bug in the prior implementation that caused
-             the matched game.pk to fall outside the gap set.
+             the matched game.pk to fall outside the gap set. All
+             candidates for the run come from one query.
           3. Pick the candidate whose first_pitch is closest to ESPN's
              commence_time (Python-side, portable across SQLite + PG).
-          4. Per-row freshness check: if the matched game already has a
+          4. Per-game freshness check: if the matched game already has a
              fresh primary OddsSnapshot in the FRESH_ODDS_MAX_AGE_MINUTES
              window, skip — primary already covered it, ESPN is fallback
-             only. This replaces the old `target_game_ids` filter and
+             only. The covered set is one query over every candidate.
+             This replaces the old `target_game_ids` filter and
              requires no caller cooperation.
-          5. Persist with odds_source='espn', source_quality='fallback'.
+          5. Persist with odds_source='espn', source_quality='fallback',
+             the whole run in one bulk insert.
 
         Logs (per spec):
           mlb_odds_espn_match_success  — per matched game
@@ -426,12 +463,33 @@ class MLBEspnOddsProvider(AbstractProvider):
         from django.conf import settings as django_settings
 
         fresh_window = getattr(django_settings, 'FRESH_ODDS_MAX_AGE_MINUTES', 180)
-        created = skipped = 0
+        skipped = 0
         skip_reasons: dict[str, int] = {}
+        pending = []
         now = timezone.now()
+
+        # One pass of lookups for the whole run: teams from memory, every
+        # candidate game in one query, and the games a fresh primary row
+        # already covers in one more.
+        teams = _TeamsByName()
+        resolved = []
         for item in normalized:
-            home = _find_team(item['home_team'])
-            away = _find_team(item['away_team'])
+            home = teams.find(item['home_team'])
+            away = teams.find(item['away_team'])
+            resolved.append((item, home, away))
+        games_by_pair = _candidate_games(
+            {(home.id, away.id) for _, home, away in resolved if home and away}, now,
+        )
+        fresh_cutoff = now - timedelta(minutes=fresh_window)
+        covered = set(
+            OddsSnapshot.objects.filter(
+                game_id__in=[g.pk for games in games_by_pair.values() for g in games],
+                last_seen_at__gte=fresh_cutoff,
+                odds_source='odds_api',
+            ).order_by().values_list('game_id', flat=True).distinct()
+        )
+
+        for item, home, away in resolved:
             if not home or not away:
                 skipped += 1
                 skip_reasons['no_team_match'] = skip_reasons.get('no_team_match', 0) + 1
@@ -446,26 +504,17 @@ class MLBEspnOddsProvider(AbstractProvider):
             if commence and timezone.is_naive(commence):
                 commence = timezone.make_aware(commence)
 
-            # Restrict to upcoming or just-started games. Without this,
-            # the matchup query could return yesterday's already-played
-            # game (same teams, same ±36h window) and we'd persist an
-            # ESPN snapshot against a finished game.
-            window_start = now - timedelta(hours=2)
-            window_end = now + timedelta(hours=72)
-            candidates = list(
-                Game.objects
-                .filter(home_team=home, away_team=away,
-                        first_pitch__gte=window_start,
-                        first_pitch__lte=window_end)
-            )
+            # Candidates are restricted to upcoming or just-started games.
+            # Without this, the matchup could resolve to yesterday's
+            # already-played game (same teams) and we'd persist an ESPN
+            # snapshot against a finished game.
+            candidates = list(games_by_pair.get((home.id, away.id), []))
             game = None
             if candidates:
                 if commence:
                     candidates.sort(
                         key=lambda g: abs((g.first_pitch - commence).total_seconds()),
                     )
-                else:
-                    candidates.sort(key=lambda g: g.first_pitch)
                 game = candidates[0]
 
             if not game:
@@ -479,18 +528,12 @@ class MLBEspnOddsProvider(AbstractProvider):
                 )
                 continue
 
-            # Per-row freshness: skip if THIS game already has a fresh
+            # Per-game freshness: skip if THIS game already has a fresh
             # primary snapshot. Replaces the old target_game_ids filter.
             # Idempotent and self-contained — no caller cooperation needed,
             # so a manually-invoked `MLBEspnOddsProvider().run()` can no
             # longer accidentally double-write.
-            fresh_cutoff = now - timedelta(minutes=fresh_window)
-            already_covered = OddsSnapshot.objects.filter(
-                game=game,
-                captured_at__gte=fresh_cutoff,
-                odds_source='odds_api',
-            ).exists()
-            if already_covered:
+            if game.pk in covered:
                 skipped += 1
                 skip_reasons['has_fresh_primary'] = skip_reasons.get('has_fresh_primary', 0) + 1
                 logger.info(
@@ -511,11 +554,14 @@ class MLBEspnOddsProvider(AbstractProvider):
                 )
                 continue
 
-            OddsSnapshot.objects.create(
+            pending.append(OddsSnapshot(
                 game=game,
                 captured_at=now,
                 sportsbook=item['sportsbook'],
                 market_home_win_prob=home_prob,
+                # bulk_create bypasses OddsSnapshot.save(), which derives these.
+                market_away_win_prob=1.0 - home_prob,
+                last_seen_at=now,
                 spread=item.get('spread'),
                 total=item.get('total'),
                 moneyline_home=item.get('moneyline_home'),
@@ -528,7 +574,7 @@ class MLBEspnOddsProvider(AbstractProvider):
                 # symmetric inversion in normalize() — recommendation
                 # engine will block these rows from ever being recommended.
                 is_derived=bool(item.get('is_derived', False)),
-            )
+            ))
             logger.info(
                 'mlb_odds_espn_match_success game_id=%s home=%s away=%s '
                 'ml_home=%s ml_away=%s sportsbook=%s',
@@ -536,16 +582,29 @@ class MLBEspnOddsProvider(AbstractProvider):
                 item.get('moneyline_home'), item.get('moneyline_away'),
                 item.get('sportsbook'),
             )
-            created += 1
 
-        status = 'ok' if created > 0 else 'empty'
+        # Change-only writes: an ESPN line identical to the current one for
+        # that (game, book) just bumps last_seen_at on it. The rest go out as
+        # one INSERT (post_save replayed per row by _bulk_insert); CurrentLine
+        # is upserted in the same transaction.
+        pending, unchanged = self._write_snapshots(OddsSnapshot, pending, now, bulk=True)
+        created = len(pending)
+
+        # No movement classification on fallback rows, but they still sit
+        # in the cross-book window movement_signal_for_pick reads, so keep
+        # the running state in step. Exception-safe.
+        from apps.core.services.movement_state import record_snapshots
+        record_snapshots(OddsSnapshot, pending)
+
+        status = 'ok' if (created + unchanged) > 0 else 'empty'
         logger.info(
-            f"mlb_odds_espn_persist_summary created={created} skipped={skipped} "
+            f"mlb_odds_espn_persist_summary created={created} unchanged={unchanged} skipped={skipped} "
             f"skip_reasons={skip_reasons} status={status}"
         )
         return {
             'status': status,
             'created': created,
+            'unchanged': unchanged,
             'skipped': skipped,
             'skip_reasons': skip_reasons,
             'source': 'espn',
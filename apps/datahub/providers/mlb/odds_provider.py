@@ -70,6 +70,134 @@ def _find_team(name):
     return None
 
 
+class _TeamIndex:
+    """In-memory `_find_team` for one persist run.
+
+    Loads every MLB Team once and answers the same alias → iexact/slug →
+    fuzzy chain from dicts, memoized per API name. A slate of ~15 events ×
+    ~10 books used to cost 2-4 Team queries per normalized row.
+    """
+
+    def __init__(self, teams=None):
+        if teams is None:
+            teams = Team.objects.all()
+        self._by_name = {}
+        self._by_slug = {}
+        # Team is ordered by name, so setdefault keeps the row that
+        # `.filter(name__iexact=...).first()` would have returned.
+        for team in teams:
+            self._by_name.setdefault(team.name.lower(), team)
+            self._by_slug.setdefault(team.slug, team)
+        self._memo = {}
+
+    def _lookup(self, canonical):
+        return (
+            self._by_name.get(canonical.lower())
+            or self._by_slug.get(slugify(canonical))
+        )
+
+    def find(self, name):
+        if not name:
+            return None
+        if name in self._memo:
+            return self._memo[name]
+        canonical = normalize_mlb_team_name(name)
+        team = self._lookup(canonical)
+        if team is None:
+            from apps.datahub.providers.mlb.name_aliases import fuzzy_match_to_canonical
+            fuzzy_canonical = fuzzy_match_to_canonical(name)
+            if fuzzy_canonical and fuzzy_canonical != canonical:
+                team = self._lookup(fuzzy_canonical)
+                if team:
+                    logger.info(
+                        'mlb_team_match_fuzzy_recovered api_name=%r canonical_attempt=%r '
+                        'fuzzy_canonical=%r matched_team=%r',
+                        name, canonical, fuzzy_canonical, team.name,
+                    )
+        self._memo[name] = team
+        return team
+
+
+class _GameIndex:
+    """Candidate Games for one persist run, keyed by (home_id, away_id).
+
+    One query covers every row's match window: ±4 days around each
+    commence time (the widest fallback) plus [now, now+7d] when a row has
+    no commence time. `match` then applies the original three-step rules
+    in memory, including closest-by-delta doubleheader resolution.
+    """
+
+    PRIMARY_WINDOW = timedelta(hours=36)
+    FALLBACK_WINDOW = timedelta(days=4)
+    NO_COMMENCE_HORIZON = timedelta(days=7)
+
+    def __init__(self, team_pairs, commences, now):
+        self.now = now
+        self._by_pair = {}
+        bounds = []
+        for commence in commences:
+            if commence:
+                bounds += [commence - self.FALLBACK_WINDOW, commence + self.FALLBACK_WINDOW]
+            else:
+                bounds += [now, now + self.NO_COMMENCE_HORIZON]
+        home_ids = {home_id for home_id, _ in team_pairs}
+        if not bounds or not home_ids:
+            return
+        games = (
+            Game.objects
+            .filter(home_team_id__in=home_ids,
+                    first_pitch__gte=min(bounds),
+                    first_pitch__lte=max(bounds))
+            .select_related('home_team', 'away_team')
+            .order_by('first_pitch')
+        )
+        for g in games:
+            self._by_pair.setdefault((g.home_team_id, g.away_team_id), []).append(g)
+
+    @staticmethod
+    def _closest(candidates, commence):
+        # sorted() is stable and candidates are in first_pitch order, so
+        # ties resolve exactly as the old per-row query + sort did.
+        return sorted(
+            candidates, key=lambda g: abs((g.first_pitch - commence).total_seconds()),
+        )[0]
+
+    def match(self, home, away, commence):
+        candidates = self._by_pair.get((home.id, away.id), [])
+        if not candidates:
+            return None
+
+        # Primary: first_pitch within ±36h of commence, closest wins.
+        if commence:
+            primary = [
+                g for g in candidates
+                if commence - self.PRIMARY_WINDOW <= g.first_pitch <= commence + self.PRIMARY_WINDOW
+            ]
+            if primary:
+                return self._closest(primary, commence)
+        # Fallback 1: no commence time → nearest upcoming within 7 days.
+        else:
+            upcoming = [
+                g for g in candidates
+                if self.now <= g.first_pitch <= self.now + self.NO_COMMENCE_HORIZON
+            ]
+            return upcoming[0] if upcoming else None
+
+        # Fallback 2: widen to ±4 days, nearest-by-delta.
+        wide = [
+            g for g in candidates
+            if commence - self.FALLBACK_WINDOW <= g.first_pitch <= commence + self.FALLBACK_WINDOW
+        ]
+        if not wide:
+            return None
+        game = self._closest(wide, commence)
+        logger.info(
+            f"mlb_odds_persist_match_fallback home={home.name} away={away.name} "
+            f"commence={commence} matched_pitch={game.first_pitch}"
+        )
+        return game
+
+
 class MLBOddsProvider(AbstractProvider):
     sport = 'mlb'
     data_type = 'odds'
@@ -340,7 +468,29 @@ class MLBOddsProvider(AbstractProvider):
         seen_matchups: set = set()
         matched_matchups: set = set()
         now = timezone.now()
+
+        # Batched path: resolve every row's teams from one in-memory index,
+        # load every candidate Game in one query, then bulk-insert the
+        # snapshots. Per-row skip reasons and logs are unchanged.
+        teams = _TeamIndex()
+        resolved = []
         for item in normalized:
+            home = teams.find(item.get('home_team', ''))
+            away = teams.find(item.get('away_team', ''))
+            commence = None
+            if home and away:
+                commence = parse_datetime(item.get('commence_time') or '')
+                if commence and timezone.is_naive(commence):
+                    commence = timezone.make_aware(commence)
+            resolved.append((item, home, away, commence))
+        games = _GameIndex(
+            {(home.id, away.id) for _, home, away, _ in resolved if home and away},
+            [commence for _, home, away, commence in resolved if home and away],
+            now,
+        )
+
+        pending = []
+        for item, home, away, commence in resolved:
             api_home = item.get('home_team', '')
             api_away = item.get('away_team', '')
             seen_matchups.add((api_home, api_away))
@@ -353,8 +503,6 @@ class MLBOddsProvider(AbstractProvider):
                     item.get('commence_time'),
                 )
 
-            home = _find_team(api_home)
-            away = _find_team(api_away)
             if not home or not away:
                 skipped += 1
                 reason = 'no_team_match'
@@ -374,73 +522,12 @@ class MLBOddsProvider(AbstractProvider):
                 )
                 continue
 
-            commence = parse_datetime(item.get('commence_time') or '')
-            if commence and timezone.is_naive(commence):
-                commence = timezone.make_aware(commence)
-
-            # Primary match: same teams, first_pitch within ±36h of commence.
-            # The wider window + direct datetime comparison avoids the
-            # timezone trap hit by `__date` lookups when TIME_ZONE != UTC
-            # (game saved as aware UTC; __date resolves in TIME_ZONE).
-            game = None
-            if commence:
-                window_start = commence - timedelta(hours=36)
-                window_end = commence + timedelta(hours=36)
-                # Pick the candidate whose first_pitch is CLOSEST to the
-                # API event's commence_time. Previous code used
-                # .order_by('first_pitch').first() which always returned
-                # the EARLIEST candidate — wrong for doubleheaders or any
-                # case with multiple Game rows for the same matchup
-                # within the ±36h window. With the old logic, both
-                # API events for a doubleheader would route to game 1,
-                # leaving game 2 with zero primary snaps.
-                #
-                # Closest-by-delta is what fallback 2 already does for
-                # the wider ±4-day query; making the primary path
-                # consistent eliminates the surprise.
-                candidates = list(
-                    Game.objects
-                    .filter(home_team=home, away_team=away,
-                            first_pitch__gte=window_start,
-                            first_pitch__lte=window_end)
-                )
-                if candidates:
-                    candidates.sort(
-                        key=lambda g: abs((g.first_pitch - commence).total_seconds()),
-                    )
-                    game = candidates[0]
-
-            # Fallback 1: no commence time in the feed → take the nearest
-            # upcoming game within 7 days for this matchup.
-            if not game and not commence:
-                cutoff = timezone.now() + timedelta(days=7)
-                game = (
-                    Game.objects
-                    .filter(home_team=home, away_team=away,
-                            first_pitch__gte=timezone.now(),
-                            first_pitch__lte=cutoff)
-                    .order_by('first_pitch').first()
-                )
-
-            # Fallback 2: widen to ±4 days and pick the nearest-by-delta game
-            # in Python. Catches doubleheader ambiguity and any remaining
-            # TZ/formatting edge cases. Portable across SQLite and Postgres.
-            if not game and commence:
-                cutoff_start = commence - timedelta(days=4)
-                cutoff_end = commence + timedelta(days=4)
-                candidates = list(
-                    Game.objects
-                    .filter(home_team=home, away_team=away,
-                            first_pitch__gte=cutoff_start,
-                            first_pitch__lte=cutoff_end)
-                )
-                if candidates:
-                    candidates.sort(key=lambda g: abs((g.first_pitch - commence).total_seconds()))
-                    game = candidates[0]
-                    logger.info(
-                        f"mlb_odds_persist_match_fallback home={home.name} away={away.name} "
-                        f"commence={commence} matched_pitch={game.first_pitch}"
-                    )
+            # Closest-by-delta within ±36h, then the no-commence and ±4-day
+            # fallbacks — see _GameIndex.match. Direct datetime comparison
+            # avoids the `__date` timezone trap when TIME_ZONE != UTC, and
+            # closest (not earliest) keeps doubleheader game 2 from routing
+            # to game 1.
+            game = games.match(home, away, commence)
 
             if not game:
                 skipped += 1
@@ -463,11 +550,14 @@ class MLBOddsProvider(AbstractProvider):
                 )
                 continue
 
-            snapshot = OddsSnapshot.objects.create(
+            pending.append(OddsSnapshot(
                 game=game,
                 captured_at=now,
                 sportsbook=item['sportsbook'],
                 market_home_win_prob=home_prob,
+                # bulk_create bypasses OddsSnapshot.save(), which derives these.
+                market_away_win_prob=1.0 - home_prob,
+                last_seen_at=now,
                 spread=item.get('spread'),
                 total=item.get('total'),
                 moneyline_home=item.get('moneyline_home'),
@@ -479,18 +569,25 @@ class MLBOddsProvider(AbstractProvider):
                 # can distinguish source without joining tables.
                 odds_source='odds_api',
                 source_quality='primary',
-            )
+            ))
             matched_matchups.add((api_home, api_away))
-            # Movement intelligence — silently no-ops on the first snapshot
-            # for a (game, sportsbook). When a follow-up pull crosses the
-            # significance threshold, this upgrades snapshot_type to
-            # "significant" and persists movement_score + movement_class.
-            # Exception-safe: telemetry can't break ingestion.
-            from apps.core.services.odds_movement import apply_movement_intelligence
-            apply_movement_intelligence(OddsSnapshot, snapshot)
-            created += 1
 
-        status = 'ok' if created > 0 else 'empty'
+        # Change-only writes: rows identical to the current line just bump
+        # last_seen_at on it. The rest go out as one INSERT for the slate;
+        # post_save (opportunity signals) is replayed per row by _bulk_insert.
+        # CurrentLine is upserted in the same transaction.
+        snapshots, unchanged = self._write_snapshots(OddsSnapshot, pending, now, bulk=True)
+        # Movement intelligence — silently no-ops on the first snapshot
+        # for a (game, sportsbook). When a follow-up pull crosses the
+        # significance threshold, this upgrades snapshot_type to
+        # "significant" and persists movement_score + movement_class.
+        # Exception-safe: telemetry can't break ingestion. Batched: one
+        # windowed history read and one bulk UPDATE for the whole slate.
+        from apps.core.services.odds_movement import apply_movement_intelligence_batch
+        apply_movement_intelligence_batch(OddsSnapshot, snapshots)
+        created = len(snapshots)
+
+        status = 'ok' if (created + unchanged) > 0 else 'empty'
 
         # Coverage check: how many distinct matchups did we successfully
         # persist at least one bookmaker row for? Anything under 50% is
@@ -506,16 +603,17 @@ class MLBOddsProvider(AbstractProvider):
             # spuriously trigger the alarm.
             log_fn = logger.error
         log_fn(
-            'mlb_odds_persist_summary created=%d skipped=%d '
+            'mlb_odds_persist_summary created=%d unchanged=%d skipped=%d '
             'skip_reasons=%s status=%s '
             'matchups_seen=%d matchups_matched=%d coverage_pct=%.1f',
-            created, skipped, skip_reasons, status,
+            created, unchanged, skipped, skip_reasons, status,
             n_seen, n_matched, coverage_pct,
         )
 
         return {
             'status': status,
             'created': created,
+            'unchanged': unchanged,
             'skipped': skipped,
             'skip_reasons': skip_reasons,
             'matchups_seen': n_seen,
@@ -9,6 +9,9 @@ cadence — the schedule provider only writes pitcher name + external_id
 so that game -> pitcher FKs can be set immediately.
 
 Idempotency: games and pitchers and teams are keyed by (source, external_id).
+persist() dedupes them across the payload and writes each entity type with
+one bulk upsert (AbstractProvider._bulk_upsert), so a full-season backfill
+costs a handful of statements rather than several per game.
 """
 import logging
 from datetime import timedelta
@@ -49,8 +52,9 @@ def _status_from_detailed(detailed_state):
     return STATUS_MAP.get(detailed_state, 'scheduled')
 
 
-def _upsert_team(team_data):
-    """Upsert a Team row from MLB Stats API team payload. Returns Team."""
+def _team_row(team_data):
+    """(external_id, division name, Team fields) from an MLB Stats API team
+    payload, or None when it lacks an id or name."""
     ext_id = str(team_data.get('id', ''))
     name = team_data.get('name') or team_data.get('teamName') or ''
     abbr = team_data.get('abbreviation', '') or ''
@@ -60,42 +64,25 @@ def _upsert_team(team_data):
     # Conference = MLB division (e.g. "American League East"). Nested shape varies.
     division = team_data.get('division') or {}
     division_name = division.get('name') or 'MLB'
-    conference, _ = Conference.objects.get_or_create(
-        slug=slugify(division_name),
-        defaults={'name': division_name},
-    )
 
     slug = slugify(name)
-    team, created = Team.objects.update_or_create(
-        source=SOURCE, external_id=ext_id,
-        defaults={
-            'name': name,
-            'slug': slug,
-            'conference': conference,
-            'abbreviation': abbr,
-            'primary_color': get_team_color(slug, 'mlb') or '',
-        },
-    )
-    return team
-
-
-def _upsert_pitcher(pitcher_data, team):
-    """Upsert a StartingPitcher from a hydrated probablePitcher dict."""
-    if not pitcher_data or not team:
+    return ext_id, division_name, {
+        'name': name,
+        'slug': slug,
+        'abbreviation': abbr,
+        'primary_color': get_team_color(slug, 'mlb') or '',
+    }
+
+
+def _pitcher_row(pitcher_data):
+    """(external_id, name) from a hydrated probablePitcher dict, or None."""
+    if not pitcher_data:
         return None
     ext_id = str(pitcher_data.get('id', ''))
     name = pitcher_data.get('fullName') or ''
     if not ext_id or not name:
         return None
-
-    pitcher, _ = StartingPitcher.objects.update_or_create(
-        source=SOURCE, external_id=ext_id,
-        defaults={
-            'name': name,
-            'team': team,
-        },
-    )
-    return pitcher
+    return ext_id, name
 
 
 class MLBScheduleProvider(AbstractProvider):
@@ -117,6 +104,9 @@ class MLBScheduleProvider(AbstractProvider):
         except Game.DoesNotExist:
             return None
 
+    def _find_existing_games(self, items):
+        return self._games_by_external_id(Game, SOURCE, items)
+
     def _normalized_game_time(self, item):
         dt = parse_datetime(item.get('game_date', '') or '')
         if dt and timezone.is_naive(dt):
@@ -182,17 +172,32 @@ class MLBScheduleProvider(AbstractProvider):
         return records
 
     def persist(self, normalized):
-        created = 0
-        updated = 0
         skipped = 0
         now = timezone.now()
 
+        # Pass 1 — parse, and collect each distinct conference, team and
+        # pitcher once. Later payload entries win, as sequential
+        # update_or_create calls did.
+        conferences = {}
+        teams = {}
+        team_division = {}
+        pitchers = {}
+        games = []
         for item in normalized:
-            home = _upsert_team(item['home_team'])
-            away = _upsert_team(item['away_team'])
-            if not home or not away:
+            sides = []
+            for side in ('home', 'away'):
+                row = _team_row(item[f'{side}_team'])
+                if row is None:
+                    continue
+                ext_id, division_name, fields = row
+                conferences[(slugify(division_name),)] = {'name': division_name}
+                teams[(SOURCE, ext_id)] = fields
+                team_division[ext_id] = slugify(division_name)
+                sides.append(ext_id)
+            if len(sides) < 2:
                 skipped += 1
                 continue
+            home_id, away_id = sides
 
             first_pitch = parse_datetime(item['game_date'])
             if first_pitch is None:
@@ -201,30 +206,43 @@ class MLBScheduleProvider(AbstractProvider):
             if timezone.is_naive(first_pitch):
                 first_pitch = timezone.make_aware(first_pitch)
 
-            status = _status_from_detailed(item['detailed_state'])
-            home_pitcher = _upsert_pitcher(item.get('home_pitcher'), home)
-            away_pitcher = _upsert_pitcher(item.get('away_pitcher'), away)
-
-            defaults = {
-                'home_team': home,
-                'away_team': away,
+            game_pitchers = []
+            for side, team_id in (('home', home_id), ('away', away_id)):
+                row = _pitcher_row(item.get(f'{side}_pitcher'))
+                if row is not None:
+                    pitchers[(SOURCE, row[0])] = {'name': row[1], 'team': team_id}
+                game_pitchers.append(row[0] if row else None)
+            games.append((item, home_id, away_id, first_pitch, *game_pitchers))
+
+        # Pass 2 — one bulk upsert per entity type, parents first.
+        conf_objs, _, _ = self._bulk_upsert(
+            Conference, conferences, key_fields=('slug',), update=False,
+        )
+        for (_, ext_id), fields in teams.items():
+            fields['conference'] = conf_objs[(team_division[ext_id],)]
+        team_objs, _, _ = self._bulk_upsert(Team, teams)
+        for fields in pitchers.values():
+            fields['team'] = team_objs[(SOURCE, fields['team'])]
+        pitcher_objs, _, _ = self._bulk_upsert(StartingPitcher, pitchers)
+
+        game_rows = {}
+        for item, home_id, away_id, first_pitch, home_p, away_p in games:
+            home_pitcher = pitcher_objs[(SOURCE, home_p)] if home_p else None
+            away_pitcher = pitcher_objs[(SOURCE, away_p)] if away_p else None
+            game_rows[(SOURCE, item['external_id'])] = {
+                'home_team': team_objs[(SOURCE, home_id)],
+                'away_team': team_objs[(SOURCE, away_id)],
                 'first_pitch': first_pitch,
-                'status': status,
+                'status': _status_from_detailed(item['detailed_state']),
                 'home_score': item.get('home_score'),
                 'away_score': item.get('away_score'),
                 'home_pitcher': home_pitcher,
                 'away_pitcher': away_pitcher,
                 'pitchers_updated_at': now if (home_pitcher or away_pitcher) else None,
             }
-
-            game, was_created = Game.objects.update_or_create(
-                source=SOURCE,
-                external_id=item['external_id'],
-                defaults=defaults,
-            )
-            if was_created:
-                created += 1
-            else:
-                updated += 1
+        _, created, updated = self._bulk_upsert(Game, game_rows)
+        # A gamePk listed twice (postponed + rescheduled) was one create or
+        # update plus one more update under per-row update_or_create.
+        updated += len(games) - len(game_rows)
 
         return {'status': 'ok', 'created': created, 'updated': updated, 'skipped': skipped}
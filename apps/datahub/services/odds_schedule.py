@@ -0,0 +1,263 @@
+"""Quota-aware odds polling plan — which sports pull odds this cycle.
+
+Without a plan every `refresh_data` run pulls the full [now-2h, now+72h]
+Odds API window for every enabled sport, whether its next game is ten
+minutes or three days out and whether the month's quota is at 10% or 85%.
+`plan_odds_pulls()` decides per sport instead:
+
+  1. Urgency tier. The sport's most urgent non-final game in the fetch
+     window (game_timing.minutes_until_first_pitch) picks a tier from
+     ODDS_POLL_TIERS — e.g. imminent (<=90 min) every 15 min, soon (<=6 h)
+     hourly, near (<=72 h) every 6 h. A sport with nothing inside the
+     outermost (near) tier is skipped outright.
+  2. Cadence. The tier's cadence is compared with the sport's last
+     successful Odds API call (OddsApiUsage); not due yet → skipped.
+  3. Quota pacing. Remaining credits (latest OddsApiUsage headers) are
+     spread evenly over the days left in the billing window
+     (ODDS_API_BILLING_DAY). Due pulls are admitted most-urgent first
+     until today's share is spent; the imminent tier is only ever
+     refused when the quota itself is exhausted.
+
+Pure read side — nothing here calls the API. `manage.py plan_odds_pulls`
+prints the plan; refresh_data follows it when ODDS_ADAPTIVE_POLLING is on
+and records planned vs. actual credits on its CronRunLog row.
+
+Golf isn't planned: its odds are per tournament, not per game, and its
+provider already gates on the event window.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from typing import List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.core.services.game_timing import minutes_until_first_pitch
+
+logger = logging.getLogger(__name__)
+
+# The Odds API window the per-game odds providers fetch.
+FETCH_LOOKBACK = timedelta(hours=2)
+FETCH_LOOKAHEAD = timedelta(hours=72)
+
+# A pull counts as due this many minutes early, so cron jitter on a
+# 15-minute schedule doesn't push a 15-minute tier to 30.
+CADENCE_GRACE_MINUTES = 2
+
+DEFAULT_TIERS = 'imminent:90:15,soon:360:60,near:4320:360'
+
+
+@dataclass(frozen=True)
+class PollTier:
+    name: str
+    max_minutes: int      # games starting within this many minutes
+    cadence_minutes: int  # pull at most this often
+
+
+@dataclass
+class SportPull:
+    sport: str
+    decision: str                      # 'pull' | 'skip'
+    reason: str                        # due / no_games_in_window / not_due / quota_deferred
+    tier: Optional[str] = None
+    minutes_to_start: Optional[int] = None
+    games_in_window: int = 0
+    last_pull_at: Optional[datetime] = None
+    cost: int = 0
+
+    @property
+    def planned(self) -> bool:
+        return self.decision == 'pull'
+
+
+@dataclass
+class OddsPollPlan:
+    generated_at: datetime
+    pulls: List[SportPull] = field(default_factory=list)
+    credits_remaining: Optional[int] = None
+    days_left: Optional[int] = None
+    daily_budget: Optional[float] = None
+    spent_today: Optional[int] = None
+
+    @property
+    def planned_sports(self) -> List[str]:
+        return [p.sport for p in self.pulls if p.planned]
+
+    @property
+    def planned_credits(self) -> int:
+        return sum(p.cost for p in self.pulls if p.planned)
+
+    def for_sport(self, sport) -> Optional[SportPull]:
+        return next((p for p in self.pulls if p.sport == sport), None)
+
+
+def adaptive_polling_enabled() -> bool:
+    return getattr(settings, 'ODDS_ADAPTIVE_POLLING', False)
+
+
+def parse_tiers(spec) -> List[PollTier]:
+    """'name:max_minutes:cadence_minutes,...' → tiers, most urgent first."""
+    tiers = []
+    for chunk in (spec or '').split(','):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        name, max_minutes, cadence = chunk.split(':')
+        tiers.append(PollTier(name.strip(), int(max_minutes), int(cadence)))
+    if not tiers:
+        raise ValueError('ODDS_POLL_TIERS defines no tiers')
+    return sorted(tiers, key=lambda t: t.max_minutes)
+
+
+def get_tiers() -> List[PollTier]:
+    return parse_tiers(getattr(settings, 'ODDS_POLL_TIERS', DEFAULT_TIERS))
+
+
+def tier_for(minutes, tiers) -> Optional[PollTier]:
+    """Most urgent tier covering `minutes` to start. Underway games (negative
+    minutes) fall in the first tier."""
+    if minutes is None:
+        return None
+    for tier in tiers:
+        if minutes <= tier.max_minutes:
+            return tier
+    return None
+
+
+def days_left_in_cycle(today: date, billing_day: int) -> int:
+    """Days from `today` up to (not including) the next quota reset."""
+    billing_day = max(1, min(28, billing_day))
+    year, month = today.year, today.month
+    if today.day >= billing_day:
+        month += 1
+        if month == 13:
+            year, month = year + 1, 1
+    return (date(year, month, billing_day) - today).days
+
+
+def _quota_state(now):
+    """(credits_remaining, credits spent since UTC midnight) from OddsApiUsage
+    headers, or (None, None) when no call has reported them."""
+    from apps.ops.models import OddsApiUsage
+
+    metered = OddsApiUsage.objects.filter(
+        credits_used__isnull=False, credits_remaining__isnull=False,
+    ).order_by('-timestamp')
+    latest = metered.first()
+    if latest is None:
+        return None, None
+    midnight = datetime.combine(now.astimezone(dt_timezone.utc).date(), time.min, dt_timezone.utc)
+    before_today = metered.filter(timestamp__lt=midnight).first()
+    spent = 0
+    if before_today is not None:
+        # A quota reset mid-day makes the counter go backwards; count from 0.
+        spent = latest.credits_used - before_today.credits_used
+        if spent < 0:
+            spent = latest.credits_used
+    return latest.credits_remaining, spent
+
+
+def _last_pulls(sports):
+    """{sport: timestamp of the last successful Odds API call}."""
+    from django.db.models import Max
+
+    from apps.ops.models import OddsApiUsage
+
+    return dict(
+        OddsApiUsage.objects.filter(sport__in=sports, success=True)
+        .values('sport').annotate(last=Max('timestamp'))
+        .values_list('sport', 'last')
+    )
+
+
+def _next_start_minutes(entry, now):
+    """(minutes to the most urgent non-final game, games in window) for one
+    SPORT_REGISTRY entry."""
+    model = entry['game_model']
+    time_field = entry['time_field']
+    qs = model.objects.filter(**{
+        f'{time_field}__gte': now - FETCH_LOOKBACK,
+        f'{time_field}__lte': now + FETCH_LOOKAHEAD,
+    }).exclude(status__in=['final', 'postponed', 'cancelled'])
+    starts = list(qs.order_by(time_field).values_list(time_field, flat=True)[:1])
+    if not starts:
+        return None, 0
+    return minutes_until_first_pitch(starts[0], now=now), qs.count()
+
+
+def plan_odds_pulls(sports=None, *, now=None) -> OddsPollPlan:
+    """Plan this cycle's Odds API pulls for `sports` (default: every
+    SPORT_REGISTRY sport). See the module docstring for the rules."""
+    from apps.core.sport_registry import SPORT_REGISTRY
+
+    now = now or timezone.now()
+    tiers = get_tiers()
+    cost = int(getattr(settings, 'ODDS_API_CREDITS_PER_PULL', 3))
+    sports = [s for s in (sports or SPORT_REGISTRY) if s in SPORT_REGISTRY]
+    last_pulls = _last_pulls(sports)
+
+    plan = OddsPollPlan(generated_at=now)
+    due = []
+    for sport in sports:
+        minutes, count = _next_start_minutes(SPORT_REGISTRY[sport], now)
+        tier = tier_for(minutes, tiers)
+        pull = SportPull(
+            sport=sport, decision='skip', reason='no_games_in_window',
+            tier=tier.name if tier else None, minutes_to_start=minutes,
+            games_in_window=count, last_pull_at=last_pulls.get(sport),
+        )
+        plan.pulls.append(pull)
+        if tier is None:
+            continue
+        if pull.last_pull_at is not None:
+            elapsed = (now - pull.last_pull_at).total_seconds() / 60
+            if elapsed < tier.cadence_minutes - CADENCE_GRACE_MINUTES:
+                pull.reason = 'not_due'
+                continue
+        pull.cost = cost
+        due.append((tiers.index(tier), minutes, pull))
+
+    remaining, spent = _quota_state(now)
+    available = None
+    if remaining is not None:
+        plan.credits_remaining = remaining
+        plan.spent_today = spent
+        plan.days_left = days_left_in_cycle(
+            now.astimezone(dt_timezone.utc).date(),
+            int(getattr(settings, 'ODDS_API_BILLING_DAY', 1)),
+        )
+        # Today's share includes what was already spent today.
+        plan.daily_budget = (remaining + spent) / plan.days_left
+        available = plan.daily_budget - spent
+
+    for tier_index, _, pull in sorted(due, key=lambda d: (d[0], d[1])):
+        if available is None:
+            admitted = True
+        elif tier_index == 0:
+            admitted = remaining >= pull.cost
+        else:
+            admitted = available >= pull.cost
+        if not admitted:
+            pull.reason = 'quota_deferred'
+            pull.cost = 0
+            continue
+        pull.decision, pull.reason = 'pull', 'due'
+        if available is not None:
+            available -= pull.cost
+            remaining -= pull.cost
+    return plan
+
+
+def latest_credits_used() -> Optional[int]:
+    """The Odds API's cumulative x-requests-used as last reported, for
+    measuring a run's actual burn as a before/after delta."""
+    from apps.ops.models import OddsApiUsage
+
+    return (
+        OddsApiUsage.objects.filter(credits_used__isnull=False)
+        .order_by('-timestamp').values_list('credits_used', flat=True).first()
+    )
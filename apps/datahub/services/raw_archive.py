@@ -0,0 +1,148 @@
+"""Compressed on-disk archive of raw provider payloads.
+
+Every `fetch()` result is written before normalize runs, so a bad parse,
+a surprising payload or a persist bug can be reproduced later with
+`manage.py replay_ingest` — no network, no API quota. Layout, partitioned
+by capture date (UTC) so retention is a plain `rm -r` of old day dirs:
+
+    <RAW_ARCHIVE_DIR>/YYYY/MM/DD/index.jsonl
+    <RAW_ARCHIVE_DIR>/YYYY/MM/DD/<sport>/<data_type>/<sha256>.json.gz
+
+Blobs are content-addressed, so a quiet market that returns the same body
+all day costs one file; every pull still gets its own index line
+(sport, data_type, provider, captured_at, sha, path, bytes). Index lines
+are appended with a single O_APPEND write and stay well under PIPE_BUF,
+so concurrent cron jobs don't interleave them.
+
+  - archive_payload(provider, raw)        write side, never raises
+  - iter_archived(...)                    index scan, oldest first
+  - load_payload(entry)                   decompress one entry's body
+
+Gated by settings.RAW_ARCHIVE_ENABLED (default OFF).
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from datetime import date, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = 'index.jsonl'
+
+
+def archive_enabled() -> bool:
+    return getattr(settings, 'RAW_ARCHIVE_ENABLED', False)
+
+
+def archive_root() -> Path:
+    return Path(settings.RAW_ARCHIVE_DIR)
+
+
+def _day_dir(root: Path, day: date) -> Path:
+    return root / f'{day:%Y}' / f'{day:%m}' / f'{day:%d}'
+
+
+def provider_path(provider) -> str:
+    cls = type(provider)
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def archive_payload(provider, raw, *, now=None):
+    """Archive one fetch result for `provider`. Returns the index entry.
+
+    Returns None when archiving is off, the payload is empty, or the
+    write fails — a full disk must never cost us an ingest, so failures
+    are logged and swallowed.
+    """
+    if not archive_enabled() or not raw:
+        return None
+    now = now or timezone.now()
+    try:
+        body = json.dumps(raw, sort_keys=True, default=str).encode('utf-8')
+        sha = hashlib.sha256(body).hexdigest()
+        day_dir = _day_dir(archive_root(), now.astimezone(dt_timezone.utc).date())
+        rel = Path(provider.sport) / provider.data_type / f'{sha}.json.gz'
+        blob = day_dir / rel
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f'{blob.name}.{os.getpid()}.tmp')
+            with gzip.open(tmp, 'wb') as fh:
+                fh.write(body)
+            os.replace(tmp, blob)
+        entry = {
+            'sport': provider.sport,
+            'data_type': provider.data_type,
+            'provider': provider_path(provider),
+            'captured_at': now.isoformat(),
+            'sha': sha,
+            'path': str(rel),
+            'bytes': len(body),
+        }
+        line = (json.dumps(entry, sort_keys=True) + '\n').encode('utf-8')
+        fd = os.open(day_dir / INDEX_NAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        entry['day_dir'] = str(day_dir)
+        return entry
+    except Exception as e:
+        logger.warning(
+            f"raw_archive_failed sport={provider.sport} data_type={provider.data_type} err={e}"
+        )
+        return None
+
+
+def iter_archived(*, sport=None, data_type=None, since=None, until=None, sha=None):
+    """Yield index entries matching the filters, oldest capture first.
+
+    `since` / `until` are inclusive dates (UTC capture day). `sha` matches
+    as a prefix. Each entry carries `day_dir` so `load_payload` can find
+    its blob.
+    """
+    root = archive_root()
+    if not root.is_dir():
+        return
+    for index in sorted(root.glob(f'*/*/*/{INDEX_NAME}')):
+        day_dir = index.parent
+        try:
+            day = date(int(day_dir.parent.parent.name), int(day_dir.parent.name), int(day_dir.name))
+        except ValueError:
+            continue
+        if (since and day < since) or (until and day > until):
+            continue
+        entries = []
+        with index.open(encoding='utf-8') as fh:
+            for raw_line in fh:
+                if not raw_line.strip():
+                    continue
+                try:
+                    entry = json.loads(raw_line)
+                except ValueError:
+                    logger.warning(f"raw_archive_bad_index_line index={index}")
+                    continue
+                if sport and entry.get('sport') != sport:
+                    continue
+                if data_type and entry.get('data_type') != data_type:
+                    continue
+                if sha and not entry.get('sha', '').startswith(sha):
+                    continue
+                entry['day_dir'] = str(day_dir)
+                entries.append(entry)
+        entries.sort(key=lambda e: e['captured_at'])
+        yield from entries
+
+
+def load_payload(entry):
+    """Decompress and decode the raw payload behind an index entry."""
+    with gzip.open(Path(entry['day_dir']) / entry['path'], 'rb') as fh:
+        return json.loads(fh.read().decode('utf-8'))
+
@@ -7,7 +7,9 @@ for games inside the live window; the rest are skipped. The heavy 6-hour
 
 Extending to a new sport: set `supports_score_only = True` on that sport's
 schedule provider and implement `_find_existing_game`, `_normalized_game_time`,
-and `_extract_score_fields`.
+and `_extract_score_fields`. If its games are keyed on (source, external_id),
+also override `_find_existing_games` with `_games_by_external_id` so the
+whole live window is one lookup.
 """
 import logging
 
@@ -334,6 +334,45 @@ class ScoreOnlyProviderTests(TestCase):
         self.assertEqual(stats['updated'], 1)
         self.assertEqual(stats['window_hours']['lookahead'], 48)
 
+    def test_live_window_is_one_lookup_and_one_bulk_write(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.mlb.models import Game
+        raws = [self._raw_game(home_score=5, away_score=3)]
+        for i in range(5):
+            game = Game.objects.create(
+                home_team=self.home, away_team=self.away,
+                first_pitch=timezone.now() + timedelta(hours=1),
+                source='mlb_stats_api', external_id=f'batch-{i}',
+            )
+            raw = self._raw_game(home_score=i, away_score=0)
+            raw['gamePk'] = game.external_id
+            raws.append(raw)
+        prov = self._patched_provider(raws)
+        with CaptureQueriesContext(connection) as ctx:
+            stats = prov.update_scores_only()
+        self.assertEqual(stats['updated'], 6)
+        selects = [q for q in ctx.captured_queries if q['sql'].startswith('SELECT')]
+        updates = [q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual((len(selects), len(updates)), (1, 1))
+        self.assertEqual(
+            sorted(Game.objects.filter(external_id__startswith='batch-')
+                   .values_list('home_score', flat=True)),
+            [0, 1, 2, 3, 4],
+        )
+
+    def test_repeated_record_diffs_against_pending_change(self):
+        """Two records for one game: the second compares with the first's
+        change, as sequential saves did."""
+        prov = self._patched_provider([
+            self._raw_game(status='In Progress', home_score=1, away_score=0),
+            self._raw_game(status='In Progress', home_score=1, away_score=0),
+        ])
+        stats = prov.update_scores_only()
+        self.assertEqual((stats['updated'], stats['unchanged']), (1, 1))
+        self.game.refresh_from_db()
+        self.assertEqual((self.game.status, self.game.home_score), ('live', 1))
+
 
 class RefreshScoresAndSettleCommandTests(TestCase):
     """End-to-end: the 15-minute command flips a pending bet to 'win' after
@@ -1924,3 +1963,868 @@ class MlbOddsPrimaryDoubleheaderMatchTests(TestCase):
         provider = MLBOddsProvider.__new__(MLBOddsProvider)
         provider.persist([self._api_event(only.first_pitch)])
         self.assertEqual(self.OddsSnapshot.objects.filter(game=only).count(), 1)
+
+
+class APIClientSessionPoolingTests(TestCase):
+    """APIClient routes through a shared, pooled keep-alive Session per host
+    instead of a fresh `requests.get` (new TCP+TLS handshake) per call."""
+
+    def setUp(self):
+        from apps.datahub.providers.client import close_sessions
+        close_sessions()
+        self.addCleanup(close_sessions)
+
+    def _json_response(self, payload='{"ok": true}'):
+        import requests
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.headers['Content-Type'] = 'application/json'
+        resp._content = payload.encode('utf-8')
+        return resp
+
+    def test_clients_for_same_host_share_one_session(self):
+        from apps.datahub.providers.client import APIClient
+        a = APIClient('https://statsapi.mlb.com/api', rate_limit_delay=0)
+        b = APIClient('https://statsapi.mlb.com/api/', rate_limit_delay=0)
+        self.assertIs(a.session, b.session)
+
+    def test_clients_for_different_hosts_get_separate_sessions(self):
+        from apps.datahub.providers.client import APIClient
+        odds = APIClient('https://api.the-odds-api.com', rate_limit_delay=0)
+        espn = APIClient('https://site.api.espn.com/apis', rate_limit_delay=0)
+        self.assertIsNot(odds.session, espn.session)
+
+    def test_session_negotiates_gzip_and_keep_alive(self):
+        from apps.datahub.providers.client import get_session
+        session = get_session('https://api.the-odds-api.com')
+        self.assertIn('gzip', session.headers['Accept-Encoding'])
+        self.assertEqual(session.headers['Connection'], 'keep-alive')
+
+    def test_pool_sizes_read_from_settings(self):
+        from apps.datahub.providers.client import get_session
+        with self.settings(HTTP_POOL_CONNECTIONS=2, HTTP_POOL_MAXSIZE=16):
+            session = get_session('https://example.com')
+        adapter = session.get_adapter('https://example.com/x')
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 16)
+        # Retries stay in APIClient.get so each attempt is logged.
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    def test_get_uses_pooled_session_not_module_requests(self):
+        from apps.datahub.providers.client import APIClient
+        client = APIClient('https://statsapi.mlb.com/api', rate_limit_delay=0)
+        with patch.object(
+            client.session, 'get', return_value=self._json_response(),
+        ) as session_get, patch(
+            'apps.datahub.providers.client.requests.get',
+        ) as module_get:
+            self.assertEqual(client.get('/v1/people', params={'personIds': '1'}), {'ok': True})
+            self.assertEqual(client.get('/v1/people', params={'personIds': '2'}), {'ok': True})
+        self.assertEqual(session_get.call_count, 2)
+        module_get.assert_not_called()
+
+    def test_injected_session_is_used(self):
+        import requests
+        from apps.datahub.providers.client import APIClient
+        custom = requests.Session()
+        client = APIClient('https://statsapi.mlb.com/api', session=custom)
+        self.assertIs(client.session, custom)
+
+
+class RefreshDataParallelTests(TestCase):
+    """`refresh_data --parallel N` — bounded fan-out across sports that keeps
+    per-sport ordering, per-sport stdout blocks and CronRunLog semantics."""
+
+    LIVE = dict(
+        LIVE_DATA_ENABLED=True, LIVE_CBB_ENABLED=True, LIVE_CFB_ENABLED=False,
+        LIVE_GOLF_ENABLED=False, LIVE_MLB_ENABLED=True,
+        LIVE_COLLEGE_BASEBALL_ENABLED=True,
+    )
+
+    def _fake_call_command(self, calls, fail=None):
+        import threading
+
+        lock = threading.Lock()
+
+        def _fake(name, *args, stdout=None, **kwargs):
+            sport = kwargs.get('sport')
+            with lock:
+                calls.append((name, sport))
+            if stdout is not None:
+                stdout.write(f'{name} {sport} ran\n')
+            if fail and (name, sport) == fail:
+                raise RuntimeError(f'{name} boom')
+        return _fake
+
+    def _run(self, parallel, fail=None):
+        from io import StringIO
+        from django.core.management import call_command
+        calls = []
+        out = StringIO()
+        with self.settings(**self.LIVE), patch(
+            'apps.datahub.management.commands.refresh_data.call_command',
+            side_effect=self._fake_call_command(calls, fail),
+        ):
+            call_command('refresh_data', parallel=parallel, stdout=out)
+        return calls, out.getvalue()
+
+    def test_parallel_runs_same_commands_as_serial(self):
+        serial_calls, _ = self._run(1)
+        parallel_calls, _ = self._run(4)
+        self.assertEqual(sorted(serial_calls), sorted(parallel_calls))
+
+    def test_schedule_precedes_dependent_steps_per_sport(self):
+        calls, _ = self._run(4)
+        for sport in ('cbb', 'mlb', 'college_baseball'):
+            order = [name for name, s in calls if s == sport]
+            self.assertEqual(order[0], 'ingest_schedule')
+            self.assertLess(order.index('ingest_odds'), order.index('capture_snapshots'))
+            self.assertLess(order.index('capture_snapshots'), order.index('resolve_outcomes'))
+        mlb = [name for name, s in calls if s == 'mlb']
+        self.assertLess(mlb.index('ingest_pitcher_stats'), mlb.index('capture_snapshots'))
+        # Post-sport steps still run after every sport settled.
+        self.assertEqual(calls[-6:], [
+            ('settle_mockbets', None), ('update_elo_ratings', None),
+            ('refresh_recommendations', 'cbb'), ('refresh_recommendations', 'mlb'),
+            ('refresh_recommendations', 'college_baseball'),
+            ('prune_old_raw_snapshots', None),
+        ])
+
+    def test_stdout_is_grouped_per_sport(self):
+        from apps.ops.models import CronRunLog
+        self._run(4)
+        row = CronRunLog.objects.get(command='refresh_data')
+        self.assertEqual(row.status, 'success')
+        lines = row.stdout_tail.splitlines()
+        start = lines.index('Refreshing mlb...')
+        end = lines.index('mlb done')
+        block = lines[start + 1:end]
+        self.assertTrue(block)
+        self.assertTrue(all(' mlb ran' in line for line in block))
+        self.assertEqual(row.summary, 'success=3 fail=0 [cbb,mlb,college_baseball]')
+
+    def test_failed_sport_marks_partial_and_stops_that_sport_only(self):
+        from apps.ops.models import CronRunLog
+        calls, _ = self._run(4, fail=('ingest_schedule', 'mlb'))
+        mlb = [name for name, s in calls if s == 'mlb']
+        self.assertEqual(mlb, ['ingest_schedule'])
+        self.assertIn(('resolve_outcomes', 'cbb'), calls)
+        row = CronRunLog.objects.get(command='refresh_data')
+        self.assertEqual(row.status, 'partial')
+        self.assertIn('mlb: ingest_schedule boom', row.error_message)
+        self.assertIn('mlb failed: ingest_schedule boom', row.stdout_tail)
+        self.assertEqual(row.summary, 'success=2 fail=1 [cbb,college_baseball]')
+
+    def test_rejects_non_positive_parallel(self):
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        with self.assertRaises(CommandError):
+            call_command('refresh_data', parallel=0)
+
+
+class APIClientHostRateLimitTests(TestCase):
+    """Per-host spacing: separate APIClient instances against the same host
+    queue behind each other's `rate_limit_delay` (parallel refresh safety)."""
+
+    def setUp(self):
+        from apps.datahub.providers import client as client_mod
+        self.client_mod = client_mod
+        client_mod._HOST_NEXT_SLOT.clear()
+        self.addCleanup(client_mod._HOST_NEXT_SLOT.clear)
+
+    def test_second_instance_waits_for_host_slot(self):
+        a = self.client_mod.APIClient('https://api.the-odds-api.com', rate_limit_delay=1.0)
+        b = self.client_mod.APIClient('https://api.the-odds-api.com', rate_limit_delay=1.0)
+        with patch.object(self.client_mod.time, 'sleep') as sleep:
+            a._wait_for_rate_limit()
+            sleep.assert_not_called()
+            b._wait_for_rate_limit()
+        sleep.assert_called_once()
+        self.assertGreater(sleep.call_args[0][0], 0.9)
+
+    def test_other_hosts_are_not_throttled(self):
+        a = self.client_mod.APIClient('https://api.the-odds-api.com', rate_limit_delay=1.0)
+        b = self.client_mod.APIClient('https://site.api.espn.com', rate_limit_delay=1.0)
+        with patch.object(self.client_mod.time, 'sleep') as sleep:
+            a._wait_for_rate_limit()
+            b._wait_for_rate_limit()
+        sleep.assert_not_called()
+
+
+class MlbOddsBatchedPersistTests(TestCase):
+    """MLBOddsProvider.persist resolves teams/games from in-memory indexes and
+    writes the slate with one bulk insert — Team/Game lookups no longer scale
+    with the number of normalized rows."""
+
+    BOOKS = ['DraftKings', 'FanDuel', 'BetMGM', 'Caesars', 'PointsBet']
+
+    def setUp(self):
+        from apps.mlb.models import Conference, Game, Team
+        conf = Conference.objects.create(name='AL East', slug='al-east')
+        names = [
+            'New York Yankees', 'Boston Red Sox', 'Texas Rangers',
+            'Houston Astros', 'Seattle Mariners', 'Kansas City Royals',
+        ]
+        self.teams = [
+            Team.objects.create(name=n, slug=n.lower().replace(' ', '-'), conference=conf)
+            for n in names
+        ]
+        self.games = [
+            Game.objects.create(
+                home_team=self.teams[i], away_team=self.teams[i + 1],
+                first_pitch=timezone.now() + timedelta(hours=6 + i),
+            )
+            for i in (0, 2, 4)
+        ]
+
+    def _rows(self, games, books):
+        rows = []
+        for g in games:
+            for book in books:
+                rows.append({
+                    'home_team': g.home_team.name,
+                    'away_team': g.away_team.name,
+                    'commence_time': g.first_pitch.isoformat().replace('+00:00', 'Z'),
+                    'sportsbook': book,
+                    'moneyline_home': -140, 'moneyline_away': 120,
+                    'spread': -1.5, 'total': 8.5,
+                })
+        return rows
+
+    def _lookup_queries(self, rows):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.datahub.providers.mlb.odds_provider import MLBOddsProvider
+        provider = MLBOddsProvider.__new__(MLBOddsProvider)
+        with CaptureQueriesContext(connection) as ctx:
+            stats = provider.persist(rows)
+        lookups = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('SELECT')
+            and ('FROM "mlb_team"' in q['sql'] or 'FROM "mlb_game"' in q['sql'])
+        ]
+        inserts = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('INSERT INTO "mlb_oddssnapshot"')
+        ]
+        return stats, lookups, inserts
+
+    def test_team_and_game_lookups_are_constant(self):
+        stats, lookups, inserts = self._lookup_queries(self._rows(self.games, self.BOOKS))
+        self.assertEqual(stats['created'], 15)
+        self.assertEqual(len(lookups), 2)
+        self.assertEqual(len(inserts), 1)
+
+    def test_bulk_rows_match_single_create_semantics(self):
+        from apps.mlb.models import OddsSnapshot, SpreadOpportunity
+        self._lookup_queries(self._rows(self.games[:1], ['DraftKings']))
+        snap = OddsSnapshot.objects.get()
+        self.assertEqual(snap.game, self.games[0])
+        self.assertAlmostEqual(snap.market_away_win_prob, 1.0 - snap.market_home_win_prob)
+        self.assertEqual((snap.odds_source, snap.source_quality), ('odds_api', 'primary'))
+        # post_save still fires for bulk-inserted rows → opportunity signal.
+        self.assertEqual(SpreadOpportunity.objects.filter(odds_snapshot=snap).count(), 1)
+
+    def test_skip_reasons_and_coverage_preserved(self):
+        rows = self._rows(self.games[:2], ['DraftKings'])
+        rows.append(dict(rows[0], home_team='Nowhere Nine'))
+        rows.append(dict(rows[0], moneyline_home=None, sportsbook='FanDuel'))
+        rows.append(dict(
+            rows[0], commence_time=(timezone.now() + timedelta(days=20)).isoformat(),
+            sportsbook='BetMGM',
+        ))
+        stats, _, _ = self._lookup_queries(rows)
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(stats['skipped'], 3)
+        self.assertEqual(stats['skip_reasons'], {
+            'no_team_match': 1, 'no_moneyline_home': 1, 'no_game_match': 1,
+        })
+        self.assertEqual(stats['matchups_seen'], 3)
+        self.assertEqual(stats['matchups_matched'], 2)
+
+    def test_wide_fallback_still_matches_within_four_days(self):
+        from apps.mlb.models import OddsSnapshot
+        rows = self._rows(self.games[:1], ['DraftKings'])
+        rows[0]['commence_time'] = (
+            self.games[0].first_pitch + timedelta(days=3)
+        ).isoformat()
+        stats, _, _ = self._lookup_queries(rows)
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(OddsSnapshot.objects.get().game, self.games[0])
+
+
+class ChangeOnlyOddsWritesTests(TestCase):
+    """With ODDS_CHANGE_ONLY_WRITES on, a pull that repeats the current line
+    for a (game, sportsbook) extends that row instead of inserting one."""
+
+    def setUp(self):
+        from apps.mlb.models import Conference, Game, Team
+        conf = Conference.objects.create(name='AL East', slug='al-east')
+        home = Team.objects.create(name='New York Yankees', slug='new-york-yankees', conference=conf)
+        away = Team.objects.create(name='Boston Red Sox', slug='boston-red-sox', conference=conf)
+        self.game = Game.objects.create(
+            home_team=home, away_team=away,
+            first_pitch=timezone.now() + timedelta(hours=6),
+        )
+
+    def _rows(self, ml_home=-140, books=('DraftKings', 'FanDuel')):
+        return [{
+            'home_team': 'New York Yankees',
+            'away_team': 'Boston Red Sox',
+            'commence_time': self.game.first_pitch.isoformat().replace('+00:00', 'Z'),
+            'sportsbook': book,
+            'moneyline_home': ml_home, 'moneyline_away': 120,
+            'spread': -1.5, 'total': 8.5,
+        } for book in books]
+
+    def _persist(self, rows, change_only=True):
+        from apps.datahub.providers.mlb.odds_provider import MLBOddsProvider
+        provider = MLBOddsProvider.__new__(MLBOddsProvider)
+        with self.settings(ODDS_CHANGE_ONLY_WRITES=change_only):
+            return provider.persist(rows)
+
+    def test_unchanged_pull_extends_current_row(self):
+        from apps.mlb.models import OddsSnapshot
+        first = self._persist(self._rows())
+        self.assertEqual((first['created'], first['unchanged']), (2, 0))
+        original = OddsSnapshot.objects.get(sportsbook='DraftKings')
+
+        second = self._persist(self._rows())
+        self.assertEqual((second['created'], second['unchanged']), (0, 2))
+        self.assertEqual(second['status'], 'ok')
+        self.assertEqual(OddsSnapshot.objects.count(), 2)
+        row = OddsSnapshot.objects.get(sportsbook='DraftKings')
+        self.assertEqual(row.observation_count, 2)
+        self.assertEqual(row.captured_at, original.captured_at)
+        self.assertGreater(row.last_seen_at, original.last_seen_at)
+
+    def test_only_moved_books_insert(self):
+        from apps.mlb.models import OddsSnapshot
+        self._persist(self._rows())
+        rows = self._rows()
+        rows[1]['moneyline_home'] = -150  # FanDuel moved
+        stats = self._persist(rows)
+        self.assertEqual((stats['created'], stats['unchanged']), (1, 1))
+        self.assertEqual(OddsSnapshot.objects.filter(sportsbook='FanDuel').count(), 2)
+        self.assertEqual(OddsSnapshot.objects.filter(sportsbook='DraftKings').count(), 1)
+
+    def test_return_to_earlier_price_is_a_new_row(self):
+        # Compared against the CURRENT line only, so A → B → A is three rows.
+        from apps.mlb.models import OddsSnapshot
+        for ml in (-140, -150, -140):
+            self._persist(self._rows(ml_home=ml, books=('DraftKings',)))
+        self.assertEqual(OddsSnapshot.objects.count(), 3)
+
+    def test_flag_off_keeps_append_only(self):
+        from apps.mlb.models import OddsSnapshot
+        self._persist(self._rows(), change_only=False)
+        stats = self._persist(self._rows(), change_only=False)
+        self.assertEqual((stats['created'], stats['unchanged']), (2, 0))
+        self.assertEqual(OddsSnapshot.objects.count(), 4)
+
+    def test_cbb_provider_extends_unchanged_rows(self):
+        from apps.cbb.models import Conference, Game, OddsSnapshot, Team
+        from apps.datahub.providers.cbb.odds_provider import CBBOddsProvider
+        conf = Conference.objects.create(name='Big East', slug='big-east')
+        Team.objects.create(name='Villanova', slug='villanova', conference=conf)
+        Team.objects.create(name='Georgetown', slug='georgetown', conference=conf)
+        Game.objects.create(
+            home_team=Team.objects.get(slug='villanova'),
+            away_team=Team.objects.get(slug='georgetown'),
+            tipoff=timezone.now() + timedelta(hours=4),
+        )
+        rows = [{
+            'home_team': 'Villanova', 'away_team': 'Georgetown',
+            'commence_time': '', 'sportsbook': 'DraftKings',
+            'moneyline_home': -200, 'moneyline_away': 170,
+            'spread': -5.5, 'total': 140.5,
+        }]
+        provider = CBBOddsProvider.__new__(CBBOddsProvider)
+        with self.settings(ODDS_CHANGE_ONLY_WRITES=True):
+            provider.persist(rows)
+            stats = provider.persist(rows)
+        self.assertEqual((stats['created'], stats['unchanged']), (0, 1))
+        self.assertEqual(OddsSnapshot.objects.get().observation_count, 2)
+
+
+class LastSeenFreshnessTests(TestCase):
+    """Freshness consumers read last_seen_at, so an old-but-reconfirmed line
+    is fresh and survives raw-snapshot pruning."""
+
+    def setUp(self):
+        from apps.mlb.models import Conference, Game, OddsSnapshot, Team
+        conf = Conference.objects.create(name='AL East', slug='al-east')
+        home = Team.objects.create(name='Home', slug='home', conference=conf)
+        away = Team.objects.create(name='Away', slug='away', conference=conf)
+        self.game = Game.objects.create(
+            home_team=home, away_team=away,
+            first_pitch=timezone.now() + timedelta(minutes=20),
+        )
+        self.snap = OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now() - timedelta(days=20),
+            sportsbook='DraftKings', market_home_win_prob=0.55,
+            moneyline_home=-125, moneyline_away=105,
+            last_seen_at=timezone.now(), observation_count=40,
+        )
+
+    def test_is_odds_stale_reads_last_seen_at(self):
+        from apps.core.utils.multi_book import is_odds_stale
+        self.assertFalse(is_odds_stale(self.game, threshold_minutes=30))
+        type(self.snap).objects.filter(pk=self.snap.pk).update(
+            last_seen_at=timezone.now() - timedelta(hours=1),
+        )
+        self.assertTrue(is_odds_stale(self.game, threshold_minutes=30))
+
+    def test_mlb_latest_odds_treats_reconfirmed_primary_as_fresh(self):
+        from apps.mlb.models import OddsSnapshot
+        from apps.mlb.services.model_service import _get_latest_odds
+        OddsSnapshot.objects.create(
+            game=self.game, captured_at=timezone.now() - timedelta(minutes=5),
+            sportsbook='ESPN BET', market_home_win_prob=0.5,
+            moneyline_home=-110, moneyline_away=-110,
+            odds_source='espn', source_quality='fallback',
+        )
+        self.assertEqual(_get_latest_odds(self.game), self.snap)
+
+    def test_save_defaults_last_seen_at_to_captured_at(self):
+        from apps.mlb.models import OddsSnapshot
+        when = timezone.now() - timedelta(hours=3)
+        snap = OddsSnapshot.objects.create(
+            game=self.game, captured_at=when, sportsbook='FanDuel',
+            market_home_win_prob=0.5,
+        )
+        self.assertEqual(snap.last_seen_at, when)
+        self.assertEqual(snap.observation_count, 1)
+
+    def test_prune_keeps_reconfirmed_raw_row(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from apps.mlb.models import OddsSnapshot
+        call_command('prune_old_raw_snapshots', stdout=StringIO())
+        self.assertTrue(OddsSnapshot.objects.filter(pk=self.snap.pk).exists())
+
+
+class BulkScheduleUpsertTests(TestCase):
+    """Schedule providers dedupe teams/pitchers across the payload and write
+    each entity type in bulk, reporting the same created/updated counts as
+    the per-row update_or_create path."""
+
+    def _mlb_game(self, game_pk, home_id, away_id, *, day=0, state='Scheduled',
+                  home_pitcher=None, away_pitcher=None):
+        def team(team_id):
+            return {'id': team_id, 'name': f'Team {team_id}', 'abbreviation': f'T{team_id}',
+                    'division': {'name': 'American League East'}}
+        return {
+            'external_id': str(game_pk),
+            'game_date': (timezone.now() + timedelta(days=day)).isoformat(),
+            'detailed_state': state,
+            'home_team': team(home_id),
+            'away_team': team(away_id),
+            'home_score': None,
+            'away_score': None,
+            'home_pitcher': home_pitcher or {},
+            'away_pitcher': away_pitcher or {},
+            'venue': {},
+        }
+
+    def _mlb_persist(self, normalized):
+        from apps.datahub.providers.mlb.schedule_provider import MLBScheduleProvider
+        provider = MLBScheduleProvider.__new__(MLBScheduleProvider)
+        return provider.persist(normalized)
+
+    def test_mlb_counts_and_dedupe(self):
+        from apps.mlb.models import Conference, Game, StartingPitcher, Team
+        ace = {'id': 9001, 'fullName': 'Ace Hurler'}
+        slate = [
+            self._mlb_game(1, 147, 118, home_pitcher=ace),
+            self._mlb_game(2, 147, 111, day=1, home_pitcher=ace),
+        ]
+        stats = self._mlb_persist(slate)
+        self.assertEqual((stats['created'], stats['updated'], stats['skipped']), (2, 0, 0))
+        self.assertEqual(Team.objects.count(), 3)
+        self.assertEqual(Conference.objects.count(), 1)
+        self.assertEqual(StartingPitcher.objects.count(), 1)
+
+        slate[1]['detailed_state'] = 'Postponed'
+        stats = self._mlb_persist(slate)
+        self.assertEqual((stats['created'], stats['updated']), (0, 2))
+        self.assertEqual(Game.objects.count(), 2)
+        game = Game.objects.get(external_id='2')
+        self.assertEqual(game.status, 'postponed')
+        self.assertEqual(game.home_pitcher.external_id, '9001')
+
+    def test_mlb_repeated_game_pk_counts_like_sequential_upserts(self):
+        from apps.mlb.models import Game
+        stats = self._mlb_persist([
+            self._mlb_game(7, 147, 118, state='Postponed'),
+            self._mlb_game(7, 147, 118, day=1),
+        ])
+        self.assertEqual((stats['created'], stats['updated']), (1, 1))
+        self.assertEqual(Game.objects.get(external_id='7').status, 'scheduled')
+
+    def test_mlb_statement_count_does_not_grow_with_slate(self):
+        small = [self._mlb_game(i, 100 + i, 200 + i) for i in range(2)]
+        large = [self._mlb_game(i, 100 + i, 200 + i) for i in range(30)]
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as small_ctx:
+            self._mlb_persist(small)
+        with CaptureQueriesContext(connection) as large_ctx:
+            self._mlb_persist(large)
+        self.assertEqual(len(large_ctx), len(small_ctx))
+
+    def test_unchanged_fk_is_not_rewritten(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        slate = [self._mlb_game(1, 147, 118)]
+        self._mlb_persist(slate)
+        with CaptureQueriesContext(connection) as ctx:
+            self._mlb_persist(slate)
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE')])
+
+    def test_college_baseball_record_merges_across_games(self):
+        from apps.college_baseball.models import Team
+        from apps.datahub.providers.college_baseball.schedule_provider import (
+            CollegeBaseballScheduleProvider,
+        )
+
+        def item(event_id, wins):
+            return {
+                'external_id': event_id,
+                'start_date': timezone.now().isoformat(),
+                'status': 'scheduled', 'neutral_site': False,
+                'home_payload': {'id': '1', 'displayName': 'LSU'},
+                'away_payload': {'id': event_id, 'displayName': f'Opp {event_id}'},
+                'home_conf': 'SEC', 'away_conf': '',
+                'home_score': None, 'away_score': None,
+                'home_wins': wins, 'home_losses': 10 if wins else None,
+                'away_wins': None, 'away_losses': None,
+            }
+
+        provider = CollegeBaseballScheduleProvider.__new__(CollegeBaseballScheduleProvider)
+        stats = provider.persist([item('g1', 30), item('g2', None)])
+        self.assertEqual((stats['created'], stats['updated']), (2, 0))
+        lsu = Team.objects.get(external_id='1')
+        self.assertEqual((lsu.wins, lsu.losses), (30, 10))
+        self.assertEqual(Team.objects.get(external_id='g2').conference.slug, 'independent')
+
+    def test_cbb_matches_within_a_day_and_fills_missing_color(self):
+        from apps.cbb.models import Conference, Game, Team
+        from apps.datahub.providers.cbb.schedule_provider import CBBScheduleProvider
+        acc = Conference.objects.create(name='ACC', slug='acc')
+        duke = Team.objects.create(name='Duke', slug='duke', conference=acc)
+        unc = Team.objects.create(name='North Carolina', slug='north-carolina', conference=acc)
+        tipoff = timezone.now().replace(microsecond=0) + timedelta(days=2)
+        Game.objects.create(home_team=duke, away_team=unc, tipoff=tipoff)
+
+        def item(home, away, start, status='scheduled'):
+            return {
+                'home_team': home, 'away_team': away,
+                'home_conference': 'ACC', 'away_conference': 'ACC',
+                'start_date': start.isoformat(), 'status': status,
+                'neutral_site': False, 'home_score': None, 'away_score': None,
+            }
+
+        provider = CBBScheduleProvider.__new__(CBBScheduleProvider)
+        with patch('apps.datahub.providers.cbb.schedule_provider.get_team_color',
+                   return_value='#001A57'):
+            stats = provider.persist([
+                item('Duke', 'North Carolina', tipoff + timedelta(hours=2), status='live'),
+                item('Duke', 'Virginia', tipoff),
+                item('Duke', 'Virginia', tipoff, status='final'),
+            ])
+        self.assertEqual((stats['created'], stats['updated']), (1, 2))
+        self.assertEqual(Game.objects.count(), 2)
+        self.assertEqual(Game.objects.get(away_team=unc).status, 'live')
+        self.assertEqual(Game.objects.get(away_team__slug='virginia').status, 'final')
+        duke.refresh_from_db()
+        self.assertEqual(duke.primary_color, '#001A57')
+
+
+class RawPayloadArchiveTests(TestCase):
+    """fetch() results land in the compressed, date-partitioned archive and
+    `replay_ingest` reproduces the ingest from it without any network."""
+
+    def setUp(self):
+        import shutil
+        import tempfile
+        from apps.mlb.models import Conference, Game, Team
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir, True)
+        override = self.settings(RAW_ARCHIVE_ENABLED=True, RAW_ARCHIVE_DIR=self.archive_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        conf = Conference.objects.create(name='AL East', slug='al-east')
+        home = Team.objects.create(name='New York Yankees', slug='nyy', conference=conf)
+        away = Team.objects.create(name='Boston Red Sox', slug='bos', conference=conf)
+        self.game = Game.objects.create(
+            home_team=home, away_team=away,
+            first_pitch=timezone.now() + timedelta(hours=6),
+        )
+
+    def _raw(self, price=-140):
+        return [{
+            'home_team': 'New York Yankees', 'away_team': 'Boston Red Sox',
+            'commence_time': self.game.first_pitch.isoformat().replace('+00:00', 'Z'),
+            'bookmakers': [{'title': 'DraftKings', 'markets': [{'key': 'h2h', 'outcomes': [
+                {'name': 'New York Yankees', 'price': price},
+                {'name': 'Boston Red Sox', 'price': 120},
+            ]}]}],
+        }]
+
+    def _run(self, raw):
+        from apps.datahub.providers.mlb.odds_provider import MLBOddsProvider
+        provider = MLBOddsProvider.__new__(MLBOddsProvider)
+        with patch.object(MLBOddsProvider, 'fetch', return_value=raw):
+            return provider.run()
+
+    def test_run_archives_fetch_result(self):
+        from apps.datahub.services.raw_archive import iter_archived, load_payload
+        self._run(self._raw())
+        self._run(self._raw())
+        self._run(self._raw(price=-150))
+        entries = list(iter_archived(sport='mlb', data_type='odds'))
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(len({e['sha'] for e in entries}), 2)  # identical bodies share a blob
+        self.assertEqual(
+            entries[0]['provider'],
+            'apps.datahub.providers.mlb.odds_provider.MLBOddsProvider',
+        )
+        self.assertTrue(entries[0]['path'].endswith('.json.gz'))
+        self.assertEqual(load_payload(entries[-1]), self._raw(price=-150))
+
+    def test_archive_failure_never_fails_ingest(self):
+        with patch('apps.datahub.services.raw_archive.gzip.open', side_effect=OSError('disk full')):
+            stats = self._run(self._raw())
+        self.assertEqual(stats['created'], 1)
+
+    def test_disabled_writes_nothing(self):
+        import os
+        with self.settings(RAW_ARCHIVE_ENABLED=False):
+            self._run(self._raw())
+        self.assertEqual(os.listdir(self.archive_dir), [])
+
+    def test_replay_reproduces_ingest_offline(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from apps.mlb.models import OddsSnapshot
+        self._run(self._raw())
+        OddsSnapshot.objects.all().delete()
+
+        out = StringIO()
+        with patch('apps.datahub.providers.client.APIClient.get',
+                   side_effect=AssertionError('network')):
+            call_command('replay_ingest', '--sport', 'mlb', '--dry-run', stdout=out)
+        self.assertFalse(OddsSnapshot.objects.exists())
+        self.assertIn("'created': 1", out.getvalue())
+        self.assertIn('replayed 1 payloads, 0 failed', out.getvalue())
+
+    def test_real_odds_replay_is_refused(self):
+        """A real odds replay would stamp an old payload as the fresh line."""
+        from io import StringIO
+        from django.core.management import call_command
+        from apps.core.models import CurrentLine
+        from apps.mlb.models import OddsSnapshot
+        self._run(self._raw())
+        OddsSnapshot.objects.all().delete()
+        CurrentLine.objects.all().delete()
+
+        out = StringIO()
+        call_command('replay_ingest', '--sport', 'mlb', '--data-type', 'odds', stdout=out)
+        self.assertFalse(OddsSnapshot.objects.exists())
+        self.assertFalse(CurrentLine.objects.exists())
+        self.assertIn('only replay with --dry-run', out.getvalue())
+        self.assertIn('replayed 0 payloads, 1 failed', out.getvalue())
+
+    def test_real_input_replay_bumps_recommendation_cache(self):
+        from unittest.mock import MagicMock
+        from apps.datahub.management.commands.replay_ingest import Command
+        provider = MagicMock(sport='mlb', data_type='schedule')
+        provider.persist.return_value = {'status': 'ok'}
+        with patch('apps.core.services.recommendation_cache.bump') as bump:
+            Command()._replay(provider, [], dry_run=True)
+            bump.assert_not_called()
+            self.assertEqual(Command()._replay(provider, [], dry_run=False), {'status': 'ok'})
+        bump.assert_called_once_with('mlb', 'inputs')
+
+
+class AdaptiveOddsPollingTests(TestCase):
+    """plan_odds_pulls tiers sports by time to first pitch, honours tier
+    cadence and paces the remaining quota; refresh_data follows the plan and
+    records planned vs. actual credits on its CronRunLog row."""
+
+    TIERS = dict(ODDS_POLL_TIERS='imminent:90:15,soon:360:60,near:4320:360',
+                 ODDS_API_CREDITS_PER_PULL=3)
+
+    def _game(self, app, minutes):
+        from importlib import import_module
+        models = import_module(f'apps.{app}.models')
+        n = models.Game.objects.count()
+        conf = models.Conference.objects.get_or_create(name=f'{app} conf', slug=f'{app}-conf')[0]
+        home = models.Team.objects.create(name=f'H{n}', slug=f'{app}-h{n}', conference=conf)
+        away = models.Team.objects.create(name=f'A{n}', slug=f'{app}-a{n}', conference=conf)
+        return models.Game.objects.create(
+            home_team=home, away_team=away,
+            first_pitch=timezone.now() + timedelta(minutes=minutes),
+        )
+
+    def _usage(self, sport, minutes_ago, used=None, remaining=None):
+        from apps.ops.models import OddsApiUsage
+        row = OddsApiUsage.objects.create(
+            sport=sport, endpoint='/v4/sports/x/odds/', status_code=200, success=True,
+            credits_used=used, credits_remaining=remaining,
+        )
+        OddsApiUsage.objects.filter(pk=row.pk).update(
+            timestamp=timezone.now() - timedelta(minutes=minutes_ago),
+        )
+
+    def _plan(self, **overrides):
+        from apps.datahub.services.odds_schedule import plan_odds_pulls
+        with self.settings(**self.TIERS, **overrides):
+            return plan_odds_pulls(['mlb', 'college_baseball', 'cbb'])
+
+    def test_tiers_cadence_and_empty_sports(self):
+        self._game('mlb', 30)
+        self._game('mlb', 600)
+        self._game('college_baseball', 2 * 24 * 60)
+        self._usage('college_baseball', 60)
+        plan = self._plan()
+        mlb, cb, cbb = (plan.for_sport(s) for s in ('mlb', 'college_baseball', 'cbb'))
+        self.assertEqual((mlb.decision, mlb.reason, mlb.tier, mlb.games_in_window),
+                         ('pull', 'due', 'imminent', 2))
+        self.assertEqual((cb.decision, cb.reason, cb.tier), ('skip', 'not_due', 'near'))
+        self.assertEqual((cbb.decision, cbb.reason), ('skip', 'no_games_in_window'))
+        self.assertEqual((plan.planned_sports, plan.planned_credits), (['mlb'], 3))
+        self.assertIsNone(plan.daily_budget)
+
+    def test_quota_defers_least_urgent_first(self):
+        from apps.datahub.services.odds_schedule import days_left_in_cycle
+        self._game('mlb', 30)
+        self._game('college_baseball', 300)
+        today = timezone.now().date()
+        billing_day = (today + timedelta(days=10)).day
+        days_left = days_left_in_cycle(today, billing_day)
+        # Today's share covers one pull, not two.
+        self._usage('unknown', 24 * 60 + 5, used=100, remaining=4 * days_left + 1)
+        plan = self._plan(ODDS_API_BILLING_DAY=billing_day)
+        self.assertEqual(plan.planned_sports, ['mlb'])
+        self.assertEqual(plan.for_sport('college_baseball').reason, 'quota_deferred')
+
+        # Today's share already spent: the imminent tier still pulls.
+        self._usage('unknown', 1, used=200, remaining=3 * days_left)
+        plan = self._plan(ODDS_API_BILLING_DAY=billing_day)
+        self.assertEqual(plan.spent_today, 100)
+        self.assertEqual(plan.planned_sports, ['mlb'])
+
+    def test_days_left_in_cycle(self):
+        from datetime import date
+        from apps.datahub.services.odds_schedule import days_left_in_cycle
+        self.assertEqual(days_left_in_cycle(date(2026, 10, 17), 1), 15)
+        self.assertEqual(days_left_in_cycle(date(2026, 10, 17), 20), 3)
+        self.assertEqual(days_left_in_cycle(date(2026, 12, 20), 20), 31)
+
+    def test_refresh_data_follows_plan_and_records_credits(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from apps.ops.models import CronRunLog
+        self._game('mlb', 30)
+        self._usage('unknown', 24 * 60 + 5, used=50, remaining=10000)
+        calls = []
+
+        def _fake(name, *args, stdout=None, **kwargs):
+            calls.append((name, kwargs.get('sport')))
+            if name == 'ingest_odds':
+                self._usage(kwargs['sport'], 0, used=53, remaining=9997)
+
+        live = dict(
+            LIVE_DATA_ENABLED=True, LIVE_CBB_ENABLED=True, LIVE_CFB_ENABLED=False,
+            LIVE_GOLF_ENABLED=False, LIVE_MLB_ENABLED=True,
+            LIVE_COLLEGE_BASEBALL_ENABLED=False, ODDS_ADAPTIVE_POLLING=True,
+        )
+        with self.settings(**self.TIERS, **live), patch(
+            'apps.datahub.management.commands.refresh_data.call_command', side_effect=_fake,
+        ):
+            call_command('refresh_data', stdout=StringIO())
+        self.assertIn(('ingest_odds', 'mlb'), calls)
+        self.assertNotIn(('ingest_odds', 'cbb'), calls)
+        self.assertIn(('ingest_injuries', 'cbb'), calls)
+        row = CronRunLog.objects.get(command='refresh_data')
+        self.assertEqual((row.odds_credits_planned, row.odds_credits_used), (3, 3))
+        self.assertIn('cbb: odds skipped (no_games_in_window, tier=-)', row.stdout_tail)
+
+    def test_plan_command_reports_without_pulling(self):
+        from io import StringIO
+        from django.core.management import call_command
+        self._game('mlb', 30)
+        out = StringIO()
+        with self.settings(**self.TIERS), patch(
+            'apps.datahub.providers.client.APIClient.get', side_effect=AssertionError('network'),
+        ):
+            call_command('plan_odds_pulls', '--sport', 'mlb', stdout=out)
+        self.assertIn('PULL', out.getvalue())
+        self.assertIn('1 pulls planned, 3 credits', out.getvalue())
+
+
+class MlbEspnBatchedPersistTests(TestCase):
+    """ESPN gap-fill persist resolves teams and games in memory, checks
+    primary coverage with one query and inserts the run in one bulk insert —
+    lookups no longer scale with the number of ESPN events."""
+
+    def setUp(self):
+        self.fx = _MlbGapFillFixture().make()
+
+    def _row(self, game, **extra):
+        row = {
+            'home_team': game.home_team.name, 'away_team': game.away_team.name,
+            'commence_time': game.first_pitch.isoformat().replace('+00:00', 'Z'),
+            'sportsbook': 'DraftKings',
+            'moneyline_home': -130, 'moneyline_away': 110,
+            'spread': -1.5, 'total': 8.5,
+        }
+        row.update(extra)
+        return row
+
+    def _persist_queries(self, rows):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from apps.datahub.providers.mlb.odds_espn_provider import MLBEspnOddsProvider
+        provider = MLBEspnOddsProvider.__new__(MLBEspnOddsProvider)
+        with CaptureQueriesContext(connection) as ctx:
+            stats = provider.persist(rows)
+        lookups = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('SELECT') and any(
+                f'FROM "{table}"' in q['sql']
+                for table in ('mlb_team', 'mlb_game', 'mlb_oddssnapshot')
+            )
+        ]
+        inserts = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('INSERT INTO "mlb_oddssnapshot"')
+        ]
+        return stats, lookups, inserts
+
+    def test_lookups_do_not_scale_with_rows(self):
+        _seed_primary_snapshot(self.fx.game_a)
+        rows = [self._row(g) for g in (self.fx.game_a, self.fx.game_b, self.fx.game_c)]
+        rows.append(self._row(self.fx.game_c, home_team='Nowhere Nine'))
+        stats, lookups, inserts = self._persist_queries(rows)
+        # Teams, candidate games, primary coverage.
+        self.assertEqual(len(lookups), 3, lookups)
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(stats['created'], 2)
+        self.assertEqual(stats['skip_reasons'], {'has_fresh_primary': 1, 'no_team_match': 1})
+
+    def test_provenance_and_derived_fields_unchanged(self):
+        rows = [
+            self._row(self.fx.game_b),
+            self._row(self.fx.game_c, sportsbook='ESPN BET', moneyline_away=None, is_derived=True),
+        ]
+        self._persist_queries(rows)
+        snaps = {s.game_id: s for s in self.fx.OddsSnapshot.objects.all()}
+        b, c = snaps[self.fx.game_b.pk], snaps[self.fx.game_c.pk]
+        for snap in (b, c):
+            self.assertEqual((snap.odds_source, snap.source_quality), ('espn', 'fallback'))
+            self.assertEqual(snap.last_seen_at, snap.captured_at)
+            self.assertAlmostEqual(snap.market_away_win_prob, 1.0 - snap.market_home_win_prob)
+        self.assertEqual((b.is_derived, c.is_derived), (False, True))
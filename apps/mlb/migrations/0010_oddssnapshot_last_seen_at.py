@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:18
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_last_seen_at(apps, schema_editor):
+    # Every existing row was a single observation.
+    OddsSnapshot = apps.get_model('mlb', 'OddsSnapshot')
+    OddsSnapshot.objects.filter(last_seen_at__isnull=True).update(last_seen_at=F('captured_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlb', '0009_team_elo_last_updated_team_elo_rating'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='oddssnapshot',
+            name='last_seen_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='oddssnapshot',
+            name='observation_count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(backfill_last_seen_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='oddssnapshot',
+            index=models.Index(fields=['game', '-last_seen_at'], name='mlb_oddssna_game_id_0fbe25_idx'),
+        ),
+    ]
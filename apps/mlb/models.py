@@ -232,11 +232,20 @@ class OddsSnapshot(models.Model):
     # doesn't explicitly set it (older data, primary path) is treated as
     # genuine market data.
     is_derived = models.BooleanField(default=False, db_index=True)
+    # Change-only writes (ODDS_CHANGE_ONLY_WRITES): when a pull returns
+    # exactly the current line for this (game, sportsbook), the ingest path
+    # bumps last_seen_at/observation_count on this row instead of inserting
+    # a duplicate. captured_at stays "when this price was first seen";
+    # last_seen_at is "when we last confirmed it" and is what freshness
+    # checks read. save() fills it from captured_at for single-shot rows.
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+    observation_count = models.PositiveIntegerField(default=1)
 
     class Meta:
         ordering = ['-captured_at']
         indexes = [
             models.Index(fields=['game', '-captured_at']),
+            models.Index(fields=['game', '-last_seen_at']),
             models.Index(fields=['snapshot_type', '-captured_at']),
         ]
 
@@ -246,6 +255,8 @@ class OddsSnapshot(models.Model):
     def save(self, *args, **kwargs):
         if self.market_away_win_prob is None:
             self.market_away_win_prob = 1.0 - self.market_home_win_prob
+        if self.last_seen_at is None:
+            self.last_seen_at = self.captured_at
         super().save(*args, **kwargs)
 
 
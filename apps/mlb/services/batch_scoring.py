@@ -0,0 +1,190 @@
+"""Columnar MLB win-probability scoring.
+
+`model_service._score` → `_sigmoid` → `finalize_win_prob` runs one game
+at a time. Slate rendering, `capture_snapshots` and the method replay
+score hundreds to thousands of games per call, so this module evaluates
+the same formula over column lists instead:
+
+    columns  = ScoringColumns(...)            one entry per game
+    scored   = score_columns(columns, weights, use_recent_form=...)
+    final    = finalize_columns(scored['raw_prob'], columns.market_home_prob)
+
+Every step performs the same float operations in the same order as the
+scalar path, so results are bit-for-bit identical (locked by
+apps/mlb/test_batch_scoring.py). The score formula itself is documented
+in apps.mlb.services.model_service; keep the two in step.
+
+Pure Python on purpose: the per-game cost of the scalar path is the
+function-call, settings and query overhead around the arithmetic, not
+the arithmetic, and numpy is not a dependency of this project.
+"""
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from apps.core.services.probability_calibration import (
+    MARKET_BLEND_WEIGHT,
+    MARKET_BLEND_WEIGHT_CAP,
+    PROB_MAX,
+    PROB_MIN,
+)
+from apps.mlb.services.model_service import HFA
+
+
+@dataclass
+class ScoringColumns:
+    """Model inputs for a batch of games, one list entry per game.
+
+    Pitcher ratings are None when the starter is unknown; unless both are
+    known the pitcher and form terms are zero and the form deltas are
+    ignored, as in `_score`. `market_home_prob` is None when there is no market to
+    blend with.
+    """
+    home_team_rating: List[float] = field(default_factory=list)
+    away_team_rating: List[float] = field(default_factory=list)
+    home_pitcher_rating: List[Optional[float]] = field(default_factory=list)
+    away_pitcher_rating: List[Optional[float]] = field(default_factory=list)
+    home_form_delta: List[float] = field(default_factory=list)
+    away_form_delta: List[float] = field(default_factory=list)
+    neutral_site: List[bool] = field(default_factory=list)
+    market_home_prob: List[Optional[float]] = field(default_factory=list)
+
+    def append(self, *, home_team_rating, away_team_rating,
+               home_pitcher_rating=None, away_pitcher_rating=None,
+               home_form_delta=0.0, away_form_delta=0.0,
+               neutral_site=False, market_home_prob=None):
+        self.home_team_rating.append(home_team_rating)
+        self.away_team_rating.append(away_team_rating)
+        self.home_pitcher_rating.append(home_pitcher_rating)
+        self.away_pitcher_rating.append(away_pitcher_rating)
+        self.home_form_delta.append(home_form_delta)
+        self.away_form_delta.append(away_form_delta)
+        self.neutral_site.append(neutral_site)
+        self.market_home_prob.append(market_home_prob)
+
+    def __len__(self):
+        return len(self.home_team_rating)
+
+    def both_pitchers_known(self):
+        return [
+            hp is not None and ap is not None
+            for hp, ap in zip(self.home_pitcher_rating, self.away_pitcher_rating)
+        ]
+
+
+def score_columns(columns: ScoringColumns, weights: dict, *,
+                  use_recent_form: bool = False) -> dict:
+    """Score every game in `columns` with one weight set.
+
+    Returns {name: [value per game]} for the score-unit contributions
+    (team_rating_contribution, pitcher_static_contribution,
+    pitcher_form_contribution, hfa_contribution), `score` and `raw_prob`
+    — the sigmoid clamped to [0.01, 0.99], before the market blend. As in
+    `_score`, the form contribution is always computed but only added to
+    the score when `use_recent_form` is set.
+    """
+    w_rating = weights['rating']
+    w_pitcher = weights['pitcher']
+    hfa_term = HFA * weights['hfa']
+    known = columns.both_pitchers_known()
+
+    team = [
+        (h - a) * 0.35 * w_rating
+        for h, a in zip(columns.home_team_rating, columns.away_team_rating)
+    ]
+    pitcher = [
+        ((hp - ap) if ok else 0.0) * 0.65 * w_pitcher
+        for hp, ap, ok in zip(columns.home_pitcher_rating, columns.away_pitcher_rating, known)
+    ]
+    form = [
+        ((hf - af) if ok else 0.0) * 0.65 * w_pitcher
+        for hf, af, ok in zip(columns.home_form_delta, columns.away_form_delta, known)
+    ]
+    hfa = [0.0 if neutral else hfa_term for neutral in columns.neutral_site]
+
+    score = [t + p + h for t, p, h in zip(team, pitcher, hfa)]
+    if use_recent_form:
+        score = [s + f for s, f in zip(score, form)]
+
+    exp = math.exp
+    raw = [max(0.01, min(0.99, 1.0 / (1.0 + exp(-s / 25.0)))) for s in score]
+    return {
+        'team_rating_contribution': team,
+        'pitcher_static_contribution': pitcher,
+        'pitcher_form_contribution': form,
+        'hfa_contribution': hfa,
+        'score': score,
+        'raw_prob': raw,
+    }
+
+
+def blend_columns(raw_probs, market_probs, *, weight: float = MARKET_BLEND_WEIGHT,
+                  cap: float = MARKET_BLEND_WEIGHT_CAP) -> list:
+    """probability_calibration.blend_with_market over columns. `cap` is
+    the weight ceiling — the live path uses MARKET_BLEND_WEIGHT_CAP, the
+    replay its own historical ceiling."""
+    weight = max(0.0, min(cap, weight))
+    keep = 1.0 - weight
+    return [
+        raw if market is None else raw * keep + market * weight
+        for raw, market in zip(raw_probs, market_probs)
+    ]
+
+
+def clamp_columns(probs) -> list:
+    """probability_calibration.clamp_probability over a column."""
+    lo_low, hi_low = 1.0 - PROB_MAX, 1.0 - PROB_MIN
+    return [
+        max(PROB_MIN, min(PROB_MAX, p)) if p > 0.5
+        else max(lo_low, min(hi_low, p)) if p < 0.5
+        else p
+        for p in probs
+    ]
+
+
+def finalize_columns(raw_probs, market_probs, **blend) -> list:
+    """finalize_win_prob over columns: blend, then clamp."""
+    return clamp_columns(blend_columns(raw_probs, market_probs, **blend))
+
+
+def win_probs(columns: ScoringColumns, weights: dict, *,
+              use_recent_form: bool = False) -> dict:
+    """score_columns plus the live calibration: adds `final_prob`."""
+    scored = score_columns(columns, weights, use_recent_form=use_recent_form)
+    scored['final_prob'] = finalize_columns(scored['raw_prob'], columns.market_home_prob)
+    return scored
+
+
+def breakdowns(columns: ScoringColumns, scored: dict, *,
+               use_recent_form: bool = False) -> list:
+    """Per-game feature-attribution dicts, identical to what
+    compute_house_win_prob(..., return_breakdown=True) returns."""
+    out = []
+    for i, known in enumerate(columns.both_pitchers_known()):
+        hp = columns.home_pitcher_rating[i]
+        ap = columns.away_pitcher_rating[i]
+        raw = scored['raw_prob'][i]
+        market = columns.market_home_prob[i]
+        final = scored['final_prob'][i]
+        out.append({
+            'use_recent_form': use_recent_form,
+            'home_team_rating': float(columns.home_team_rating[i]),
+            'away_team_rating': float(columns.away_team_rating[i]),
+            'home_pitcher_rating': float(hp) if hp is not None else None,
+            'away_pitcher_rating': float(ap) if ap is not None else None,
+            'home_pitcher_form_delta': columns.home_form_delta[i] if known else None,
+            'away_pitcher_form_delta': columns.away_form_delta[i] if known else None,
+            'neutral_site': bool(columns.neutral_site[i]),
+            'team_rating_contribution': float(scored['team_rating_contribution'][i]),
+            'pitcher_static_contribution': float(scored['pitcher_static_contribution'][i]),
+            'pitcher_form_contribution': float(scored['pitcher_form_contribution'][i]),
+            'hfa_contribution': float(scored['hfa_contribution'][i]),
+            'score': float(scored['score'][i]),
+            'raw_prob_pre_blend': float(raw),
+            'market_home_win_prob': float(market) if market is not None else None,
+            'final_home_win_prob': float(final),
+            'market_blend_pp': (
+                round((final - raw) * 100, 2) if market is not None else 0.0
+            ),
+        })
+    return out
@@ -55,22 +55,40 @@ def _get_latest_odds(game):
     recommendation engine and the trust-badge layer already know how to
     flag/suppress them — we don't gate them out here so the UI can choose.
     """
-    from datetime import timedelta
-    from django.conf import settings
+    if hasattr(game, 'prefetched_latest_odds'):
+        # compute_slate_data already ran this ladder for the whole slate.
+        return game.prefetched_latest_odds
+
+    from apps.core.services import compute_context
+    return compute_context.memoize(
+        ('mlb.latest_odds', game.pk), lambda: _query_latest_odds(game),
+    )
 
-    fresh_window = getattr(settings, 'FRESH_ODDS_MAX_AGE_MINUTES', 180)
-    fresh_cutoff = timezone.now() - timedelta(minutes=fresh_window)
 
-    base = game.odds_snapshots.order_by('-captured_at')
+def _query_latest_odds(game):
+    from apps.core.services import current_line
 
-    primary = base.filter(odds_source='odds_api', captured_at__gte=fresh_cutoff).first()
+    fresh_cutoff = _fresh_cutoff()
+
+    if current_line.reads_enabled():
+        # One query: the snapshot behind each current line for this game.
+        candidates = current_line.current_snapshots_by_game(
+            game.odds_snapshots.model, [game.pk],
+        ).get(game.pk, [])
+        return _pick_latest_odds(candidates, fresh_cutoff)
+
+    # last_seen_at, not captured_at: with change-only writes an unchanged
+    # line keeps its original captured_at but is re-confirmed every pull.
+    base = game.odds_snapshots.order_by('-last_seen_at', '-captured_at')
+
+    primary = base.filter(odds_source='odds_api', last_seen_at__gte=fresh_cutoff).first()
     if primary:
         return primary
 
     secondary = base.filter(
         odds_source='espn',
         is_derived=False,
-        captured_at__gte=fresh_cutoff,
+        last_seen_at__gte=fresh_cutoff,
     ).first()
     if secondary:
         return secondary
@@ -78,8 +96,45 @@ def _get_latest_odds(game):
     return base.first()
 
 
+def _fresh_cutoff():
+    from datetime import timedelta
+    from django.conf import settings
+
+    fresh_window = getattr(settings, 'FRESH_ODDS_MAX_AGE_MINUTES', 180)
+    return timezone.now() - timedelta(minutes=fresh_window)
+
+
+def _pick_latest_odds(candidates, fresh_cutoff):
+    """_get_latest_odds' trust ladder over in-memory snapshots, newest-seen
+    first (the CurrentLine read path)."""
+    def fresh(snap):
+        return snap.last_seen_at is not None and snap.last_seen_at >= fresh_cutoff
+
+    for snap in candidates:
+        if snap.odds_source == 'odds_api' and fresh(snap):
+            return snap
+    for snap in candidates:
+        if snap.odds_source == 'espn' and not snap.is_derived and fresh(snap):
+            return snap
+    return candidates[0] if candidates else None
+
+
+def _recent_odds(game):
+    """The two newest snapshots by captured_at (line-movement input)."""
+    if hasattr(game, 'prefetched_recent_odds'):
+        return game.prefetched_recent_odds
+    from apps.core.services import compute_context
+    return compute_context.memoize(
+        ('mlb.recent_odds', game.pk),
+        lambda: list(game.odds_snapshots.order_by('-captured_at')[:2]),
+    )
+
+
 def _injuries(game):
-    return list(game.injuries.all())
+    from apps.core.services import compute_context
+    return compute_context.memoize(
+        ('mlb.injuries', game.pk), lambda: list(game.injuries.all()),
+    )
 
 
 def _pitcher_diff(game):
@@ -126,13 +181,8 @@ def _score(game, weights, *, return_breakdown=False, use_recent_form=None,
         # Compute the form delta even when the flag is OFF so the
         # contribution is available for audit/replay. Adding it to the
         # score is gated by use_recent_form.
-        from apps.mlb.services.pitcher_form import recent_form_delta
-        home_form_delta = recent_form_delta(
-            game.home_pitcher, reference_date=reference_date,
-        )
-        away_form_delta = recent_form_delta(
-            game.away_pitcher, reference_date=reference_date,
-        )
+        home_form_delta = _form_delta(game.home_pitcher, reference_date)
+        away_form_delta = _form_delta(game.away_pitcher, reference_date)
     form_diff = (home_form_delta - away_form_delta) * 0.65 * weights['pitcher']
 
     hfa = HFA * weights['hfa'] if not game.neutral_site else 0.0
@@ -165,6 +215,21 @@ def _score(game, weights, *, return_breakdown=False, use_recent_form=None,
     return score, breakdown
 
 
+def _form_delta(pitcher, reference_date):
+    """recent_form_delta, or the value compute_slate_data prefetched for
+    the live (reference_date=None) path."""
+    prefetched = getattr(pitcher, 'prefetched_form_delta', None)
+    if reference_date is None and prefetched is not None:
+        return prefetched
+    from apps.mlb.services.pitcher_form import recent_form_delta
+    if reference_date is None:
+        from apps.core.services import compute_context
+        return compute_context.memoize(
+            ('mlb.form_delta', pitcher.pk), lambda: recent_form_delta(pitcher),
+        )
+    return recent_form_delta(pitcher, reference_date=reference_date)
+
+
 def _sigmoid(x):
     # Divisor flattened 15 → 25 (2026-04-28 calibration tune) to reduce
     # overconfidence — see apps/cfb/services/model_service.py for rationale.
@@ -179,6 +244,41 @@ def compute_house_win_prob(game, latest_odds=None, injuries=None, context=None,
     When `return_breakdown=True`, returns (final_prob, contribution_dict)
     where contribution_dict is the v3.1 feature-attribution capture.
     """
+    from apps.core.services import compute_context
+
+    prefetched = getattr(game, 'prefetched_house_win_prob', None)
+    if prefetched is not None and _prefetched_mode_matches(game) and (
+        latest_odds is None
+        or _same_snapshot(latest_odds, getattr(game, 'prefetched_latest_odds', None))
+    ):
+        # compute_slate_data already scored the slate in one batch.
+        final, breakdown = prefetched
+        return (final, dict(breakdown)) if return_breakdown else final
+
+    if compute_context.active():
+        if latest_odds is None:
+            latest_odds = _get_latest_odds(game)
+        final, breakdown = compute_context.memoize(
+            ('mlb.house_win_prob', game.pk, compute_context.snapshot_key(latest_odds),
+             compute_context.rating_mode()),
+            lambda: _house_win_prob(game, latest_odds, return_breakdown=True),
+        )
+        return (final, dict(breakdown)) if return_breakdown else final
+    return _house_win_prob(game, latest_odds, return_breakdown=return_breakdown)
+
+
+def _same_snapshot(a, b):
+    return a is b or (a is not None and b is not None and a.pk is not None and a.pk == b.pk)
+
+
+def _prefetched_mode_matches(game):
+    """Batch-scored probabilities are only valid under the rating mode
+    they were scored in; the shadow pass flips it on the same instance."""
+    from apps.core.services import compute_context
+    return getattr(game, 'prefetched_rating_mode', None) == compute_context.rating_mode()
+
+
+def _house_win_prob(game, latest_odds, *, return_breakdown):
     score_result = _score(game, HOUSE_WEIGHTS, return_breakdown=return_breakdown)
     if return_breakdown:
         raw_score, breakdown = score_result
@@ -207,13 +307,33 @@ def compute_house_win_prob(game, latest_odds=None, injuries=None, context=None,
     return final, breakdown
 
 
-def compute_user_win_prob(game, user_config, injuries=None):
-    weights = {
+def _user_weights(user_config):
+    return {
         'rating': user_config.rating_weight,
         'pitcher': getattr(user_config, 'pitcher_weight', 1.0),
         'hfa': user_config.hfa_weight,
         'injury': user_config.injury_weight,
     }
+
+
+def compute_user_win_prob(game, user_config, injuries=None):
+    from apps.core.services import compute_context
+
+    prefetched = getattr(game, 'prefetched_user_win_prob', None)
+    if prefetched is not None and prefetched[0] is user_config and _prefetched_mode_matches(game):
+        return prefetched[1]
+    if compute_context.active():
+        return compute_context.memoize(
+            ('mlb.user_win_prob', game.pk,
+             compute_context.snapshot_key(_get_latest_odds(game)),
+             compute_context.rating_mode(), compute_context.config_key(user_config)),
+            lambda: _user_win_prob(game, user_config),
+        )
+    return _user_win_prob(game, user_config)
+
+
+def _user_win_prob(game, user_config):
+    weights = _user_weights(user_config)
     raw = _sigmoid(_score(game, weights))
     raw = max(0.01, min(0.99, raw))
     latest_odds = _get_latest_odds(game)
@@ -237,7 +357,7 @@ def compute_data_confidence(game, latest_odds=None, injuries=None):
         return 'low'
 
     _, both_pitchers = _pitcher_diff(game)
-    age_h = (timezone.now() - latest_odds.captured_at).total_seconds() / 3600.0
+    age_h = (timezone.now() - (latest_odds.last_seen_at or latest_odds.captured_at)).total_seconds() / 3600.0
 
     if not both_pitchers:
         return 'low'
@@ -260,7 +380,22 @@ def compute_edges(market_prob, house_prob, user_prob=None):
     return result
 
 
-def compute_game_data(game, user=None):
+def compute_game_data(game, user=None, *, user_config=None):
+    from apps.core.services import compute_context, slate
+
+    if not compute_context.active():
+        return _compute_game_data(game, user, user_config=user_config)
+    if user_config is None:
+        user_config = slate.user_model_config(user)
+    data = compute_context.memoize(
+        ('mlb.game_data', game.pk, compute_context.snapshot_key(_get_latest_odds(game)),
+         compute_context.rating_mode(), compute_context.config_key(user_config)),
+        lambda: _compute_game_data(game, user, user_config=user_config),
+    )
+    return dict(data)
+
+
+def _compute_game_data(game, user=None, *, user_config=None):
     latest_odds = _get_latest_odds(game)
     injuries = _injuries(game)
 
@@ -280,7 +415,7 @@ def compute_game_data(game, user=None):
     user_prob = None
     if user and user.is_authenticated:
         from apps.accounts.models import UserModelConfig
-        config = UserModelConfig.get_or_create_for_user(user)
+        config = user_config or UserModelConfig.get_or_create_for_user(user)
         user_prob = compute_user_win_prob(game, config, injuries)
 
     edges = compute_edges(market_prob, house_prob, user_prob)
@@ -289,7 +424,7 @@ def compute_game_data(game, user=None):
     # Line movement detection (same convention as CFB/CBB)
     line_movement = None
     if latest_odds:
-        snaps = list(game.odds_snapshots.order_by('-captured_at')[:2])
+        snaps = _recent_odds(game)
         if len(snaps) == 2:
             diff = (snaps[0].market_home_win_prob - snaps[1].market_home_win_prob) * 100
             if abs(diff) > 0.5:
@@ -326,3 +461,122 @@ def compute_game_data(game, user=None):
         'trust_tier': trust_tier,
         'trust_badge': trust_badge(trust_tier),
     }
+
+
+def compute_slate_data(games, user=None):
+    """compute_game_data for a whole slate in a fixed number of queries.
+
+    Prefetches latest odds (same trust ladder / CurrentLine path),
+    line-movement snapshots, injuries, pitchers, both starters' recent
+    form and the user's config once, scores the house and user models for
+    the whole slate in one batch_scoring call each, then runs the per-game
+    code. Returns the per-game dicts in `games` order. See
+    apps.core.services.slate.
+    """
+    from apps.core.services import compute_context, slate
+
+    games = prefetch_scoring_inputs(games)
+    if not games:
+        return []
+
+    house = house_win_probs(games, return_breakdown=True)
+    config = slate.user_model_config(user)
+    user_probs = user_win_probs(games, config) if config else None
+    mode = compute_context.rating_mode()
+    for i, game in enumerate(games):
+        game.prefetched_rating_mode = mode
+        game.prefetched_house_win_prob = house[i]
+        if user_probs is not None:
+            game.prefetched_user_win_prob = (config, user_probs[i])
+    return [compute_game_data(g, user, user_config=config) for g in games]
+
+
+def prefetch_scoring_inputs(games):
+    """Load everything the house/user models read for `games` in a fixed
+    number of queries: latest odds (same trust ladder / CurrentLine path),
+    line-movement snapshots, injuries, teams, pitchers and both starters'
+    recent form. Returns `games` as a list."""
+    from apps.core.services import current_line, slate
+    from apps.mlb.services.pitcher_form import recent_form_deltas
+
+    games = list(games)
+    if not games:
+        return games
+    fresh_cutoff = _fresh_cutoff()
+    candidates = None
+    if current_line.reads_enabled():
+        candidates = current_line.current_snapshots_by_game(
+            slate.snapshot_model_for(type(games[0])), [g.pk for g in games],
+        )
+    slate.prefetch_slate(
+        games, lambda c: _pick_latest_odds(c, fresh_cutoff),
+        related=('home_team', 'away_team', 'home_pitcher', 'away_pitcher'),
+        candidates=candidates,
+    )
+
+    starters = [
+        p for g in games if g.home_pitcher and g.away_pitcher
+        for p in (g.home_pitcher, g.away_pitcher)
+    ]
+    deltas = recent_form_deltas(starters)
+    for pitcher in starters:
+        pitcher.prefetched_form_delta = deltas[pitcher.id]
+    return games
+
+
+def scoring_columns(games, *, reference_date=None):
+    """batch_scoring.ScoringColumns for `games`, read the same way `_score`
+    and compute_house_win_prob read them one game at a time. Run
+    prefetch_scoring_inputs first to keep this query-free."""
+    from apps.core.services.elo_service import team_rating_for_model
+    from apps.mlb.services.batch_scoring import ScoringColumns
+
+    columns = ScoringColumns()
+    for game in games:
+        hp, ap = game.home_pitcher, game.away_pitcher
+        both_known = hp is not None and ap is not None
+        latest_odds = _get_latest_odds(game)
+        columns.append(
+            home_team_rating=team_rating_for_model(game.home_team),
+            away_team_rating=team_rating_for_model(game.away_team),
+            home_pitcher_rating=hp.rating if hp is not None else None,
+            away_pitcher_rating=ap.rating if ap is not None else None,
+            home_form_delta=_form_delta(hp, reference_date) if both_known else 0.0,
+            away_form_delta=_form_delta(ap, reference_date) if both_known else 0.0,
+            neutral_site=game.neutral_site,
+            market_home_prob=latest_odds.market_home_win_prob if latest_odds else None,
+        )
+    return columns
+
+
+def _use_recent_form():
+    from django.conf import settings
+    return bool(getattr(settings, 'USE_STARTER_RECENT_FORM', False))
+
+
+def house_win_probs(games, *, return_breakdown=False):
+    """compute_house_win_prob for every game in one batch_scoring call.
+    Returns a list in `games` order — of (final, breakdown) tuples when
+    `return_breakdown=True`."""
+    from apps.mlb.services import batch_scoring
+
+    columns = scoring_columns(games)
+    use_recent_form = _use_recent_form()
+    scored = batch_scoring.win_probs(columns, HOUSE_WEIGHTS, use_recent_form=use_recent_form)
+    if not return_breakdown:
+        return scored['final_prob']
+    return list(zip(
+        scored['final_prob'],
+        batch_scoring.breakdowns(columns, scored, use_recent_form=use_recent_form),
+    ))
+
+
+def user_win_probs(games, user_config):
+    """compute_user_win_prob for every game in one batch_scoring call."""
+    from apps.mlb.services import batch_scoring
+
+    scored = batch_scoring.win_probs(
+        scoring_columns(games), _user_weights(user_config),
+        use_recent_form=_use_recent_form(),
+    )
+    return scored['final_prob']
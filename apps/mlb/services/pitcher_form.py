@@ -28,6 +28,7 @@ average rating, based on recent W/L over their last N starts."
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime
 from typing import Optional
 
@@ -43,6 +44,7 @@ def recent_form_delta(
     *,
     reference_date: Optional[datetime] = None,
     n: int = DEFAULT_LOOKBACK_STARTS,
+    ledger: Optional[StartLedger] = None,
 ) -> float:
     """Return a rating-scale delta (positive = better-than-season form).
 
@@ -52,6 +54,8 @@ def recent_form_delta(
             considered. Defaults to "now" — but for replay must be the
             game's own first_pitch (leak guard).
         n: lookback window in completed starts.
+        ledger: a StartLedger covering this pitcher up to reference_date;
+            when given, the delta is read from it instead of queried.
 
     Returns:
         A float on the rating scale (50-centered). 0.0 means "no signal"
@@ -66,6 +70,8 @@ def recent_form_delta(
 
     if reference_date is None:
         reference_date = timezone.now()
+    if ledger is not None:
+        return ledger.delta(pitcher.id, reference_date, n=n)
 
     qs = (
         Game.objects
@@ -78,24 +84,165 @@ def recent_form_delta(
         )
         .order_by('-first_pitch')[:n]
     )
-    games = list(qs)
-    if len(games) < MIN_DECISIONS_FOR_SIGNAL:
-        return 0.0
+    return _delta_from_starts(pitcher.id, list(qs))
+
+
+def recent_form_deltas(
+    pitchers,
+    *,
+    reference_date: Optional[datetime] = None,
+    n: int = DEFAULT_LOOKBACK_STARTS,
+) -> dict:
+    """{pitcher_id: recent_form_delta(pitcher)} for many pitchers in two
+    queries (last `n` home starts and last `n` away starts per pitcher)
+    instead of one per pitcher. Same cutoff and result as the scalar path.
+    """
+    from django.utils import timezone
+
+    ids = {p.id for p in pitchers if p is not None}
+    if not ids:
+        return {}
+    if reference_date is None:
+        reference_date = timezone.now()
+    ledger = StartLedger.recent_for_pitchers(ids, until=reference_date, n=n)
+    return {pid: ledger.delta(pid, reference_date, n=n) for pid in ids}
+
+
+class StartLedger:
+    """Per-pitcher chronological record of final starts.
 
-    wins = 0
-    decisions = 0
+    Loaded once (one query) for a set of pitchers, then every
+    recent_form_delta lookup is a bisect on the pitcher's start times
+    plus a read of the last `n` outcomes before the cutoff — no query.
+    The method replay loads full histories (`for_pitchers`) once per
+    experiment, so each game's leak-guarded lookback (reference_date =
+    its own first_pitch) is served from memory. The slate path looks
+    back from a single cutoff and only loads the last `n` starts per
+    pitcher (`recent_for_pitchers`).
+
+    Outcomes are 1 (pitcher's team won), 0 (lost) or None (tie — a start
+    without a decision), exactly as `_delta_from_starts` scores them.
+    """
+
+    def __init__(self):
+        self._times = {}      # pitcher_id -> [first_pitch, ...] ascending
+        self._outcomes = {}   # pitcher_id -> [1 | 0 | None, ...] aligned
+
+    @classmethod
+    def for_pitchers(cls, pitcher_ids, *, until: Optional[datetime] = None):
+        """Ledger of every final, scored start by `pitcher_ids` before
+        `until` (default: all history)."""
+        from django.db.models import Q
+        from apps.mlb.models import Game
+
+        ledger = cls()
+        ids = set(pitcher_ids)
+        if not ids:
+            return ledger
+        qs = Game.objects.filter(
+            Q(home_pitcher_id__in=ids) | Q(away_pitcher_id__in=ids),
+            status='final',
+            home_score__isnull=False,
+            away_score__isnull=False,
+        )
+        if until is not None:
+            qs = qs.filter(first_pitch__lt=until)
+        rows = qs.order_by('first_pitch').values_list(
+            'first_pitch', 'home_pitcher_id', 'away_pitcher_id', 'home_score', 'away_score',
+        )
+        for first_pitch, home_id, away_id, home_score, away_score in rows:
+            if home_id in ids:
+                ledger.add(home_id, first_pitch, home_score, away_score)
+            if away_id in ids:
+                ledger.add(away_id, first_pitch, away_score, home_score)
+        return ledger
+
+    @classmethod
+    def recent_for_pitchers(cls, pitcher_ids, *, until: datetime,
+                            n: int = DEFAULT_LOOKBACK_STARTS):
+        """Ledger of only the last `n` final, scored starts per pitcher
+        before `until` — enough for `delta(pid, until, n)` and bounded no
+        matter how long the careers. Two windowed queries, one per side;
+        the top `n` home plus top `n` away starts always contain the top
+        `n` overall."""
+        from django.db.models import F, Window
+        from django.db.models.functions import RowNumber
+        from apps.mlb.models import Game
+
+        ledger = cls()
+        ids = set(pitcher_ids)
+        if not ids:
+            return ledger
+        for side in ('home_pitcher_id', 'away_pitcher_id'):
+            rows = Game.objects.filter(
+                **{f'{side}__in': ids},
+                status='final',
+                first_pitch__lt=until,
+                home_score__isnull=False,
+                away_score__isnull=False,
+            ).annotate(start_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F(side)],
+                order_by=[F('first_pitch').desc()],
+            )).filter(start_rank__lte=n).values_list(
+                'first_pitch', side, 'home_score', 'away_score',
+            )
+            for first_pitch, pitcher_id, home_score, away_score in rows:
+                if side == 'home_pitcher_id':
+                    ledger.add(pitcher_id, first_pitch, home_score, away_score)
+                else:
+                    ledger.add(pitcher_id, first_pitch, away_score, home_score)
+        return ledger
+
+    def add(self, pitcher_id, first_pitch, team_score, opponent_score):
+        """Record one final start. Appends in O(1) when starts arrive in
+        chronological order (as `for_pitchers` loads them); otherwise
+        inserts in place."""
+        outcome = None if team_score == opponent_score else int(team_score > opponent_score)
+        times = self._times.setdefault(pitcher_id, [])
+        outcomes = self._outcomes.setdefault(pitcher_id, [])
+        if not times or times[-1] <= first_pitch:
+            times.append(first_pitch)
+            outcomes.append(outcome)
+            return
+        i = bisect_left(times, first_pitch)
+        times.insert(i, first_pitch)
+        outcomes.insert(i, outcome)
+
+    def delta(self, pitcher_id, reference_date: datetime,
+              n: int = DEFAULT_LOOKBACK_STARTS) -> float:
+        """recent_form_delta over the last `n` starts strictly before
+        `reference_date`."""
+        times = self._times.get(pitcher_id)
+        if not times:
+            return 0.0
+        end = bisect_left(times, reference_date)
+        return _delta_from_outcomes(self._outcomes[pitcher_id][max(0, end - n):end])
+
+
+def _delta_from_starts(pitcher_id, games) -> float:
+    """W/L form delta over `games`, the pitcher's recent final starts."""
+    outcomes = []
     for g in games:
         # A tie counts as no decision (defensive — MLB regulation games
         # don't tie, but extra-inning suspensions exist).
         if g.home_score is None or g.away_score is None or g.home_score == g.away_score:
-            continue
-        decisions += 1
-        if g.home_pitcher_id == pitcher.id:
-            pitcher_team_won = g.home_score > g.away_score
+            outcomes.append(None)
+        elif g.home_pitcher_id == pitcher_id:
+            outcomes.append(int(g.home_score > g.away_score))
         else:
-            pitcher_team_won = g.away_score > g.home_score
-        if pitcher_team_won:
-            wins += 1
+            outcomes.append(int(g.away_score > g.home_score))
+    return _delta_from_outcomes(outcomes)
+
+
+def _delta_from_outcomes(outcomes) -> float:
+    """W/L form delta over a window of start outcomes (1 / 0 / None)."""
+    if len(outcomes) < MIN_DECISIONS_FOR_SIGNAL:
+        return 0.0
+
+    decided = [o for o in outcomes if o is not None]
+    decisions = len(decided)
+    wins = sum(decided)
 
     if decisions < MIN_DECISIONS_FOR_SIGNAL:
         return 0.0
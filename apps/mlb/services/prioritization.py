@@ -423,7 +423,10 @@ def build_signals(game, *, user=None, streaks=None, user_bet_by_game=None) -> Ga
 
     `user_bet_by_game` is a dict mapping game.id -> pending mockbet.id (str).
     """
-    latest_odds = game.odds_snapshots.order_by('-captured_at').first()
+    # Newest snapshot by captured_at — the slate prefetch / request memo
+    # behind model_service._recent_odds when available.
+    from apps.mlb.services.model_service import _recent_odds
+    latest_odds = next(iter(_recent_odds(game)), None)
     injuries = list(game.injuries.all())
     for inj in injuries:
         inj.game = game
@@ -585,6 +588,17 @@ def prioritize(games: Iterable, *, user=None) -> list[GameSignals]:
                 'bet_type': bet.bet_type,
             }
 
+    from apps.core.services import compute_context
+    if compute_context.active() and games:
+        # Inside a request-scoped context, compute every game's model data
+        # for the slate up front (fixed query count); build_signals and
+        # get_recommendation then read it from the memo.
+        from apps.mlb.services.model_service import compute_slate_data
+        compute_slate_data(games, user)
+
+    from apps.core.services.current_recommendation import prefetch_current_recommendations
+    prefetch_current_recommendations('mlb', games, user)
+
     return [
         build_signals(g, user=user, streaks=streaks, user_bet_by_game=user_bet_by_game)
         for g in games
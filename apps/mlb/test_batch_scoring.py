@@ -0,0 +1,124 @@
+"""Parity tests for apps.mlb.services.batch_scoring.
+
+The columnar engine must reproduce the scalar model — `_score` →
+`_sigmoid` → `finalize_win_prob` and the feature breakdown — bit for bit,
+for house and user weights, with the recent-form flag on and off.
+"""
+import random
+from types import SimpleNamespace
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.mlb.models import Game, OddsSnapshot, StartingPitcher, Team
+from apps.mlb.services import batch_scoring
+from apps.mlb.services.model_service import (
+    HOUSE_WEIGHTS,
+    _user_weights,
+    compute_house_win_prob,
+    compute_user_win_prob,
+    house_win_probs,
+    prefetch_scoring_inputs,
+    scoring_columns,
+    user_win_probs,
+)
+
+
+def _unsaved_games(n, seed=7):
+    """`n` in-memory games covering missing starters, neutral sites, no
+    market, extreme ratings and ratings stored as ints."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(n):
+        home = Team(name=f'H{i}', rating=rng.uniform(0, 100))
+        away = Team(name=f'A{i}', rating=rng.choice([rng.uniform(0, 100), rng.randint(0, 100)]))
+        pitchers = []
+        for team in (home, away):
+            if rng.random() < 0.15:
+                pitchers.append(None)
+                continue
+            p = StartingPitcher(team=team, name='P', rating=rng.uniform(20, 95))
+            p.prefetched_form_delta = rng.choice([0.0, rng.uniform(-6, 6)])
+            pitchers.append(p)
+        game = Game(
+            home_team=home, away_team=away,
+            home_pitcher=pitchers[0], away_pitcher=pitchers[1],
+            first_pitch=timezone.now(), neutral_site=rng.random() < 0.1,
+        )
+        game.prefetched_latest_odds = None
+        if rng.random() < 0.85:
+            game.prefetched_latest_odds = OddsSnapshot(
+                game=game, market_home_win_prob=rng.choice([0.5, rng.uniform(0.2, 0.8)]),
+            )
+        games.append(game)
+    return games
+
+
+class BatchScoringParityTests(TestCase):
+
+    def test_house_probabilities_and_breakdowns_match_scalar(self):
+        games = _unsaved_games(2000)
+        for flag in (False, True):
+            with self.subTest(use_recent_form=flag), \
+                    override_settings(USE_STARTER_RECENT_FORM=flag):
+                scalar = [compute_house_win_prob(g, return_breakdown=True) for g in games]
+                self.assertEqual(house_win_probs(games, return_breakdown=True), scalar)
+                self.assertEqual(
+                    house_win_probs(games), [final for final, _ in scalar],
+                )
+
+    def test_user_weights_match_scalar(self):
+        games = _unsaved_games(500, seed=11)
+        config = SimpleNamespace(
+            rating_weight=1.7, pitcher_weight=0.3, hfa_weight=2.2, injury_weight=1.0,
+        )
+        for flag in (False, True):
+            with self.subTest(use_recent_form=flag), \
+                    override_settings(USE_STARTER_RECENT_FORM=flag):
+                scalar = [compute_user_win_prob(g, config) for g in games]
+                self.assertEqual(user_win_probs(games, config), scalar)
+
+    def test_stages_are_exposed_per_feature(self):
+        games = _unsaved_games(50, seed=3)
+        columns = scoring_columns(games)
+        scored = batch_scoring.win_probs(columns, _user_weights(SimpleNamespace(
+            rating_weight=1.0, pitcher_weight=1.0, hfa_weight=1.0, injury_weight=1.0,
+        )))
+        self.assertEqual(len(columns), 50)
+        for key in ('team_rating_contribution', 'pitcher_static_contribution',
+                    'pitcher_form_contribution', 'hfa_contribution', 'score',
+                    'raw_prob', 'final_prob'):
+            self.assertEqual(len(scored[key]), 50, key)
+        # HOUSE_WEIGHTS are unit weights, so the house model scores the same.
+        self.assertEqual(
+            batch_scoring.win_probs(columns, HOUSE_WEIGHTS)['final_prob'], scored['final_prob'],
+        )
+
+    def test_saved_slate_matches_per_game(self):
+        from apps.mlb.models import Conference
+
+        conf = Conference.objects.create(name='AL', slug='al-batch')
+        games = []
+        for i in range(4):
+            home = Team.objects.create(name=f'H{i}', slug=f'bh{i}', conference=conf, rating=40 + 5 * i)
+            away = Team.objects.create(name=f'A{i}', slug=f'ba{i}', conference=conf, rating=60 - 3 * i)
+            kwargs = {}
+            if i != 3:
+                kwargs = {
+                    'home_pitcher': StartingPitcher.objects.create(team=home, name=f'HP{i}', rating=50 + i),
+                    'away_pitcher': StartingPitcher.objects.create(team=away, name=f'AP{i}', rating=45),
+                }
+            game = Game.objects.create(
+                home_team=home, away_team=away, first_pitch=timezone.now(), **kwargs,
+            )
+            if i != 2:
+                OddsSnapshot.objects.create(
+                    game=game, captured_at=timezone.now(), market_home_win_prob=0.45 + i / 20,
+                    moneyline_home=-120, moneyline_away=110, odds_source='odds_api',
+                )
+            games.append(game)
+
+        per_game = {g.pk: compute_house_win_prob(Game.objects.get(pk=g.pk)) for g in games}
+        slate = prefetch_scoring_inputs(Game.objects.filter(pk__in=list(per_game)))
+        batched = dict(zip((g.pk for g in slate), house_win_probs(slate)))
+        self.assertEqual(batched, per_game)
@@ -172,6 +172,41 @@ class RecentFormServiceTests(TestCase):
         # With no past games + future game excluded → zero signal.
         self.assertEqual(recent_form_delta(p, reference_date=now), 0.0)
 
+    def test_start_ledger_matches_query_at_every_cutoff(self):
+        """StartLedger bisect + window read == the per-call query, for
+        every cutoff (exactly on a start, between starts, past the end),
+        window size and side, including a tied game."""
+        from apps.mlb.services.pitcher_form import StartLedger, recent_form_delta
+        h, a = _make_mlb_setup('rf4')
+        p = _make_pitcher(h, rating=50.0, name='ledger')
+        other = _make_pitcher(a, rating=50.0, name='opp')
+        now = timezone.now()
+        starts = []
+        for i in range(12):
+            home = i % 3 != 0
+            scores = (3, 3) if i == 5 else ((i % 4, 2) if home else (2, i % 5))
+            starts.append(Game.objects.create(
+                home_team=h, away_team=a,
+                first_pitch=now - timedelta(days=30 - 2 * i),
+                home_pitcher=p if home else other,
+                away_pitcher=other if home else p,
+                status='final', home_score=scores[0], away_score=scores[1],
+                source='mlb_stats_api', external_id=f'ledger-{i}',
+            ))
+        ledger = StartLedger.for_pitchers({p.id, other.id})
+        cutoffs = [g.first_pitch for g in starts]
+        cutoffs += [c + timedelta(hours=1) for c in cutoffs] + [now]
+        for cutoff in cutoffs:
+            for pitcher in (p, other):
+                for n in (2, 3, 5):
+                    self.assertEqual(
+                        ledger.delta(pitcher.id, cutoff, n=n),
+                        recent_form_delta(pitcher, reference_date=cutoff, n=n),
+                        (pitcher.name, cutoff, n),
+                    )
+        with self.assertNumQueries(0):
+            recent_form_delta(p, reference_date=now, ledger=ledger)
+
 
 class FlagOffPreservesProductionTests(TestCase):
     """When USE_STARTER_RECENT_FORM=False the score must equal the original
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.shortcuts import render, get_object_or_404
 from django.utils import timezone
 
+from apps.core.services.compute_context import request_scoped
 from apps.mockbets.services.prefill import prefill_from_signals
 
 from .models import Game, Team
@@ -29,6 +30,7 @@ def _attach_prefill(signals_list, *, authenticated: bool):
     return signals_list
 
 
+@request_scoped
 def mlb_hub(request):
     now = timezone.now()
     # "Today" respects the viewer's timezone (UserTimezoneMiddleware activates it).
@@ -191,6 +191,8 @@ def _eligible_games_for_user(user, sport: str = 'mlb', tier_filter: str = 'all',
         g for g in upcoming
         if timezone.localtime(g.first_pitch).date() == today_local
     ]
+    from apps.core.services.current_recommendation import prefetch_current_recommendations
+    prefetch_current_recommendations('mlb', upcoming, user)
     for game in upcoming:
         rec = get_recommendation('mlb', game, user)
         if is_bulk_moneyline_eligible(
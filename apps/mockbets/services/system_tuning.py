@@ -383,7 +383,7 @@ def compute_stale_games_count(threshold_minutes: int = 30) -> int:
     """
     try:
         from datetime import timedelta
-        from apps.core.utils.multi_book import is_odds_stale
+        from apps.core.utils.multi_book import count_stale_games
         from django.utils import timezone as _tz
 
         now = _tz.now()
@@ -407,9 +407,7 @@ def compute_stale_games_count(threshold_minutes: int = 30) -> int:
             qs = model.objects.filter(
                 **{f'{start_field}__gt': now, f'{start_field}__lte': cutoff}
             )
-            for game in qs:
-                if is_odds_stale(game, threshold_minutes):
-                    count += 1
+            count += count_stale_games(qs, threshold_minutes)
         return count
     except Exception:
         return 0
@@ -7,6 +7,8 @@ from django.shortcuts import render, get_object_or_404
 from django.utils import timezone
 from django.views.decorators.http import require_POST
 
+from apps.core.services.compute_context import request_scoped
+
 from .models import MockBet
 from .services.analytics import (
     compute_kpis, compute_chart_data, compute_comparison,
@@ -319,6 +321,7 @@ def review_bet(request, bet_id):
 
 @login_required
 @require_POST
+@request_scoped
 def bulk_place_recommended(request):
     """Place mock bets on every recommended game without existing pending bet.
 
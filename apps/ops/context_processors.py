@@ -7,10 +7,9 @@ be invasive. A context processor is the standard Django escape hatch.
 Cost control:
   - Returns an empty dict for non-superusers, so the snapshot is never
     computed for the 99%+ of requests that won't show the dot.
-  - For superusers, calls build_snapshot() once per request. Each snapshot
-    is ~5–6 indexed lookups against bounded recent windows (24h / 7d) on
-    append-only tables — fast in practice. If profiling shows otherwise
-    we can add a short-TTL cache here without touching the template.
+  - For superusers, reads the shared cached_snapshot() — rebuilt at most
+    once per OPS_SNAPSHOT_CACHE_SECONDS, or after a cron run closes or a
+    provider circuit flips — rather than ~6 aggregate queries per page.
   - Wrapped in a broad try/except so a snapshot failure can NEVER take
     down the header. On error we silently fall back to "unknown" status,
     same as the dot would render before any data has been captured.
@@ -47,9 +46,9 @@ def ops_status(request):
         # Local import — context processors load at app startup; importing
         # apps.ops.services.command_center at module level can race with
         # Django's app registry on cold boot.
-        from apps.ops.services.command_center import build_snapshot
+        from apps.ops.services.command_center import cached_snapshot
 
-        snap = build_snapshot()
+        snap = cached_snapshot()
         color = snap.overall.health
         # Tooltip kept tight (3 lines, under 200 chars) so browsers don't
         # truncate. Title attributes word-wrap inconsistently across OSes,
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0002_providerhealth'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cronrunlog',
+            name='odds_credits_planned',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='cronrunlog',
+            name='odds_credits_used',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0003_cronrunlog_odds_credits'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='oddsapiusage',
+            name='timestamp',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
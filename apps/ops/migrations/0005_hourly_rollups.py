@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ops', '0004_oddsapiusage_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CronRunHourly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('command', models.CharField(max_length=120)),
+                ('runs', models.IntegerField(default=0)),
+                ('successes', models.IntegerField(default=0)),
+                ('failures', models.IntegerField(default=0)),
+                ('partials', models.IntegerField(default=0)),
+                ('duration_sum_seconds', models.FloatField(default=0)),
+            ],
+            options={
+                'ordering': ['-hour', 'command'],
+                'indexes': [models.Index(fields=['command', '-hour'], name='ops_cronrun_command_b02bd8_idx')],
+                'constraints': [models.UniqueConstraint(fields=('hour', 'command'), name='ops_cron_hourly_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OddsApiUsageHourly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hour', models.DateTimeField()),
+                ('sport', models.CharField(choices=[('cbb', 'CBB'), ('cfb', 'CFB'), ('mlb', 'MLB'), ('college_baseball', 'College Baseball'), ('golf', 'Golf'), ('unknown', 'Unknown')], max_length=20)),
+                ('calls', models.IntegerField(default=0)),
+                ('failures', models.IntegerField(default=0)),
+                ('latency_count', models.IntegerField(default=0)),
+                ('latency_sum_ms', models.BigIntegerField(default=0)),
+                ('latency_le_100', models.IntegerField(default=0)),
+                ('latency_le_250', models.IntegerField(default=0)),
+                ('latency_le_500', models.IntegerField(default=0)),
+                ('latency_le_1000', models.IntegerField(default=0)),
+                ('latency_le_2500', models.IntegerField(default=0)),
+                ('latency_le_5000', models.IntegerField(default=0)),
+                ('latency_over', models.IntegerField(default=0)),
+                ('last_call_at', models.DateTimeField(blank=True, null=True)),
+                ('last_status_code', models.IntegerField(blank=True, null=True)),
+                ('last_success', models.BooleanField(blank=True, null=True)),
+                ('last_failure_at', models.DateTimeField(blank=True, null=True)),
+                ('last_failure_status', models.IntegerField(blank=True, null=True)),
+                ('quota_captured_at', models.DateTimeField(blank=True, null=True)),
+                ('credits_used', models.IntegerField(blank=True, null=True)),
+                ('credits_remaining', models.IntegerField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-hour', 'sport'],
+                'indexes': [models.Index(fields=['-hour'], name='ops_oddsapi_hour_044d56_idx')],
+                'constraints': [models.UniqueConstraint(fields=('hour', 'sport'), name='ops_usage_hourly_unique')],
+            },
+        ),
+    ]
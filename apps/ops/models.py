@@ -11,6 +11,7 @@ import uuid
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class OddsApiUsage(models.Model):
@@ -32,7 +33,9 @@ class OddsApiUsage(models.Model):
         ('unknown', 'Unknown'),
     ]
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # default rather than auto_now_add so buffered rows keep the time of the
+    # call, not of the flush (apps/ops/services/api_logging.py).
+    timestamp = models.DateTimeField(default=timezone.now, db_index=True)
     sport = models.CharField(max_length=20, choices=SPORT_CHOICES, default='unknown')
     endpoint = models.CharField(max_length=512)
     status_code = models.IntegerField(null=True, blank=True)
@@ -93,6 +96,12 @@ class CronRunLog(models.Model):
     error_message = models.TextField(blank=True, default='')
     # Truncated stdout for at-a-glance debugging without leaving the dashboard.
     stdout_tail = models.TextField(blank=True, default='')
+    # Odds API credits: what the adaptive polling plan expected this run to
+    # spend vs. what the x-requests-used header moved by. Null for commands
+    # that don't pull odds, and `planned` is null when ODDS_ADAPTIVE_POLLING
+    # is off.
+    odds_credits_planned = models.IntegerField(null=True, blank=True)
+    odds_credits_used = models.IntegerField(null=True, blank=True)
 
     class Meta:
         ordering = ['-started_at']
@@ -188,3 +197,80 @@ class ProviderHealth(models.Model):
     def is_circuit_open(self) -> bool:
         from django.utils import timezone
         return bool(self.circuit_open_until and self.circuit_open_until > timezone.now())
+
+
+# Upper bounds (ms) of the latency histogram buckets on OddsApiUsageHourly.
+# Calls slower than the last bound land in `latency_over`. Percentiles read
+# from the histogram are reported as the bucket's upper bound.
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000)
+
+
+class OddsApiUsageHourly(models.Model):
+    """Hourly rollup of OddsApiUsage, one row per (hour, sport).
+
+    Updated incrementally whenever usage rows are written
+    (apps/ops/services/rollups.py) so the Command Center can answer
+    "calls / failures / latency / quota over 24h or 7d" from a bounded
+    number of rows, however long the raw table gets — and after
+    prune_ops_history has removed the raw rows. Counters are only ever
+    bumped with F() expressions, so concurrent writers can't lose
+    increments.
+    """
+    hour = models.DateTimeField()  # UTC, truncated to the hour
+    sport = models.CharField(max_length=20, choices=OddsApiUsage.SPORT_CHOICES)
+    calls = models.IntegerField(default=0)
+    failures = models.IntegerField(default=0)
+    latency_count = models.IntegerField(default=0)
+    latency_sum_ms = models.BigIntegerField(default=0)
+    latency_le_100 = models.IntegerField(default=0)
+    latency_le_250 = models.IntegerField(default=0)
+    latency_le_500 = models.IntegerField(default=0)
+    latency_le_1000 = models.IntegerField(default=0)
+    latency_le_2500 = models.IntegerField(default=0)
+    latency_le_5000 = models.IntegerField(default=0)
+    latency_over = models.IntegerField(default=0)
+    last_call_at = models.DateTimeField(null=True, blank=True)
+    last_status_code = models.IntegerField(null=True, blank=True)
+    last_success = models.BooleanField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_failure_status = models.IntegerField(null=True, blank=True)
+    # Most recent x-requests-used / -remaining seen in this bucket.
+    quota_captured_at = models.DateTimeField(null=True, blank=True)
+    credits_used = models.IntegerField(null=True, blank=True)
+    credits_remaining = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-hour', 'sport']
+        constraints = [
+            models.UniqueConstraint(fields=['hour', 'sport'], name='ops_usage_hourly_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['-hour']),
+        ]
+
+    def __str__(self):
+        return f'[{self.sport}] {self.hour:%Y-%m-%d %H}:00 calls={self.calls} fail={self.failures}'
+
+
+class CronRunHourly(models.Model):
+    """Hourly rollup of finished CronRunLog rows, one row per (hour, command),
+    bucketed by started_at. Bumped by cron_run_log when a run closes."""
+    hour = models.DateTimeField()  # UTC, truncated to the hour
+    command = models.CharField(max_length=120)
+    runs = models.IntegerField(default=0)
+    successes = models.IntegerField(default=0)
+    failures = models.IntegerField(default=0)
+    partials = models.IntegerField(default=0)
+    duration_sum_seconds = models.FloatField(default=0)
+
+    class Meta:
+        ordering = ['-hour', 'command']
+        constraints = [
+            models.UniqueConstraint(fields=['hour', 'command'], name='ops_cron_hourly_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['command', '-hour']),
+        ]
+
+    def __str__(self):
+        return f'{self.command} {self.hour:%Y-%m-%d %H}:00 runs={self.runs}'
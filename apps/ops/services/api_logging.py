@@ -10,9 +10,24 @@ Why a service module instead of a method on the model:
     the actual ingestion call. We swallow exceptions here and emit a warning.
   - Keeping detection logic (sport from path, success from status_code, etc.)
     out of model code keeps `models.py` describing data shape, not behavior.
+
+Buffered mode (ODDS_API_USAGE_BUFFERED): instead of one INSERT per attempt
+on the ingestion hot path, rows are queued in memory and written with one
+`bulk_create` when the queue reaches ODDS_API_USAGE_FLUSH_SIZE, when a
+provider run finishes (AbstractProvider.run calls `flush()`), and at
+process exit. A failed flush drops that batch and counts it (`stats()`)
+rather than retrying or blocking ingestion. Each row keeps the time of
+its call, and quota headers are captured exactly as in direct mode.
+
+Either way, saved rows are folded into the hourly OddsApiUsageHourly
+rollup (apps/ops/services/rollups.py) right after they're written.
 """
+import atexit
 import logging
 import re
+import threading
+
+from apps.ops.services.rollups import rollup_usage
 
 logger = logging.getLogger(__name__)
 
@@ -101,7 +116,7 @@ def record_call(*, url, status_code, success, response_time_ms,
         if len(endpoint) > 500:
             endpoint = endpoint[:500]
 
-        OddsApiUsage.objects.create(
+        row = OddsApiUsage(
             sport=extract_sport(url),
             endpoint=endpoint,
             status_code=status_code,
@@ -111,5 +126,85 @@ def record_call(*, url, status_code, success, response_time_ms,
             credits_used=credits_used,
             credits_remaining=credits_remaining,
         )
+        if _buffered():
+            _buffer.add(row)
+        else:
+            row.save()
+            rollup_usage([row])
     except Exception as exc:  # noqa: BLE001 — logging must never break callers
         logger.warning('Failed to write OddsApiUsage row: %s', exc)
+
+
+# --- Buffered sink -----------------------------------------------------------
+
+def _buffered() -> bool:
+    from django.conf import settings
+    return getattr(settings, 'ODDS_API_USAGE_BUFFERED', False)
+
+
+def _flush_size() -> int:
+    from django.conf import settings
+    return max(1, int(getattr(settings, 'ODDS_API_USAGE_FLUSH_SIZE', 50)))
+
+
+class _UsageBuffer:
+    """Process-wide queue of unsaved OddsApiUsage rows.
+
+    Bounded by the flush size: the add that fills it flushes it. The lock
+    only guards the list swap, so threads never wait on each other's
+    INSERT (refresh_data --parallel).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = []
+        self.flushed = 0
+        self.dropped = 0
+
+    def add(self, row):
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= _flush_size()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            rows, self._rows = self._rows, []
+        if not rows:
+            return 0
+        try:
+            from apps.ops.models import OddsApiUsage
+            OddsApiUsage.objects.bulk_create(rows)
+        except Exception as exc:  # noqa: BLE001 — drop, never block ingestion
+            with self._lock:
+                self.dropped += len(rows)
+            logger.warning(
+                'Dropped %d buffered OddsApiUsage rows (%d dropped total): %s',
+                len(rows), self.dropped, exc,
+            )
+            return 0
+        with self._lock:
+            self.flushed += len(rows)
+        rollup_usage(rows)
+        return len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'pending': len(self._rows), 'flushed': self.flushed, 'dropped': self.dropped}
+
+
+_buffer = _UsageBuffer()
+
+
+def flush() -> int:
+    """Write any buffered rows now. Returns rows written. Never raises."""
+    return _buffer.flush()
+
+
+def stats() -> dict:
+    """{'pending', 'flushed', 'dropped'} for this process's buffer."""
+    return _buffer.stats()
+
+
+atexit.register(flush)
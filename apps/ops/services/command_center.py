@@ -8,17 +8,34 @@ Design choices:
   - We never raise from this layer; an empty DB returns a snapshot with
     zero counts and `health='unknown'` so the dashboard renders a
     "No run history captured yet" state instead of a crash.
+  - With OPS_ROLLUP_READS on, the 24h / 7d API and cron numbers come
+    from the hourly rollup tables (services/rollups.py) instead: at most
+    ~170 rows per sport or command, however much raw history exists. Only
+    the last-hour API counts, the last run per command and the recent
+    lists still read raw rows, all through bounded indexed queries.
+  - Page renders go through cached_snapshot(): the header dot (every
+    superuser page) and the dashboard share one snapshot in Django's
+    cache for OPS_SNAPSHOT_CACHE_SECONDS. It is dropped when a cron run
+    closes or a provider circuit opens / closes, and `?fresh=1` on the
+    dashboard rebuilds it.
   - Health categories are explicitly tri-state — green / yellow / red /
     unknown — because the dashboard CSS keys colors off them.
 """
+import logging
 from collections import Counter
 from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import List, Optional
 
-from django.db.models import Avg, Count, Max, Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Max, Q, Sum
 from django.utils import timezone
 
+from apps.ops.services import rollups
+
+logger = logging.getLogger(__name__)
+
 
 # --- Health classification thresholds ----------------------------------------
 # Tuned to be conservative: a single 4xx in the last hour drops API to red,
@@ -55,6 +72,9 @@ class ApiUsageStats:
     last_status: Optional[int] = None
     last_success: Optional[bool] = None
     avg_latency_ms_24h: Optional[int] = None
+    # Histogram bucket bounds — only available from the rollups.
+    p50_latency_ms_24h: Optional[int] = None
+    p95_latency_ms_24h: Optional[int] = None
     by_sport_24h: dict = field(default_factory=dict)
     last_failure_status: Optional[int] = None
     last_failure_at: Optional['timezone.datetime'] = None
@@ -120,9 +140,56 @@ def build_snapshot() -> CommandCenterSnapshot:
     )
 
 
+# --- Shared snapshot cache -----------------------------------------------------
+
+SNAPSHOT_CACHE_KEY = 'ops:command_center_snapshot'
+
+
+def _snapshot_cache_seconds() -> int:
+    return int(getattr(settings, 'OPS_SNAPSHOT_CACHE_SECONDS', 30))
+
+
+def cached_snapshot(*, refresh=False) -> CommandCenterSnapshot:
+    """build_snapshot(), memoized in the default cache for
+    OPS_SNAPSHOT_CACHE_SECONDS (0 disables). `refresh=True` rebuilds and
+    re-caches. A cache outage degrades to building every time."""
+    ttl = _snapshot_cache_seconds()
+    if ttl <= 0:
+        return build_snapshot()
+    if not refresh:
+        try:
+            snap = cache.get(SNAPSHOT_CACHE_KEY)
+        except Exception as exc:  # noqa: BLE001 — the cache is an optimization
+            logger.warning('ops snapshot cache read failed: %s', exc)
+            snap = None
+        if snap is not None:
+            return snap
+    snap = build_snapshot()
+    try:
+        cache.set(SNAPSHOT_CACHE_KEY, snap, ttl)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning('ops snapshot cache write failed: %s', exc)
+    return snap
+
+
+def invalidate_snapshot():
+    """Drop the cached snapshot so the next page render rebuilds it. Never
+    raises — called from cron and circuit-breaker paths."""
+    try:
+        cache.delete(SNAPSHOT_CACHE_KEY)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning('ops snapshot cache invalidation failed: %s', exc)
+
+
+def rollup_reads_enabled() -> bool:
+    return getattr(settings, 'OPS_ROLLUP_READS', False)
+
+
 # --- API metrics -------------------------------------------------------------
 
 def _api_usage_stats() -> ApiUsageStats:
+    if rollup_reads_enabled():
+        return _api_usage_stats_from_rollups()
     from apps.ops.models import OddsApiUsage
 
     now = timezone.now()
@@ -161,6 +228,56 @@ def _api_usage_stats() -> ApiUsageStats:
     return stats
 
 
+def _api_usage_stats_from_rollups() -> ApiUsageStats:
+    from apps.ops.models import OddsApiUsage, OddsApiUsageHourly
+
+    now = timezone.now()
+    qs_1h = OddsApiUsage.objects.filter(timestamp__gte=now - timedelta(hours=1))
+    hours_24h = OddsApiUsageHourly.objects.filter(hour__gte=rollups.window_start(now, 24))
+
+    stats = ApiUsageStats()
+    stats.last_1h = qs_1h.count()
+    stats.last_1h_failures = qs_1h.filter(success=False).count()
+    stats.last_7d = OddsApiUsageHourly.objects.filter(
+        hour__gte=rollups.window_start(now, 24 * 7),
+    ).aggregate(n=Sum('calls'))['n'] or 0
+
+    histogram = rollups.latency_columns()
+    totals = hours_24h.aggregate(
+        calls=Sum('calls'), failures=Sum('failures'),
+        latency_sum=Sum('latency_sum_ms'), latency_count=Sum('latency_count'),
+        **{col: Sum(col) for col in histogram},
+    )
+    stats.last_24h = totals['calls'] or 0
+    stats.last_24h_failures = totals['failures'] or 0
+    if totals['latency_count']:
+        stats.avg_latency_ms_24h = int(round(totals['latency_sum'] / totals['latency_count']))
+    stats.p50_latency_ms_24h = rollups.latency_percentile(totals, 50)
+    stats.p95_latency_ms_24h = rollups.latency_percentile(totals, 95)
+
+    sport_rows = hours_24h.values('sport').annotate(n=Sum('calls'))
+    stats.by_sport_24h = {r['sport']: r['n'] for r in sport_rows if r['n']}
+
+    last = (
+        OddsApiUsageHourly.objects.filter(last_call_at__isnull=False)
+        .order_by('-hour', '-last_call_at').first()
+    )
+    if last:
+        stats.last_call_at = last.last_call_at
+        stats.last_status = last.last_status_code
+        stats.last_success = last.last_success
+
+    last_fail = (
+        OddsApiUsageHourly.objects.filter(last_failure_at__isnull=False)
+        .order_by('-hour', '-last_failure_at').first()
+    )
+    if last_fail:
+        stats.last_failure_at = last_fail.last_failure_at
+        stats.last_failure_status = last_fail.last_failure_status
+
+    return stats
+
+
 def _classify_api_health(stats: ApiUsageStats) -> HealthCard:
     if stats.last_24h == 0:
         return HealthCard(
@@ -202,14 +319,24 @@ def _quota_stats() -> QuotaStats:
     storm produces no quota visibility. That's accurate to reality — if
     health is bad we'd rather say `unknown` than guess.
     """
-    from apps.ops.models import OddsApiUsage
-
-    row = (
-        OddsApiUsage.objects
-        .filter(credits_used__isnull=False, credits_remaining__isnull=False)
-        .order_by('-timestamp')
-        .first()
-    )
+    from apps.ops.models import OddsApiUsage, OddsApiUsageHourly
+
+    if rollup_reads_enabled():
+        row = (
+            OddsApiUsageHourly.objects
+            .filter(quota_captured_at__isnull=False)
+            .order_by('-hour', '-quota_captured_at')
+            .first()
+        )
+        captured_at = row.quota_captured_at if row else None
+    else:
+        row = (
+            OddsApiUsage.objects
+            .filter(credits_used__isnull=False, credits_remaining__isnull=False)
+            .order_by('-timestamp')
+            .first()
+        )
+        captured_at = row.timestamp if row else None
     if not row:
         return QuotaStats(health='unknown')
 
@@ -232,7 +359,7 @@ def _quota_stats() -> QuotaStats:
         remaining=remaining,
         pct_used=pct,
         health=health,
-        captured_at=row.timestamp,
+        captured_at=captured_at,
     )
 
 
@@ -244,20 +371,34 @@ TRACKED_COMMANDS = ['refresh_data', 'refresh_scores_and_settle']
 
 
 def _cron_command_stats() -> List[CronCommandStats]:
-    from apps.ops.models import CronRunLog
+    from apps.ops.models import CronRunHourly, CronRunLog
 
     now = timezone.now()
     cutoff_7d = now - timedelta(days=7)
     stuck_cutoff = now - timedelta(minutes=STUCK_RUNNING_MINUTES)
 
+    counts_7d = {}
+    if rollup_reads_enabled():
+        counts_7d = {
+            r['command']: (r['ok'] or 0, (r['failed'] or 0) + (r['partial'] or 0))
+            for r in CronRunHourly.objects.filter(
+                command__in=TRACKED_COMMANDS, hour__gte=rollups.window_start(now, 24 * 7),
+            ).values('command').annotate(
+                ok=Sum('successes'), failed=Sum('failures'), partial=Sum('partials'),
+            )
+        }
+
     out = []
     for cmd in TRACKED_COMMANDS:
         cmd_qs = CronRunLog.objects.filter(command=cmd)
         last = cmd_qs.order_by('-started_at').first()
 
-        recent = cmd_qs.filter(started_at__gte=cutoff_7d)
-        success_n = recent.filter(status='success').count()
-        failure_n = recent.filter(status__in=['failure', 'partial']).count()
+        if rollup_reads_enabled():
+            success_n, failure_n = counts_7d.get(cmd, (0, 0))
+        else:
+            recent = cmd_qs.filter(started_at__gte=cutoff_7d)
+            success_n = recent.filter(status='success').count()
+            failure_n = recent.filter(status__in=['failure', 'partial']).count()
 
         is_running = False
         is_stuck = False
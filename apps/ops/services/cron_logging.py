@@ -16,6 +16,9 @@ Usage:
         ... # do the work
         log.summary = 'refreshed 4 sports'  # optional
         # log.mark_partial('odds failed for golf')  # optional partial path
+
+Closed rows are also counted into the hourly CronRunHourly rollup, and
+closing a row drops the cached Command Center snapshot.
 """
 import logging
 import time
@@ -24,6 +27,9 @@ from contextlib import contextmanager
 
 from django.utils import timezone
 
+from apps.ops.services.command_center import invalidate_snapshot
+from apps.ops.services.rollups import rollup_cron_run
+
 logger = logging.getLogger(__name__)
 
 STDOUT_TAIL_LINES = 500  # last N lines of captured stdout to persist
@@ -51,6 +57,8 @@ class _CronLogHandle:
         self._row = log_row
         self.summary = ''
         self.stdout_tail = ''
+        self.odds_credits_planned = None
+        self.odds_credits_used = None
         self._forced_status = None
         self._forced_error = ''
 
@@ -106,7 +114,11 @@ def cron_run_log(command, trigger='cron', triggered_by_user=None):
         row.error_message = traceback.format_exc()[:8000]
         row.summary = handle.summary or ''
         row.stdout_tail = _tail(handle.stdout_tail)
+        row.odds_credits_planned = handle.odds_credits_planned
+        row.odds_credits_used = handle.odds_credits_used
         row.save()
+        rollup_cron_run(row)
+        invalidate_snapshot()
         raise
     else:
         duration = time.time() - start
@@ -116,7 +128,11 @@ def cron_run_log(command, trigger='cron', triggered_by_user=None):
         row.summary = handle.summary or ''
         row.error_message = handle._forced_error or ''
         row.stdout_tail = _tail(handle.stdout_tail)
+        row.odds_credits_planned = handle.odds_credits_planned
+        row.odds_credits_used = handle.odds_credits_used
         row.save()
+        rollup_cron_run(row)
+        invalidate_snapshot()
 
 
 def _tail(text):
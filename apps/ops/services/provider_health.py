@@ -29,7 +29,32 @@ Public surface:
         "Reset Circuit Breaker" button on the Ops dashboard.
 
     get(provider) -> ProviderHealth
-        Convenience get-or-create.
+        Convenience get-or-create. Always reads the database.
+
+    clear_cache()
+        Drop the process-local breaker cache (tests, manual ops actions).
+
+Caching and write coalescing:
+  - is_circuit_open / state_summary read a process-local copy of the row,
+    reloaded after PROVIDER_HEALTH_CACHE_SECONDS. Any save() of a
+    ProviderHealth row in this process drops its entry, so record_failure,
+    open_circuit, reset_circuit and admin edits are seen immediately here;
+    other processes see them within one TTL.
+  - record_success writes only when it changes state (failures to reset,
+    a circuit to close, a different status code) or when last_success_at
+    is older than PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS. Whether state
+    changes is decided against the database, not the cache: when the
+    cached row looks clean, a conditional UPDATE that only matches a row
+    with failures / an open circuit / a different status code stands in
+    for the skip, so a failure recorded by another process is still
+    cleared. A healthy provider's run of successes costs one no-op
+    UPDATE per call and one real write per interval, instead of a
+    get_or_create + full-row save per call.
+  - record_failure always reads the row fresh and saves immediately, so
+    failure counts and circuit opens are shared across gunicorn workers
+    and cron processes without waiting on anyone's cache.
+  - Opening or closing a circuit also drops the cached Command Center
+    snapshot (command_center.invalidate_snapshot).
 
 Design notes:
   - Every mutating call is wrapped in a broad try/except + log so a DB
@@ -42,10 +67,13 @@ Design notes:
 from __future__ import annotations
 
 import logging
+import time
 from datetime import timedelta
 from typing import Optional
 
 from django.conf import settings
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -69,6 +97,49 @@ def _cooldown_minutes() -> int:
     return int(getattr(settings, 'ODDS_PROVIDER_CIRCUIT_COOLDOWN_MINUTES', 60))
 
 
+def _cache_seconds() -> float:
+    return float(getattr(settings, 'PROVIDER_HEALTH_CACHE_SECONDS', 10))
+
+
+def _success_write_seconds() -> float:
+    return float(getattr(settings, 'PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS', 60))
+
+
+# provider -> (ProviderHealth row, time.monotonic() when loaded). Plain dict
+# reads/writes are atomic under the GIL, which is all refresh_data's worker
+# threads need: the worst race is two threads both reloading one row.
+_cache: dict = {}
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _invalidate(sender, instance, **kwargs):
+    _cache.pop(instance.provider, None)
+
+
+post_save.connect(_invalidate, sender='ops.ProviderHealth',
+                  dispatch_uid='provider_health_cache_save')
+post_delete.connect(_invalidate, sender='ops.ProviderHealth',
+                    dispatch_uid='provider_health_cache_delete')
+
+
+def _circuit_changed():
+    from apps.ops.services.command_center import invalidate_snapshot
+    invalidate_snapshot()
+
+
+def _cached(provider: str):
+    """The row for `provider`, from the process-local cache when fresh."""
+    entry = _cache.get(provider)
+    if entry is not None and time.monotonic() - entry[1] < _cache_seconds():
+        return entry[0]
+    row = get(provider)
+    _cache[provider] = (row, time.monotonic())
+    return row
+
+
 def get(provider: str):
     """Return the ProviderHealth row for `provider`, creating it on first use."""
     from apps.ops.models import ProviderHealth
@@ -78,9 +149,9 @@ def get(provider: str):
 
 def is_circuit_open(provider: str) -> bool:
     """True if the breaker is currently blocking calls. Reads-only — never
-    mutates state. Cheap; safe to call before every provider request."""
+    mutates state. Cheap (cached); safe to call before every provider request."""
     try:
-        return get(provider).is_circuit_open
+        return _cached(provider).is_circuit_open
     except Exception as exc:  # noqa: BLE001 — never break the caller on a read
         logger.warning('is_circuit_open(%s) failed: %s', provider, exc)
         return False
@@ -88,17 +159,64 @@ def is_circuit_open(provider: str) -> bool:
 
 def record_success(provider: str, status_code: int = 200):
     """Mark a successful call. Closes any open circuit and zeros the failure
-    counter — a single success is sufficient evidence to recover."""
+    counter — a single success is sufficient evidence to recover.
+
+    Coalesced: a success that changes nothing is written at most once per
+    PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS. Returns the (cached) row."""
     from apps.ops.models import ProviderHealth
     try:
-        row, _ = ProviderHealth.objects.get_or_create(provider=provider)
-        row.last_success_at = timezone.now()
-        row.last_status_code = status_code
-        row.last_error_message = ''
-        row.consecutive_failures = 0
-        row.circuit_open_until = None
-        row.last_open_reason = ''
-        row.save()
+        row = _cached(provider)
+        now = timezone.now()
+        changes_state = bool(
+            row.consecutive_failures
+            or row.circuit_open_until
+            or row.last_open_reason
+            or row.last_error_message
+            or row.last_status_code != status_code
+        )
+        due = (
+            row.last_success_at is None
+            or (now - row.last_success_at).total_seconds() >= _success_write_seconds()
+        )
+        fields = {
+            'last_success_at': now,
+            'last_status_code': status_code,
+            'last_error_message': '',
+            'consecutive_failures': 0,
+            'circuit_open_until': None,
+            'last_open_reason': '',
+        }
+        if not (changes_state or due):
+            # The cached row looks clean, but it can be a TTL behind
+            # failures or an open circuit written by another process.
+            # Decide against the database: this UPDATE matches (and
+            # writes) nothing unless the stored row has state to clear.
+            dirty = (
+                Q(consecutive_failures__gt=0)
+                | Q(circuit_open_until__isnull=False)
+                | ~Q(last_open_reason='')
+                | ~Q(last_error_message='')
+                | ~Q(last_status_code=status_code)
+                | Q(last_status_code__isnull=True)
+            )
+            if not ProviderHealth.objects.filter(pk=row.pk).filter(dirty).update(
+                updated_at=now, **fields,
+            ):
+                return row
+            # Another process had recorded trouble; the circuit may have
+            # been open, so drop both caches.
+            _cache.pop(provider, None)
+            _circuit_changed()
+            return _cached(provider)
+        closes = bool(row.circuit_open_until)
+        # Targeted UPDATE rather than save(): nothing to re-read, and the
+        # cached instance stays valid as a mirror of the row.
+        ProviderHealth.objects.filter(pk=row.pk).update(updated_at=now, **fields)
+        for name, value in fields.items():
+            setattr(row, name, value)
+        row.updated_at = now
+        if closes:
+            _circuit_changed()
         return row
     except Exception as exc:  # noqa: BLE001 — never break the caller
         logger.warning('record_success(%s) failed: %s', provider, exc)
@@ -110,6 +228,9 @@ def record_failure(provider: str, *, status_code: Optional[int] = None,
     """Mark a failed call. Increments consecutive_failures; opens the breaker
     on auto-open status codes or the consecutive-failure threshold.
 
+    Never coalesced or cached: the row is read fresh and saved at once so
+    every process sees the count and any circuit open.
+
     Returns the updated row (or None if the write itself failed)."""
     from apps.ops.models import ProviderHealth
     try:
@@ -130,6 +251,8 @@ def record_failure(provider: str, *, status_code: Optional[int] = None,
                 provider, reason, cooldown, row.consecutive_failures,
             )
         row.save()
+        if reason:
+            _circuit_changed()
         return row
     except Exception as exc:  # noqa: BLE001 — never break the caller
         logger.warning('record_failure(%s) failed: %s', provider, exc)
@@ -144,6 +267,7 @@ def open_circuit(provider: str, reason: str = 'manual'):
     row.circuit_open_until = timezone.now() + timedelta(minutes=_cooldown_minutes())
     row.last_open_reason = reason
     row.save()
+    _circuit_changed()
     logger.warning('Circuit force-opened for %s (reason=%s)', provider, reason)
     return row
 
@@ -158,6 +282,7 @@ def reset_circuit(provider: str):
     row.consecutive_failures = 0
     row.last_open_reason = ''
     row.save()
+    _circuit_changed()
     logger.info('Circuit manually reset for %s', provider)
     return row
 
@@ -178,8 +303,9 @@ def state_summary(provider: str) -> dict:
     """Cheap read-only snapshot of provider state for the Ops dashboard.
 
     Returns a dict the template can consume directly without poking at
-    timezone-naive vs aware datetimes or remembering field names."""
-    row = get(provider)
+    timezone-naive vs aware datetimes or remembering field names. Served
+    from the breaker cache."""
+    row = _cached(provider)
     return {
         'provider': row.provider,
         'state': row.state,
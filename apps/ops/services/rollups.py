@@ -0,0 +1,204 @@
+"""Hourly rollups of ops telemetry — OddsApiUsageHourly / CronRunHourly.
+
+The raw OddsApiUsage and CronRunLog tables are append-only and grow with
+every API attempt and cron run. The Command Center only ever needs
+per-hour aggregates of them, so those aggregates are maintained as the
+raw rows are written:
+
+  - rollup_usage(rows)     api_logging, after a direct save or a buffered
+                           flush — one UPDATE set per (hour, sport) touched
+  - rollup_cron_run(row)   cron_run_log, when a run closes
+
+Counters are bumped with F() expressions and the "last seen" fields are
+only overwritten by newer values, so concurrent writers and out-of-order
+flushes converge on the same row. Like the telemetry itself, rollups
+never raise: a failed rollup is logged and `rebuild_ops_rollups`
+recomputes it from raw history.
+
+build_snapshot reads these tables when OPS_ROLLUP_READS is on, which
+keeps its cost constant however long raw history gets and lets
+`prune_ops_history` delete old raw rows without losing the 7-day view.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db.models import F, Q
+
+logger = logging.getLogger(__name__)
+
+
+def hour_of(dt):
+    """Truncate a datetime to the start of its hour."""
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def latency_bucket(ms):
+    """Histogram column name for a response time in ms."""
+    from apps.ops.models import LATENCY_BUCKETS_MS
+
+    for bound in LATENCY_BUCKETS_MS:
+        if ms <= bound:
+            return f'latency_le_{bound}'
+    return 'latency_over'
+
+
+def latency_percentile(row_counts, pct):
+    """Approximate percentile (ms) from summed histogram counts.
+
+    `row_counts` maps bucket column → count. Returns the upper bound of the
+    bucket holding the percentile, the last bound for the overflow bucket,
+    or None with no samples.
+    """
+    from apps.ops.models import LATENCY_BUCKETS_MS
+
+    columns = [(f'latency_le_{b}', b) for b in LATENCY_BUCKETS_MS]
+    columns.append(('latency_over', LATENCY_BUCKETS_MS[-1]))
+    total = sum(row_counts.get(col) or 0 for col, _ in columns)
+    if not total:
+        return None
+    target = total * pct / 100.0
+    seen = 0
+    for col, bound in columns:
+        seen += row_counts.get(col) or 0
+        if seen >= target:
+            return bound
+    return LATENCY_BUCKETS_MS[-1]
+
+
+def latency_columns():
+    from apps.ops.models import LATENCY_BUCKETS_MS
+
+    return [f'latency_le_{b}' for b in LATENCY_BUCKETS_MS] + ['latency_over']
+
+
+def rollup_usage(rows):
+    """Fold saved OddsApiUsage rows into OddsApiUsageHourly. Never raises."""
+    if not rows:
+        return
+    try:
+        _rollup_usage(rows)
+    except Exception as exc:  # noqa: BLE001 — telemetry must never break callers
+        logger.warning('Failed to roll up %d OddsApiUsage rows: %s', len(rows), exc)
+
+
+def _rollup_usage(rows):
+    from apps.ops.models import OddsApiUsageHourly
+
+    groups = defaultdict(list)
+    for row in rows:
+        groups[(hour_of(row.timestamp), row.sport)].append(row)
+
+    OddsApiUsageHourly.objects.bulk_create(
+        [OddsApiUsageHourly(hour=hour, sport=sport) for hour, sport in groups],
+        ignore_conflicts=True,
+    )
+    for (hour, sport), group in groups.items():
+        bucket = OddsApiUsageHourly.objects.filter(hour=hour, sport=sport)
+
+        increments = defaultdict(int)
+        for row in group:
+            increments['calls'] += 1
+            if not row.success:
+                increments['failures'] += 1
+            if row.response_time_ms is not None:
+                increments['latency_count'] += 1
+                increments['latency_sum_ms'] += row.response_time_ms
+                increments[latency_bucket(row.response_time_ms)] += 1
+        bucket.update(**{col: F(col) + n for col, n in increments.items()})
+
+        last = max(group, key=lambda r: r.timestamp)
+        bucket.filter(Q(last_call_at__isnull=True) | Q(last_call_at__lte=last.timestamp)).update(
+            last_call_at=last.timestamp,
+            last_status_code=last.status_code,
+            last_success=last.success,
+        )
+        failed = [r for r in group if not r.success]
+        if failed:
+            last_fail = max(failed, key=lambda r: r.timestamp)
+            bucket.filter(
+                Q(last_failure_at__isnull=True) | Q(last_failure_at__lte=last_fail.timestamp)
+            ).update(
+                last_failure_at=last_fail.timestamp,
+                last_failure_status=last_fail.status_code,
+            )
+        metered = [
+            r for r in group
+            if r.credits_used is not None and r.credits_remaining is not None
+        ]
+        if metered:
+            latest = max(metered, key=lambda r: r.timestamp)
+            bucket.filter(
+                Q(quota_captured_at__isnull=True) | Q(quota_captured_at__lte=latest.timestamp)
+            ).update(
+                quota_captured_at=latest.timestamp,
+                credits_used=latest.credits_used,
+                credits_remaining=latest.credits_remaining,
+            )
+
+
+def rollup_cron_run(row):
+    """Fold one closed CronRunLog row into CronRunHourly. Never raises."""
+    if row.status == 'running':
+        return
+    try:
+        from apps.ops.models import CronRunHourly
+
+        hour = hour_of(row.started_at)
+        CronRunHourly.objects.bulk_create(
+            [CronRunHourly(hour=hour, command=row.command)], ignore_conflicts=True,
+        )
+        increments = {'runs': F('runs') + 1}
+        status_column = {'success': 'successes', 'failure': 'failures', 'partial': 'partials'}
+        if row.status in status_column:
+            col = status_column[row.status]
+            increments[col] = F(col) + 1
+        if row.duration_seconds is not None:
+            increments['duration_sum_seconds'] = F('duration_sum_seconds') + row.duration_seconds
+        CronRunHourly.objects.filter(hour=hour, command=row.command).update(**increments)
+    except Exception as exc:  # noqa: BLE001 — telemetry must never break callers
+        logger.warning('Failed to roll up CronRunLog %s: %s', row.pk, exc)
+
+
+def rebuild(since=None):
+    """Recompute rollups from raw rows at or after `since` (default: all raw
+    history). Rollup hours older than the oldest surviving raw row — i.e.
+    already pruned — are left alone. Returns (usage_rows, cron_rows) read.
+    """
+    from apps.ops.models import CronRunHourly, CronRunLog, OddsApiUsage, OddsApiUsageHourly
+
+    usage_qs = OddsApiUsage.objects.all()
+    cron_qs = CronRunLog.objects.exclude(status='running')
+    if since is not None:
+        usage_qs = usage_qs.filter(timestamp__gte=hour_of(since))
+        cron_qs = cron_qs.filter(started_at__gte=hour_of(since))
+
+    usage_start = usage_qs.order_by('timestamp').values_list('timestamp', flat=True).first()
+    usage_n = 0
+    if usage_start is not None:
+        OddsApiUsageHourly.objects.filter(hour__gte=hour_of(usage_start)).delete()
+        chunk = []
+        for row in usage_qs.order_by('timestamp').iterator(chunk_size=2000):
+            chunk.append(row)
+            if len(chunk) >= 2000:
+                _rollup_usage(chunk)
+                usage_n += len(chunk)
+                chunk = []
+        if chunk:
+            _rollup_usage(chunk)
+            usage_n += len(chunk)
+
+    cron_start = cron_qs.order_by('started_at').values_list('started_at', flat=True).first()
+    cron_n = 0
+    if cron_start is not None:
+        CronRunHourly.objects.filter(hour__gte=hour_of(cron_start)).delete()
+        for row in cron_qs.order_by('started_at').iterator(chunk_size=2000):
+            rollup_cron_run(row)
+            cron_n += 1
+    return usage_n, cron_n
+
+
+def window_start(now, hours):
+    """First rollup hour inside a trailing `hours` window. Whole buckets
+    are counted, so a window can include up to an hour of extra history."""
+    return hour_of(now - timedelta(hours=hours))
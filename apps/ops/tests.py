@@ -2,11 +2,13 @@
 
 Coverage:
   - record_call() writes rows for the-odds-api URLs and ignores others
+  - Hourly rollups, rollup-backed snapshot reads, prune_ops_history
   - Sport extraction from path
   - cron_run_log() context manager: success, failure, partial, exception
   - is_command_running() guard
   - build_snapshot(): empty DB, healthy DB, failure DB
   - Dashboard view: anon redirect, non-superuser 302, superuser 200, no-data render
+  - Shared snapshot cache: hits, invalidation, ?fresh=1 bypass
   - Manual trigger views: auth gating + anti-overlap
   - Test Odds API trigger: missing key error path
 
@@ -15,9 +17,11 @@ subprocess.Popen) — we only verify the auth + overlap behavior. The
 subprocess shape is exercised in production deploys.
 """
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch, MagicMock
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
@@ -113,6 +117,198 @@ class ApiLoggingTests(TestCase):
         self.assertIsNone(row.credits_used)
 
 
+class BufferedUsageTelemetryTests(TestCase):
+    """ODDS_API_USAGE_BUFFERED: rows queue in memory and go out in one
+    bulk_create per provider run / size threshold; a failed flush drops and
+    counts instead of raising."""
+
+    URL = 'https://api.the-odds-api.com/v4/sports/baseball_mlb/odds/'
+
+    def setUp(self):
+        from apps.ops.services import api_logging
+        self.api_logging = api_logging
+        buffer_patch = patch.object(api_logging, '_buffer', api_logging._UsageBuffer())
+        buffer_patch.start()
+        self.addCleanup(buffer_patch.stop)
+        flags = self.settings(ODDS_API_USAGE_BUFFERED=True, ODDS_API_USAGE_FLUSH_SIZE=50)
+        flags.enable()
+        self.addCleanup(flags.disable)
+
+    def _call(self, used=42, status_code=200):
+        record_call(
+            url=self.URL, status_code=status_code, success=status_code == 200,
+            response_time_ms=100, error_message='',
+            headers={'x-requests-used': str(used), 'x-requests-remaining': str(1000 - used)},
+        )
+
+    def test_rows_wait_for_flush_and_keep_call_time(self):
+        with self.assertNumQueries(0):
+            self._call(used=10)
+            self._call(used=13)
+        self.assertEqual(OddsApiUsage.objects.count(), 0)
+        before_flush = timezone.now()
+        # One INSERT for the batch + the hourly rollup (create-if-missing,
+        # counters, last call, quota) for its single (hour, sport) bucket.
+        with self.assertNumQueries(5):
+            self.assertEqual(self.api_logging.flush(), 2)
+        rows = list(OddsApiUsage.objects.order_by('timestamp'))
+        self.assertEqual([r.credits_used for r in rows], [10, 13])
+        self.assertTrue(all(r.timestamp <= before_flush for r in rows))
+        snap = build_snapshot()
+        self.assertEqual((snap.quota.used, snap.quota.remaining), (13, 987))
+
+    def test_size_threshold_flushes(self):
+        with self.settings(ODDS_API_USAGE_FLUSH_SIZE=2):
+            self._call()
+            self.assertEqual(OddsApiUsage.objects.count(), 0)
+            self._call()
+        self.assertEqual(OddsApiUsage.objects.count(), 2)
+        self.assertEqual(self.api_logging.stats(), {'pending': 0, 'flushed': 2, 'dropped': 0})
+
+    def test_failed_flush_drops_and_counts(self):
+        self._call()
+        self._call(status_code=500)
+        with patch('apps.ops.models.OddsApiUsage.objects.bulk_create',
+                   side_effect=RuntimeError('db_down')):
+            self.assertEqual(self.api_logging.flush(), 0)
+        self.assertEqual(self.api_logging.stats(), {'pending': 0, 'flushed': 0, 'dropped': 2})
+        self.assertEqual(OddsApiUsage.objects.count(), 0)
+
+    def test_provider_run_flushes(self):
+        from apps.datahub.providers.mlb.odds_provider import MLBOddsProvider
+        provider = MLBOddsProvider.__new__(MLBOddsProvider)
+
+        def _fetch():
+            self._call()
+            return []
+        with patch.object(MLBOddsProvider, 'fetch', side_effect=_fetch):
+            provider.run()
+        self.assertEqual(OddsApiUsage.objects.count(), 1)
+
+
+class OpsRollupTests(TestCase):
+    """OddsApiUsageHourly / CronRunHourly are kept current as telemetry is
+    written; with OPS_ROLLUP_READS the Command Center reads them and
+    survives prune_ops_history deleting raw rows."""
+
+    URL = 'https://api.the-odds-api.com/v4/sports/baseball_mlb/odds/'
+
+    def _call(self, ms=120, status_code=200, used=10):
+        record_call(
+            url=self.URL, status_code=status_code, success=status_code == 200,
+            response_time_ms=ms, error_message='' if status_code == 200 else 'boom',
+            headers={'x-requests-used': str(used), 'x-requests-remaining': str(1000 - used)},
+        )
+
+    def _old_row(self, days, **kwargs):
+        from apps.ops.services.rollups import rollup_usage
+        row = OddsApiUsage(
+            sport='mlb', endpoint='/v4/sports/baseball_mlb/odds/', status_code=200,
+            success=True, response_time_ms=300,
+            timestamp=timezone.now() - timedelta(days=days), **kwargs,
+        )
+        row.save()
+        rollup_usage([row])
+        return row
+
+    def test_direct_calls_roll_up_per_hour_and_sport(self):
+        from apps.ops.models import OddsApiUsageHourly
+        self._call(ms=80, used=10)
+        self._call(ms=700, used=13)
+        self._call(ms=9000, status_code=500)
+        bucket = OddsApiUsageHourly.objects.get()
+        self.assertEqual((bucket.sport, bucket.calls, bucket.failures), ('mlb', 3, 1))
+        self.assertEqual(bucket.latency_sum_ms, 9780)
+        self.assertEqual((bucket.latency_le_100, bucket.latency_le_1000, bucket.latency_over), (1, 1, 1))
+        self.assertEqual((bucket.last_status_code, bucket.last_success), (500, False))
+        self.assertEqual(bucket.last_failure_status, 500)
+        self.assertEqual((bucket.credits_used, bucket.credits_remaining), (10, 990))
+
+    def test_buffered_flush_rolls_up_like_direct_writes(self):
+        from apps.ops.models import OddsApiUsageHourly
+        from apps.ops.services import api_logging
+        with patch.object(api_logging, '_buffer', api_logging._UsageBuffer()), \
+                self.settings(ODDS_API_USAGE_BUFFERED=True):
+            self._call(used=10)
+            self._call(used=13)
+            self.assertFalse(OddsApiUsageHourly.objects.exists())
+            api_logging.flush()
+        bucket = OddsApiUsageHourly.objects.get()
+        self.assertEqual((bucket.calls, bucket.failures), (2, 0))
+        self.assertEqual(bucket.credits_used, 13)
+
+    def test_rollup_snapshot_matches_raw_snapshot(self):
+        for ms in (80, 120, 200, 400):
+            self._call(ms=ms, used=20)
+        self._call(status_code=401, ms=50)
+        self._old_row(days=3)
+        raw = build_snapshot()
+        with self.settings(OPS_ROLLUP_READS=True):
+            rolled = build_snapshot()
+        for attr in ('last_24h', 'last_24h_failures', 'last_1h', 'last_1h_failures',
+                     'last_7d', 'avg_latency_ms_24h', 'by_sport_24h',
+                     'last_status', 'last_success', 'last_failure_status'):
+            self.assertEqual(getattr(rolled.api_stats, attr), getattr(raw.api_stats, attr), attr)
+        self.assertEqual(
+            (rolled.quota.used, rolled.quota.remaining, rolled.quota.captured_at),
+            (raw.quota.used, raw.quota.remaining, raw.quota.captured_at),
+        )
+        self.assertEqual(rolled.api_stats.p50_latency_ms_24h, 250)
+        self.assertEqual(rolled.api_stats.p95_latency_ms_24h, 500)
+        self.assertEqual(rolled.api.health, raw.api.health)
+
+    def test_prune_keeps_rollups_and_running_rows(self):
+        from django.core.management import call_command
+        self._old_row(days=3)
+        self._old_row(days=40)
+        self._call()
+        with cron_run_log('refresh_data'):
+            pass
+        CronRunLog.objects.update(started_at=timezone.now() - timedelta(days=2))
+        stuck = CronRunLog.objects.create(command='refresh_data', status='running')
+        CronRunLog.objects.filter(pk=stuck.pk).update(started_at=timezone.now() - timedelta(days=2))
+
+        call_command('prune_ops_history', '--days', '1', stdout=StringIO())
+        self.assertEqual(OddsApiUsage.objects.count(), 1)
+        self.assertEqual(list(CronRunLog.objects.values_list('status', flat=True)), ['running'])
+        with self.settings(OPS_ROLLUP_READS=True):
+            snap = build_snapshot()
+        self.assertEqual(snap.api_stats.last_7d, 2)
+        cmd = next(c for c in snap.cron_commands if c.command == 'refresh_data')
+        self.assertEqual(cmd.success_count_7d, 1)
+
+    def test_cron_runs_roll_up_and_rebuild_reproduces(self):
+        from django.core.management import call_command
+
+        from apps.ops.models import CronRunHourly, OddsApiUsageHourly
+        with cron_run_log('refresh_data') as log:
+            log.mark_partial('golf odds failed')
+        with self.assertRaises(RuntimeError):
+            with cron_run_log('refresh_data'):
+                raise RuntimeError('boom')
+        self._call(ms=90)
+        self._call(ms=3000, status_code=502)
+        self._old_row(days=2, credits_used=5, credits_remaining=995)
+
+        def _state():
+            return (
+                list(CronRunHourly.objects.values('hour', 'command', 'runs', 'successes',
+                                                  'failures', 'partials')),
+                list(OddsApiUsageHourly.objects.values()
+                     .order_by('hour', 'sport')),
+            )
+
+        before = _state()
+        self.assertEqual(
+            [(r['runs'], r['partials'], r['failures']) for r in before[0]], [(2, 1, 1)],
+        )
+        call_command('rebuild_ops_rollups', stdout=StringIO())
+        after = _state()
+        self.assertEqual(after[0], before[0])
+        strip = lambda rows: [{k: v for k, v in r.items() if k != 'id'} for r in rows]  # noqa: E731
+        self.assertEqual(strip(after[1]), strip(before[1]))
+
+
 # -------------------- Cron logging --------------------
 
 class CronLoggingTests(TestCase):
@@ -256,6 +452,7 @@ class SnapshotHealthTests(TestCase):
 class CommandCenterViewTests(TestCase):
 
     def setUp(self):
+        cache.clear()
         self.client = Client()
         self.url = reverse('ops:command_center')
 
@@ -473,6 +670,7 @@ class HeaderStatusIndicatorTests(TestCase):
     PUBLIC_PAGE = '/accounts/login/'
 
     def setUp(self):
+        cache.clear()
         self.client = Client()
 
     def test_anonymous_does_not_see_indicator(self):
@@ -561,6 +759,63 @@ class HeaderStatusIndicatorTests(TestCase):
             self.assertContains(resp, 'status-dot--unknown')
 
 
+class OpsSnapshotCacheTests(TestCase):
+    """The header dot and dashboard share one cached snapshot; cron closes
+    and circuit flips drop it, `?fresh=1` rebuilds it."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        from apps.ops.services import command_center
+        self.command_center = command_center
+        spy = patch.object(command_center, 'build_snapshot', wraps=command_center.build_snapshot)
+        self.build = spy.start()
+        self.addCleanup(spy.stop)
+
+    def test_repeat_reads_hit_the_cache(self):
+        first = self.command_center.cached_snapshot()
+        with self.assertNumQueries(0):
+            second = self.command_center.cached_snapshot()
+        self.assertEqual(self.build.call_count, 1)
+        self.assertEqual(second.overall.health, first.overall.health)
+
+    def test_ttl_zero_disables_cache(self):
+        with self.settings(OPS_SNAPSHOT_CACHE_SECONDS=0):
+            self.command_center.cached_snapshot()
+            self.command_center.cached_snapshot()
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_closed_cron_run_invalidates(self):
+        self.assertEqual(self.command_center.cached_snapshot().cron.health, 'unknown')
+        with cron_run_log('refresh_data'):
+            pass
+        self.assertEqual(self.command_center.cached_snapshot().cron.health, 'green')
+
+    def test_circuit_open_and_close_invalidate(self):
+        from apps.ops.services import provider_health
+        provider_health.clear_cache()
+        self.command_center.cached_snapshot()
+        provider_health.record_failure('odds_api', status_code=401)
+        self.command_center.cached_snapshot()
+        provider_health.record_success('odds_api')
+        self.command_center.cached_snapshot()
+        self.assertEqual(self.build.call_count, 3)
+        # A failure that doesn't open the breaker keeps the cached copy.
+        provider_health.record_failure('odds_api', status_code=500)
+        self.command_center.cached_snapshot()
+        self.assertEqual(self.build.call_count, 3)
+
+    def test_fresh_param_bypasses_cache(self):
+        admin = User.objects.create_superuser('admin', 'a@a.com', 'pw')
+        self.client.force_login(admin)
+        url = reverse('ops:command_center')
+        self.client.get(url)
+        self.client.get(url)
+        self.assertEqual(self.build.call_count, 1)
+        self.client.get(url, {'fresh': '1'})
+        self.assertEqual(self.build.call_count, 2)
+
+
 # =========================================================================
 # Provider Health / Circuit Breaker — Auto-failover Commit 1
 # =========================================================================
@@ -569,7 +824,16 @@ from apps.ops.models import ProviderHealth
 from apps.ops.services import provider_health
 
 
-class ProviderHealthStateTests(TestCase):
+class _ProviderHealthTestCase(TestCase):
+    """The breaker cache is process-local and outlives each test's rolled-back
+    transaction, so every test starts from an empty one."""
+
+    def setUp(self):
+        super().setUp()
+        provider_health.clear_cache()
+
+
+class ProviderHealthStateTests(_ProviderHealthTestCase):
     """Pure state-machine coverage. The service is the single source of
     truth for "should I call this provider?" and "should I open the
     breaker?" — every transition must be explicit and reversible."""
@@ -614,7 +878,7 @@ class ProviderHealthStateTests(TestCase):
         self.assertFalse(row.is_circuit_open)
 
 
-class CircuitBreakerTriggerTests(TestCase):
+class CircuitBreakerTriggerTests(_ProviderHealthTestCase):
     """The three auto-open paths must each fire the breaker on the
     correct event."""
 
@@ -674,7 +938,7 @@ class CircuitBreakerTriggerTests(TestCase):
         self.assertFalse(row.is_circuit_open)
 
 
-class CircuitBreakerCooldownTests(TestCase):
+class CircuitBreakerCooldownTests(_ProviderHealthTestCase):
     """The circuit's time-based reset is the recovery path. Verify both
     sides: still open before cooldown, automatically closed after."""
 
@@ -717,7 +981,7 @@ class CircuitBreakerCooldownTests(TestCase):
         self.assertIsNone(row.circuit_open_until)
 
 
-class CircuitBreakerManualControlsTests(TestCase):
+class CircuitBreakerManualControlsTests(_ProviderHealthTestCase):
     """Manual reset is the operator's escape hatch — clears state without
     waiting for cooldown or successful probe."""
 
@@ -747,7 +1011,7 @@ class CircuitBreakerManualControlsTests(TestCase):
         self.assertEqual(summary['last_status_code'], 401)
 
 
-class CircuitBreakerExceptionSafetyTests(TestCase):
+class CircuitBreakerExceptionSafetyTests(_ProviderHealthTestCase):
     """The service must never raise — a DB hiccup writing health state can
     NOT take down the upstream provider call."""
 
@@ -772,7 +1036,7 @@ class CircuitBreakerExceptionSafetyTests(TestCase):
             self.assertFalse(provider_health.is_circuit_open('odds_api'))
 
 
-class CooldownSettingOverrideTests(TestCase):
+class CooldownSettingOverrideTests(_ProviderHealthTestCase):
     """The cooldown is configurable via settings — verify the service
     reads it dynamically (so override_settings works in tests)."""
 
@@ -789,6 +1053,81 @@ class CooldownSettingOverrideTests(TestCase):
             self.assertLess(delta_min, 5.5)
 
 
+class ProviderHealthCacheTests(_ProviderHealthTestCase):
+    """Breaker reads come from a short-TTL process cache; successes that
+    change nothing are coalesced; failures and opens persist at once."""
+
+    def test_reads_are_cached_within_ttl(self):
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))
+        with self.assertNumQueries(0):
+            for _ in range(5):
+                provider_health.is_circuit_open('odds_api')
+                provider_health.state_summary('odds_api')
+
+    def test_unchanged_successes_are_coalesced(self):
+        provider_health.record_success('odds_api')
+        first = ProviderHealth.objects.get(provider='odds_api').last_success_at
+        self.assertIsNotNone(first)
+        # One conditional UPDATE per success, matching no row: nothing is
+        # written while the stored row is clean.
+        with self.assertNumQueries(10):
+            for _ in range(10):
+                provider_health.record_success('odds_api')
+        self.assertEqual(ProviderHealth.objects.get(provider='odds_api').last_success_at, first)
+
+        with self.settings(PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS=0):
+            with self.assertNumQueries(1):
+                provider_health.record_success('odds_api')
+        self.assertGreater(ProviderHealth.objects.get(provider='odds_api').last_success_at, first)
+
+    def test_success_that_changes_state_writes_at_once(self):
+        provider_health.record_success('odds_api')
+        provider_health.record_failure('odds_api', status_code=500, error_message='boom')
+        provider_health.record_success('odds_api')
+        row = ProviderHealth.objects.get(provider='odds_api')
+        self.assertEqual((row.consecutive_failures, row.last_error_message), (0, ''))
+
+    def test_success_clears_other_process_failures_despite_fresh_cache(self):
+        provider_health.record_success('odds_api')
+        # Another worker records failures and opens the circuit while this
+        # process's cache entry is still fresh — no signal reaches it.
+        ProviderHealth.objects.filter(provider='odds_api').update(
+            consecutive_failures=2, last_status_code=500, last_error_message='boom',
+            circuit_open_until=timezone.now() + timedelta(minutes=30),
+            last_open_reason='consecutive_failures',
+        )
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))  # cache is fresh
+        row = provider_health.record_success('odds_api')
+        stored = ProviderHealth.objects.get(provider='odds_api')
+        self.assertEqual(
+            (stored.consecutive_failures, stored.circuit_open_until,
+             stored.last_open_reason, stored.last_error_message, stored.last_status_code),
+            (0, None, '', '', 200),
+        )
+        self.assertEqual(row.consecutive_failures, 0)
+        # A later single failure starts counting from zero again.
+        provider_health.record_failure('odds_api', status_code=500)
+        self.assertFalse(ProviderHealth.objects.get(provider='odds_api').is_circuit_open)
+
+    def test_failure_and_open_are_seen_immediately(self):
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))
+        provider_health.record_failure('odds_api', status_code=429, error_message='quota')
+        self.assertTrue(ProviderHealth.objects.get(provider='odds_api').is_circuit_open)
+        self.assertTrue(provider_health.is_circuit_open('odds_api'))
+        provider_health.reset_circuit('odds_api')
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))
+
+    def test_other_process_writes_seen_after_ttl(self):
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))
+        # Another worker opens the circuit — no signal reaches this process.
+        ProviderHealth.objects.filter(provider='odds_api').update(
+            circuit_open_until=timezone.now() + timedelta(minutes=30),
+        )
+        self.assertFalse(provider_health.is_circuit_open('odds_api'))
+        with self.settings(PROVIDER_HEALTH_CACHE_SECONDS=0):
+            self.assertTrue(provider_health.is_circuit_open('odds_api'))
+
+
 class SnapshotSourceFieldDefaultsTests(TestCase):
     """The new odds_source / source_quality fields must default to the
     primary path so existing rows + new rows that don't explicitly set
@@ -25,7 +25,7 @@ from django.views.decorators.http import require_POST
 
 from apps.ops.services.api_logging import record_call
 from apps.ops.services.cron_logging import is_command_running
-from apps.ops.services.command_center import build_snapshot
+from apps.ops.services.command_center import cached_snapshot
 
 
 def _is_staff_or_superuser(user):
@@ -51,8 +51,10 @@ def command_center(request):
     is to be the first place to look when something is wrong, so it must
     not crash if telemetry is missing. build_snapshot() returns 'unknown'
     health and zero counts in that case and the template handles those.
+
+    Served from the shared snapshot cache; `?fresh=1` bypasses it.
     """
-    snapshot = build_snapshot()
+    snapshot = cached_snapshot(refresh=request.GET.get('fresh') == '1')
     return render(request, 'ops/command_center.html', {
         'snapshot': snapshot,
         'live_data_enabled': settings.LIVE_DATA_ENABLED,
@@ -154,6 +154,13 @@ ODDS_API_KEY = os.environ.get('ODDS_API_KEY', '')
 CFBD_API_KEY = os.environ.get('CFBD_API_KEY', '')
 CBBD_API_KEY = os.environ.get('CBBD_API_KEY', '')
 
+# Outbound HTTP connection pooling (apps/datahub/providers/client.py). One
+# keep-alive pool per upstream host, shared by every provider instance.
+# POOL_CONNECTIONS = distinct pools cached per adapter; POOL_MAXSIZE = max
+# idle sockets kept per host (raise alongside `refresh_data --parallel`).
+HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', '4'))
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', '8'))
+
 # --- Provider Health / Circuit Breaker (Auto-failover layer) ----------------
 # How long the breaker stays open after a 401, 429, or 3 consecutive failures.
 # After the cooldown the next call probes; success closes the breaker, another
@@ -161,6 +168,52 @@ CBBD_API_KEY = os.environ.get('CBBD_API_KEY', '')
 ODDS_PROVIDER_CIRCUIT_COOLDOWN_MINUTES = int(
     os.environ.get('ODDS_PROVIDER_CIRCUIT_COOLDOWN_MINUTES', '60')
 )
+# Breaker reads (is_circuit_open / state_summary) are served from a
+# process-local copy of the ProviderHealth row for this many seconds; other
+# processes' failures and circuit opens are seen within one TTL. Successes
+# that change nothing are written at most once per SUCCESS_WRITE interval.
+PROVIDER_HEALTH_CACHE_SECONDS = int(os.environ.get('PROVIDER_HEALTH_CACHE_SECONDS', '10'))
+PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS = int(
+    os.environ.get('PROVIDER_HEALTH_SUCCESS_WRITE_SECONDS', '60')
+)
+# Buffer OddsApiUsage telemetry in memory and bulk-insert it at the end of
+# each provider run, every ODDS_API_USAGE_FLUSH_SIZE rows, and at process
+# exit, instead of one INSERT per API attempt. Rows that can't be written
+# are dropped and counted, never retried inline. Default OFF.
+ODDS_API_USAGE_BUFFERED = os.environ.get('ODDS_API_USAGE_BUFFERED', 'false').lower() == 'true'
+ODDS_API_USAGE_FLUSH_SIZE = int(os.environ.get('ODDS_API_USAGE_FLUSH_SIZE', '50'))
+# Command Center reads its 24h / 7d API and cron numbers from the hourly
+# rollup tables (always maintained) instead of scanning raw telemetry.
+# prune_ops_history deletes raw rows older than OPS_RAW_RETENTION_DAYS;
+# only turn it on once the rollups are live. Default OFF.
+OPS_ROLLUP_READS = os.environ.get('OPS_ROLLUP_READS', 'false').lower() == 'true'
+OPS_RAW_RETENTION_DAYS = int(os.environ.get('OPS_RAW_RETENTION_DAYS', '30'))
+# Seconds the Command Center snapshot (header status dot + dashboard) is
+# served from Django's cache. Dropped early when a cron run closes or a
+# provider circuit opens/closes; `?fresh=1` on the dashboard bypasses it.
+# With the default per-process cache, invalidations from cron processes
+# don't reach web workers and this TTL bounds the staleness. 0 disables.
+OPS_SNAPSHOT_CACHE_SECONDS = int(os.environ.get('OPS_SNAPSHOT_CACHE_SECONDS', '30'))
+# Serve get_recommendation from Django's cache, keyed on the game's latest
+# snapshot, per-sport input / odds versions, rating mode and the user's
+# model config (apps/core/services/recommendation_cache.py). Ingest, score
+# refreshes and Elo updates always bump the versions, so it can be turned
+# on at any time. The versions live in the database (core.RecommendationCacheVersion),
+# so cron-side bumps reach every web worker; RECOMMENDATION_CACHE_SECONDS
+# only bounds memory. Default OFF.
+RECOMMENDATION_CACHE = os.environ.get('RECOMMENDATION_CACHE', 'false').lower() == 'true'
+RECOMMENDATION_CACHE_SECONDS = int(os.environ.get('RECOMMENDATION_CACHE_SECONDS', '600'))
+# Hub, value board and Bet All read each game's house pick from
+# core.CurrentRecommendation, written at the end of every ingest_odds /
+# refresh_data run (apps/core/services/current_recommendation.py). A row
+# older than CURRENT_RECOMMENDATION_MAX_AGE_MINUTES, or computed against an
+# older snapshot, is ignored and the pick is computed inline. Rows are
+# written regardless; run `manage.py refresh_recommendations` once before
+# flipping this on. Default OFF.
+CURRENT_RECOMMENDATION_READS = os.environ.get('CURRENT_RECOMMENDATION_READS', 'false').lower() == 'true'
+CURRENT_RECOMMENDATION_MAX_AGE_MINUTES = int(
+    os.environ.get('CURRENT_RECOMMENDATION_MAX_AGE_MINUTES', '30')
+)
 # Diagnostic flag. When True, the MLB odds provider emits an INFO log line
 # for every API team name it sees during a persist run. Designed to be
 # flipped on briefly via Railway env var to harvest unfamiliar API names,
@@ -169,6 +222,45 @@ DEBUG_ODDS_MATCHING = os.environ.get('DEBUG_ODDS_MATCHING', 'false').lower() ==
 # Freshness windows for odds-driven UI gating (Commit 2 will start using these).
 FRESH_ODDS_MAX_AGE_MINUTES = int(os.environ.get('FRESH_ODDS_MAX_AGE_MINUTES', '180'))
 STALE_ODDS_MAX_AGE_MINUTES = int(os.environ.get('STALE_ODDS_MAX_AGE_MINUTES', '720'))
+# Movement scoring reads the persisted OddsMovementState rows instead of
+# re-reading snapshot history (apps/core/services/movement_state.py).
+# State is written on every ingest regardless; run
+# `manage.py rebuild_movement_state` once before flipping this on so games
+# already in flight have complete windows. Default OFF.
+MOVEMENT_STATE_READS = os.environ.get('MOVEMENT_STATE_READS', 'false').lower() == 'true'
+# Change-only odds writes. When True, an odds pull that returns exactly the
+# current line for a (game, sportsbook) bumps last_seen_at/observation_count
+# on the existing OddsSnapshot instead of inserting a duplicate row. Quiet
+# markets stop growing the table; freshness checks read last_seen_at so they
+# behave the same either way. Movement scoring then sees one row per distinct
+# price rather than one per pull. Default OFF.
+ODDS_CHANGE_ONLY_WRITES = os.environ.get('ODDS_CHANGE_ONLY_WRITES', 'false').lower() == 'true'
+# Latest-odds, consensus / best-price and staleness lookups read the
+# materialized core.CurrentLine table (apps/core/services/current_line.py)
+# instead of ordering OddsSnapshot per game. Rows are upserted on every
+# ingest regardless; run `manage.py rebuild_current_lines` once before
+# flipping this on. Default OFF.
+CURRENT_LINE_READS = os.environ.get('CURRENT_LINE_READS', 'false').lower() == 'true'
+# Raw-payload archive. When True, every provider fetch() result is written
+# gzip-compressed to RAW_ARCHIVE_DIR (date-partitioned, with a per-day
+# index) before normalize runs, so `manage.py replay_ingest` can re-run
+# normalize/persist against it offline. Archive failures are logged and
+# never fail an ingest. Point RAW_ARCHIVE_DIR at a mounted volume in prod.
+# Default OFF.
+RAW_ARCHIVE_ENABLED = os.environ.get('RAW_ARCHIVE_ENABLED', 'false').lower() == 'true'
+RAW_ARCHIVE_DIR = os.environ.get('RAW_ARCHIVE_DIR', str(BASE_DIR / 'var' / 'raw_archive'))
+# Adaptive odds polling. When True, refresh_data only runs ingest_odds for
+# sports the plan in apps/datahub/services/odds_schedule.py marks due:
+# games are tiered by minutes to start (ODDS_POLL_TIERS, comma-separated
+# name:max_minutes:cadence_minutes), sports with nothing inside the
+# outermost tier are skipped, and remaining quota is spread over the days
+# left before the plan's billing day. `manage.py plan_odds_pulls` prints
+# the plan without pulling. Default OFF.
+ODDS_ADAPTIVE_POLLING = os.environ.get('ODDS_ADAPTIVE_POLLING', 'false').lower() == 'true'
+ODDS_POLL_TIERS = os.environ.get('ODDS_POLL_TIERS', 'imminent:90:15,soon:360:60,near:4320:360')
+ODDS_API_BILLING_DAY = int(os.environ.get('ODDS_API_BILLING_DAY', '1'))
+# h2h,spreads,totals × one region.
+ODDS_API_CREDITS_PER_PULL = int(os.environ.get('ODDS_API_CREDITS_PER_PULL', '3'))
 
 # --- Tiered Intelligence — Phase 1 Opportunity Signals (Spread + Total) ---
 # Feature-flag the UI surface so the data layer (signal generation +